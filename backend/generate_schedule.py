@@ -6,29 +6,21 @@ import sys
 from pathlib import Path
 from typing import Optional
 
-# Backend imports (installed as package)
-
-# Import backend components
-from core.config import load_config
-from core.constants import SCHEDULING_CONSTANTS
-from core.models import SchedulerStrategy
-from schedulers.base import BaseScheduler
-from core.config import load_config
-from core.models import SchedulerStrategy
-from console import print_schedule_summary, print_deadline_status, print_utilization_summary
-from reports import generate_schedule_report
+# Backend modules are imported inside the handlers so that --help and
+# --list-strategies start without loading pydantic, schedulers or pulp.
 
 # Constants from backend
 DEFAULT_CONFIG_PATH = "data/config.json"
-AVAILABLE_STRATEGIES = {
-    "greedy": SchedulerStrategy.GREEDY,
-    "stochastic": SchedulerStrategy.STOCHASTIC,
-    "lookahead": SchedulerStrategy.LOOKAHEAD,
-    "backtracking": SchedulerStrategy.BACKTRACKING,
-    "random": SchedulerStrategy.RANDOM,
-    "heuristic": SchedulerStrategy.HEURISTIC,
-    "optimal": SchedulerStrategy.OPTIMAL
-}
+# Values of core.models.SchedulerStrategy
+AVAILABLE_STRATEGIES = (
+    "greedy",
+    "stochastic",
+    "lookahead",
+    "backtracking",
+    "random",
+    "heuristic",
+    "optimal"
+)
 
 
 def create_argument_parser() -> argparse.ArgumentParser:
@@ -50,7 +42,7 @@ Default config: {DEFAULT_CONFIG_PATH}
     # Core functionality arguments
     parser.add_argument(
         "--strategy",
-        choices=list(AVAILABLE_STRATEGIES.keys()),
+        choices=list(AVAILABLE_STRATEGIES),
         help="Scheduling strategy to use"
     )
     parser.add_argument(
@@ -93,7 +85,7 @@ def validate_arguments(args: argparse.Namespace) -> Optional[str]:
 def list_available_strategies() -> None:
     """Display all available scheduling strategies."""
     print("Available scheduling strategies:")
-    for strategy in AVAILABLE_STRATEGIES.keys():
+    for strategy in AVAILABLE_STRATEGIES:
         print(f"  - {strategy}")
 
 
@@ -103,11 +95,15 @@ def handle_strategy_mode(strategy: str, config_path: str, output_path: Optional[
         print(f"Using {strategy} scheduling strategy...")
     
     try:
+        from core.config import load_config
+        from core.models import SchedulerStrategy
+        from schedulers.base import BaseScheduler
+        
         # Load configuration directly
         config = load_config(config_path)
         
         # Get the strategy enum
-        strategy_enum = AVAILABLE_STRATEGIES[strategy]
+        strategy_enum = SchedulerStrategy(strategy)
         
         # Create scheduler and generate schedule
         if not quiet:
@@ -131,6 +127,7 @@ def handle_strategy_mode(strategy: str, config_path: str, output_path: Optional[
             print(f"Duration: {duration_days} days")
             
             # Print detailed console output
+            from console import print_schedule_summary, print_deadline_status, print_utilization_summary
             print_schedule_summary(schedule, config)
             print_deadline_status(schedule, config)
             print_utilization_summary(schedule, config)
@@ -178,13 +175,18 @@ def handle_compare_mode(config_path: str, output_path: Optional[str], quiet: boo
         print("Comparing multiple scheduling strategies...")
     
     try:
+        from core.config import load_config
+        from core.models import SchedulerStrategy
+        from schedulers.base import BaseScheduler
+        
         # Load configuration directly
         config = load_config(config_path)
         
         results = {}
         
         # Run each strategy
-        for strategy_name, strategy_enum in AVAILABLE_STRATEGIES.items():
+        for strategy_name in AVAILABLE_STRATEGIES:
+            strategy_enum = SchedulerStrategy(strategy_name)
             if not quiet:
                 print(f"\nTesting {strategy_name} strategy...")
             
@@ -39,9 +39,44 @@ OPERATIONS = {
         'desc': 'Interactive console interface for schedule operations',
         'requires': ['config'],
         'examples': ['--config data/config.json', '--interactive']
+    },
+    'cache': {
+        'desc': 'Manage the config snapshot cache and the schedule result cache',
+        'requires': ['config'],
+        'examples': ['--cache-action warm --config data/config.json', '--cache-action stats --config data/config.json',
+                     '--cache-action purge --strategy optimal --older-than-days 30']
+    },
+    'serve': {
+        'desc': 'Run the local scheduling service with a warm worker pool',
+        'requires': [],
+        'examples': ['--config data/config.json --port 8765 --workers 4', '--config data/config.json --strategy optimal']
+    },
+    'whatif': {
+        'desc': 'Schedule deadline and capacity scenarios of a config in parallel and compare their metrics',
+        'requires': ['config', 'scenarios'],
+        'examples': ['--scenarios scenarios.json --config data/config.json',
+                     '--scenarios scenarios.json --strategy heuristic --workers 4 --output whatif.json']
+    },
+    'importtime': {
+        'desc': 'Report module import times for an operation (python -X importtime)',
+        'requires': [],
+        'examples': ['--target schedule --strategy optimal', '--target validate --top 25 --output importtime.json']
     }
 }
 
+# Modules each operation imports on demand, profiled by the importtime operation
+OPERATION_MODULES = {
+    'schedule': ['caching.snapshot', 'caching.results', 'schedulers.base', 'console'],
+    'analyze': ['caching.snapshot', 'analytics'],
+    'validate': ['caching.snapshot', 'validation.schedule', 'validation.deadline', 'validation.resources', 'validation.config'],
+    'monitor': ['caching.snapshot', 'monitoring.progress', 'monitoring.rescheduler'],
+    'export': ['caching.snapshot', 'exporters.csv_exporter'],
+    'console': ['console'],
+    'cache': ['caching.snapshot'],
+    'serve': ['service.server'],
+    'whatif': ['caching.snapshot', 'scenarios']
+}
+
 def setup_env():
     """Check if backend modules are available."""
     try:
@@ -54,13 +89,33 @@ def setup_env():
         print("Please ensure backend is properly installed or PYTHONPATH is set")
         return False
 
+def load_operation_config(args: argparse.Namespace):
+    """Load the config for an operation, using the snapshot cache unless disabled."""
+    if getattr(args, 'no_cache', False):
+        from core.config import load_config
+        return load_config(args.config)
+    from caching.snapshot import load_config_cached
+    return load_config_cached(args.config, getattr(args, 'cache_dir', None))
+
+def get_operation_result_cache(args: argparse.Namespace):
+    """Return the schedule result cache for an operation, or None when caching is disabled."""
+    if getattr(args, 'no_cache', False):
+        return None
+    from caching.results import get_result_cache
+    return get_result_cache(args.config, getattr(args, 'cache_dir', None))
+
+def get_strategy_params(args: argparse.Namespace) -> Dict[str, Any]:
+    """Collect strategy parameters given on the command line."""
+    return {
+        'seed': getattr(args, 'seed', None),
+        'lookahead_days': getattr(args, 'lookahead_days', None),
+        'randomness_factor': getattr(args, 'randomness_factor', None)
+    }
+
 def run_schedule_operation(args: argparse.Namespace) -> int:
     """Run schedule generation operation."""
     try:
-        from schedulers.base import BaseScheduler
-        from core.config import load_config
-        from console import print_schedule_summary, print_deadline_status, print_utilization_summary
-        from reports import generate_schedule_report
+        from caching.results import schedule_cached
         
         print(f"\n🚀 Generating schedule with {args.strategy} strategy")
         print(f"📁 Config: {args.config}")
@@ -68,26 +123,28 @@ def run_schedule_operation(args: argparse.Namespace) -> int:
         print("-" * 50)
         
         # Load configuration
-        config = load_config(args.config)
+        config = load_operation_config(args)
+        result_cache = get_operation_result_cache(args)
+        params = get_strategy_params(args)
         
         if args.compare:
             # Compare multiple strategies
             strategies = ['greedy', 'stochastic', 'lookahead', 'backtracking', 'random', 'heuristic', 'optimal']
             results = {}
+            archived = []
             
             for strategy in strategies:
                 print(f"\n📈 Testing {strategy} strategy...")
                 try:
-                    # Convert string to SchedulerStrategy enum
-                    from core.models import SchedulerStrategy
-                    strategy_enum = SchedulerStrategy(strategy)
-                    scheduler = BaseScheduler.create_scheduler(strategy_enum, config)
-                    schedule = scheduler.schedule()
+                    # Each strategy gets its own copy since schedulers modify submissions
+                    schedule, metrics, cached = schedule_cached(config.model_copy(deep=True), strategy, params, result_cache)
                     if schedule and len(schedule.intervals) > 0:
+                        archived.append((schedule, strategy, 'compare', metrics, None))
                         # Calculate basic metrics
                         total_submissions = len(schedule.intervals)
                         duration_days = schedule.calculate_duration_days()
-                        print(f"  ✓ {strategy}: {total_submissions} submissions, duration: {duration_days} days")
+                        source = " (cached)" if cached else ""
+                        print(f"  ✓ {strategy}: {total_submissions} submissions, duration: {duration_days} days{source}")
                         results[strategy] = {
                             'total_submissions': total_submissions,
                             'duration_days': duration_days
@@ -104,17 +161,27 @@ def run_schedule_operation(args: argparse.Namespace) -> int:
                 sorted_results = sorted(results.items(), key=lambda x: x[1]['duration_days'])
                 for strategy, metrics in sorted_results:
                     print(f"  {strategy}: {metrics['total_submissions']} submissions, {metrics['duration_days']} days")
+            
+            if args.archive and archived:
+                from database.archive import ScheduleArchive
+                ScheduleArchive(args.archive).append_many(archived)
+                print(f"\n🗃️  Archived {len(archived)} schedule(s) to: {args.archive}")
         else:
             # Single strategy
-            from core.models import SchedulerStrategy
-            strategy_enum = SchedulerStrategy(args.strategy)
-            scheduler = BaseScheduler.create_scheduler(strategy_enum, config)
-            schedule = scheduler.schedule()
+            schedule, metrics, cached = schedule_cached(config, args.strategy, params, result_cache)
             if not schedule or len(schedule.intervals) == 0:
                 print("❌ Failed to generate schedule")
                 return 1
+            if cached:
+                print("⚡ Reusing cached result")
+            
+            if args.archive:
+                from database.archive import ScheduleArchive
+                ScheduleArchive(args.archive).append(schedule, args.strategy, Path(args.config).stem, metrics)
+                print(f"🗃️  Archived schedule to: {args.archive}")
             
             # Display results
+            from console import print_schedule_summary, print_deadline_status, print_utilization_summary
             print_schedule_summary(schedule, config)
             print_deadline_status(schedule, config)
             print_utilization_summary(schedule, config)
@@ -147,13 +214,12 @@ def run_analyze_operation(args: argparse.Namespace) -> int:
     """Run schedule analysis operation."""
     try:
         from analytics import analyze_schedule_with_scoring
-        from core.config import load_config
         
         print(f"\n🔍 Analyzing schedule data")
         print(f"📁 Config: {args.config}")
         print("-" * 50)
         
-        config = load_config(args.config)
+        config = load_operation_config(args)
         
         # Load existing schedule if available
         schedule_file = args.schedule or "output/latest_schedule.json"
@@ -225,7 +291,6 @@ def run_analyze_operation(args: argparse.Namespace) -> int:
 def run_validate_operation(args: argparse.Namespace) -> int:
     """Run validation operation."""
     try:
-        from core.config import load_config
         from validation.schedule import validate_schedule_constraints
         from validation.deadline import validate_deadline_constraints
         from validation.resources import validate_resources_constraints
@@ -235,7 +300,7 @@ def run_validate_operation(args: argparse.Namespace) -> int:
         print(f"📁 Config: {args.config}")
         print("-" * 50)
         
-        config = load_config(args.config)
+        config = load_operation_config(args)
         
         # Validate configuration
         validation_result = validate_config(config)
@@ -288,13 +353,12 @@ def run_monitor_operation(args: argparse.Namespace) -> int:
     try:
         from monitoring.progress import ProgressTracker
         from monitoring.rescheduler import DynamicRescheduler
-        from core.config import load_config
         
         print(f"\n📊 Monitoring schedule progress")
         print(f"📁 Config: {args.config}")
         print("-" * 50)
         
-        config = load_config(args.config)
+        config = load_operation_config(args)
         
         # Initialize monitoring components
         progress_tracker = ProgressTracker(config)
@@ -344,8 +408,7 @@ def run_monitor_operation(args: argparse.Namespace) -> int:
 def run_export_operation(args: argparse.Namespace) -> int:
     """Run export operation."""
     try:
-        from exporters.csv_exporter import CSVExporter
-        from core.config import load_config
+        from exporters.orchestrator import ExportOrchestrator, build_schedule_artifacts
         
         print(f"\n📤 Exporting schedule data")
         print(f"📁 Config: {args.config}")
@@ -353,7 +416,7 @@ def run_export_operation(args: argparse.Namespace) -> int:
         print(f"📁 Output: {args.output}")
         print("-" * 50)
         
-        config = load_config(args.config)
+        config = load_operation_config(args)
         
         # Load schedule
         schedule_file = args.schedule or "output/latest_schedule.json"
@@ -385,36 +448,24 @@ def run_export_operation(args: argparse.Namespace) -> int:
         else:
             schedule = schedule_data
         
-        # Export based on format
-        if args.format == 'csv':
-            # Create output directory if it doesn't exist
-            output_dir = Path(args.output)
-            output_dir.mkdir(parents=True, exist_ok=True)
-            
-            # CSV export with intervals
-            import csv
-            csv_file = output_dir / "schedule.csv"
-            with open(csv_file, 'w', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow(['Submission ID', 'Start Date', 'End Date', 'Duration (days)'])
-                for submission_id, interval in schedule.intervals.items():
-                    duration = (interval.end_date - interval.start_date).days + 1
-                    writer.writerow([submission_id, interval.start_date, interval.end_date, duration])
-            
-            print(f"\n📄 CSV export saved to: {csv_file}")
-        
-        elif args.format == 'json':
-            # Create output directory if it doesn't exist
-            output_dir = Path(args.output)
-            output_dir.mkdir(parents=True, exist_ok=True)
-            
-            output_file = output_dir / "schedule_export.json"
-            with open(output_file, 'w') as f:
-                json.dump(schedule_data, f, indent=2)
-            print(f"\n📄 JSON export saved to: {output_file}")
-        
-        else:
-            print(f"❌ Unsupported format: {args.format}")
+        # Export the requested formats in parallel, skipping unchanged artifacts
+        formats = ['csv', 'json', 'html', 'png'] if args.format == 'all' else [args.format]
+        orchestrator = ExportOrchestrator(args.output)
+        # The JSON export keeps the format of the schedule file it was loaded from
+        artifacts = build_schedule_artifacts(schedule, config, formats, json_data=schedule_data)
+        results = orchestrator.run(artifacts, force=args.force)
+        
+        failed = False
+        for result in results.values():
+            if result.error:
+                failed = True
+                print(f"\n❌ {result.key.upper()} export failed: {result.error}")
+            elif result.skipped:
+                print(f"\n⏭️  {result.key.upper()} export unchanged: {result.path}")
+            elif result.path:
+                print(f"\n📄 {result.key.upper()} export saved to: {result.path} ({result.seconds:.2f}s)")
+        
+        if failed:
             return 1
         
         return 0
@@ -455,6 +506,182 @@ def run_console_operation(args: argparse.Namespace) -> int:
             traceback.print_exc()
         return 1
 
+def run_cache_operation(args: argparse.Namespace) -> int:
+    """Run config snapshot cache operation."""
+    try:
+        from caching.snapshot import warm_config_cache, inspect_config_cache, clear_config_cache
+        
+        print(f"\n🗄️  Config snapshot cache: {args.cache_action}")
+        print(f"📁 Config: {args.config}")
+        print("-" * 50)
+        
+        if args.cache_action == 'warm':
+            result = warm_config_cache(args.config, args.cache_dir, force=args.no_cache)
+            print(f"✓ Snapshot {result['status']} (was {result['previous']}): {result['snapshot']}")
+        elif args.cache_action == 'inspect':
+            info = inspect_config_cache(args.config, args.cache_dir)
+            print(f"Snapshot: {info['snapshot']}")
+            print(f"Status: {info['status']}")
+            if 'created_at' in info:
+                print(f"Created: {info['created_at']}")
+                print(f"Schema: {info['schema']} (pydantic {info['pydantic']})")
+                print(f"Contents: {info['submissions']} submissions, {info['conferences']} conferences")
+            if 'payload_bytes' in info:
+                print(f"Payload: {info['payload_bytes']} bytes")
+            for entry in info.get('inputs', []):
+                if entry.get('exists'):
+                    print(f"  {entry['path']} ({entry['size']} bytes, sha256 {entry['sha256'][:12]})")
+                else:
+                    print(f"  {entry['path']} (missing)")
+            if args.output:
+                import json
+                with open(args.output, 'w') as f:
+                    json.dump(info, f, indent=2)
+                print(f"\n📄 Cache info saved to: {args.output}")
+        elif args.cache_action == 'clear':
+            removed = clear_config_cache(args.config, args.cache_dir)
+            print(f"✓ Removed {removed} snapshot(s)")
+        elif args.cache_action == 'stats':
+            from caching.results import get_result_cache
+            stats = get_result_cache(args.config, args.cache_dir).stats()
+            print(f"Result cache: {stats['cache_dir']}")
+            print(f"Entries: {stats['entries']}/{stats['max_entries']} ({stats['total_bytes']} of {stats['max_bytes']} bytes)")
+            print(f"Hits: {stats.get('hits', 0)}, misses: {stats.get('misses', 0)}, hit rate: {stats['hit_rate']:.1%}")
+            print(f"Writes: {stats.get('writes', 0)}, evictions: {stats.get('evictions', 0)}")
+            for strategy, count in sorted(stats['by_strategy'].items()):
+                print(f"  {strategy}: {count}")
+            if args.output:
+                import json
+                with open(args.output, 'w') as f:
+                    json.dump(stats, f, indent=2)
+                print(f"\n📄 Cache stats saved to: {args.output}")
+        elif args.cache_action == 'purge':
+            from caching.results import get_result_cache
+            removed = get_result_cache(args.config, args.cache_dir).purge(args.strategy, args.older_than_days)
+            print(f"✓ Removed {removed} cached result(s)")
+        
+        return 0
+        
+    except Exception as e:
+        print(f"❌ Cache operation failed: {e}")
+        if args.verbose:
+            import traceback
+            traceback.print_exc()
+        return 1
+
+def run_serve_operation(args: argparse.Namespace) -> int:
+    """Run the scheduling service."""
+    try:
+        from service.server import serve
+        
+        preload = [args.config] if args.config and Path(args.config).exists() else []
+        strategies = [args.strategy] if args.strategy else ['greedy']
+        
+        print(f"\n🛰️  Scheduling service on http://{args.host}:{args.port}")
+        print(f"👷 Workers: {args.workers}")
+        print(f"📁 Preloaded config: {preload[0] if preload else 'none'}")
+        print("-" * 50)
+        
+        serve(host=args.host, port=args.port, workers=args.workers, preload=preload, strategies=strategies)
+        return 0
+        
+    except Exception as e:
+        print(f"❌ Serve operation failed: {e}")
+        if args.verbose:
+            import traceback
+            traceback.print_exc()
+        return 1
+
+def run_whatif_operation(args: argparse.Namespace) -> int:
+    """Run what-if scenario comparison operation."""
+    try:
+        import json
+        from scenarios import Scenario, compare_scenarios, run_scenarios
+        
+        strategy = args.strategy or 'greedy'
+        with open(args.scenarios, encoding='utf-8') as f:
+            scenarios = [Scenario.from_dict(entry) for entry in json.load(f)]
+        
+        print(f"\n🔀 What-if analysis of {len(scenarios)} scenarios with {strategy} strategy")
+        print(f"📁 Config: {args.config}")
+        print(f"👷 Workers: {args.workers}")
+        print("-" * 50)
+        
+        config = load_operation_config(args)
+        results = run_scenarios(config, scenarios, strategy, get_strategy_params(args), max_workers=args.workers)
+        table = compare_scenarios(results)
+        
+        for row in table:
+            print(f"\n{row['Scenario']} ({row['Changes']}):")
+            if row['Status'] != 'OK':
+                print(f"  {row['Status']}")
+                continue
+            print(f"  Scheduled: {row['Scheduled']}")
+            print(f"  Makespan: {row['Makespan']}")
+            print(f"  Penalty: {row['Total Penalty']} ({row['Penalty Change']})")
+            print(f"  Compliance: {row['Compliance']}, Quality: {row['Quality']}, Efficiency: {row['Efficiency']}")
+        
+        if args.output:
+            with open(args.output, 'w') as f:
+                json.dump(table, f, indent=2)
+            print(f"\n📄 Scenario comparison saved to: {args.output}")
+        
+        return 0 if all(result.metrics is not None for result in results) else 1
+        
+    except Exception as e:
+        print(f"❌ What-if operation failed: {e}")
+        if args.verbose:
+            import traceback
+            traceback.print_exc()
+        return 1
+
+def run_importtime_operation(args: argparse.Namespace) -> int:
+    """Run import-time profiling operation."""
+    try:
+        from profiling import measure_import_time, summarize_import_times
+        
+        target = args.target or 'schedule'
+        modules = ['core.models', 'core.config'] + OPERATION_MODULES.get(target, [])
+        if target == 'schedule' and args.strategy:
+            modules.append(f"schedulers.{args.strategy}")
+        
+        print(f"\n⏱️  Import times for {target} operation")
+        print(f"📦 Modules: {', '.join(modules)}")
+        print("-" * 50)
+        
+        src_path = str(Path(__file__).resolve().parent / "src")
+        timings = measure_import_time(modules, [src_path, str(Path(src_path).parent)])
+        summary = summarize_import_times(timings, args.top)
+        summary['target'] = target
+        summary['modules'] = modules
+        
+        print(f"Total: {summary['total_ms']:.1f} ms across {summary['module_count']} modules")
+        print("\nSlowest (cumulative):")
+        for entry in summary['top_cumulative']:
+            print(f"  {entry['cumulative_ms']:8.1f} ms  {entry['module']}")
+        print("\nSlowest (self):")
+        for entry in summary['top_self']:
+            print(f"  {entry['self_ms']:8.1f} ms  {entry['module']}")
+        if summary['heavy_packages']:
+            print(f"\n⚠️  Heavy packages loaded: {', '.join(summary['heavy_packages'])}")
+        else:
+            print("\n✓ No heavy packages loaded")
+        
+        if args.output:
+            import json
+            with open(args.output, 'w') as f:
+                json.dump(summary, f, indent=2)
+            print(f"\n📄 Import-time report saved to: {args.output}")
+        
+        return 0
+        
+    except Exception as e:
+        print(f"❌ Import-time operation failed: {e}")
+        if args.verbose:
+            import traceback
+            traceback.print_exc()
+        return 1
+
 def main():
     parser = argparse.ArgumentParser(
         description="Paper Planner Backend - Comprehensive backend operations",
@@ -467,6 +694,10 @@ Examples:
   %(prog)s monitor --config data/config.json --track-progress
   %(prog)s export --format csv --output exports/ --config data/config.json
   %(prog)s console --config data/config.json --interactive
+  %(prog)s cache --cache-action inspect --config data/config.json
+  %(prog)s serve --config data/config.json --workers 4
+  %(prog)s whatif --scenarios scenarios.json --config data/config.json
+  %(prog)s importtime --target schedule --strategy optimal
         """
     )
     
@@ -511,12 +742,22 @@ Examples:
         action='store_true',
         help='Compare multiple strategies (for schedule operation)'
     )
+    parser.add_argument(
+        '--archive',
+        type=str,
+        help='Append generated schedules to this columnar archive file (for schedule operation)'
+    )
     parser.add_argument(
         '--format',
-        choices=['csv', 'json'],
+        choices=['csv', 'json', 'html', 'png', 'all'],
         default='csv',
         help='Export format (for export operation)'
     )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Rewrite export files even when their inputs are unchanged (for export operation)'
+    )
     parser.add_argument(
         '--track-progress',
         action='store_true',
@@ -527,6 +768,76 @@ Examples:
         action='store_true',
         help='Enable interactive mode (for console operation)'
     )
+    parser.add_argument(
+        '--cache-action',
+        choices=['warm', 'inspect', 'clear', 'stats', 'purge'],
+        default='inspect',
+        help='Cache action: warm/inspect/clear the config snapshot, stats/purge the result cache (for cache operation)'
+    )
+    parser.add_argument(
+        '--older-than-days',
+        type=float,
+        help='Only purge results unused for this many days (for cache purge)'
+    )
+    parser.add_argument(
+        '--seed',
+        type=int,
+        help='Random seed (for random strategy)'
+    )
+    parser.add_argument(
+        '--lookahead-days',
+        type=int,
+        help='Lookahead window in days (for lookahead strategy)'
+    )
+    parser.add_argument(
+        '--randomness-factor',
+        type=float,
+        help='Randomness factor (for stochastic strategy)'
+    )
+    parser.add_argument(
+        '--cache-dir',
+        type=str,
+        help='Cache directory for snapshots and results (default: .cache next to the config file)'
+    )
+    parser.add_argument(
+        '--host',
+        type=str,
+        default='127.0.0.1',
+        help='Bind address (for serve operation)'
+    )
+    parser.add_argument(
+        '--port',
+        type=int,
+        default=8765,
+        help='Port (for serve operation)'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=2,
+        help='Worker processes (for serve and whatif operations)'
+    )
+    parser.add_argument(
+        '--scenarios',
+        type=str,
+        help='JSON file with a list of scenarios: name, config, deadline_shifts, submissions (for whatif operation)'
+    )
+    parser.add_argument(
+        '--target',
+        choices=[op for op in OPERATIONS if op != 'importtime'],
+        help='Operation to profile (for importtime operation, default: schedule)'
+    )
+    parser.add_argument(
+        '--top',
+        type=int,
+        default=15,
+        help='Number of slowest modules to list (for importtime operation)'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Bypass the config snapshot and result caches (forces a rebuild for cache warm)'
+    )
     
     args = parser.parse_args()
     
@@ -539,6 +850,8 @@ Examples:
             missing_required.append('strategy (or --compare)')
         elif required == 'config' and not args.config:
             missing_required.append('config file')
+        elif required == 'scenarios' and not args.scenarios:
+            missing_required.append('scenarios file')
     
     if missing_required:
         print(f"❌ Missing required arguments for {args.operation}: {', '.join(missing_required)}")
@@ -548,12 +861,12 @@ Examples:
         return 1
     
     # Check if config file exists
-    if not Path(args.config).exists():
+    if 'config' in operation_info['requires'] and not Path(args.config).exists():
         print(f"❌ Configuration file not found: {args.config}")
         return 1
     
-    # Setup environment
-    if not setup_env():
+    # Setup environment (profiling runs in a child interpreter and must not pre-import)
+    if args.operation != 'importtime' and not setup_env():
         return 1
     
     # Run the selected operation
@@ -563,7 +876,11 @@ Examples:
         'validate': run_validate_operation,
         'monitor': run_monitor_operation,
         'export': run_export_operation,
-        'console': run_console_operation
+        'console': run_console_operation,
+        'cache': run_cache_operation,
+        'serve': run_serve_operation,
+        'whatif': run_whatif_operation,
+        'importtime': run_importtime_operation
     }
     
     try:
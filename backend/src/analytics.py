@@ -7,7 +7,11 @@ import statistics
 from collections import defaultdict, deque
 from dataclasses import dataclass
 
+from core.graph import (
+    GraphAnalysis, analyze_config_graph, analyze_graph, analyze_structure, get_dependency_structure
+)
 from core.models import Config, Schedule, ScheduleMetrics, SubmissionType
+from caching.metrics import memoize_schedule_metric
 from validation.resources import _calculate_daily_load
 from core.constants import SCHEDULING_CONSTANTS, EFFICIENCY_CONSTANTS
 from validation.deadline import validate_deadline_constraints
@@ -28,7 +32,7 @@ class GraphNode:
 
 
 @dataclass
-class GraphAnalysis:
+class DependencyGraphReport:
     """Results of dependency graph analysis."""
     nodes: Dict[str, GraphNode]
     cycles: List[List[str]]
@@ -37,12 +41,14 @@ class GraphAnalysis:
     max_depth: int
     isolated_nodes: List[str]
     summary: str
+    timing: GraphAnalysis
 
 
 # ============================================================================
 # PUBLIC FUNCTIONS
 # ============================================================================
 
+@memoize_schedule_metric
 def generate_schedule_summary(schedule: Schedule, config: Config) -> ScheduleMetrics:
     """Generate comprehensive schedule analysis and metrics in one unified model."""
     if not schedule:
@@ -196,19 +202,21 @@ def generate_schedule_summary(schedule: Schedule, config: Config) -> ScheduleMet
 # PRIVATE HELPER FUNCTIONS
 # ============================================================================
 
-def _analyze_dependency_graph(config: Config) -> GraphAnalysis:
+def _analyze_dependency_graph(config: Config) -> DependencyGraphReport:
     """Analyze dependency graphs for submissions."""
     nodes = _build_dependency_graph(config)
     
     # Detect cycles
-    cycles = _detect_cycles(nodes)
-    
-    # Calculate depths
-    depths = _calculate_depths(nodes)
-    max_depth = max(depths.values()) if depths else 0
-    
-    # Find critical path
-    critical_path = _find_critical_path(nodes)
+    cycles = [list(cycle) for cycle in get_dependency_structure(config.submissions).cycles]
+    
+    # Depths, floats and the duration-weighted critical path in one pass
+    timing = analyze_config_graph(config)
+    max_depth = timing.max_depth
+    critical_path = timing.critical_path
+    for node_id, depth in timing.depths.items():
+        nodes[node_id].depth = depth
+    for node_id in critical_path:
+        nodes[node_id].critical_path = True
     
     # Find bottlenecks
     bottlenecks = _find_bottlenecks(nodes)
@@ -219,16 +227,18 @@ def _analyze_dependency_graph(config: Config) -> GraphAnalysis:
     # Generate summary
     summary = f"Graph Analysis: {len(nodes)} nodes, {len(cycles)} cycles, " \
              f"max depth {max_depth}, {len(bottlenecks)} bottlenecks, " \
-             f"{len(isolated_nodes)} isolated nodes"
+             f"{len(isolated_nodes)} isolated nodes, " \
+             f"critical path {timing.project_duration} days"
     
-    return GraphAnalysis(
+    return DependencyGraphReport(
         nodes=nodes,
         cycles=cycles,
         bottlenecks=bottlenecks,
         critical_path=critical_path,
         max_depth=max_depth,
         isolated_nodes=isolated_nodes,
-        summary=summary
+        summary=summary,
+        timing=timing
     )
 
 
@@ -257,135 +267,39 @@ def _build_dependency_graph(config: Config) -> Dict[str, GraphNode]:
 
 
 def _detect_cycles(nodes: Dict[str, GraphNode]) -> List[List[str]]:
-    """Detect cycles in the dependency graph."""
-    cycles = []
-    visited = set()
-    rec_stack = set()
-    
-    def dfs(node_id: str, path: List[str]) -> None:
-        if node_id in rec_stack:
-            # Found a cycle
-            cycle_start = path.index(node_id)
-            cycle = path[cycle_start:] + [node_id]
-            cycles.append(cycle)
-            return
-        
-        if node_id in visited:
-            return
-        
-        visited.add(node_id)
-        rec_stack.add(node_id)
-        path.append(node_id)
-        
-        node = nodes.get(node_id)
-        if node:
-            for dep_id in node.dependencies:
-                dfs(dep_id, path.copy())
-        
-        rec_stack.remove(node_id)
-    
-    for node_id in nodes:
-        if node_id not in visited:
-            dfs(node_id, [])
-    
-    return cycles
+    """Detect cycles in the dependency graph, one closed path per set of mutually dependent nodes."""
+    return analyze_structure({node_id: node.dependencies for node_id, node in nodes.items()}).cycles
 
 
 def _calculate_depths(nodes: Dict[str, GraphNode]) -> Dict[str, int]:
-    """Calculate the depth of each node in the dependency graph."""
-    depths = {}
-    in_degree = defaultdict(int)
-    
-    # Calculate in-degrees
-    for node in nodes.values():
-        for dep_id in node.dependencies:
-            in_degree[dep_id] += 1
+    """Calculate the depth of each node in the dependency graph.
     
-    # Topological sort with depth calculation
-    queue = deque()
-    for node_id in nodes:
-        if in_degree[node_id] == 0:
-            queue.append(node_id)
-            depths[node_id] = 0
-    
-    while queue:
-        node_id = queue.popleft()
-        current_depth = depths[node_id]
-        
-        node = nodes[node_id]
-        for dependent_id in node.dependents:
-            in_degree[dependent_id] -= 1
-            depths[dependent_id] = max(depths.get(dependent_id, 0), current_depth + 1)
-            
-            if in_degree[dependent_id] == 0:
-                queue.append(dependent_id)
+    Depth is the length of the longest dependency chain leading to a node;
+    nodes on or behind a cycle get no depth.
+    """
+    depths = _analyze_nodes(nodes).depths
     
     # Update node depths
     for node_id, depth in depths.items():
-        if node_id in nodes:
-            nodes[node_id].depth = depth
+        nodes[node_id].depth = depth
     
     return depths
 
 
 def _find_critical_path(nodes: Dict[str, GraphNode]) -> List[str]:
-    """Find the critical path in the dependency graph."""
-    depths = _calculate_depths(nodes)
-    max_depth = max(depths.values()) if depths else 0
-    
-    # Find nodes at maximum depth
-    max_depth_nodes = [node_id for node_id, depth in depths.items() if depth == max_depth]
-    
-    # Find the longest path to each max depth node
-    critical_path = []
-    max_path_length = 0
-    
-    for end_node in max_depth_nodes:
-        path = _find_longest_path_to_node(end_node, nodes)
-        if len(path) > max_path_length:
-            max_path_length = len(path)
-            critical_path = path
+    """Find the critical path: the longest dependency chain, from its root to its end."""
+    critical_path = _analyze_nodes(nodes).critical_path
     
     # Mark critical path nodes
     for node_id in critical_path:
-        if node_id in nodes:
-            nodes[node_id].critical_path = True
+        nodes[node_id].critical_path = True
     
     return critical_path
 
 
-def _find_longest_path_to_node(target_node: str, nodes: Dict[str, GraphNode]) -> List[str]:
-    """Find the longest path to a specific node."""
-    def dfs(node_id: str, path: List[str], visited: Set[str]) -> List[str]:
-        if node_id == target_node:
-            return path + [node_id]
-        
-        if node_id in visited:
-            return []
-        
-        visited.add(node_id)
-        longest_path = []
-        
-        node = nodes.get(node_id)
-        if node:
-            for dep_id in node.dependencies:
-                new_path = dfs(dep_id, path + [node_id], visited.copy())
-                if len(new_path) > len(longest_path):
-                    longest_path = new_path
-        
-        return longest_path
-    
-    # Start from nodes with no dependencies
-    start_nodes = [node_id for node_id, node in nodes.items() 
-                  if not node.dependencies]
-    
-    longest_path = []
-    for start_node in start_nodes:
-        path = dfs(start_node, [], set())
-        if len(path) > len(longest_path):
-            longest_path = path
-    
-    return longest_path
+def _analyze_nodes(nodes: Dict[str, GraphNode]) -> GraphAnalysis:
+    """Run the critical path method over graph nodes, counting each node as one unit."""
+    return analyze_graph({node_id: node.dependencies for node_id, node in nodes.items()})
 
 
 def _find_bottlenecks(nodes: Dict[str, GraphNode]) -> List[str]:
@@ -0,0 +1,74 @@
+"""Per-(schedule, config) memoization of metric and validation functions.
+
+Scoring functions call each other repeatedly for the same schedule: penalty
+scoring runs schedule validation, quality scoring runs it again and resource
+efficiency is computed several times per summary. Decorated functions are
+cached on the schedule's version number, which changes whenever its intervals
+change, and on the identity of the config object. Configs are assumed not to
+be modified between scoring calls; call ``clear_metrics_cache`` if they are.
+"""
+
+import functools
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Tuple, TypeVar
+
+from core.models import Config, Schedule
+
+MAX_MEMO_ENTRIES = 512
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# (function, schedule version, config id) -> (config, result)
+_MEMO: "OrderedDict[Tuple[str, int, int], Tuple[Config, Any]]" = OrderedDict()
+_STATS: Dict[str, Dict[str, int]] = {}
+_lock = threading.RLock()
+
+
+def memoize_schedule_metric(func: F) -> F:
+    """Cache a ``func(schedule, config)`` result until the schedule changes.
+
+    Calls with anything other than a non-empty Schedule and a Config, or with
+    extra arguments, are passed straight through.
+    """
+    name = f"{func.__module__}.{func.__qualname__}"
+
+    @functools.wraps(func)
+    def wrapper(schedule: Any, config: Any, *args: Any, **kwargs: Any) -> Any:
+        if args or kwargs or not isinstance(schedule, Schedule) or not isinstance(config, Config) or not schedule:
+            return func(schedule, config, *args, **kwargs)
+
+        key = (name, schedule.version, id(config))
+        with _lock:
+            cached = _MEMO.get(key)
+            # The stored config guards against a recycled id()
+            if cached is not None and cached[0] is config:
+                _MEMO.move_to_end(key)
+                _STATS.setdefault(name, {"hits": 0, "misses": 0})["hits"] += 1
+                return cached[1]
+
+        result = func(schedule, config)
+        with _lock:
+            _MEMO[key] = (config, result)
+            _MEMO.move_to_end(key)
+            while len(_MEMO) > MAX_MEMO_ENTRIES:
+                _MEMO.popitem(last=False)
+            _STATS.setdefault(name, {"hits": 0, "misses": 0})["misses"] += 1
+        return result
+
+    wrapper.__wrapped__ = func
+    return wrapper  # type: ignore[return-value]
+
+
+def get_metrics_cache_stats() -> Dict[str, Dict[str, int]]:
+    """Return hit/miss counts per memoized function."""
+    with _lock:
+        return {name: dict(counts) for name, counts in _STATS.items()}
+
+
+def clear_metrics_cache(reset_stats: bool = True) -> None:
+    """Drop all memoized results."""
+    with _lock:
+        _MEMO.clear()
+        if reset_stats:
+            _STATS.clear()
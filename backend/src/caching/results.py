@@ -0,0 +1,362 @@
+"""Content-addressed cache of scheduling results.
+
+A result is keyed on a canonical hash of the ``Config`` content, the strategy,
+the strategy parameters that affect its output, the date the schedule was
+computed for and a hash of the scheduling and scoring code. Each entry stores
+the ``Schedule``, its ``ScheduleMetrics`` and the conference assignments the
+scheduler made on the config's submissions, so a hit skips both scheduling
+and scoring and leaves the config as a fresh run would. Runs in which the
+strategy failed and fell back to another algorithm are not stored. Entries are evicted least-recently-used first once the cache
+exceeds its entry or byte budget.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import threading
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import pydantic
+
+from core.models import Config, Schedule, ScheduleMetrics, SchedulerStrategy
+
+RESULT_CACHE_VERSION = 2
+RESULT_SUFFIX = ".res"
+DEFAULT_RESULTS_DIRNAME = "results"
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+PICKLE_PROTOCOL = 5
+
+# Constructor parameters that change each strategy's output
+STRATEGY_PARAMS: Dict[str, Tuple[str, ...]] = {
+    SchedulerStrategy.RANDOM.value: ("seed",),
+    SchedulerStrategy.LOOKAHEAD.value: ("lookahead_days",),
+    SchedulerStrategy.STOCHASTIC.value: ("randomness_factor",),
+}
+
+# Submission fields schedulers set while assigning conferences
+ASSIGNMENT_FIELDS = ("conference_id", "preferred_kinds")
+
+# Modules whose source determines the schedule and metrics for a given input
+_CODE_SOURCES = ("core", "schedulers", "scoring", "validation", "analytics.py")
+_code_version: Optional[str] = None
+_stats_lock = threading.Lock()
+
+
+def get_code_version() -> str:
+    """Return a hash of the scheduling and scoring source code."""
+    global _code_version
+    if _code_version is None:
+        digest = hashlib.sha256(f"{RESULT_CACHE_VERSION}:{pydantic.VERSION}".encode())
+        src_root = Path(__file__).resolve().parent.parent
+        for relative in _CODE_SOURCES:
+            target = src_root / relative
+            files = sorted(target.rglob("*.py")) if target.is_dir() else [target]
+            for path in files:
+                digest.update(str(path.relative_to(src_root)).encode())
+                try:
+                    digest.update(path.read_bytes())
+                except OSError:
+                    continue
+        _code_version = digest.hexdigest()[:16]
+    return _code_version
+
+
+def get_config_hash(config: Config) -> str:
+    """Return a canonical hash of a Config's content."""
+    payload = json.dumps(config.model_dump(mode="json"), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def get_submission_assignments(config: Config) -> Dict[str, Dict[str, Any]]:
+    """Return the conference assignment fields of every submission."""
+    return {
+        submission.id: {name: getattr(submission, name) for name in ASSIGNMENT_FIELDS}
+        for submission in config.submissions
+    }
+
+
+def apply_submission_assignments(config: Config, assignments: Dict[str, Dict[str, Any]]) -> None:
+    """Set stored conference assignment fields on a config's submissions."""
+    for submission in config.submissions:
+        for name, value in assignments.get(submission.id, {}).items():
+            setattr(submission, name, value)
+
+
+def normalize_params(strategy: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Keep only the parameters the strategy accepts, dropping unset values."""
+    accepted = STRATEGY_PARAMS.get(strategy, ())
+    return {name: value for name, value in (params or {}).items() if name in accepted and value is not None}
+
+
+def is_cacheable(strategy: str, params: Optional[Dict[str, Any]] = None) -> bool:
+    """Return False for runs whose output is not reproducible (unseeded random)."""
+    return strategy != SchedulerStrategy.RANDOM.value or "seed" in normalize_params(strategy, params)
+
+
+def make_result_key(config: Config, strategy: str, params: Optional[Dict[str, Any]] = None,
+                    as_of: Optional[date] = None) -> str:
+    """
+    Build the cache key for a scheduling run.
+
+    Parameters
+    ----------
+    config : Config
+        Configuration to be scheduled (hashed before the scheduler mutates it)
+    strategy : str
+        Scheduler strategy name
+    params : Dict[str, Any], optional
+        Strategy parameters; ones the strategy ignores do not affect the key
+    as_of : date, optional
+        Date the schedule is computed for, defaults to today since schedulers
+        fall back to the current date
+
+    Returns
+    -------
+    str
+        Hex digest identifying the result
+    """
+    key_data = {
+        "config": get_config_hash(config),
+        "strategy": strategy,
+        "params": normalize_params(strategy, params),
+        "as_of": (as_of or date.today()).isoformat(),
+        "code": get_code_version(),
+    }
+    return hashlib.sha256(json.dumps(key_data, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class ScheduleResultCache:
+    """On-disk store of schedules and metrics with LRU eviction."""
+
+    def __init__(self, cache_dir: str, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+    def get(self, key: str) -> Optional[Tuple[Schedule, ScheduleMetrics]]:
+        """Return the cached schedule and metrics, or None on a miss."""
+        entry = self.get_entry(key)
+        return (entry["schedule"], entry["metrics"]) if entry is not None else None
+
+    def get_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the whole cached entry (schedule, metrics, assignments), or None on a miss."""
+        entry_file = self._entry_path(key)
+        try:
+            with open(entry_file, "rb") as f:
+                entry = pickle.load(f)
+            if entry.get("version") != RESULT_CACHE_VERSION:
+                raise ValueError("outdated result entry")
+            # Modification time doubles as the LRU timestamp
+            os.utime(entry_file)
+        except FileNotFoundError:
+            self._record("misses")
+            return None
+        except Exception as e:
+            print(f"Warning: Discarding unreadable result cache entry {entry_file}: {e}")
+            self._remove(entry_file)
+            self._record("misses")
+            return None
+        self._record("hits")
+        return entry
+
+    def put(self, key: str, schedule: Schedule, metrics: ScheduleMetrics, strategy: str = "",
+            params: Optional[Dict[str, Any]] = None,
+            assignments: Optional[Dict[str, Dict[str, Any]]] = None) -> None:
+        """Store a result and evict old entries beyond the budget."""
+        entry = {
+            "version": RESULT_CACHE_VERSION,
+            "strategy": strategy,
+            "params": params or {},
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "schedule": schedule,
+            "metrics": metrics,
+            "assignments": assignments or {},
+        }
+        try:
+            self._write_atomic(self._entry_path(key), pickle.dumps(entry, protocol=PICKLE_PROTOCOL))
+            self._record("writes")
+            self.evict()
+        except OSError as e:
+            print(f"Warning: Could not write result cache entry for {key[:12]}: {e}")
+
+    def evict(self) -> int:
+        """Remove least recently used entries until both budgets are met."""
+        entries = self._list_entries()
+        total_bytes = sum(size for _, size, _ in entries)
+        removed = 0
+        for path, size, _ in sorted(entries, key=lambda e: e[2]):
+            if len(entries) - removed <= self.max_entries and total_bytes <= self.max_bytes:
+                break
+            if self._remove(path):
+                removed += 1
+                total_bytes -= size
+        if removed:
+            self._record("evictions", removed)
+        return removed
+
+    def purge(self, strategy: Optional[str] = None, older_than_days: Optional[float] = None) -> int:
+        """Remove entries, optionally only for one strategy or unused for some days."""
+        cutoff = None
+        if older_than_days is not None:
+            cutoff = datetime.now().timestamp() - older_than_days * 86400
+        removed = 0
+        for path, _, last_used in self._list_entries():
+            if cutoff is not None and last_used >= cutoff:
+                continue
+            if strategy and self._read_strategy(path) != strategy:
+                continue
+            if self._remove(path):
+                removed += 1
+        if strategy is None and older_than_days is None:
+            self._remove(self.cache_dir / "stats.json")
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        """Summarize entries, size, per-strategy counts and hit/miss counters."""
+        entries = self._list_entries()
+        by_strategy: Dict[str, int] = {}
+        for path, _, _ in entries:
+            name = self._read_strategy(path) or "unknown"
+            by_strategy[name] = by_strategy.get(name, 0) + 1
+        counters = self._read_counters()
+        lookups = counters.get("hits", 0) + counters.get("misses", 0)
+        return {
+            "cache_dir": str(self.cache_dir),
+            "entries": len(entries),
+            "total_bytes": sum(size for _, size, _ in entries),
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "by_strategy": by_strategy,
+            "hit_rate": round(counters.get("hits", 0) / lookups, 3) if lookups else 0.0,
+            "code_version": get_code_version(),
+            **counters,
+        }
+
+    # ===== INTERNAL HELPERS =====
+
+    def _entry_path(self, key: str) -> Path:
+        """Return the file holding a key's entry."""
+        return self.cache_dir / f"{key}{RESULT_SUFFIX}"
+
+    def _list_entries(self) -> List[Tuple[Path, int, float]]:
+        """Return (path, size, last used) for every entry."""
+        entries = []
+        for path in self.cache_dir.glob(f"*{RESULT_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((path, stat.st_size, stat.st_mtime))
+        return entries
+
+    def _read_strategy(self, path: Path) -> Optional[str]:
+        """Return the strategy recorded in an entry."""
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f).get("strategy")
+        except Exception:
+            return None
+
+    def _read_counters(self) -> Dict[str, int]:
+        """Read the persisted hit/miss/write/eviction counters."""
+        try:
+            with open(self.cache_dir / "stats.json", "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _record(self, counter: str, amount: int = 1) -> None:
+        """Increment a persisted counter."""
+        with _stats_lock:
+            counters = self._read_counters()
+            counters[counter] = counters.get(counter, 0) + amount
+            try:
+                self._write_atomic(self.cache_dir / "stats.json", json.dumps(counters, sort_keys=True).encode("utf-8"))
+            except OSError:
+                pass
+
+    def _write_atomic(self, target: Path, data: bytes) -> None:
+        """Write a file atomically so readers never see a partial entry."""
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_name, target)
+        except BaseException:
+            self._remove(Path(tmp_name))
+            raise
+
+    @staticmethod
+    def _remove(path: Path) -> bool:
+        """Delete a file, ignoring ones already gone."""
+        try:
+            path.unlink()
+            return True
+        except OSError:
+            return False
+
+
+def get_result_cache(config_path: Optional[str] = None, cache_dir: Optional[str] = None) -> ScheduleResultCache:
+    """Return the result cache for a config, stored under its snapshot cache directory."""
+    if cache_dir:
+        directory = Path(cache_dir) / DEFAULT_RESULTS_DIRNAME
+    elif config_path:
+        from caching.snapshot import DEFAULT_CACHE_DIRNAME
+        directory = Path(config_path).resolve().parent / DEFAULT_CACHE_DIRNAME / DEFAULT_RESULTS_DIRNAME
+    else:
+        directory = Path.home() / ".paper_planner" / "cache" / DEFAULT_RESULTS_DIRNAME
+    return ScheduleResultCache(str(directory))
+
+
+def schedule_cached(
+    config: Config,
+    strategy: str,
+    params: Optional[Dict[str, Any]] = None,
+    cache: Optional[ScheduleResultCache] = None
+) -> Tuple[Schedule, ScheduleMetrics, bool]:
+    """
+    Schedule and score a config, reusing a cached result when available.
+
+    Parameters
+    ----------
+    config : Config
+        Configuration to schedule; the scheduler assigns conferences on its
+        submissions, and a cache hit applies the stored assignments instead
+    strategy : str
+        Scheduler strategy name
+    params : Dict[str, Any], optional
+        Strategy parameters (seed, lookahead_days, randomness_factor)
+    cache : ScheduleResultCache, optional
+        Cache to use; without one the run is never cached
+
+    Returns
+    -------
+    Tuple[Schedule, ScheduleMetrics, bool]
+        Schedule, its metrics and whether they came from the cache
+    """
+    options = normalize_params(strategy, params)
+    key = None
+    if cache is not None and is_cacheable(strategy, options):
+        # Hash before scheduling: schedulers assign conferences on the config
+        key = make_result_key(config, strategy, options)
+        entry = cache.get_entry(key)
+        if entry is not None:
+            apply_submission_assignments(config, entry["assignments"])
+            return entry["schedule"], entry["metrics"], True
+
+    from analytics import generate_schedule_summary
+    from schedulers.base import BaseScheduler
+
+    scheduler = BaseScheduler.create_scheduler(SchedulerStrategy(strategy), config, **options)
+    schedule = scheduler.schedule()
+    metrics = generate_schedule_summary(schedule, config)
+    # Empty schedules and fallbacks after a strategy failure may succeed on a retry
+    if key is not None and schedule.intervals and not scheduler.used_fallback:
+        cache.put(key, schedule, metrics, strategy, options, get_submission_assignments(config))
+    return schedule, metrics, False
@@ -0,0 +1,301 @@
+"""Binary snapshot cache for loaded configurations.
+
+``load_config`` re-reads every JSON input, parses every date and validates
+every model on each call. A snapshot stores the fully built ``Config`` as a
+pickle (protocol 5) behind a small versioned header, keyed on the paths,
+mtimes, sizes and content hashes of all inputs. Snapshots are rebuilt only
+when an input changes.
+
+File layout::
+
+    MAGIC (8 bytes) | header length (4 bytes, big endian) | header JSON | payload
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import struct
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import pydantic
+
+from core.config import load_config, resolve_data_paths
+from core.models import Config
+
+SNAPSHOT_MAGIC = b"PPCFGSNP"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_SUFFIX = ".snap"
+DEFAULT_CACHE_DIRNAME = ".cache"
+PICKLE_PROTOCOL = 5
+
+_HEADER_LENGTH = struct.Struct(">I")
+_HASH_CHUNK_SIZE = 1 << 20
+
+# Modules whose source defines how a snapshot payload is built and unpickled: the models,
+# and the loading, record reading and date parsing that decide what a loaded Config holds
+_SCHEMA_SOURCES = ("core/models.py", "core/config.py", "core/streaming.py", "core/dates.py")
+_schema_tag: Optional[str] = None
+
+
+def get_schema_tag() -> str:
+    """Return a tag identifying the snapshot format and model code."""
+    global _schema_tag
+    if _schema_tag is None:
+        digest = hashlib.sha256(f"{SNAPSHOT_VERSION}:{pydantic.VERSION}".encode())
+        src_root = Path(__file__).resolve().parent.parent
+        for relative in _SCHEMA_SOURCES:
+            try:
+                digest.update((src_root / relative).read_bytes())
+            except OSError:
+                digest.update(relative.encode())
+        _schema_tag = digest.hexdigest()[:16]
+    return _schema_tag
+
+
+def get_snapshot_path(config_path: str, cache_dir: Optional[str] = None) -> Path:
+    """Return the snapshot file used for a config file."""
+    config_file = Path(config_path).resolve()
+    directory = Path(cache_dir) if cache_dir else config_file.parent / DEFAULT_CACHE_DIRNAME
+    key = hashlib.sha256(str(config_file).encode("utf-8")).hexdigest()[:12]
+    return directory / f"{config_file.stem}-{key}{SNAPSHOT_SUFFIX}"
+
+
+def get_config_inputs(config_path: str) -> List[Path]:
+    """Return every file that contributes to the loaded Config."""
+    config_file = Path(config_path).resolve()
+    inputs = [config_file]
+    try:
+        with open(config_file, "r", encoding="utf-8") as f:
+            data_files = json.load(f).get("data_files", {})
+    except (OSError, ValueError, AttributeError):
+        return inputs
+    inputs.extend(resolve_data_paths(config_file.parent, data_files).values())
+    return inputs
+
+
+def get_input_signature(config_path: str) -> Tuple:
+    """Return (path, mtime_ns, size) for every config input, for cheap change checks."""
+    signature = []
+    for path in get_config_inputs(config_path):
+        try:
+            stat = path.stat()
+            signature.append((str(path), stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            signature.append((str(path), None, None))
+    return tuple(signature)
+
+
+def load_config_cached(config_path: str, cache_dir: Optional[str] = None) -> Config:
+    """Load a Config, using a valid snapshot when available.
+
+    Parameters
+    ----------
+    config_path : str
+        Path to the JSON configuration file.
+    cache_dir : str, optional
+        Directory holding snapshots. Defaults to ``.cache`` next to the config.
+
+    Returns
+    -------
+    Config
+        The loaded configuration. A fresh object is returned on every call,
+        so callers may mutate it freely.
+    """
+    if not Path(config_path).exists():
+        return load_config(config_path)
+
+    snapshot_file = get_snapshot_path(config_path, cache_dir)
+    status, header, payload = _check_snapshot(config_path, snapshot_file)
+    if status in ("fresh", "touched") and payload is not None:
+        try:
+            config = pickle.loads(payload)
+            if status == "touched":
+                # Content is unchanged; refresh stats so the next check is a stat only
+                header["inputs"] = _fingerprint_inputs(get_config_inputs(config_path))
+                _write_snapshot(snapshot_file, header, payload)
+            return config
+        except Exception as e:
+            print(f"Warning: Discarding unreadable config snapshot {snapshot_file}: {e}")
+
+    config, _ = _build_snapshot(config_path, snapshot_file)
+    return config
+
+
+def warm_config_cache(config_path: str, cache_dir: Optional[str] = None, force: bool = False) -> Dict[str, Any]:
+    """Build the snapshot for a config file if it is missing or stale."""
+    snapshot_file = get_snapshot_path(config_path, cache_dir)
+    status, _, _ = _check_snapshot(config_path, snapshot_file)
+    if force or status not in ("fresh", "touched"):
+        _build_snapshot(config_path, snapshot_file)
+        return {"snapshot": str(snapshot_file), "status": "rebuilt", "previous": status}
+    return {"snapshot": str(snapshot_file), "status": "fresh", "previous": status}
+
+
+def inspect_config_cache(config_path: str, cache_dir: Optional[str] = None) -> Dict[str, Any]:
+    """Describe the snapshot for a config file without modifying it."""
+    snapshot_file = get_snapshot_path(config_path, cache_dir)
+    status, header, payload = _check_snapshot(config_path, snapshot_file)
+    info: Dict[str, Any] = {"snapshot": str(snapshot_file), "status": status}
+    if header:
+        info.update({
+            "created_at": header.get("created_at"),
+            "schema": header.get("schema"),
+            "pydantic": header.get("pydantic"),
+            "submissions": header.get("submissions"),
+            "conferences": header.get("conferences"),
+            "inputs": header.get("inputs", []),
+        })
+    if payload is not None:
+        info["payload_bytes"] = len(payload)
+    return info
+
+
+def clear_config_cache(config_path: Optional[str] = None, cache_dir: Optional[str] = None) -> int:
+    """Remove snapshots for one config file, or every snapshot in ``cache_dir``."""
+    if config_path:
+        targets = [get_snapshot_path(config_path, cache_dir)]
+    elif cache_dir:
+        targets = list(Path(cache_dir).glob(f"*{SNAPSHOT_SUFFIX}"))
+    else:
+        return 0
+
+    removed = 0
+    for target in targets:
+        try:
+            target.unlink()
+            removed += 1
+        except FileNotFoundError:
+            continue
+    return removed
+
+
+# ============================================================================
+# INTERNAL HELPERS
+# ============================================================================
+
+def _hash_file(path: Path) -> str:
+    """Return the SHA-256 of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _fingerprint_inputs(paths: List[Path]) -> List[Dict[str, Any]]:
+    """Record path, mtime, size and content hash for each input."""
+    fingerprints = []
+    for path in paths:
+        try:
+            stat = path.stat()
+        except OSError:
+            fingerprints.append({"path": str(path), "exists": False})
+            continue
+        fingerprints.append({
+            "path": str(path),
+            "exists": True,
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": _hash_file(path),
+        })
+    return fingerprints
+
+
+def _compare_inputs(recorded: List[Dict[str, Any]], current_paths: List[Path]) -> str:
+    """Compare recorded fingerprints to the files on disk.
+
+    Returns ``fresh`` when every stat matches, ``touched`` when stats moved
+    but contents hash the same, and ``stale`` otherwise.
+    """
+    if [entry.get("path") for entry in recorded] != [str(p) for p in current_paths]:
+        return "stale"
+
+    touched = False
+    for entry, path in zip(recorded, current_paths):
+        try:
+            stat = path.stat()
+        except OSError:
+            if entry.get("exists"):
+                return "stale"
+            continue
+        if not entry.get("exists"):
+            return "stale"
+        if stat.st_mtime_ns == entry.get("mtime_ns") and stat.st_size == entry.get("size"):
+            continue
+        if stat.st_size != entry.get("size") or _hash_file(path) != entry.get("sha256"):
+            return "stale"
+        touched = True
+    return "touched" if touched else "fresh"
+
+
+def _read_snapshot(snapshot_file: Path) -> Tuple[Dict[str, Any], bytes]:
+    """Read and split a snapshot file into header and payload."""
+    with open(snapshot_file, "rb") as f:
+        data = f.read()
+    if not data.startswith(SNAPSHOT_MAGIC):
+        raise ValueError("not a config snapshot")
+    offset = len(SNAPSHOT_MAGIC)
+    (header_length,) = _HEADER_LENGTH.unpack_from(data, offset)
+    offset += _HEADER_LENGTH.size
+    header = json.loads(data[offset:offset + header_length].decode("utf-8"))
+    return header, data[offset + header_length:]
+
+
+def _write_snapshot(snapshot_file: Path, header: Dict[str, Any], payload: bytes) -> None:
+    """Write a snapshot atomically so readers never see a partial file."""
+    snapshot_file.parent.mkdir(parents=True, exist_ok=True)
+    header_bytes = json.dumps(header, sort_keys=True).encode("utf-8")
+    fd, tmp_name = tempfile.mkstemp(dir=snapshot_file.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(SNAPSHOT_MAGIC)
+            f.write(_HEADER_LENGTH.pack(len(header_bytes)))
+            f.write(header_bytes)
+            f.write(payload)
+        os.replace(tmp_name, snapshot_file)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def _check_snapshot(config_path: str, snapshot_file: Path) -> Tuple[str, Optional[Dict[str, Any]], Optional[bytes]]:
+    """Classify a snapshot as missing, invalid, outdated, stale, touched or fresh."""
+    if not snapshot_file.exists():
+        return "missing", None, None
+    try:
+        header, payload = _read_snapshot(snapshot_file)
+    except Exception:
+        return "invalid", None, None
+    if header.get("version") != SNAPSHOT_VERSION or header.get("schema") != get_schema_tag():
+        return "outdated", header, None
+    status = _compare_inputs(header.get("inputs", []), get_config_inputs(config_path))
+    return status, header, payload
+
+
+def _build_snapshot(config_path: str, snapshot_file: Path) -> Tuple[Config, Dict[str, Any]]:
+    """Load the config from JSON and store it as a snapshot."""
+    # Fingerprint before loading so an edit made during the load marks the snapshot stale
+    inputs = _fingerprint_inputs(get_config_inputs(config_path))
+    config = load_config(config_path)
+    payload = pickle.dumps(config, protocol=PICKLE_PROTOCOL)
+    header = {
+        "version": SNAPSHOT_VERSION,
+        "schema": get_schema_tag(),
+        "pydantic": pydantic.VERSION,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "submissions": len(config.submissions),
+        "conferences": len(config.conferences),
+        "inputs": inputs,
+    }
+    try:
+        _write_snapshot(snapshot_file, header, payload)
+    except OSError as e:
+        print(f"Warning: Could not write config snapshot {snapshot_file}: {e}")
+    return config, header
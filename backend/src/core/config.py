@@ -2,16 +2,23 @@
 
 import json
 import re
-from datetime import date, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-from dateutil.parser import parse as parse_date
+from typing import Any, Callable, Dict, List, Optional
 
 from core.models import (
     Conference, ConferenceRecurrence, ConferenceType, Config, Submission, 
     SubmissionType, SubmissionWorkflow
 )
 from core.constants import SCHEDULING_CONSTANTS, PENALTY_CONSTANTS
+from core.streaming import iter_json_records, iter_filtered_records
+from core.dates import (
+    parse_date_fast, get_date_parse_stats, expand_date_range, expand_recurring_dates
+)
+
+# Threads used by load_config to read and parse data files concurrently
+DATA_LOADER_WORKERS = 4
 
 # Regex patterns for robust ID matching
 MOD_ID_PATTERN = re.compile(r'^mod_(\d+)$')
@@ -69,9 +76,9 @@ def _build_deadlines_dict(conf_data: Dict) -> Dict[SubmissionType, date]:
     """Build deadlines dict from JSON data."""
     deadlines = {}
     if conf_data.get("full_paper_deadline"):
-        deadlines[SubmissionType.PAPER] = parse_date(conf_data["full_paper_deadline"]).date()
+        deadlines[SubmissionType.PAPER] = parse_date_fast(conf_data["full_paper_deadline"])
     if conf_data.get("abstract_deadline"):
-        deadlines[SubmissionType.ABSTRACT] = parse_date(conf_data["abstract_deadline"]).date()
+        deadlines[SubmissionType.ABSTRACT] = parse_date_fast(conf_data["abstract_deadline"])
     return deadlines
 
 
@@ -96,7 +103,7 @@ def _map_paper_data(json_data: Dict) -> Dict:
         "preferred_kinds": _parse_preferred_kinds(json_data),  # Preferred submission types
         "submission_workflow": _parse_submission_workflow(json_data),  # How this submission should be handled
         # Unified schema fields
-        "engineering_ready_date": parse_date(json_data["engineering_ready_date"]).date() if json_data.get("engineering_ready_date") else None,
+        "engineering_ready_date": parse_date_fast(json_data["engineering_ready_date"]) if json_data.get("engineering_ready_date") else None,
         "free_slack_months": json_data.get("free_slack_months", 1),
         "penalty_cost_per_month": json_data.get("penalty_cost_per_month", PENALTY_CONSTANTS.default_mod_penalty_per_day * SCHEDULING_CONSTANTS.days_per_month)
     }
@@ -106,7 +113,7 @@ def _map_mod_data(json_data: Dict) -> Dict:
     """Map JSON mod data to model fields."""
     engineering_ready_date = None
     if json_data.get("engineering_ready_date"):
-        engineering_ready_date = parse_date(json_data["engineering_ready_date"]).date()
+        engineering_ready_date = parse_date_fast(json_data["engineering_ready_date"])
     
     # Parse author field
     author = json_data.get("author", "pccp")
@@ -133,6 +140,22 @@ def _map_mod_data(json_data: Dict) -> Dict:
     }
 
 
+DEFAULT_DATA_FILES = {
+    "conferences": "data/conferences.json",
+    "mods": "data/mods.json",
+    "papers": "data/papers.json",
+    "blackouts": "data/blackout.json",
+}
+
+
+def resolve_data_paths(config_dir: Path, data_files: Dict[str, str]) -> Dict[str, Path]:
+    """Resolve data file paths relative to the config file directory."""
+    return {
+        key: Path(config_dir) / data_files.get(key, default)
+        for key, default in DEFAULT_DATA_FILES.items()
+    }
+
+
 def load_config(config_path: str) -> Config:
     """Load configuration from JSON file."""
     try:
@@ -143,40 +166,49 @@ def load_config(config_path: str) -> Config:
             return Config.create_default()
         
         print(f"DEBUG: Loading config from {config_path}")
+        parse_stats_before = get_date_parse_stats()
         with open(config_file, "r", encoding="utf-8") as f:
             config_data = json.load(f)
         
         # Load data files - use config file directory as base
-        config_dir = config_file.parent
         data_files = config_data.get("data_files", {})
-        conferences_path = config_dir / data_files.get("conferences", "data/conferences.json")
-        mods_path = config_dir / data_files.get("mods", "data/mods.json")
-        papers_path = config_dir / data_files.get("papers", "data/papers.json")
-        blackouts_path = config_dir / data_files.get("blackouts", "data/blackout.json")
+        data_paths = resolve_data_paths(config_file.parent, data_files)
+        conferences_path = data_paths["conferences"]
+        mods_path = data_paths["mods"]
+        papers_path = data_paths["papers"]
+        blackouts_path = data_paths["blackouts"]
         
         print("DEBUG: Data file paths:")
         print(f"  Conferences: {conferences_path} (exists: {conferences_path.exists()})")
         print(f"  Mods: {mods_path} (exists: {mods_path.exists()})")
         print(f"  Papers: {papers_path} (exists: {papers_path.exists()})")
         
-        # Load conferences with proper field mapping
-        conferences = _load_conferences(conferences_path)
-        print(f"DEBUG: Loaded {len(conferences)} conferences")
-        
-        # Load submissions with proper abstract-paper dependencies
-        submissions = _load_submissions_with_abstracts(
-            mods_path, papers_path, conferences, config_data
-        )
-        print(f"DEBUG: Loaded {len(submissions)} submissions")
-        
         # Load blackout dates only if enabled
         scheduling_options = config_data.get("scheduling_options", {})
         enable_blackout_periods = scheduling_options.get("enable_blackout_periods", False)
         
-        if enable_blackout_periods:
-            blackout_dates = _load_blackout_dates(blackouts_path)
-        else:
-            blackout_dates = []
+        # Read and parse the independent data files concurrently
+        filters = config_data.get("submission_filters")
+        with ThreadPoolExecutor(max_workers=DATA_LOADER_WORKERS, thread_name_prefix="config-loader") as executor:
+            conferences_future = executor.submit(_load_conferences, conferences_path)
+            mods_future = executor.submit(_load_mods, mods_path, filters)
+            papers_future = executor.submit(_load_papers, papers_path, filters)
+            blackouts_future = executor.submit(_load_blackout_dates, blackouts_path) if enable_blackout_periods else None
+            
+            conferences = conferences_future.result()
+            mods = mods_future.result()
+            papers = papers_future.result()
+            blackout_dates = blackouts_future.result() if blackouts_future else []
+        print(f"DEBUG: Loaded {len(conferences)} conferences")
+        
+        # Wire submissions once conferences are known
+        submissions = _wire_submissions(mods, papers, conferences, config_data)
+        print(f"DEBUG: Loaded {len(submissions)} submissions")
+        
+        parse_stats = get_date_parse_stats()
+        fallbacks = parse_stats["fallback"] - parse_stats_before["fallback"]
+        if fallbacks:
+            print(f"DEBUG: {fallbacks} non-ISO date(s) needed the slow dateutil parser")
         
         # Create config object
         config = Config(
@@ -217,7 +249,7 @@ def _load_blackout_dates(path: Path) -> List[date]:
         custom_dates = data.get("custom_dates", [])
         for date_str in custom_dates:
             try:
-                blackout_dates.append(parse_date(date_str).date())
+                blackout_dates.append(parse_date_fast(date_str))
             except (ValueError, TypeError):
                 continue
         
@@ -227,7 +259,7 @@ def _load_blackout_dates(path: Path) -> List[date]:
             if federal_holidays_key in data:
                 for date_str in data[federal_holidays_key]:
                     try:
-                        blackout_dates.append(parse_date(date_str).date())
+                        blackout_dates.append(parse_date_fast(date_str))
                     except (ValueError, TypeError):
                         continue
         
@@ -235,14 +267,11 @@ def _load_blackout_dates(path: Path) -> List[date]:
         custom_periods = data.get("custom_blackout_periods", [])
         for period in custom_periods:
             try:
-                start_date = parse_date(period["start"]).date()
-                end_date = parse_date(period["end"]).date()
-                current_date = start_date
-                while current_date <= end_date:
-                    blackout_dates.append(current_date)
-                    current_date += timedelta(days=1)
+                start_date = parse_date_fast(period["start"])
+                end_date = parse_date_fast(period["end"])
             except (KeyError, ValueError, TypeError):
                 continue
+            blackout_dates.extend(expand_date_range(start_date, end_date))
         
         # Load recurring holidays (old format)
         recurring_holidays = data.get("recurring_holidays", [])
@@ -265,10 +294,8 @@ def _load_recurring_holidays(recurring_holidays: List[Dict]) -> List[date]:
             day = holiday.get("day", 1)
             year = holiday.get("year", 2025)
             
-            # Add for multiple years
-            for year_offset in range(-1, 3):  # Previous year to 2 years ahead
-                holiday_date = date(year + year_offset, month, day)
-                holiday_dates.append(holiday_date)
+            # Add for multiple years: previous year to 2 years ahead
+            holiday_dates.extend(expand_recurring_dates(month, day, range(year - 1, year + 3)))
         except (ValueError, TypeError):
             continue
     
@@ -317,18 +344,28 @@ def _load_submissions_with_abstracts(
     
     Conference assignment happens during scheduling, not during loading.
     """
+    # Load both mods and papers - both need conference validation now
+    filters = config_data.get("submission_filters")
+    mods = _load_mods(mods_path, filters)
+    papers = _load_papers(papers_path, filters)
+    return _wire_submissions(mods, papers, conferences, config_data)
+
+
+def _wire_submissions(
+    mods: List[Submission],
+    papers: List[Submission],
+    conferences: List[Conference],
+    config_data: Dict[str, Any]
+) -> List[Submission]:
+    """Validate preferred conferences for loaded mods and papers and combine them."""
     submissions = []
-    
+
     # Load penalty costs
     penalty_costs = config_data.get("penalty_costs", {})
-    
+
     # Create a map of conference names for validation
     conference_names = {conf.name for conf in conferences}
-    
-    # Load both mods and papers - both need conference validation now
-    mods = _load_mods(mods_path)
-    papers = _load_papers(papers_path)
-    
+
     # Process all submissions (mods + papers) uniformly
     all_submissions = mods + papers
     for submission_data in all_submissions:
@@ -368,60 +405,73 @@ def _load_submissions_with_abstracts(
     return submissions
 
 
-def _load_mods(path: Path) -> List[Submission]:
-    """Load mods from JSON file with proper field mapping."""
-    mods = []
+def build_submission_filter(
+    filters: Optional[Dict[str, Any]], default_author: str
+) -> Optional[Callable[[Dict[str, Any]], bool]]:
+    """Build a predicate over raw submission records from author/conference filters.
     
-    if not path.exists():
-        return mods
+    ``filters`` may contain ``authors`` and/or ``conferences`` lists. A record
+    passes when its author (or ``default_author``) is listed and it references
+    at least one listed conference via ``preferred_conferences`` or
+    ``conference_id``. Returns None when no filtering is requested.
+    """
+    if not filters:
+        return None
+    authors = set(filters.get("authors") or [])
+    conferences = set(filters.get("conferences") or [])
+    if not authors and not conferences:
+        return None
     
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        
-        for mod_data in data:
-            try:
-                # Use the mapping function to transform JSON data to model fields
-                mapped_data = _map_mod_data(mod_data)
-                mod = Submission(**mapped_data)
-                mods.append(mod)
-                
-            except (KeyError, ValueError) as e:
-                print(f"Warning: Could not load mod {mod_data.get('id', 'unknown')}: {e}")
-                continue
-                
-    except Exception as e:
-        print(f"Warning: Could not load mods from {path}: {e}")
+    def matches(record: Dict[str, Any]) -> bool:
+        if authors and record.get("author", default_author) not in authors:
+            return False
+        if conferences:
+            referenced = set(record.get("preferred_conferences") or [])
+            if record.get("conference_id"):
+                referenced.add(record["conference_id"])
+            if not referenced & conferences:
+                return False
+        return True
     
-    return mods
+    return matches
+
+
+def _load_mods(path: Path, filters: Optional[Dict[str, Any]] = None) -> List[Submission]:
+    """Load mods from a JSON array or JSONL file, one record at a time."""
+    return _stream_submissions(path, _map_mod_data, "mod", build_submission_filter(filters, "pccp"))
 
 
-def _load_papers(path: Path) -> List[Submission]:
-    """Load papers from JSON file with proper field mapping."""
-    papers = []
+def _load_papers(path: Path, filters: Optional[Dict[str, Any]] = None) -> List[Submission]:
+    """Load papers from a JSON array or JSONL file, one record at a time."""
+    return _stream_submissions(path, _map_paper_data, "paper", build_submission_filter(filters, "ed"))
+
+
+def _stream_submissions(
+    path: Path,
+    mapper: Callable[[Dict], Dict],
+    label: str,
+    predicate: Optional[Callable[[Dict[str, Any]], bool]] = None
+) -> List[Submission]:
+    """Validate and convert streamed records into Submissions, keeping only filtered ones."""
+    submissions = []
     
     if not path.exists():
-        return papers
+        return submissions
     
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        
-        for paper_data in data:
+        for record in iter_filtered_records(iter_json_records(path), predicate):
             try:
                 # Use the mapping function to transform JSON data to model fields
-                mapped_data = _map_paper_data(paper_data)
-                paper = Submission(**mapped_data)
-                papers.append(paper)
-                
-            except (KeyError, ValueError) as e:
-                print(f"Warning: Could not load paper {paper_data.get('id', 'unknown')}: {e}")
+                submissions.append(Submission(**mapper(record)))
+            except (KeyError, ValueError, TypeError, AttributeError) as e:
+                record_id = record.get('id', 'unknown') if isinstance(record, dict) else 'unknown'
+                print(f"Warning: Could not load {label} {record_id}: {e}")
                 continue
                 
     except Exception as e:
-        print(f"Warning: Could not load papers from {path}: {e}")
+        print(f"Warning: Could not load {label}s from {path}: {e}")
     
-    return papers
+    return submissions
 
 
 def save_config(config: Config, config_path: str) -> None:
@@ -1,12 +1,107 @@
 """Date utilities for the paper planning system."""
 
-from typing import Optional, Dict, Union
+import threading
+from typing import Optional, Dict, List, Union, Iterable
 from datetime import date, timedelta, datetime
 
+from dateutil.parser import parse as dateutil_parse
+
 from core.models import Conference, SubmissionType
 from core.constants import SCHEDULING_CONSTANTS
 
 
+# Counters for parse_date_fast; guarded by a lock since data files may load concurrently
+_DATE_PARSE_STATS: Dict[str, int] = {"iso": 0, "fallback": 0, "failed": 0}
+_DATE_PARSE_LOCK = threading.Lock()
+
+
+def _record_date_parse(outcome: str) -> None:
+    """Increment a date parse counter."""
+    with _DATE_PARSE_LOCK:
+        _DATE_PARSE_STATS[outcome] += 1
+
+
+def parse_date_fast(value: Union[str, date, datetime]) -> date:
+    """
+    Parse a date, trying strict ISO 8601 before falling back to dateutil.
+    
+    Parameters
+    ----------
+    value : str | date | datetime
+        Date string (e.g. '2025-01-15' or '2025-01-15T09:00:00') or date object
+        
+    Returns
+    -------
+    date
+        Parsed calendar date
+        
+    Raises
+    ------
+    ValueError
+        If the value cannot be parsed by either path
+    TypeError
+        If the value is not a string or date
+    """
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if not isinstance(value, str):
+        raise TypeError(f"Cannot parse date from {type(value).__name__}")
+    
+    text = value.strip()
+    try:
+        parsed = date.fromisoformat(text)
+        _record_date_parse("iso")
+        return parsed
+    except ValueError:
+        pass
+    try:
+        parsed = datetime.fromisoformat(text).date()
+        _record_date_parse("iso")
+        return parsed
+    except ValueError:
+        pass
+    
+    try:
+        parsed = dateutil_parse(text).date()
+    except (ValueError, OverflowError) as e:
+        _record_date_parse("failed")
+        raise ValueError(f"Invalid date: {value!r}") from e
+    _record_date_parse("fallback")
+    return parsed
+
+
+def get_date_parse_stats() -> Dict[str, int]:
+    """Return counts of ISO, fallback and failed parses from parse_date_fast."""
+    with _DATE_PARSE_LOCK:
+        return dict(_DATE_PARSE_STATS)
+
+
+def reset_date_parse_stats() -> None:
+    """Reset the parse_date_fast counters."""
+    with _DATE_PARSE_LOCK:
+        for key in _DATE_PARSE_STATS:
+            _DATE_PARSE_STATS[key] = 0
+
+
+def expand_date_range(start_date: date, end_date: date) -> List[date]:
+    """Return every date from start_date to end_date inclusive."""
+    return [date.fromordinal(o) for o in range(start_date.toordinal(), end_date.toordinal() + 1)]
+
+
+def expand_recurring_dates(month: int, day: int, years: Iterable[int]) -> List[date]:
+    """Return a fixed month/day for each year, skipping years where it does not exist."""
+    dates = []
+    for year in years:
+        try:
+            dates.append(date(year, month, day))
+        except ValueError:
+            # e.g. Feb 29 outside leap years
+            continue
+    return dates
+
+
 def is_working_day(check_date: date, blackout_dates: list[date] | None = None) -> bool:
     """
     Check if a date is a working day (not weekend and not blackout).
@@ -0,0 +1,310 @@
+"""Structure and critical path analysis of the submission dependency graph.
+
+``analyze_structure`` finds the topological order, the strongly connected
+components and a witness path for every dependency cycle in one iterative
+pass of Tarjan's algorithm, so long dependency chains cannot hit Python's
+recursion limit. ``get_dependency_structure`` caches it per set of
+dependencies for the schedulers, validation and analytics.
+
+``analyze_graph`` runs the classic critical path method in O(V + E): one
+topological sort (Kahn), a forward pass for earliest start and finish, and a
+backward pass in reverse topological order for latest start and finish.
+Times are day offsets from the start of the project, with each submission
+taking its duration and starting no earlier than its ``lead_time_from_parents``
+after its latest dependency finishes. Submissions on or behind a dependency
+cycle cannot be ordered and are reported in ``cyclic`` instead.
+"""
+
+from __future__ import annotations
+import threading
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from core.models import Config, Submission
+
+# Dependency structures kept per distinct set of submission dependencies
+MAX_CACHED_STRUCTURES = 32
+
+
+@dataclass
+class DependencyStructure:
+    """Topological order, strongly connected components and cycles of a dependency graph."""
+    order: List[str] = field(default_factory=list)
+    components: List[List[str]] = field(default_factory=list)
+    cycles: List[List[str]] = field(default_factory=list)
+
+    @property
+    def has_cycles(self) -> bool:
+        """Whether any submissions depend on each other circularly."""
+        return bool(self.cycles)
+
+    @property
+    def cyclic(self) -> Set[str]:
+        """Submissions on a dependency cycle."""
+        return {node_id for component in self.components for node_id in component}
+
+
+@dataclass
+class GraphAnalysis:
+    """Depths, critical path method times and floats of a dependency graph."""
+    order: List[str] = field(default_factory=list)
+    durations: Dict[str, int] = field(default_factory=dict)
+    depths: Dict[str, int] = field(default_factory=dict)
+    earliest_start: Dict[str, int] = field(default_factory=dict)
+    earliest_finish: Dict[str, int] = field(default_factory=dict)
+    latest_start: Dict[str, int] = field(default_factory=dict)
+    latest_finish: Dict[str, int] = field(default_factory=dict)
+    total_float: Dict[str, int] = field(default_factory=dict)
+    free_float: Dict[str, int] = field(default_factory=dict)
+    critical_path: List[str] = field(default_factory=list)
+    project_duration: int = 0
+    cyclic: List[str] = field(default_factory=list)
+
+    @property
+    def max_depth(self) -> int:
+        """Length of the longest dependency chain, counted in edges."""
+        return max(self.depths.values(), default=0)
+
+    def is_critical(self, node_id: str) -> bool:
+        """Whether any delay to a submission delays the whole project."""
+        return self.total_float.get(node_id) == 0
+
+    def priority_key(self, node_id: str) -> Tuple[int, int]:
+        """Sort key putting the least total float first, then the earliest latest start.
+
+        Cyclic or unknown submissions sort last.
+        """
+        if node_id not in self.total_float:
+            return (self.project_duration + 1, 0)
+        return (self.total_float[node_id], self.latest_start[node_id])
+
+
+def analyze_structure(dependencies: Mapping[str, Iterable[str]]) -> DependencyStructure:
+    """
+    Find the topological order, cyclic components and cycle witnesses of a graph.
+
+    Parameters
+    ----------
+    dependencies : Mapping[str, Iterable[str]]
+        Node ID to the IDs it depends on; unknown IDs are ignored
+
+    Returns
+    -------
+    DependencyStructure
+        ``order`` holds every node with dependencies first, in depth-first
+        post-order from the nodes in mapping order, and the members of each
+        cycle next to each other; ``cycles`` holds one closed path per cyclic
+        component, following dependencies from its first member back to it
+    """
+    edges = {
+        node_id: [dep_id for dep_id in dict.fromkeys(deps or ()) if dep_id in dependencies]
+        for node_id, deps in dependencies.items()
+    }
+    index: Dict[str, int] = {}
+    lowlink: Dict[str, int] = {}
+    stack: List[str] = []
+    on_stack: Set[str] = set()
+    structure = DependencyStructure()
+
+    for root in edges:
+        if root in index:
+            continue
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        # Explicit DFS stack of (node, remaining dependencies) instead of recursion
+        work = [(root, iter(edges[root]))]
+        while work:
+            node_id, remaining = work[-1]
+            descended = False
+            for dep_id in remaining:
+                if dep_id not in index:
+                    index[dep_id] = lowlink[dep_id] = len(index)
+                    stack.append(dep_id)
+                    on_stack.add(dep_id)
+                    work.append((dep_id, iter(edges[dep_id])))
+                    descended = True
+                    break
+                if dep_id in on_stack:
+                    lowlink[node_id] = min(lowlink[node_id], index[dep_id])
+            if descended:
+                continue
+
+            work.pop()
+            if work:
+                parent_id = work[-1][0]
+                lowlink[parent_id] = min(lowlink[parent_id], lowlink[node_id])
+            if lowlink[node_id] != index[node_id]:
+                continue
+
+            # node_id roots a component; dependencies' components were all emitted before it
+            component: List[str] = []
+            while True:
+                member = stack.pop()
+                on_stack.discard(member)
+                component.append(member)
+                if member == node_id:
+                    break
+            component.reverse()
+            structure.order.extend(component)
+            if len(component) > 1 or node_id in edges[node_id]:
+                structure.components.append(component)
+                structure.cycles.append(_cycle_witness(component, edges))
+
+    return structure
+
+
+_structures: "OrderedDict[Tuple[Tuple[str, Tuple[str, ...]], ...], DependencyStructure]" = OrderedDict()
+_structures_lock = threading.Lock()
+
+
+def get_dependency_structure(submissions: Iterable[Submission]) -> DependencyStructure:
+    """Return the dependency structure of submissions, computing it once per set of dependencies."""
+    key = tuple((submission.id, tuple(submission.depends_on or ())) for submission in submissions)
+    with _structures_lock:
+        structure = _structures.get(key)
+        if structure is not None:
+            _structures.move_to_end(key)
+            return structure
+    structure = analyze_structure(dict(key))
+    with _structures_lock:
+        _structures[key] = structure
+        while len(_structures) > MAX_CACHED_STRUCTURES:
+            _structures.popitem(last=False)
+    return structure
+
+
+def clear_structure_cache() -> None:
+    """Drop all cached dependency structures."""
+    with _structures_lock:
+        _structures.clear()
+
+
+def analyze_graph(dependencies: Mapping[str, Iterable[str]], durations: Optional[Mapping[str, int]] = None,
+                  lags: Optional[Mapping[str, int]] = None) -> GraphAnalysis:
+    """
+    Run the critical path method over a dependency graph.
+
+    Parameters
+    ----------
+    dependencies : Mapping[str, Iterable[str]]
+        Node ID to the IDs it depends on; unknown IDs are ignored
+    durations : Mapping[str, int], optional
+        Duration of each node in days; 1 when omitted, which makes the
+        critical path the longest chain by node count
+    lags : Mapping[str, int], optional
+        Days a node waits after its dependencies finish
+
+    Returns
+    -------
+    GraphAnalysis
+        Times for every node outside a cycle, in topological order
+    """
+    durations = {node_id: max(0, int((durations or {}).get(node_id, 1))) for node_id in dependencies}
+    lags = {node_id: max(0, int((lags or {}).get(node_id, 0))) for node_id in dependencies}
+    parents: Dict[str, List[str]] = {
+        node_id: [dep_id for dep_id in dict.fromkeys(deps or ()) if dep_id in dependencies]
+        for node_id, deps in dependencies.items()
+    }
+    children: Dict[str, List[str]] = {node_id: [] for node_id in dependencies}
+    for node_id, deps in parents.items():
+        for dep_id in deps:
+            children[dep_id].append(node_id)
+
+    # Forward pass in Kahn order: depth, earliest start and the parent that fixes it
+    remaining = {node_id: len(deps) for node_id, deps in parents.items()}
+    queue = deque(node_id for node_id, count in remaining.items() if count == 0)
+    order: List[str] = []
+    depths = {node_id: 0 for node_id in queue}
+    earliest_start = {node_id: 0 for node_id in queue}
+    earliest_finish: Dict[str, int] = {}
+    driver: Dict[str, Optional[str]] = {node_id: None for node_id in queue}
+    while queue:
+        node_id = queue.popleft()
+        order.append(node_id)
+        finish = earliest_start[node_id] + durations[node_id]
+        earliest_finish[node_id] = finish
+        for child_id in children[node_id]:
+            start = finish + lags[child_id]
+            if child_id not in earliest_start or start > earliest_start[child_id]:
+                earliest_start[child_id] = start
+                driver[child_id] = node_id
+            depths[child_id] = max(depths.get(child_id, 0), depths[node_id] + 1)
+            remaining[child_id] -= 1
+            if remaining[child_id] == 0:
+                queue.append(child_id)
+
+    ordered = set(order)
+    cyclic = [node_id for node_id in dependencies if node_id not in ordered]
+    project_duration = max(earliest_finish.values(), default=0)
+
+    # Backward pass in reverse order: latest finish and start, then floats
+    latest_finish: Dict[str, int] = {}
+    latest_start: Dict[str, int] = {}
+    free_float: Dict[str, int] = {}
+    for node_id in reversed(order):
+        successors = [child_id for child_id in children[node_id] if child_id in ordered]
+        if successors:
+            latest_finish[node_id] = min(latest_start[child_id] - lags[child_id] for child_id in successors)
+            free_float[node_id] = min(earliest_start[child_id] - lags[child_id] for child_id in successors) \
+                - earliest_finish[node_id]
+        else:
+            latest_finish[node_id] = project_duration
+            free_float[node_id] = project_duration - earliest_finish[node_id]
+        latest_start[node_id] = latest_finish[node_id] - durations[node_id]
+    total_float = {node_id: latest_start[node_id] - earliest_start[node_id] for node_id in order}
+
+    # Critical path: from the first node finishing last, back through the parents that fixed each start
+    critical_path: List[str] = []
+    if order:
+        node: Optional[str] = next(node_id for node_id in order if earliest_finish[node_id] == project_duration)
+        while node is not None:
+            critical_path.append(node)
+            node = driver[node]
+        critical_path.reverse()
+
+    return GraphAnalysis(
+        order=order,
+        durations={node_id: durations[node_id] for node_id in order},
+        depths={node_id: depths[node_id] for node_id in order},
+        earliest_start={node_id: earliest_start[node_id] for node_id in order},
+        earliest_finish=earliest_finish,
+        latest_start={node_id: latest_start[node_id] for node_id in order},
+        latest_finish={node_id: latest_finish[node_id] for node_id in order},
+        total_float=total_float,
+        free_float={node_id: free_float[node_id] for node_id in order},
+        critical_path=critical_path,
+        project_duration=project_duration,
+        cyclic=cyclic
+    )
+
+
+def analyze_config_graph(config: Config) -> GraphAnalysis:
+    """Run the critical path method over a config's submissions, weighted by their durations."""
+    return analyze_graph(
+        {submission.id: submission.depends_on or [] for submission in config.submissions},
+        durations={submission.id: submission.get_duration_days(config) for submission in config.submissions},
+        lags={submission.id: submission.lead_time_from_parents or 0 for submission in config.submissions}
+    )
+
+
+def _cycle_witness(component: List[str], edges: Dict[str, List[str]]) -> List[str]:
+    """Shortest closed path from a cyclic component's first member back to itself."""
+    start = component[0]
+    members = set(component)
+    parents: Dict[str, Optional[str]] = {start: None}
+    queue = deque([start])
+    while queue:
+        node_id = queue.popleft()
+        for dep_id in edges[node_id]:
+            if dep_id == start:
+                path = [node_id]
+                while parents[path[-1]] is not None:
+                    path.append(parents[path[-1]])
+                path.reverse()
+                return path + [start]
+            if dep_id in members and dep_id not in parents:
+                parents[dep_id] = node_id
+                queue.append(dep_id)
+    return component + [start]
@@ -1,12 +1,13 @@
 """Core data types and models."""
 
 from __future__ import annotations
+import itertools
 from typing import Dict, List, Optional, Any
 from datetime import date, timedelta
 from enum import Enum
 from dateutil.parser import parse as parse_date
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, field_validator
 
 from core.constants import SCHEDULING_CONSTANTS, PENALTY_CONSTANTS, EFFICIENCY_CONSTANTS, SCORING_CONSTANTS, PRIORITY_CONSTANTS
 
@@ -51,6 +52,65 @@ class Interval(BaseModel):
     def duration_days(self) -> int:
         return (self.end_date - self.start_date).days
 
+# Process-wide counter so no two distinct interval mappings share a version
+_SCHEDULE_VERSIONS = itertools.count(1)
+
+
+class ScheduleIntervals(dict):
+    """Interval mapping that takes a new version number on every mutation.
+    
+    Metric memoization keys on the version, so intervals must be replaced
+    (``schedule.intervals[sid] = Interval(...)``) rather than edited in place.
+    """
+    
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.version = next(_SCHEDULE_VERSIONS)
+    
+    def _touch(self) -> None:
+        self.version = next(_SCHEDULE_VERSIONS)
+    
+    def __setitem__(self, key: str, value: Interval) -> None:
+        super().__setitem__(key, value)
+        self._touch()
+    
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self._touch()
+    
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        self._touch()
+    
+    def pop(self, *args: Any) -> Any:
+        value = super().pop(*args)
+        self._touch()
+        return value
+    
+    def popitem(self) -> Any:
+        item = super().popitem()
+        self._touch()
+        return item
+    
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        value = super().setdefault(key, default)
+        self._touch()
+        return value
+    
+    def clear(self) -> None:
+        super().clear()
+        self._touch()
+    
+    def __ior__(self, other: Any) -> 'ScheduleIntervals':
+        super().__ior__(other)
+        self._touch()
+        return self
+    
+    def __reduce__(self) -> Any:
+        # Unpickled copies (e.g. from worker processes) get a version from this process
+        return (ScheduleIntervals, (dict(self),))
+
+
 class Schedule(BaseModel):
     """A schedule mapping submission IDs to their time intervals."""
     model_config = ConfigDict(validate_assignment=True)
@@ -60,6 +120,20 @@ class Schedule(BaseModel):
         description="Submission ID -> Interval mapping"
     )
     
+    @field_validator('intervals', mode='after')
+    @classmethod
+    def _track_intervals(cls, intervals: Dict[str, Interval]) -> ScheduleIntervals:
+        """Wrap intervals so mutations bump the schedule version."""
+        return ScheduleIntervals(intervals)
+    
+    @property
+    def version(self) -> int:
+        """Version number that changes whenever the intervals change."""
+        if not isinstance(self.intervals, ScheduleIntervals):
+            # model_copy(update=...) and model_construct skip validation
+            self.__dict__['intervals'] = ScheduleIntervals(self.intervals)
+        return self.intervals.version
+    
     def add_interval(self, submission_id: str, start_date: date, end_date: Optional[date] = None, 
                     duration_days: Optional[int] = None) -> None:
         """Add or update an interval for a submission."""
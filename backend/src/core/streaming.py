@@ -0,0 +1,136 @@
+"""Incremental readers for large JSON and JSONL data files."""
+
+import json
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, TextIO
+
+try:
+    import ijson
+except ImportError:  # Optional dependency; the pure-Python reader is used instead
+    ijson = None
+
+JSONL_SUFFIXES = {".jsonl", ".ndjson"}
+DEFAULT_CHUNK_SIZE = 64 * 1024
+# Characters a single record may span before the pure-Python reader gives up on decoding it
+DEFAULT_MAX_RECORD_SIZE = 16 * 1024 * 1024
+
+_WHITESPACE = " \t\r\n"
+
+
+def iter_json_records(path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                      max_record_size: int = DEFAULT_MAX_RECORD_SIZE) -> Iterator[Any]:
+    """
+    Yield records from a JSON array or JSONL file one at a time.
+
+    Parameters
+    ----------
+    path : Path
+        File holding either a top-level JSON array or one JSON value per line
+    chunk_size : int
+        Number of characters read per chunk by the pure-Python reader
+    max_record_size : int
+        Largest record, in characters, the pure-Python reader buffers while
+        waiting for it to decode
+
+    Returns
+    -------
+    Iterator[Any]
+        Decoded records, in file order
+    """
+    path = Path(path)
+    with open(path, "r", encoding="utf-8-sig") as f:
+        first = _peek_first_char(f)
+        if not first:
+            return
+        is_array = first == "[" and path.suffix.lower() not in JSONL_SUFFIXES
+
+        if is_array and ijson is not None:
+            with open(path, "rb") as raw:
+                yield from ijson.items(raw, "item", use_float=True)
+            return
+
+        yield from _iter_decoded_values(f, is_array, chunk_size, max_record_size)
+
+
+def iter_filtered_records(
+    records: Iterable[Dict[str, Any]],
+    predicate: Optional[Callable[[Dict[str, Any]], bool]] = None
+) -> Iterator[Dict[str, Any]]:
+    """Yield raw records that pass the predicate, before any model is built."""
+    for record in records:
+        if predicate is None or predicate(record):
+            yield record
+
+
+def _peek_first_char(f: TextIO) -> str:
+    """Return the first non-whitespace character and leave the file positioned at it."""
+    while True:
+        position = f.tell()
+        char = f.read(1)
+        if not char:
+            return ""
+        if char in _WHITESPACE:
+            continue
+        f.seek(position)
+        return char
+
+
+def _iter_decoded_values(f: TextIO, in_array: bool, chunk_size: int, max_record_size: int) -> Iterator[Any]:
+    """Decode consecutive JSON values from a text stream using bounded buffering.
+
+    Decoded values are skipped by advancing ``position``; the consumed prefix is
+    only dropped when the next chunk is appended, so each character is copied a
+    bounded number of times.
+    """
+    decoder = json.JSONDecoder()
+    separators = _WHITESPACE + ("," if in_array else "")
+    buffer = ""
+    position = 0
+    eof = False
+
+    if in_array:
+        # Skip the opening bracket; the caller positioned the file on it
+        f.read(1)
+
+    while True:
+        while position < len(buffer) and buffer[position] in separators:
+            position += 1
+
+        if in_array and buffer[position:position + 1] == "]":
+            return
+
+        if position == len(buffer):
+            if eof:
+                if in_array:
+                    raise ValueError("Unterminated JSON array")
+                return
+            buffer = f.read(chunk_size)
+            position = 0
+            eof = not buffer
+            continue
+
+        try:
+            value, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            pending = len(buffer) - position
+            if pending > max_record_size:
+                raise ValueError(f"Malformed JSON record: no value decoded within {max_record_size} characters")
+            # Record spans the chunk boundary; read more, growing with the record size
+            chunk = f.read(max(chunk_size, pending))
+            eof = not chunk
+            buffer = buffer[position:] + chunk
+            position = 0
+            continue
+
+        if end == len(buffer) and not eof and not isinstance(value, (dict, list)):
+            # A bare scalar at the end of the buffer may continue in the next chunk
+            chunk = f.read(chunk_size)
+            eof = not chunk
+            buffer = buffer[position:] + chunk
+            position = 0
+            continue
+
+        yield value
+        position = end
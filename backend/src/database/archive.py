@@ -0,0 +1,337 @@
+"""Append-only columnar archive of generated schedules.
+
+Every schedule becomes one row group holding three columns (submission IDs
+and start/end days as little-endian int32 ordinals) behind a small JSON
+header carrying the name, strategy, creation time, metrics and min/max day
+statistics. Readers memory-map the file and walk the headers only, so
+filters on strategy or date range skip row groups without decoding them, and
+day columns are exposed as zero-copy views.
+
+File layout::
+
+    MAGIC (8 bytes)
+    row group*: GROUP_MAGIC (4) | header length (4) | header JSON
+                | submission IDs (UTF-8, newline separated) | start days | end days
+
+When pyarrow is installed, ``export_parquet`` converts an archive to Parquet
+for external tools.
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+import threading
+from array import array
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from core.models import Schedule, ScheduleMetrics
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows; appends are then only serialized within this process
+    fcntl = None
+
+ARCHIVE_MAGIC = b"PPARCH01"
+GROUP_MAGIC = b"RGRP"
+ARCHIVE_VERSION = 1
+
+_LENGTH = struct.Struct("<I")
+_NATIVE_LITTLE_ENDIAN = sys.byteorder == "little"
+
+DateLike = Union[date, str, None]
+
+
+@dataclass
+class ArchivedSchedule:
+    """One row group read from an archive."""
+    header: Dict[str, Any]
+    submission_ids: List[str]
+    start_days: Sequence[int]
+    end_days: Sequence[int]
+
+    @property
+    def strategy(self) -> str:
+        return self.header["strategy"]
+
+    @property
+    def metrics(self) -> Dict[str, Any]:
+        return self.header.get("metrics", {})
+
+    def to_schedule(self) -> Schedule:
+        """Rebuild the Schedule model."""
+        schedule = Schedule()
+        for sid, start, end in zip(self.submission_ids, self.start_days, self.end_days):
+            schedule.add_interval(sid, date.fromordinal(start), end_date=date.fromordinal(end))
+        return schedule
+
+
+class ScheduleArchive:
+    """Append-only columnar store of schedules with header-level filtering."""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    # ===== WRITING =====
+
+    def append(self, schedule: Schedule, strategy: str, name: str = "",
+               metrics: Optional[Union[ScheduleMetrics, Dict[str, Any]]] = None,
+               created_at: Optional[datetime] = None) -> None:
+        """Append one schedule as a new row group."""
+        self.append_many([(schedule, strategy, name, metrics, created_at)])
+
+    def append_many(self, entries: Iterable[Tuple[Schedule, str, str, Any, Optional[datetime]]]) -> int:
+        """
+        Append several schedules with a single write.
+
+        Parameters
+        ----------
+        entries : Iterable[Tuple[Schedule, str, str, metrics, datetime]]
+            (schedule, strategy, name, metrics, created_at) per schedule;
+            metrics may be a ScheduleMetrics, a dict or None
+
+        Returns
+        -------
+        int
+            Number of row groups written
+        """
+        groups = [_encode_group(*entry) for entry in entries]
+        if not groups:
+            return 0
+        data = b"".join(groups)
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a+b") as f:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+                try:
+                    # Drop the torn tail of an interrupted append, which readers would stop at
+                    size = os.fstat(f.fileno()).st_size
+                    complete = self._complete_length(f, size)
+                    if complete < size:
+                        print(f"Warning: Truncating {size - complete} bytes of incomplete data at the end of {self.path}")
+                        f.truncate(complete)
+                    if complete == 0:
+                        f.write(ARCHIVE_MAGIC)
+                    f.write(data)
+                    f.flush()
+                    os.fsync(f.fileno())
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        return len(groups)
+
+    # ===== READING =====
+
+    def headers(self, strategy: Optional[str] = None, start: DateLike = None, end: DateLike = None) -> List[Dict[str, Any]]:
+        """Return row group headers matching the filters without reading any columns."""
+        return [header for header, _, _ in self._matching_groups(strategy, start, end)]
+
+    def scan(self, strategy: Optional[str] = None, start: DateLike = None, end: DateLike = None) -> Iterator[ArchivedSchedule]:
+        """
+        Yield archived schedules overlapping a date range and/or with a strategy.
+
+        Row groups are filtered on their header statistics before their
+        columns are touched. Day columns are zero-copy views into the
+        memory-mapped file, which stays mapped while any view is alive.
+        """
+        if not self.path.exists() or self.path.stat().st_size == 0:
+            return
+        with open(self.path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(mapped)
+        try:
+            for header, offset, _ in self._matching_groups(strategy, start, end, mapped):
+                yield _decode_columns(header, view, offset)
+        finally:
+            view.release()
+            try:
+                mapped.close()
+            except BufferError:
+                pass  # Day columns handed out are still alive; the mapping is released with the last of them
+
+    def metrics_history(self, strategy: Optional[str] = None, start: DateLike = None,
+                        end: DateLike = None) -> List[Dict[str, Any]]:
+        """Return (created_at, name, strategy, metrics) per schedule from headers only."""
+        return [
+            {
+                "created_at": header["created_at"],
+                "name": header["name"],
+                "strategy": header["strategy"],
+                "rows": header["rows"],
+                **header.get("metrics", {}),
+            }
+            for header in self.headers(strategy, start, end)
+        ]
+
+    def stats(self) -> Dict[str, Any]:
+        """Summarize the archive: row groups, rows and schedules per strategy."""
+        headers = self.headers()
+        by_strategy: Dict[str, int] = {}
+        for header in headers:
+            by_strategy[header["strategy"]] = by_strategy.get(header["strategy"], 0) + 1
+        return {
+            "path": str(self.path),
+            "bytes": self.path.stat().st_size if self.path.exists() else 0,
+            "row_groups": len(headers),
+            "rows": sum(header["rows"] for header in headers),
+            "by_strategy": by_strategy,
+        }
+
+    # ===== INTERNAL HELPERS =====
+
+    def _matching_groups(self, strategy: Optional[str], start: DateLike, end: DateLike,
+                         mapped: Optional[mmap.mmap] = None) -> Iterator[Tuple[Dict[str, Any], int, int]]:
+        """Yield (header, column offset, group end) for groups passing the filters."""
+        start_day = _to_ordinal(start)
+        end_day = _to_ordinal(end)
+        for header, offset, group_end in self._iter_headers(mapped):
+            if strategy is not None and header["strategy"] != strategy:
+                continue
+            if header["rows"] == 0:
+                if start_day is not None or end_day is not None:
+                    continue
+            elif (start_day is not None and header["max_end"] < start_day) or (end_day is not None and header["min_start"] > end_day):
+                continue
+            yield header, offset, group_end
+
+    def _complete_length(self, f: Any, size: int) -> int:
+        """Length of the file up to the end of its last complete row group, 0 for an empty file."""
+        if size < len(ARCHIVE_MAGIC):
+            f.seek(0)
+            if not ARCHIVE_MAGIC.startswith(f.read()):
+                raise ValueError(f"{self.path} is not a schedule archive")
+            return 0
+        complete = len(ARCHIVE_MAGIC)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for _, _, group_end in self._iter_headers(mapped):
+                complete = group_end
+        return complete
+
+    def _iter_headers(self, mapped: Optional[mmap.mmap] = None) -> Iterator[Tuple[Dict[str, Any], int, int]]:
+        """Walk row group headers, skipping over column data."""
+        if mapped is None:
+            if not self.path.exists() or self.path.stat().st_size == 0:
+                return
+            with open(self.path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as own:
+                yield from self._iter_headers(own)
+            return
+
+        if mapped[:len(ARCHIVE_MAGIC)] != ARCHIVE_MAGIC:
+            raise ValueError(f"{self.path} is not a schedule archive")
+        offset = len(ARCHIVE_MAGIC)
+        size = len(mapped)
+        while offset < size:
+            prefix_end = offset + len(GROUP_MAGIC) + _LENGTH.size
+            if prefix_end > size or mapped[offset:offset + len(GROUP_MAGIC)] != GROUP_MAGIC:
+                print(f"Warning: Ignoring truncated data at byte {offset} of {self.path}")
+                return
+            (header_length,) = _LENGTH.unpack_from(mapped, offset + len(GROUP_MAGIC))
+            header_end = prefix_end + header_length
+            try:
+                header = json.loads(mapped[prefix_end:header_end].decode("utf-8"))
+                group_end = header_end + header["ids_bytes"] + 8 * header["rows"]
+            except (ValueError, KeyError):
+                print(f"Warning: Ignoring unreadable row group at byte {offset} of {self.path}")
+                return
+            if group_end > size:
+                print(f"Warning: Ignoring truncated row group at byte {offset} of {self.path}")
+                return
+            yield header, header_end, group_end
+            offset = group_end
+
+
+def export_parquet(archive_path: str, parquet_path: str) -> str:
+    """Convert an archive to a Parquet file with one row group per schedule (requires pyarrow)."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Parquet export requires pyarrow (pip install pyarrow)") from e
+
+    writer = None
+    try:
+        for group in ScheduleArchive(archive_path).scan():
+            rows = len(group.submission_ids)
+            table = pa.table({
+                "group": pa.array([group.header["group_id"]] * rows, pa.string()),
+                "strategy": pa.array([group.strategy] * rows, pa.string()),
+                "submission_id": pa.array(group.submission_ids, pa.string()),
+                "start_day": pa.array([date.fromordinal(day) for day in group.start_days], pa.date32()),
+                "end_day": pa.array([date.fromordinal(day) for day in group.end_days], pa.date32()),
+            })
+            if writer is None:
+                writer = pq.ParquetWriter(parquet_path, table.schema)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+    return parquet_path
+
+
+def _to_ordinal(value: DateLike) -> Optional[int]:
+    """Convert a date or ISO string filter to a day ordinal."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = date.fromisoformat(value)
+    return value.toordinal()
+
+
+def _encode_group(schedule: Schedule, strategy: str, name: str = "", metrics: Any = None,
+                  created_at: Optional[datetime] = None) -> bytes:
+    """Encode one schedule as a row group."""
+    intervals = sorted(schedule.intervals.items(), key=lambda item: item[1].start_date)
+    ids = "\n".join(sid for sid, _ in intervals).encode("utf-8")
+    starts = array("i", (interval.start_date.toordinal() for _, interval in intervals))
+    ends = array("i", (interval.end_date.toordinal() for _, interval in intervals))
+    min_start = min(starts) if intervals else None
+    max_end = max(ends) if intervals else None
+    if not _NATIVE_LITTLE_ENDIAN:
+        starts.byteswap()
+        ends.byteswap()
+
+    if isinstance(metrics, ScheduleMetrics):
+        metrics = metrics.model_dump(mode="json")
+    created = created_at or datetime.now()
+    header = {
+        "version": ARCHIVE_VERSION,
+        "group_id": f"{created.strftime('%Y%m%dT%H%M%S%f')}-{strategy}",
+        "name": name,
+        "strategy": strategy,
+        "created_at": created.isoformat(timespec="seconds"),
+        "rows": len(intervals),
+        "ids_bytes": len(ids),
+        "min_start": min_start,
+        "max_end": max_end,
+        "metrics": _scalar_metrics(metrics or {}),
+    }
+    header_bytes = json.dumps(header, sort_keys=True).encode("utf-8")
+    return b"".join((GROUP_MAGIC, _LENGTH.pack(len(header_bytes)), header_bytes, ids, starts.tobytes(), ends.tobytes()))
+
+
+def _scalar_metrics(metrics: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only scalar metrics in headers; distributions stay out of the index."""
+    return {key: value for key, value in metrics.items() if isinstance(value, (int, float, str, bool)) or value is None}
+
+
+def _decode_columns(header: Dict[str, Any], view: memoryview, offset: int) -> ArchivedSchedule:
+    """Decode a row group's columns from the mapped file."""
+    rows = header["rows"]
+    ids_end = offset + header["ids_bytes"]
+    ids = bytes(view[offset:ids_end]).decode("utf-8").split("\n") if rows else []
+    starts_end = ids_end + 4 * rows
+    if _NATIVE_LITTLE_ENDIAN:
+        starts: Sequence[int] = view[ids_end:starts_end].cast("i")
+        ends: Sequence[int] = view[starts_end:starts_end + 4 * rows].cast("i")
+    else:
+        starts = array("i", view[ids_end:starts_end])
+        ends = array("i", view[starts_end:starts_end + 4 * rows])
+        starts.byteswap()
+        ends.byteswap()
+    return ArchivedSchedule(header=header, submission_ids=ids, start_days=starts, end_days=ends)
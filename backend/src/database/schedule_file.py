@@ -0,0 +1,169 @@
+"""Fixed-width binary schedule files that can be memory-mapped and sliced by date.
+
+Records are sorted by start day, so a date window is found with two binary
+searches over the mapped file instead of parsing the whole schedule. The
+header stores the longest interval, which bounds how far before the window
+an overlapping interval can start.
+
+File layout (little endian)::
+
+    MAGIC (8) | version (u32) | record count (u32) | id width (u32) | max duration days (i32)
+    record*: start day (i32 ordinal) | end day (i32 ordinal) | submission ID (UTF-8, NUL padded)
+"""
+
+import mmap
+import os
+import struct
+import tempfile
+from bisect import bisect_left, bisect_right
+from datetime import date
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+from core.models import Schedule
+
+SCHEDULE_FILE_MAGIC = b"PPSCHF01"
+SCHEDULE_FILE_VERSION = 1
+SCHEDULE_FILE_SUFFIX = ".ppsf"
+
+_HEADER = struct.Struct("<8sIIIi")
+_DAYS = struct.Struct("<ii")
+
+
+def write_schedule_file(schedule: Schedule, path: str) -> str:
+    """
+    Write a schedule as a fixed-width binary file sorted by start date.
+
+    Parameters
+    ----------
+    schedule : Schedule
+        Schedule to store
+    path : str
+        Destination file; written atomically
+
+    Returns
+    -------
+    str
+        The path written
+    """
+    entries = sorted(
+        (interval.start_date.toordinal(), interval.end_date.toordinal(), sid.encode("utf-8"))
+        for sid, interval in schedule.intervals.items()
+    )
+    id_width = max((len(sid) for _, _, sid in entries), default=0)
+    max_duration = max((end - start for start, end, _ in entries), default=0)
+    record = struct.Struct(f"<ii{id_width}s")
+
+    buffer = bytearray(_HEADER.size + record.size * len(entries))
+    _HEADER.pack_into(buffer, 0, SCHEDULE_FILE_MAGIC, SCHEDULE_FILE_VERSION, len(entries), id_width, max_duration)
+    offset = _HEADER.size
+    for start, end, sid in entries:
+        record.pack_into(buffer, offset, start, end, sid)
+        offset += record.size
+
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(buffer)
+        os.replace(tmp_name, target)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+    return str(target)
+
+
+class _StartDays:
+    """Read-only sequence view of the start-day column, for bisect."""
+
+    def __init__(self, mapped: mmap.mmap, count: int, record_size: int):
+        self._mapped = mapped
+        self._count = count
+        self._record_size = record_size
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> int:
+        return _DAYS.unpack_from(self._mapped, _HEADER.size + index * self._record_size)[0]
+
+
+class MappedScheduleFile:
+    """Memory-mapped reader for files written by ``write_schedule_file``."""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, count, id_width, max_duration = _HEADER.unpack_from(self._mapped, 0)
+        except struct.error as e:
+            self._mapped.close()
+            raise ValueError(f"{path} is not a schedule file") from e
+        if magic != SCHEDULE_FILE_MAGIC or version != SCHEDULE_FILE_VERSION:
+            self._mapped.close()
+            raise ValueError(f"{path} is not a version {SCHEDULE_FILE_VERSION} schedule file")
+        self._record = struct.Struct(f"<ii{id_width}s")
+        if len(self._mapped) < _HEADER.size + count * self._record.size:
+            self._mapped.close()
+            raise ValueError(f"{path} is truncated")
+        self._count = count
+        self.max_duration_days = max_duration
+        self._starts = _StartDays(self._mapped, count, self._record.size)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __enter__(self) -> "MappedScheduleFile":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Unmap the file."""
+        self._mapped.close()
+
+    @property
+    def start_date(self) -> Optional[date]:
+        """Earliest start date in the file."""
+        return date.fromordinal(self._starts[0]) if self._count else None
+
+    def window_indices(self, start: Optional[date] = None, end: Optional[date] = None) -> Tuple[int, int]:
+        """Return the record range whose starts could overlap [start, end]."""
+        lo = 0 if start is None else bisect_left(self._starts, start.toordinal() - self.max_duration_days)
+        hi = self._count if end is None else bisect_right(self._starts, end.toordinal())
+        return lo, hi
+
+    def iter_window(self, start: Optional[date] = None, end: Optional[date] = None) -> Iterator[Tuple[str, date, date]]:
+        """Yield (submission_id, start_date, end_date) for intervals overlapping [start, end]."""
+        lo, hi = self.window_indices(start, end)
+        start_day = start.toordinal() if start else None
+        for index in range(lo, hi):
+            first, last, raw_id = self._record.unpack_from(self._mapped, _HEADER.size + index * self._record.size)
+            if start_day is not None and last < start_day:
+                continue
+            yield raw_id.rstrip(b"\0").decode("utf-8"), date.fromordinal(first), date.fromordinal(last)
+
+    def window(self, start: Optional[date] = None, end: Optional[date] = None) -> Schedule:
+        """Build a Schedule of the intervals overlapping [start, end] (inclusive)."""
+        schedule = Schedule()
+        intervals = {}
+        for sid, first, last in self.iter_window(start, end):
+            intervals[sid] = {"start_date": first, "end_date": last}
+        schedule.intervals = intervals
+        return schedule
+
+    def to_schedule(self) -> Schedule:
+        """Build the full Schedule."""
+        return self.window()
+
+
+def read_schedule_window(path: str, start: Optional[date] = None, end: Optional[date] = None) -> Schedule:
+    """Read the part of a schedule file overlapping [start, end]."""
+    with MappedScheduleFile(path) as schedule_file:
+        return schedule_file.window(start, end)
@@ -2,12 +2,13 @@
 SQLite database models for Paper Planner using SQLModel ORM.
 """
 
-from datetime import date, datetime, timedelta
-from typing import Dict, List, Optional, Any
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Optional, Any, Iterable, Tuple
 from pathlib import Path
 import json
 
-from sqlmodel import SQLModel, Field, Session, select
+from sqlmodel import SQLModel, Field
+from sqlalchemy import Index, delete, insert, select
 from sqlalchemy.sql import func
 from database.session import engine as default_engine
 from core.constants import SCHEDULING_CONSTANTS
@@ -17,8 +18,8 @@ class ScheduleBase(SQLModel):
     """Base model for schedules."""
     name: str = Field(index=True)
     strategy: str = Field(index=True)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow, sa_column_kwargs={"onupdate": func.now()})
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), sa_column_kwargs={"onupdate": func.now()})
 
 class Schedule(ScheduleBase, table=True):
     """Schedule table model."""
@@ -34,6 +35,8 @@ class ScheduleItemBase(SQLModel):
 
 class ScheduleItem(ScheduleItemBase, table=True):
     """Schedule item table model."""
+    __table_args__ = (Index("ix_scheduleitem_schedule_submission", "schedule_id", "submission_id"),)
+    
     id: Optional[int] = Field(default=None, primary_key=True)
     schedule_id: Optional[int] = Field(default=None, foreign_key="schedule.id")
 
@@ -46,75 +49,100 @@ class Configuration(ConfigurationBase, table=True):
     """Configuration table model."""
     id: Optional[int] = Field(default=None, primary_key=True)
 
+# (name, strategy, schedule, config) as accepted by ScheduleDatabase.save_many
+ScheduleEntry = Tuple[str, str, Any, Dict[str, Any]]
+
+# Column order of the positional item rows built by _item_rows
+ITEM_COLUMNS = ("schedule_id", "submission_id", "start_date", "end_date", "duration_days", "row_position")
+
 # Database Manager
 class ScheduleDatabase:
-    """SQLModel-based database manager for Paper Planner."""
+    """SQLModel-based database manager for Paper Planner.
+    
+    Tables are defined with SQLModel, but reads and writes go through
+    SQLAlchemy Core so schedule items are inserted with a single
+    executemany and loaded as plain rows instead of ORM objects.
+    """
     
     def __init__(self, engine=None):
-        """Initialize database connection."""
+        """Initialize database connection and make sure tables and indexes exist."""
         if engine is None:
             self.engine = default_engine
         else:
             self.engine = engine
+        self.create_schema()
+    
+    def create_schema(self) -> None:
+        """Create missing tables and indexes, including indexes added to existing tables."""
+        SQLModel.metadata.create_all(self.engine)
+        for index in ScheduleItem.__table__.indexes:
+            index.create(self.engine, checkfirst=True)
     
     def save_schedule(self, name: str, strategy: str, schedule: Schedule, 
                      config: Dict[str, Any]) -> int:
         """Save a schedule to the database."""
-        with Session(self.engine) as session:
-            # Create schedule
-            schedule_obj = Schedule(name=name, strategy=strategy)
-            session.add(schedule_obj)
-            session.commit()
-            session.refresh(schedule_obj)
-            
-            schedule_id = schedule_obj.id
-            if schedule_id is None:
-                raise RuntimeError("Failed to get schedule ID")
+        return self.save_many([(name, strategy, schedule, config)])[0]
+    
+    def save_many(self, entries: Iterable[ScheduleEntry]) -> List[int]:
+        """
+        Save several schedules in one transaction.
+        
+        Parameters
+        ----------
+        entries : Iterable[Tuple[str, str, Schedule, Dict[str, Any]]]
+            (name, strategy, schedule, config) for each schedule, e.g. every
+            result of a strategy comparison or a seed portfolio
             
-            # Create schedule items
-            for submission_id, interval in schedule.intervals.items():
-                end_date = interval.start_date + timedelta(days=SCHEDULING_CONSTANTS.poster_duration_days)
-                item = ScheduleItem(
-                    schedule_id=schedule_id,
-                    submission_id=submission_id,
-                    start_date=interval.start_date,
-                    end_date=end_date,
-                    duration_days=SCHEDULING_CONSTANTS.poster_duration_days,
-                    row_position=0
+        Returns
+        -------
+        List[int]
+            Schedule IDs in the order given
+        """
+        schedule_ids = []
+        with self.engine.begin() as conn:
+            for name, strategy, schedule, config in entries:
+                now = datetime.now(timezone.utc)
+                result = conn.execute(
+                    insert(Schedule.__table__).values(name=name, strategy=strategy, created_at=now, updated_at=now)
                 )
-                session.add(item)
-            
-            # Create configuration
-            config_json = json.dumps(config, default=str)
-            config_obj = Configuration(
-                name=f"{name}_config",
-                config_data=config_json
-            )
-            session.add(config_obj)
-            
-            session.commit()
-            return schedule_id
+                schedule_id = result.inserted_primary_key[0]
+                if schedule_id is None:
+                    raise RuntimeError("Failed to get schedule ID")
+                
+                # Create schedule items with a single executemany
+                self._insert_items(conn, schedule_id, schedule)
+                
+                # Create configuration
+                conn.execute(
+                    insert(Configuration.__table__).values(
+                        name=f"{name}_config",
+                        config_data=json.dumps(config, default=str)
+                    )
+                )
+                schedule_ids.append(schedule_id)
+        return schedule_ids
     
     def load_schedule(self, schedule_id: int) -> Optional[Dict[str, Any]]:
         """Load a schedule from the database."""
-        with Session(self.engine) as session:
+        schedule_table = Schedule.__table__
+        with self.engine.connect() as conn:
             # Get schedule
-            schedule = session.get(Schedule, schedule_id)
+            schedule = conn.execute(
+                select(schedule_table.c.name, schedule_table.c.strategy, schedule_table.c.created_at)
+                .where(schedule_table.c.id == schedule_id)
+            ).first()
             if not schedule:
                 return None
             
-            # Get schedule items
-            statement = select(ScheduleItem).where(ScheduleItem.schedule_id == schedule_id)
-            items = session.exec(statement).all()
-            
-            schedule_dict = {}
-            for item in items:
-                schedule_dict[item.submission_id] = item.start_date
+            # Get schedule items as (submission_id, start_date) rows
+            schedule_dict = self._load_items(conn, schedule_id)
             
             # Get configuration
-            config_statement = select(Configuration).where(Configuration.name == f"{schedule.name}_config")
-            config_obj = session.exec(config_statement).first()
-            config = json.loads(config_obj.config_data) if config_obj else {}
+            config_data = conn.execute(
+                select(Configuration.__table__.c.config_data)
+                .where(Configuration.__table__.c.name == f"{schedule.name}_config")
+            ).scalar()
+            config = json.loads(config_data) if config_data else {}
             
             return {
                 'id': schedule_id,
@@ -127,49 +155,73 @@ class ScheduleDatabase:
     
     def list_schedules(self) -> List[Dict[str, Any]]:
         """List all available schedules."""
-        with Session(self.engine) as session:
-            statement = select(Schedule).order_by(Schedule.created_at.desc())
-            schedules = session.exec(statement).all()
-            
-            return [
-                {
-                    'id': s.id,
-                    'name': s.name,
-                    'strategy': s.strategy,
-                    'created_at': s.created_at,
-                    'updated_at': s.updated_at
-                }
-                for s in schedules
-            ]
+        schedule_table = Schedule.__table__
+        with self.engine.connect() as conn:
+            rows = conn.execute(
+                select(
+                    schedule_table.c.id,
+                    schedule_table.c.name,
+                    schedule_table.c.strategy,
+                    schedule_table.c.created_at,
+                    schedule_table.c.updated_at
+                ).order_by(schedule_table.c.created_at.desc())
+            )
+            return [dict(row) for row in rows.mappings()]
     
     def delete_schedule(self, schedule_id: int) -> bool:
         """Delete a schedule from the database."""
         try:
-            with Session(self.engine) as session:
+            with self.engine.begin() as conn:
                 # Get schedule
-                schedule = session.get(Schedule, schedule_id)
-                if not schedule:
+                name = conn.execute(
+                    select(Schedule.__table__.c.name).where(Schedule.__table__.c.id == schedule_id)
+                ).scalar()
+                if name is None:
                     return False
                 
-                # Delete related items
-                statement = select(ScheduleItem).where(ScheduleItem.schedule_id == schedule_id)
-                items = session.exec(statement).all()
-                for item in items:
-                    session.delete(item)
-                
-                # Delete configuration
-                config_statement = select(Configuration).where(Configuration.name == f"{schedule.name}_config")
-                config_obj = session.exec(config_statement).first()
-                if config_obj:
-                    session.delete(config_obj)
-                
-                # Delete schedule
-                session.delete(schedule)
-                session.commit()
+                # Delete related items, configuration and schedule
+                conn.execute(delete(ScheduleItem.__table__).where(ScheduleItem.__table__.c.schedule_id == schedule_id))
+                conn.execute(delete(Configuration.__table__).where(Configuration.__table__.c.name == f"{name}_config"))
+                conn.execute(delete(Schedule.__table__).where(Schedule.__table__.c.id == schedule_id))
                 return True
         except Exception:
             return False
     
+    def _insert_items(self, conn, schedule_id: int, schedule: Schedule) -> None:
+        """Insert all items of a schedule in one executemany."""
+        duration_days = SCHEDULING_CONSTANTS.poster_duration_days
+        duration = timedelta(days=duration_days)
+        rows = [
+            (schedule_id, submission_id, interval.start_date, interval.start_date + duration, duration_days, 0)
+            for submission_id, interval in schedule.intervals.items()
+        ]
+        if not rows:
+            return
+        if conn.dialect.name == "sqlite":
+            # Bypass per-parameter type processing; SQLite stores dates as ISO strings
+            placeholders = ", ".join("?" for _ in ITEM_COLUMNS)
+            conn.exec_driver_sql(
+                f"INSERT INTO {ScheduleItem.__tablename__} ({', '.join(ITEM_COLUMNS)}) VALUES ({placeholders})",
+                [(sid, sub, start.isoformat(), end.isoformat(), days, pos) for sid, sub, start, end, days, pos in rows]
+            )
+        else:
+            conn.execute(insert(ScheduleItem.__table__), [dict(zip(ITEM_COLUMNS, row)) for row in rows])
+    
+    def _load_items(self, conn, schedule_id: int) -> Dict[str, date]:
+        """Load submission start dates of a schedule as plain rows."""
+        if conn.dialect.name == "sqlite":
+            rows = conn.exec_driver_sql(
+                f"SELECT submission_id, start_date FROM {ScheduleItem.__tablename__} WHERE schedule_id = ?",
+                (schedule_id,)
+            )
+            return {submission_id: date.fromisoformat(start) for submission_id, start in rows}
+        item_table = ScheduleItem.__table__
+        rows = conn.execute(
+            select(item_table.c.submission_id, item_table.c.start_date)
+            .where(item_table.c.schedule_id == schedule_id)
+        )
+        return {submission_id: start for submission_id, start in rows}
+    
     def close(self):
         """Close database connection."""
         if hasattr(self, 'engine'):
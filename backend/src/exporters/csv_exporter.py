@@ -1,10 +1,11 @@
 """CSV export functionality for Paper Planner."""
 
 from __future__ import annotations
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, Iterable, List, Any, Optional, Sequence, Tuple
 from datetime import date, datetime, timedelta
 from pathlib import Path
-import csv
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 import json
 from collections import defaultdict
 
@@ -14,10 +15,23 @@ from validation.schedule import validate_schedule_constraints
 from scoring.penalties import calculate_penalty_score
 
 from tables import (
-    generate_schedule_table, generate_metrics_table, generate_deadline_table,
-    generate_violations_table, generate_penalties_table, save_schedule_json, save_table_csv, save_metrics_json
+    VIOLATION_COLUMNS, iter_schedule_rows, iter_deadline_rows, iter_violation_rows,
+    save_schedule_json, save_table_csv, save_metrics_json, write_rows_csv
 )
 
+# Upper bound on files written concurrently by export_all_csv
+MAX_EXPORT_WORKERS = 6
+
+
+@dataclass
+class ExportData:
+    """Intermediates shared by every CSV written for one schedule."""
+    durations: Dict[str, int]
+    max_concurrent: int
+    average_load: float
+    validation: Optional[Dict[str, Any]] = None
+    penalties: Optional[List[Dict[str, str]]] = None
+
 
 def create_output_directory(base_dir: str = "output") -> str:
     """Create a timestamped output directory."""
@@ -93,18 +107,8 @@ class CSVExporter:
         # Create directory if it doesn't exist
         filepath.parent.mkdir(parents=True, exist_ok=True)
         
-        # Get detailed schedule table
-        schedule_data = generate_schedule_table(schedule, self.config)
-        
-        if not schedule_data:
-            return ""
-        
-        with open(filepath, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=schedule_data[0].keys())
-            writer.writeheader()
-            writer.writerows(schedule_data)
-        
-        return str(filepath)
+        data = self.prepare_export(schedule, validation=False, penalties=False)
+        return write_rows_csv(iter_schedule_rows(schedule, self.config, data.durations), filepath)
     
     def export_metrics_csv(self, schedule: Schedule, output_dir: str,
                           filename: str = "metrics.csv") -> str:
@@ -131,14 +135,7 @@ class CSVExporter:
         filepath.parent.mkdir(parents=True, exist_ok=True)
         
         # Calculate comprehensive metrics
-        metrics_data = self._calculate_comprehensive_metrics(schedule)
-        
-        with open(filepath, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=metrics_data[0].keys())
-            writer.writeheader()
-            writer.writerows(metrics_data)
-        
-        return str(filepath)
+        return write_rows_csv(self._calculate_comprehensive_metrics(schedule), filepath)
     
     def export_deadline_csv(self, schedule: Schedule, output_dir: str,
                            filename: str = "deadlines.csv") -> str:
@@ -164,18 +161,8 @@ class CSVExporter:
         # Create directory if it doesn't exist
         filepath.parent.mkdir(parents=True, exist_ok=True)
         
-        # Get deadline table
-        deadline_data = generate_deadline_table(schedule, self.config)
-        
-        if not deadline_data:
-            return ""
-        
-        with open(filepath, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=deadline_data[0].keys())
-            writer.writeheader()
-            writer.writerows(deadline_data)
-        
-        return str(filepath)
+        data = self.prepare_export(schedule, validation=False, penalties=False)
+        return write_rows_csv(iter_deadline_rows(schedule, self.config, data.durations), filepath)
     
     def export_violations_csv(self, schedule: Schedule, output_dir: str,
                              filename: str = "violations.csv") -> str:
@@ -203,17 +190,7 @@ class CSVExporter:
         
         # Run comprehensive validation
         validation_result = self._run_comprehensive_validation(schedule)
-        violations_data = generate_violations_table(validation_result)
-        
-        if not violations_data:
-            return ""
-        
-        with open(filepath, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=violations_data[0].keys())
-            writer.writeheader()
-            writer.writerows(violations_data)
-        
-        return str(filepath)
+        return write_rows_csv(iter_violation_rows(validation_result), filepath, VIOLATION_COLUMNS)
     
     def export_penalties_csv(self, schedule: Schedule, output_dir: str,
                             filename: str = "penalties.csv") -> str:
@@ -240,17 +217,7 @@ class CSVExporter:
         filepath.parent.mkdir(parents=True, exist_ok=True)
         
         # Calculate comprehensive penalties
-        penalties_data = self._calculate_comprehensive_penalties(schedule)
-        
-        if not penalties_data:
-            return ""
-        
-        with open(filepath, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=penalties_data[0].keys())
-            writer.writeheader()
-            writer.writerows(penalties_data)
-        
-        return str(filepath)
+        return write_rows_csv(self._calculate_comprehensive_penalties(schedule), filepath)
     
     def export_comparison_csv(self, comparison_results: Dict[str, Any], output_dir: str,
                              filename: str = "strategy_comparison.csv") -> str:
@@ -276,17 +243,7 @@ class CSVExporter:
         # Create directory if it doesn't exist
         filepath.parent.mkdir(parents=True, exist_ok=True)
         
-        comparison_data = self._format_comparison_data(comparison_results)
-        
-        if not comparison_data:
-            return ""
-        
-        with open(filepath, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=comparison_data[0].keys())
-            writer.writeheader()
-            writer.writerows(comparison_data)
-        
-        return str(filepath)
+        return write_rows_csv(self._format_comparison_data(comparison_results), filepath)
     
     def export_summary_csv(self, schedule: Schedule, output_dir: str,
                           filename: str = "summary.csv") -> str:
@@ -312,14 +269,7 @@ class CSVExporter:
         # Create directory if it doesn't exist
         filepath.parent.mkdir(parents=True, exist_ok=True)
         
-        summary_data = self._create_summary_data(schedule)
-        
-        with open(filepath, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=summary_data[0].keys())
-            writer.writeheader()
-            writer.writerows(summary_data)
-        
-        return str(filepath)
+        return write_rows_csv(self._create_summary_data(schedule), filepath)
     
     def export_all_csv(self, schedule: Schedule, output_dir: str) -> Dict[str, str]:
         """
@@ -336,20 +286,93 @@ class CSVExporter:
         -------
         Dict[str, str]
             Mapping of file type to file path
+            
+        Notes
+        -----
+        Validation, penalties and per-submission durations are computed once
+        up front and shared; the files are then streamed row by row on a
+        thread pool, so memory stays flat however large the schedule is.
         """
-        saved_files = {}
-        
-        # Export all CSV formats
-        saved_files["schedule"] = self.export_schedule_csv(schedule, output_dir)
-        saved_files["metrics"] = self.export_metrics_csv(schedule, output_dir)
-        saved_files["deadlines"] = self.export_deadline_csv(schedule, output_dir)
-        saved_files["violations"] = self.export_violations_csv(schedule, output_dir)
-        saved_files["penalties"] = self.export_penalties_csv(schedule, output_dir)
-        saved_files["summary"] = self.export_summary_csv(schedule, output_dir)
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+        data = self.prepare_export(schedule)
+        
+        writers: Dict[str, Tuple[str, Callable[[], Iterable[Dict[str, str]]], Optional[Sequence[str]]]] = {
+            "schedule": ("schedule.csv", lambda: iter_schedule_rows(schedule, self.config, data.durations), None),
+            "metrics": ("metrics.csv", lambda: self._calculate_comprehensive_metrics(schedule, data), None),
+            "deadlines": ("deadlines.csv", lambda: iter_deadline_rows(schedule, self.config, data.durations), None),
+            "violations": ("violations.csv", lambda: iter_violation_rows(data.validation), VIOLATION_COLUMNS),
+            "penalties": ("penalties.csv", lambda: data.penalties, None),
+            "summary": ("summary.csv", lambda: self._create_summary_data(schedule, data), None),
+        }
+        
+        with ThreadPoolExecutor(max_workers=min(MAX_EXPORT_WORKERS, len(writers))) as pool:
+            futures = {
+                file_type: pool.submit(lambda item: write_rows_csv(item[1](), Path(output_dir) / item[0], item[2]), item)
+                for file_type, item in writers.items()
+            }
+            return {file_type: future.result() for file_type, future in futures.items()}
+    
+    def prepare_export(self, schedule: Schedule, validation: bool = True,
+                       penalties: bool = True) -> ExportData:
+        """
+        Compute the intermediates shared by the CSV tables of one schedule.
         
-        return saved_files
+        Parameters
+        ----------
+        schedule : Schedule
+            Schedule to export
+        validation : bool, optional
+            Also run comprehensive validation, default True
+        penalties : bool, optional
+            Also compute the penalty breakdown, default True
+            
+        Returns
+        -------
+        ExportData
+            Durations, load statistics and optionally validation and penalties
+        """
+        durations: Dict[str, int] = {}
+        if schedule:
+            for sid in schedule.intervals:
+                submission = self.config.get_submission(sid)
+                if submission:
+                    durations[sid] = submission.get_duration_days(self.config)
+        max_concurrent, average_load = self._daily_load_stats(schedule, durations)
+        return ExportData(
+            durations=durations,
+            max_concurrent=max_concurrent,
+            average_load=average_load,
+            validation=self._run_comprehensive_validation(schedule) if validation else None,
+            penalties=self._calculate_comprehensive_penalties(schedule) if penalties else None,
+        )
     
-    def _calculate_comprehensive_metrics(self, schedule: Schedule) -> List[Dict[str, str]]:
+    @staticmethod
+    def _daily_load_stats(schedule: Schedule, durations: Dict[str, int]) -> Tuple[int, float]:
+        """Return (max concurrent, average load over busy days) with a sweep over interval endpoints."""
+        events: List[Tuple[int, int]] = []
+        total_load = 0
+        for sid, duration in durations.items():
+            if duration > 0:
+                start = schedule.intervals[sid].start_date.toordinal()
+                events.append((start, 1))
+                events.append((start + duration, -1))
+                total_load += duration
+        if not events:
+            return 0, 0
+        
+        events.sort()
+        active = max_concurrent = busy_days = 0
+        previous_day = events[0][0]
+        for day, delta in events:
+            if active > 0:
+                busy_days += day - previous_day
+            active += delta
+            max_concurrent = max(max_concurrent, active)
+            previous_day = day
+        return max_concurrent, total_load / busy_days
+    
+    def _calculate_comprehensive_metrics(self, schedule: Schedule,
+                                         data: Optional[ExportData] = None) -> List[Dict[str, str]]:
         """Calculate comprehensive metrics for CSV export."""
         if not schedule:
             return [{"Metric": "Total Submissions", "Value": "0"}]
@@ -361,17 +384,8 @@ class CSVExporter:
         schedule_span = schedule.calculate_duration_days()
         
         # Calculate resource utilization
-        daily_load = defaultdict(int)
-        for sid, interval in schedule.intervals.items():
-            submission = self.config.get_submission(sid)
-            if submission:
-                duration = submission.get_duration_days(self.config)
-                for i in range(duration):
-                    check_date = interval.start_date + timedelta(days=i)
-                    daily_load[check_date] += 1
-        
-        max_concurrent = max(daily_load.values()) if daily_load else 0
-        avg_concurrent = sum(daily_load.values()) / len(daily_load) if daily_load else 0
+        data = data or self.prepare_export(schedule, validation=False, penalties=False)
+        max_concurrent, avg_concurrent = data.max_concurrent, data.average_load
         
         # Count by submission type
         submission_types = defaultdict(int)
@@ -491,7 +505,8 @@ class CSVExporter:
         
         return comparison_data
     
-    def _create_summary_data(self, schedule: Schedule) -> List[Dict[str, str]]:
+    def _create_summary_data(self, schedule: Schedule,
+                             data: Optional[ExportData] = None) -> List[Dict[str, str]]:
         """Create summary data for CSV export."""
         if not schedule:
             return [{"Category": "Status", "Value": "No Schedule"}]
@@ -511,17 +526,8 @@ class CSVExporter:
                 submission_types[sub_type] += 1
         
         # Calculate resource utilization
-        daily_load = defaultdict(int)
-        for sid, interval in schedule.intervals.items():
-            submission = self.config.get_submission(sid)
-            if submission:
-                duration = submission.get_duration_days(self.config)
-                for i in range(duration):
-                    check_date = interval.start_date + timedelta(days=i)
-                    daily_load[check_date] += 1
-        
-        max_concurrent = max(daily_load.values()) if daily_load else 0
-        avg_concurrent = sum(daily_load.values()) / len(daily_load) if daily_load else 0
+        data = data or self.prepare_export(schedule, validation=False, penalties=False)
+        max_concurrent, avg_concurrent = data.max_concurrent, data.average_load
         
         summary_data = [
             {"Category": "Total Submissions", "Value": str(total_submissions)},
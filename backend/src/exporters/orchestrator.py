@@ -0,0 +1,343 @@
+"""Parallel multi-format export with incremental skips and a warm image renderer.
+
+An export is a set of independent artifacts, each described by the inputs it
+is derived from and a function that writes it. ``ExportOrchestrator`` hashes
+those inputs, skips artifacts whose hash matches the manifest left by the
+previous export into the same directory, and writes the rest on a thread
+pool. Static images go through a single shared ``FigureRenderer`` that keeps
+kaleido's headless browser running between calls instead of starting one per
+image.
+"""
+
+import atexit
+import csv
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from core.models import Config, Schedule
+
+EXPORT_MANIFEST_VERSION = 1
+EXPORT_MANIFEST_NAME = "export_manifest.json"
+DEFAULT_EXPORT_WORKERS = 4
+
+
+# ===== IMAGE RENDERING =====
+
+class FigureRenderer:
+    """Static image renderer that reuses one kaleido browser across calls.
+
+    With kaleido 1.x the persistent sync server is started on first use, so
+    later images skip the browser start-up; older kaleido versions keep their
+    own process alive between calls. Kaleido handles one figure at a time, so
+    renders are serialized behind a lock and callers render from any thread.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._server_started = False
+
+    def start(self) -> None:
+        """Start the persistent renderer if kaleido supports one."""
+        with self._lock:
+            self._start_locked()
+
+    def write_image(self, fig: Any, path: str, **options: Any) -> str:
+        """Render a figure to an image file; the format follows the file suffix."""
+        with self._lock:
+            self._start_locked()
+            fig.write_image(str(path), **options)
+        return str(path)
+
+    def close(self) -> None:
+        """Stop the persistent renderer."""
+        with self._lock:
+            if not self._server_started:
+                return
+            self._server_started = False
+            try:
+                import kaleido
+                kaleido.stop_sync_server()
+            except Exception as e:
+                print(f"Warning: Could not stop image renderer: {e}")
+
+    def _start_locked(self) -> None:
+        if self._server_started:
+            return
+        try:
+            import kaleido
+        except ImportError:
+            return
+        start_server = getattr(kaleido, "start_sync_server", None)
+        if start_server is None:
+            return
+        try:
+            start_server()
+            self._server_started = True
+        except Exception as e:
+            print(f"Warning: Could not start persistent image renderer, rendering per call: {e}")
+
+
+_renderer: Optional[FigureRenderer] = None
+_renderer_lock = threading.Lock()
+
+
+def get_figure_renderer() -> FigureRenderer:
+    """Return the process-wide renderer, stopped automatically at exit."""
+    global _renderer
+    with _renderer_lock:
+        if _renderer is None:
+            _renderer = FigureRenderer()
+            atexit.register(_renderer.close)
+        return _renderer
+
+
+# ===== ORCHESTRATION =====
+
+@dataclass
+class ExportArtifact:
+    """One output file and the inputs it is derived from."""
+    key: str
+    filename: str
+    inputs: Any
+    write: Callable[[Path], Optional[str]]
+
+
+@dataclass
+class ExportResult:
+    """Outcome of one artifact in an export run."""
+    key: str
+    path: str = ""
+    skipped: bool = False
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+
+def hash_inputs(inputs: Any) -> str:
+    """Return a stable hash of JSON-serializable artifact inputs."""
+    payload = json.dumps(inputs, sort_keys=True, separators=(",", ":"), default=str)
+    digest = hashlib.sha256(f"{EXPORT_MANIFEST_VERSION}:".encode("utf-8"))
+    digest.update(payload.encode("utf-8"))
+    return digest.hexdigest()
+
+
+@dataclass
+class ExportOrchestrator:
+    """Write export artifacts in parallel, skipping those whose inputs are unchanged."""
+    output_dir: str
+    max_workers: int = DEFAULT_EXPORT_WORKERS
+    _manifest_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    @property
+    def manifest_path(self) -> Path:
+        return Path(self.output_dir) / EXPORT_MANIFEST_NAME
+
+    def run(self, artifacts: Iterable[ExportArtifact], force: bool = False) -> Dict[str, ExportResult]:
+        """
+        Export artifacts, reusing files from the previous run when possible.
+
+        Parameters
+        ----------
+        artifacts : Iterable[ExportArtifact]
+            Artifacts to produce; keys must be unique
+        force : bool, optional
+            Rewrite every artifact even when its inputs are unchanged
+
+        Returns
+        -------
+        Dict[str, ExportResult]
+            Result per artifact key, in the order given
+        """
+        output_dir = Path(self.output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        manifest = self.load_manifest()
+        previous = manifest.get("artifacts", {})
+
+        results: Dict[str, ExportResult] = {}
+        pending: List[ExportArtifact] = []
+        hashes: Dict[str, str] = {}
+        for artifact in artifacts:
+            hashes[artifact.key] = hash_inputs(artifact.inputs)
+            entry = previous.get(artifact.key, {})
+            path = output_dir / artifact.filename
+            if not force and entry.get("inputs_hash") == hashes[artifact.key] \
+                    and entry.get("filename") == artifact.filename and path.exists():
+                results[artifact.key] = ExportResult(key=artifact.key, path=str(path), skipped=True)
+            else:
+                results[artifact.key] = ExportResult(key=artifact.key)
+                pending.append(artifact)
+
+        if pending:
+            with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(pending)))) as pool:
+                futures = {artifact.key: pool.submit(self._write, artifact) for artifact in pending}
+                for key, future in futures.items():
+                    results[key] = future.result()
+
+        written = {
+            key: {"filename": Path(result.path).name, "inputs_hash": hashes[key]}
+            for key, result in results.items()
+            if result.path and not result.error
+        }
+        failed = {key for key, result in results.items() if result.error}
+        artifacts_entry = {key: value for key, value in previous.items() if key not in failed}
+        artifacts_entry.update(written)
+        self._save_manifest({"version": EXPORT_MANIFEST_VERSION, "artifacts": artifacts_entry})
+        return results
+
+    def load_manifest(self) -> Dict[str, Any]:
+        """Load the manifest of the previous export, or an empty one."""
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+            if manifest.get("version") == EXPORT_MANIFEST_VERSION:
+                return manifest
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            print(f"Warning: Ignoring unreadable export manifest {self.manifest_path}: {e}")
+        return {"version": EXPORT_MANIFEST_VERSION, "artifacts": {}}
+
+    def _write(self, artifact: ExportArtifact) -> ExportResult:
+        """Write one artifact, capturing failures in the result."""
+        started = time.perf_counter()
+        try:
+            path = artifact.write(Path(self.output_dir) / artifact.filename)
+            return ExportResult(key=artifact.key, path=path or "", seconds=time.perf_counter() - started)
+        except Exception as e:
+            return ExportResult(key=artifact.key, seconds=time.perf_counter() - started, error=str(e))
+
+    def _save_manifest(self, manifest: Dict[str, Any]) -> None:
+        """Write the manifest atomically."""
+        with self._manifest_lock:
+            fd, tmp_name = tempfile.mkstemp(dir=self.output_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(manifest, f, indent=2, sort_keys=True)
+                os.replace(tmp_name, self.manifest_path)
+            except OSError as e:
+                print(f"Warning: Could not write export manifest: {e}")
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+
+
+# ===== SCHEDULE ARTIFACTS =====
+
+def schedule_inputs(schedule: Schedule, config: Config) -> Dict[str, Any]:
+    """Inputs every schedule artifact is derived from: the intervals and the config."""
+    from caching.results import get_config_hash
+    return {
+        "intervals": {
+            sid: [interval.start_date.isoformat(), interval.end_date.isoformat()]
+            for sid, interval in sorted(schedule.intervals.items())
+        },
+        "config": get_config_hash(config),
+    }
+
+
+def create_timeline_figure(schedule: Schedule, config: Config) -> Any:
+    """Build a horizontal-bar timeline figure of the schedule."""
+    import plotly.graph_objects as go
+
+    ordered = sorted(schedule.intervals.items(), key=lambda item: (item[1].start_date, item[0]))
+    day_ms = timedelta(days=1).total_seconds() * 1000
+    fig = go.Figure(go.Bar(
+        orientation="h",
+        y=[sid for sid, _ in ordered],
+        base=[interval.start_date.isoformat() for _, interval in ordered],
+        x=[max(1, (interval.end_date - interval.start_date).days) * day_ms for _, interval in ordered],
+        customdata=[getattr(config.get_submission(sid), "title", sid) for sid, _ in ordered],
+        hovertemplate="%{customdata}<br>%{base|%Y-%m-%d}<extra></extra>",
+    ))
+    fig.update_layout(
+        title="Paper Planner Schedule",
+        xaxis={"type": "date"},
+        yaxis={"autorange": "reversed"},
+        height=max(400, 22 * len(ordered) + 120),
+        showlegend=False,
+    )
+    return fig
+
+
+def build_schedule_artifacts(schedule: Schedule, config: Config, formats: Iterable[str],
+                             renderer: Optional[FigureRenderer] = None,
+                             json_data: Optional[Any] = None) -> List[ExportArtifact]:
+    """
+    Describe the export artifacts for a schedule in the requested formats.
+
+    Parameters
+    ----------
+    schedule : Schedule
+        Schedule to export
+    config : Config
+        Configuration the schedule was built from
+    formats : Iterable[str]
+        Any of "csv", "json", "html" and "png"
+    renderer : FigureRenderer, optional
+        Renderer for PNG output; defaults to the shared process-wide renderer
+    json_data : Any, optional
+        Payload of the JSON export, written unchanged, e.g. the schedule file
+        the schedule was loaded from; defaults to the schedule's fields
+
+    Returns
+    -------
+    List[ExportArtifact]
+        One artifact per format; the chart figure is built at most once
+    """
+    inputs = schedule_inputs(schedule, config)
+    figure_lock = threading.Lock()
+    figure: List[Any] = []
+
+    def get_figure() -> Any:
+        with figure_lock:
+            if not figure:
+                figure.append(create_timeline_figure(schedule, config))
+            return figure[0]
+
+    def write_csv(path: Path) -> str:
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["Submission ID", "Start Date", "End Date", "Duration (days)"])
+            writer.writerows(
+                (sid, interval.start_date, interval.end_date, (interval.end_date - interval.start_date).days + 1)
+                for sid, interval in schedule.intervals.items()
+            )
+        return str(path)
+
+    def write_json(path: Path) -> str:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(schedule.model_dump(mode="json") if json_data is None else json_data, f, indent=2)
+        return str(path)
+
+    def write_html(path: Path) -> str:
+        get_figure().write_html(str(path), include_plotlyjs="cdn")
+        return str(path)
+
+    def write_png(path: Path) -> str:
+        return (renderer or get_figure_renderer()).write_image(get_figure(), str(path))
+
+    writers = {
+        "csv": ("schedule.csv", write_csv),
+        "json": ("schedule_export.json", write_json),
+        "html": ("schedule_chart.html", write_html),
+        "png": ("schedule_chart.png", write_png),
+    }
+    artifacts = []
+    for export_format in formats:
+        if export_format not in writers:
+            raise ValueError(f"Unsupported export format: {export_format}")
+        filename, write = writers[export_format]
+        artifact_inputs = {**inputs, "format": export_format}
+        if export_format == "json" and json_data is not None:
+            artifact_inputs["payload"] = json_data
+        artifacts.append(ExportArtifact(key=export_format, filename=filename, inputs=artifact_inputs, write=write))
+    return artifacts
@@ -0,0 +1,98 @@
+"""Import-time profiling for the backend CLIs."""
+
+from __future__ import annotations
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Any
+
+
+# Packages that should only be imported by operations that actually need them
+HEAVY_PACKAGES = ("pulp", "plotly", "dash", "sqlmodel", "sqlalchemy", "pandas", "numpy")
+
+
+@dataclass
+class ImportTiming:
+    """One line of ``python -X importtime`` output."""
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(output: str) -> List[ImportTiming]:
+    """Parse ``-X importtime`` stderr into timings, ignoring unrelated lines."""
+    timings = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            self_us = int(parts[0].strip())
+            cumulative_us = int(parts[1].strip())
+        except ValueError:
+            # Header line: "self [us] | cumulative | imported package"
+            continue
+        # One separator space, then two spaces of indentation per nesting level
+        name = parts[2].rstrip()[1:]
+        stripped = name.lstrip()
+        depth = (len(name) - len(stripped)) // 2
+        timings.append(ImportTiming(stripped, self_us, cumulative_us, depth))
+    return timings
+
+
+def measure_import_time(modules: List[str], python_path: Optional[List[str]] = None) -> List[ImportTiming]:
+    """
+    Import modules in a fresh interpreter under ``-X importtime``.
+
+    Parameters
+    ----------
+    modules : List[str]
+        Modules to import, in order. Modules that fail to import are skipped.
+    python_path : List[str], optional
+        Entries prepended to PYTHONPATH for the child interpreter
+
+    Returns
+    -------
+    List[ImportTiming]
+        Timings for every module imported by the child
+    """
+    # __import__ rather than importlib.import_module: only the former is timed by -X importtime
+    script = (
+        f"for name in {modules!r}:\n"
+        "    try:\n"
+        "        __import__(name)\n"
+        "    except ImportError:\n"
+        "        pass\n"
+    )
+    env = dict(os.environ)
+    if python_path:
+        existing = env.get("PYTHONPATH")
+        env["PYTHONPATH"] = os.pathsep.join(python_path + ([existing] if existing else []))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script],
+        capture_output=True, text=True, env=env, timeout=120
+    )
+    return parse_importtime(result.stderr)
+
+
+def summarize_import_times(timings: List[ImportTiming], top: int = 15) -> Dict[str, Any]:
+    """Summarize timings: total time, slowest modules and heavy packages loaded."""
+    top_level = [t for t in timings if t.depth == 0]
+    loaded = {t.module.split(".")[0] for t in timings}
+    return {
+        "total_ms": sum(t.cumulative_us for t in top_level) / 1000,
+        "module_count": len(timings),
+        "top_cumulative": [
+            {"module": t.module, "cumulative_ms": t.cumulative_us / 1000}
+            for t in sorted(timings, key=lambda t: t.cumulative_us, reverse=True)[:top]
+        ],
+        "top_self": [
+            {"module": t.module, "self_ms": t.self_us / 1000}
+            for t in sorted(timings, key=lambda t: t.self_us, reverse=True)[:top]
+        ],
+        "heavy_packages": [name for name in HEAVY_PACKAGES if name in loaded],
+    }
@@ -0,0 +1,246 @@
+"""What-if analysis: schedule variants of a config and compare their metrics.
+
+A scenario is a named set of changes to a base config: config fields (e.g.
+``max_concurrent_submissions``), conference deadline shifts and submission
+fields. Variants are materialized copy-on-write: only the config, and the
+conferences and submissions a scenario changes, are copied; everything else
+is shared with the base config. Each variant is scheduled and scored in a
+worker process, which receives its own pickled copy, so schedulers can assign
+conferences without touching the base config or other variants.
+"""
+
+from __future__ import annotations
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Any, Dict, List, Optional, Sequence
+
+from core.models import Config, ScheduleMetrics
+
+DEFAULT_SCENARIO_WORKERS = 4
+
+# Name of the unchanged config in comparisons
+BASELINE_NAME = "baseline"
+
+# Config fields a scenario may not replace wholesale; use deadline shifts and submission changes instead
+STRUCTURAL_FIELDS = ("submissions", "conferences")
+
+
+@dataclass
+class Scenario:
+    """A named set of changes to a base config."""
+    name: str
+    config_changes: Dict[str, Any] = field(default_factory=dict)
+    deadline_shifts: Dict[str, int] = field(default_factory=dict)
+    submission_changes: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Scenario':
+        """Build a scenario from its JSON form.
+
+        Keys are ``name``, ``config`` (field -> value), ``deadline_shifts``
+        (conference ID or name -> days) and ``submissions`` (submission ID ->
+        field -> value).
+        """
+        return cls(
+            name=str(data.get("name") or "scenario"),
+            config_changes=dict(data.get("config") or {}),
+            deadline_shifts={key: int(days) for key, days in (data.get("deadline_shifts") or {}).items()},
+            submission_changes={key: dict(changes) for key, changes in (data.get("submissions") or {}).items()}
+        )
+
+    def describe(self) -> str:
+        """Summarize the changes in one line."""
+        parts = [f"{name}={value}" for name, value in self.config_changes.items()]
+        parts += [f"{conference} deadlines {days:+d}d" for conference, days in self.deadline_shifts.items()]
+        parts += [
+            f"{submission_id}.{name}={value}"
+            for submission_id, changes in self.submission_changes.items()
+            for name, value in changes.items()
+        ]
+        return ", ".join(parts) or "no changes"
+
+
+@dataclass
+class ScenarioResult:
+    """Metrics of one scheduled scenario, or why it could not be run."""
+    name: str
+    description: str
+    metrics: Optional[ScheduleMetrics] = None
+    error: Optional[str] = None
+
+
+def materialize_scenario(base: Config, scenario: Scenario) -> Config:
+    """
+    Apply a scenario's changes to a copy of a config.
+
+    Parameters
+    ----------
+    base : Config
+        Config to vary; it is not modified
+    scenario : Scenario
+        Changes to apply
+
+    Returns
+    -------
+    Config
+        A shallow copy sharing every conference and submission the scenario
+        does not change; changed values are validated like assignments
+
+    Raises
+    ------
+    ValueError
+        If a change names an unknown field, conference or submission
+    """
+    unknown = [name for name in scenario.config_changes if name not in Config.model_fields or name in STRUCTURAL_FIELDS]
+    if unknown:
+        raise ValueError(f"Scenario '{scenario.name}' changes unknown or structural config fields: {unknown}")
+
+    conferences = list(base.conferences)
+    for key, days in scenario.deadline_shifts.items():
+        positions = [index for index, conf in enumerate(conferences) if key in (conf.id, conf.name)]
+        if not positions:
+            raise ValueError(f"Scenario '{scenario.name}' shifts deadlines of unknown conference: {key}")
+        for index in positions:
+            conf = conferences[index]
+            conferences[index] = conf.model_copy(update={
+                "deadlines": {
+                    kind: deadline + timedelta(days=days) if deadline else deadline
+                    for kind, deadline in conf.deadlines.items()
+                }
+            })
+
+    submissions = list(base.submissions)
+    positions_by_id = {submission.id: index for index, submission in enumerate(submissions)}
+    for submission_id, changes in scenario.submission_changes.items():
+        if submission_id not in positions_by_id:
+            raise ValueError(f"Scenario '{scenario.name}' changes unknown submission: {submission_id}")
+        index = positions_by_id[submission_id]
+        submissions[index] = _copy_with_changes(submissions[index], changes, scenario.name)
+
+    variant = base.model_copy(update={"conferences": conferences, "submissions": submissions})
+    for name, value in scenario.config_changes.items():
+        setattr(variant, name, value)
+    return variant
+
+
+def run_scenarios(base: Config, scenarios: Sequence[Scenario], strategy: str = "greedy",
+                  params: Optional[Dict[str, Any]] = None, include_baseline: bool = True,
+                  max_workers: int = DEFAULT_SCENARIO_WORKERS, use_processes: bool = True) -> List[ScenarioResult]:
+    """
+    Schedule and score each scenario of a base config in parallel.
+
+    Parameters
+    ----------
+    base : Config
+        Config the scenarios vary
+    scenarios : Sequence[Scenario]
+        Scenarios to run; invalid ones are reported as errors
+    strategy : str, optional
+        Scheduler strategy used for every scenario
+    params : Dict[str, Any], optional
+        Strategy parameters (seed, lookahead_days, randomness_factor)
+    include_baseline : bool, optional
+        Also run the unchanged config, first, as the comparison baseline
+    max_workers : int, optional
+        Worker count; 1 runs the scenarios one after another in this process
+    use_processes : bool, optional
+        Use worker processes rather than threads
+
+    Returns
+    -------
+    List[ScenarioResult]
+        One result per scenario, in the given order after the baseline
+    """
+    runs = ([Scenario(BASELINE_NAME)] if include_baseline else []) + list(scenarios)
+    results: List[ScenarioResult] = []
+    variants: Dict[int, Config] = {}
+    for index, scenario in enumerate(runs):
+        results.append(ScenarioResult(scenario.name, scenario.describe()))
+        try:
+            variants[index] = materialize_scenario(base, scenario)
+        except ValueError as e:
+            results[index].error = str(e)
+
+    if max_workers <= 1 or len(variants) <= 1:
+        for index, variant in variants.items():
+            _record(results[index], _run_in_process, variant, strategy, params)
+        return results
+
+    with _create_executor(min(max_workers, len(variants)), use_processes) as executor:
+        # Threads share this process's objects, so give each run its own copy to schedule on
+        job = _run_in_worker if use_processes else _run_in_process
+        futures = {index: executor.submit(job, variant, strategy, params) for index, variant in variants.items()}
+        for index, future in futures.items():
+            _record(results[index], future.result)
+    return results
+
+
+def compare_scenarios(results: Sequence[ScenarioResult]) -> List[Dict[str, str]]:
+    """Format scenario results as a comparison table, with changes relative to the first successful run."""
+    baseline = next((result.metrics for result in results if result.metrics is not None), None)
+    rows = []
+    for result in results:
+        metrics = result.metrics
+        if metrics is None:
+            rows.append({
+                "Scenario": result.name, "Changes": result.description, "Scheduled": "-", "Makespan": "-",
+                "Total Penalty": "-", "Penalty Change": "-", "Compliance": "-", "Quality": "-",
+                "Efficiency": "-", "Status": f"Error: {result.error}"
+            })
+            continue
+        assert baseline is not None  # Type guard: set from the first successful result
+        rows.append({
+            "Scenario": result.name,
+            "Changes": result.description,
+            "Scheduled": f"{metrics.scheduled_count}/{metrics.submission_count}",
+            "Makespan": f"{metrics.makespan} days ({metrics.makespan - baseline.makespan:+d})",
+            "Total Penalty": f"${metrics.total_penalty:.2f}",
+            "Penalty Change": f"{metrics.total_penalty - baseline.total_penalty:+.2f}",
+            "Compliance": f"{metrics.compliance_rate:.1f}%",
+            "Quality": f"{metrics.quality_score:.1f}",
+            "Efficiency": f"{metrics.efficiency_score:.1f}",
+            "Status": "OK"
+        })
+    return rows
+
+
+def _copy_with_changes(model: Any, changes: Dict[str, Any], scenario_name: str) -> Any:
+    """Copy a model and assign changed fields, validating each one."""
+    unknown = [name for name in changes if name not in type(model).model_fields]
+    if unknown:
+        raise ValueError(f"Scenario '{scenario_name}' changes unknown fields of {model.id}: {unknown}")
+    copy = model.model_copy()
+    for name, value in changes.items():
+        setattr(copy, name, value)
+    return copy
+
+
+def _create_executor(workers: int, use_processes: bool) -> Executor:
+    """Create the scenario worker pool."""
+    if use_processes:
+        # spawn keeps workers independent of threads running in the caller
+        return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+    return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scenario")
+
+
+def _run_in_worker(config: Config, strategy: str, params: Optional[Dict[str, Any]]) -> ScheduleMetrics:
+    """Schedule and score a variant received as a private pickled copy."""
+    from caching.results import schedule_cached
+
+    _, metrics, _ = schedule_cached(config, strategy, params)
+    return metrics
+
+
+def _run_in_process(config: Config, strategy: str, params: Optional[Dict[str, Any]]) -> ScheduleMetrics:
+    """Schedule and score a variant that shares objects with its base config."""
+    return _run_in_worker(config.model_copy(deep=True), strategy, params)
+
+
+def _record(result: ScenarioResult, run: Any, *args: Any) -> None:
+    """Store a run's metrics, or its error, on a result."""
+    try:
+        result.metrics = run(*args)
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
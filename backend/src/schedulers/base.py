@@ -1,6 +1,7 @@
 """Base scheduler implementation."""
 
 from __future__ import annotations
+import importlib
 from abc import ABC, abstractmethod
 from typing import Dict, List, Type, Optional, Tuple, Any
 from datetime import date, timedelta
@@ -10,12 +11,25 @@ from core.models import (
 from core.constants import PENALTY_CONSTANTS, SCHEDULING_CONSTANTS, PRIORITY_CONSTANTS, EFFICIENCY_CONSTANTS
 
 from core.dates import is_working_day
+from core.graph import GraphAnalysis, analyze_config_graph, get_dependency_structure
 
 # Validation imports
 from validation.submission import validate_submission_constraints
 from validation.scheduler import validate_scheduler_constraints, validate_scheduling_window
 
 
+# Module and class implementing each strategy, imported on first use
+STRATEGY_MODULES: Dict[SchedulerStrategy, Tuple[str, str]] = {
+    SchedulerStrategy.GREEDY: ("schedulers.greedy", "GreedyScheduler"),
+    SchedulerStrategy.STOCHASTIC: ("schedulers.stochastic", "StochasticGreedyScheduler"),
+    SchedulerStrategy.LOOKAHEAD: ("schedulers.lookahead", "LookaheadGreedyScheduler"),
+    SchedulerStrategy.BACKTRACKING: ("schedulers.backtracking", "BacktrackingGreedyScheduler"),
+    SchedulerStrategy.RANDOM: ("schedulers.random", "RandomScheduler"),
+    SchedulerStrategy.HEURISTIC: ("schedulers.heuristic", "HeuristicScheduler"),
+    SchedulerStrategy.OPTIMAL: ("schedulers.optimal", "OptimalScheduler"),
+}
+
+
 class SchedulingConfig:
     """Configuration constants for scheduling algorithms."""
     MAX_ITERATIONS = EFFICIENCY_CONSTANTS.max_algorithm_iterations
@@ -40,6 +54,8 @@ class BaseScheduler(ABC):
         self._topo: Optional[List[str]] = None
         self._start_date: Optional[date] = None
         self._end_date: Optional[date] = None
+        self._graph_analysis: Optional[GraphAnalysis] = None
+        self.used_fallback = False  # Set when the strategy failed and another algorithm produced the schedule
     
     # ===== PUBLIC INTERFACE METHODS =====
     
@@ -51,8 +67,8 @@ class BaseScheduler(ABC):
     # ===== PUBLIC UTILITY METHODS =====
     
     @classmethod
-    def create_scheduler(cls, strategy: SchedulerStrategy, config: Config) -> 'BaseScheduler':
-        """Create a scheduler instance for the given strategy."""
+    def create_scheduler(cls, strategy: SchedulerStrategy, config: Config, **options: Any) -> 'BaseScheduler':
+        """Create a scheduler instance for the given strategy, passing options to its constructor."""
         if strategy not in cls._strategy_registry:
             # Try to auto-register the strategy by looking for scheduler classes
             cls._auto_register_strategy(strategy)
@@ -62,7 +78,7 @@ class BaseScheduler(ABC):
                 raise ValueError(f"Unknown strategy: {strategy}. No scheduler class found.")
         
         scheduler_class = cls._strategy_registry[strategy]
-        return scheduler_class(config)
+        return scheduler_class(config, **options)
     
     def get_dependency_order(self) -> List[str]:
         """Get submissions in proper dependency order (topological sort)."""
@@ -254,6 +270,13 @@ class BaseScheduler(ABC):
         assert self._end_date is not None  # Type guard
         return self._end_date
     
+    @property
+    def graph_analysis(self) -> GraphAnalysis:
+        """Get the critical path analysis of the dependency graph, computing it once."""
+        if self._graph_analysis is None:
+            self._graph_analysis = analyze_config_graph(self.config)
+        return self._graph_analysis
+    
     # ===== PRIVATE HELPER METHODS =====
     
     def _ensure_schedule_initialized(self) -> None:
@@ -263,37 +286,10 @@ class BaseScheduler(ABC):
     
     def _topological_order(self) -> List[str]:
         """Get submissions in topological order based on dependencies."""
-        # Simple topological sort implementation
-        visited = set()
-        temp_visited = set()
-        result = []
-        
-        def dfs(node_id: str) -> None:
-            if node_id in temp_visited:
-                # Circular dependency detected
-                raise ValueError(f"Circular dependency detected involving {node_id}")
-            if node_id in visited:
-                return
-            
-            temp_visited.add(node_id)
-            
-            # Process dependencies first
-            submission = self.submissions[node_id]
-            if submission.depends_on:
-                for dep_id in submission.depends_on:
-                    if dep_id in self.submissions:
-                        dfs(dep_id)
-            
-            temp_visited.remove(node_id)
-            visited.add(node_id)
-            result.append(node_id)
-        
-        # Process all submissions
-        for submission_id in self.submissions:
-            if submission_id not in visited:
-                dfs(submission_id)
-        
-        return result
+        structure = get_dependency_structure(self.submissions.values())
+        if structure.has_cycles:
+            raise ValueError(f"Circular dependency detected involving {structure.cycles[0][0]}")
+        return list(structure.order)
     
     def _calculate_earliest_start_date(self, submission: Submission, schedule: Schedule) -> date:
         """Calculate the earliest possible start date for a submission."""
@@ -413,69 +409,23 @@ class BaseScheduler(ABC):
     
     @classmethod
     def _auto_register_strategy(cls, strategy: SchedulerStrategy) -> None:
-        """Auto-register scheduler classes by looking for them in the schedulers module."""
+        """Register the scheduler class for a strategy, importing only its module.
+        
+        Each scheduler lives in its own module so that, for example, the
+        optimal scheduler's ``pulp`` dependency is only imported when that
+        strategy is requested.
+        """
+        if strategy not in STRATEGY_MODULES:
+            return
+        module_name, class_name = STRATEGY_MODULES[strategy]
         try:
-            # Import the scheduler classes directly
-            from schedulers.greedy import GreedyScheduler
-            from schedulers.random import RandomScheduler
-            from schedulers.stochastic import StochasticGreedyScheduler
-            from schedulers.lookahead import LookaheadGreedyScheduler
-            from schedulers.heuristic import HeuristicScheduler
-            from schedulers.backtracking import BacktrackingGreedyScheduler
-            from schedulers.optimal import OptimalScheduler
-            
-            # Map strategies to scheduler classes
-            strategy_mapping = {
-                SchedulerStrategy.GREEDY: GreedyScheduler,
-                SchedulerStrategy.STOCHASTIC: StochasticGreedyScheduler,
-                SchedulerStrategy.LOOKAHEAD: LookaheadGreedyScheduler,
-                SchedulerStrategy.BACKTRACKING: BacktrackingGreedyScheduler,
-                SchedulerStrategy.RANDOM: RandomScheduler,
-                SchedulerStrategy.HEURISTIC: HeuristicScheduler,
-                SchedulerStrategy.OPTIMAL: OptimalScheduler
-            }
-            
-            if strategy in strategy_mapping:
-                cls._strategy_registry[strategy] = strategy_mapping[strategy]
-                
-        except ImportError:
-            # If import fails, try to find classes dynamically
-            import importlib
-            import inspect
-            
-            # Get the module where this class is defined
-            module = inspect.getmodule(cls)
-            if not module:
-                return
-                
-            # Look for scheduler classes in the module
-            for name, obj in inspect.getmembers(module):
-                if (inspect.isclass(obj) and 
-                    issubclass(obj, BaseScheduler) and 
-                    obj != BaseScheduler and
-                    hasattr(obj, '__module__') and
-                    obj.__module__ == module.__name__):
-                    
-                    # Try to determine the strategy from the class name
-                    if strategy.value in name.lower():
-                        cls._strategy_registry[strategy] = obj
-                        return
-            
-            # If not found by name, try to register based on common patterns
-            strategy_mapping = {
-                SchedulerStrategy.GREEDY: 'GreedyScheduler',
-                SchedulerStrategy.STOCHASTIC: 'StochasticGreedyScheduler',
-                SchedulerStrategy.LOOKAHEAD: 'LookaheadGreedyScheduler',
-                SchedulerStrategy.BACKTRACKING: 'BacktrackingGreedyScheduler',
-                SchedulerStrategy.RANDOM: 'RandomScheduler',
-                SchedulerStrategy.HEURISTIC: 'HeuristicScheduler',
-                SchedulerStrategy.OPTIMAL: 'OptimalScheduler'
-            }
-            
-            if strategy in strategy_mapping:
-                class_name = strategy_mapping[strategy]
-                if hasattr(module, class_name):
-                    cls._strategy_registry[strategy] = getattr(module, class_name)
+            module = importlib.import_module(module_name)
+        except ImportError as e:
+            print(f"Warning: Could not import {module_name} for {strategy.value} strategy: {e}")
+            return
+        scheduler_class = getattr(module, class_name, None)
+        if scheduler_class is not None:
+            cls._strategy_registry[strategy] = scheduler_class
     
 
     
@@ -129,14 +129,5 @@ class HeuristicScheduler(BaseScheduler):
         return sorted(ready, key=get_processing_time, reverse=reverse)
     
     def _sort_by_critical_path(self, ready: List[str]) -> List[str]:
-        """Sort by critical path priority (submissions that block others get higher priority)."""
-        def get_critical_priority(submission_id: str) -> int:
-            # Count how many other submissions depend on this one
-            blocking_count = 0
-            for other_submission_id in self.submissions:
-                other_submission = self.submissions[other_submission_id]
-                if other_submission.depends_on and submission_id in other_submission.depends_on:
-                    blocking_count += 1
-            return blocking_count
-        
-        return sorted(ready, key=get_critical_priority, reverse=True)
+        """Sort by critical path priority (least total float, then earliest latest start)."""
+        return sorted(ready, key=self.graph_analysis.priority_key)
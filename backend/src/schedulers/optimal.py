@@ -33,6 +33,7 @@ class OptimalScheduler(GreedyScheduler):
         """Generate a schedule using MILP optimization with greedy fallback."""
         # Use shared setup from base class
         self.reset_schedule()
+        self.used_fallback = False
         schedule = self.current_schedule
         start_date, end_date = self.get_scheduling_window()
         
@@ -67,6 +68,7 @@ class OptimalScheduler(GreedyScheduler):
         
         # Fallback to greedy algorithm
         print("Using greedy algorithm as fallback...")
+        self.used_fallback = True
         return super().schedule()
     
     # ===== MILP MODEL METHODS =====
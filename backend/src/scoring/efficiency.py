@@ -6,6 +6,7 @@ from collections import defaultdict
 import statistics
 
 from core.models import Config, ScheduleMetrics, Schedule, Interval
+from caching.metrics import memoize_schedule_metric
 from typing import Optional
 from core.constants import (
     EFFICIENCY_CONSTANTS, SCORING_CONSTANTS, REPORT_CONSTANTS, QUALITY_CONSTANTS
@@ -13,6 +14,7 @@ from core.constants import (
 
 
 
+@memoize_schedule_metric
 def calculate_efficiency_score(schedule: Schedule, config: Config) -> float:
     """
     Calculate efficiency score based on resource utilization and timeline.
@@ -55,6 +57,7 @@ def calculate_efficiency_score(schedule: Schedule, config: Config) -> float:
     return max(min_score, min(max_score, efficiency_score))
 
 
+@memoize_schedule_metric
 def calculate_efficiency_resource(schedule: Schedule, config: Config) -> Optional[ScheduleMetrics]:
     """
     Calculate detailed resource efficiency metrics.
@@ -126,6 +129,7 @@ def calculate_efficiency_resource(schedule: Schedule, config: Config) -> Optiona
 
 
 
+@memoize_schedule_metric
 def calculate_efficiency_timeline(schedule: Schedule, config: Config) -> Optional[ScheduleMetrics]:
     """
     Calculate timeline efficiency metrics.
@@ -9,11 +9,13 @@ from core.constants import (
     PENALTY_CONSTANTS, REPORT_CONSTANTS, SCHEDULING_CONSTANTS
 )
 from validation.schedule import validate_schedule_constraints
-from src.scoring.efficiency import calculate_efficiency_score, calculate_efficiency_resource
-from src.scoring.quality import calculate_quality_score
+from caching.metrics import memoize_schedule_metric
+from scoring.efficiency import calculate_efficiency_score, calculate_efficiency_resource
+from scoring.quality import calculate_quality_score
 # Note: Penalty costs moved to config.json because they are project-specific
 # and should be configurable by users. Only algorithm constants remain in constants.py.
 
+@memoize_schedule_metric
 def calculate_penalty_score(schedule: Schedule, config: Config) -> ScheduleMetrics:
     """Calculate penalty score for a schedule based on various constraint violations.
     
@@ -8,10 +8,12 @@ from core.models import Config, Schedule
 from validation.deadline import validate_deadline_constraints
 from validation.schedule import validate_schedule_constraints
 from validation.resources import validate_resources_constraints
+from caching.metrics import memoize_schedule_metric
 from core.constants import (
     QUALITY_CONSTANTS, SCORING_CONSTANTS, REPORT_CONSTANTS
 )
 
+@memoize_schedule_metric
 def calculate_quality_score(schedule: Schedule, config: Config) -> float:
     """
     Calculate quality score based on deadline compliance, dependencies, and resource utilization.
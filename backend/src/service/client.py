@@ -0,0 +1,65 @@
+"""Minimal client for the scheduling service.
+
+Uses only the standard library so callers such as the Dash frontend or batch
+scripts do not need to import the scheduling stack themselves.
+"""
+
+import json
+import urllib.request
+from typing import Any, Dict, List, Optional
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+
+class SchedulingClient:
+    """JSON-over-HTTP client for a running scheduling service."""
+
+    def __init__(self, base_url: Optional[str] = None, timeout: float = 300.0) -> None:
+        self.base_url = (base_url or f"http://{DEFAULT_HOST}:{DEFAULT_PORT}").rstrip("/")
+        self.timeout = timeout
+
+    def health(self) -> Dict[str, Any]:
+        """Return service status and counters."""
+        return self._request("GET", "/health")
+
+    def schedule(self, config_path: str, strategy: str = "greedy") -> Dict[str, Any]:
+        """Generate and score a schedule."""
+        return self._request("POST", "/schedule", {"config_path": config_path, "strategy": strategy})
+
+    def validate(self, config_path: str, intervals: Optional[Dict[str, Dict[str, str]]] = None) -> Dict[str, Any]:
+        """Validate a config and optionally a schedule."""
+        payload: Dict[str, Any] = {"config_path": config_path}
+        if intervals is not None:
+            payload["intervals"] = intervals
+        return self._request("POST", "/validate", payload)
+
+    def score(self, config_path: str, intervals: Dict[str, Dict[str, str]]) -> Dict[str, Any]:
+        """Compute metrics for an existing schedule."""
+        return self._request("POST", "/score", {"config_path": config_path, "intervals": intervals})
+
+    def batch(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Submit several requests at once; results come back in request order."""
+        return self._request("POST", "/batch", {"requests": requests})["results"]
+
+    def whatif(self, config_path: str, scenarios: List[Dict[str, Any]], strategy: str = "greedy",
+               include_baseline: bool = True) -> Dict[str, Any]:
+        """Schedule scenarios of a config in parallel; returns per-scenario results and a comparison table."""
+        return self._request("POST", "/whatif", {
+            "config_path": config_path,
+            "strategy": strategy,
+            "scenarios": scenarios,
+            "include_baseline": include_baseline
+        })
+
+    def _request(self, method: str, path: str, payload: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Send a JSON request and decode the JSON response."""
+        data = json.dumps(payload).encode("utf-8") if payload is not None else None
+        request = urllib.request.Request(
+            self.base_url + path,
+            data=data,
+            method=method,
+            headers={"Content-Type": "application/json"}
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            return json.loads(response.read().decode("utf-8"))
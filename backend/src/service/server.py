@@ -0,0 +1,187 @@
+"""Local HTTP scheduling service backed by a warm worker pool."""
+
+from __future__ import annotations
+import asyncio
+import json
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List, Literal, Optional, Sequence
+
+from fastapi import FastAPI
+from pydantic import BaseModel, Field
+
+from core.models import ScheduleMetrics
+from scenarios import BASELINE_NAME, ScenarioResult, compare_scenarios
+from service.client import DEFAULT_HOST, DEFAULT_PORT
+from service.worker import run_job, warm_worker
+
+DEFAULT_WORKERS = 2
+
+
+class IntervalData(BaseModel):
+    """Start and end dates of one scheduled submission (ISO strings)."""
+    start_date: str
+    end_date: str
+
+
+class JobRequest(BaseModel):
+    """A single schedule, validate, score or what-if request."""
+    op: Literal["schedule", "validate", "score", "whatif"] = "schedule"
+    config_path: str
+    strategy: str = "greedy"
+    intervals: Optional[Dict[str, IntervalData]] = None
+    scenario: Optional[Dict[str, Any]] = None
+
+
+class BatchRequest(BaseModel):
+    """Several requests answered together."""
+    requests: List[JobRequest] = Field(default_factory=list)
+
+
+class WhatIfRequest(BaseModel):
+    """Scenarios of one config to schedule with one strategy and compare."""
+    config_path: str
+    strategy: str = "greedy"
+    scenarios: List[Dict[str, Any]] = Field(default_factory=list)
+    include_baseline: bool = True
+
+
+class SchedulingService:
+    """Dispatches requests to a pool of workers that keep Configs warm."""
+
+    def __init__(
+        self,
+        workers: int = DEFAULT_WORKERS,
+        preload: Sequence[str] = (),
+        strategies: Sequence[str] = (),
+        use_processes: bool = True
+    ) -> None:
+        if use_processes:
+            # spawn avoids forking a process that already runs the event loop and threads
+            self._executor: Executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=warm_worker,
+                initargs=(tuple(preload), tuple(strategies))
+            )
+        else:
+            self._executor = ThreadPoolExecutor(
+                max_workers=workers,
+                initializer=warm_worker,
+                initargs=(tuple(preload), tuple(strategies))
+            )
+        self.workers = workers
+        self.use_processes = use_processes
+        self.requests_served = 0
+        self.batches_served = 0
+
+    async def submit(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Run one request on the pool."""
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(self._executor, run_job, request)
+        self.requests_served += 1
+        return result
+
+    async def submit_batch(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Run a batch concurrently, computing identical requests only once."""
+        unique: Dict[str, Dict[str, Any]] = {}
+        keys = []
+        for request in requests:
+            key = json.dumps(request, sort_keys=True)
+            unique.setdefault(key, request)
+            keys.append(key)
+        results = await asyncio.gather(*(self.submit(request) for request in unique.values()))
+        by_key = dict(zip(unique.keys(), results))
+        self.batches_served += 1
+        return [by_key[key] for key in keys]
+
+    def stats(self) -> Dict[str, Any]:
+        """Return service counters."""
+        return {
+            "workers": self.workers,
+            "mode": "process" if self.use_processes else "thread",
+            "requests_served": self.requests_served,
+            "batches_served": self.batches_served,
+        }
+
+    def shutdown(self) -> None:
+        """Stop the worker pool."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+def create_app(service: SchedulingService) -> FastAPI:
+    """Create the FastAPI app exposing a SchedulingService."""
+
+    @asynccontextmanager
+    async def lifespan(_app: FastAPI):
+        yield
+        service.shutdown()
+
+    app = FastAPI(title="Paper Planner Scheduling Service", lifespan=lifespan)
+
+    @app.get("/health")
+    async def health() -> Dict[str, Any]:
+        return {"status": "ok", **service.stats()}
+
+    @app.post("/schedule")
+    async def schedule(request: JobRequest) -> Dict[str, Any]:
+        return await service.submit(_job_payload(request, "schedule"))
+
+    @app.post("/validate")
+    async def validate(request: JobRequest) -> Dict[str, Any]:
+        return await service.submit(_job_payload(request, "validate"))
+
+    @app.post("/score")
+    async def score(request: JobRequest) -> Dict[str, Any]:
+        return await service.submit(_job_payload(request, "score"))
+
+    @app.post("/batch")
+    async def batch(request: BatchRequest) -> Dict[str, Any]:
+        payloads = [_job_payload(job, job.op) for job in request.requests]
+        return {"results": await service.submit_batch(payloads)}
+
+    @app.post("/whatif")
+    async def whatif(request: WhatIfRequest) -> Dict[str, Any]:
+        scenarios = ([{"name": BASELINE_NAME}] if request.include_baseline else []) + request.scenarios
+        payloads = [
+            {"op": "whatif", "config_path": request.config_path, "strategy": request.strategy, "scenario": scenario}
+            for scenario in scenarios
+        ]
+        results = await service.submit_batch(payloads)
+        return {"results": results, "table": compare_scenarios(_scenario_results(scenarios, results))}
+
+    return app
+
+
+def serve(
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    workers: int = DEFAULT_WORKERS,
+    preload: Sequence[str] = (),
+    strategies: Sequence[str] = ()
+) -> None:
+    """Run the scheduling service until interrupted."""
+    import uvicorn
+
+    service = SchedulingService(workers=workers, preload=preload, strategies=strategies)
+    uvicorn.run(create_app(service), host=host, port=port, log_level="info")
+
+
+def _job_payload(request: JobRequest, op: str) -> Dict[str, Any]:
+    """Convert a request model into the plain dict sent to workers."""
+    payload = request.model_dump(exclude_none=True)
+    payload["op"] = op
+    return payload
+
+
+def _scenario_results(scenarios: List[Dict[str, Any]], results: List[Dict[str, Any]]) -> List[ScenarioResult]:
+    """Convert what-if job results back into scenario results for comparison."""
+    converted = []
+    for scenario, result in zip(scenarios, results):
+        name = result.get("scenario") or scenario.get("name") or "scenario"
+        if result.get("ok"):
+            converted.append(ScenarioResult(name, result["changes"], ScheduleMetrics.model_validate(result["metrics"])))
+        else:
+            converted.append(ScenarioResult(name, "", error=result.get("error")))
+    return converted
@@ -0,0 +1,158 @@
+"""Job functions run in the scheduling service's worker processes.
+
+Each worker keeps parsed Configs warm in memory, keyed by config path and
+revalidated against the input files' stats. Jobs always receive a deep copy
+because schedulers assign conferences on the config's submissions.
+"""
+
+from __future__ import annotations
+import os
+from datetime import date
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from caching.snapshot import get_input_signature, load_config_cached
+from core.models import Config, Schedule, SchedulerStrategy
+
+JOB_OPERATIONS = ("schedule", "validate", "score", "whatif")
+
+# config path -> (input stat signature, Config)
+_WARM_CONFIGS: Dict[str, Tuple[Tuple, Config]] = {}
+
+
+def get_warm_config(config_path: str) -> Config:
+    """Return a private copy of a warm Config, reloading it if any input changed."""
+    return _load_warm_config(config_path).model_copy(deep=True)
+
+
+def _load_warm_config(config_path: str) -> Config:
+    """Return the shared warm Config itself; callers must not let it be scheduled or modified."""
+    key = os.path.abspath(config_path)
+    signature = get_input_signature(config_path)
+    cached = _WARM_CONFIGS.get(key)
+    if cached is None or cached[0] != signature:
+        config = load_config_cached(config_path)
+        _WARM_CONFIGS[key] = (signature, config)
+    else:
+        config = cached[1]
+    return config
+
+
+def warm_worker(config_paths: Iterable[str] = (), strategies: Iterable[str] = ()) -> None:
+    """Pool initializer: import scheduler modules and load configs up front."""
+    from schedulers.base import BaseScheduler
+
+    for strategy in strategies:
+        BaseScheduler._auto_register_strategy(SchedulerStrategy(strategy))
+    for config_path in config_paths:
+        try:
+            get_warm_config(config_path)
+        except Exception as e:
+            print(f"Warning: Could not preload config {config_path}: {e}")
+
+
+def run_job(request: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Run one service request and return a JSON-serializable result.
+
+    Parameters
+    ----------
+    request : Dict[str, Any]
+        ``op`` (schedule, validate, score or whatif), ``config_path`` and,
+        depending on the operation, ``strategy``, ``intervals`` and ``scenario``
+
+    Returns
+    -------
+    Dict[str, Any]
+        ``{"ok": True, ...}`` with operation results, or ``{"ok": False, "error": ...}``
+    """
+    op = request.get("op")
+    try:
+        if op == "schedule":
+            result = schedule_job(request["config_path"], request.get("strategy") or "greedy")
+        elif op == "validate":
+            result = validate_job(request["config_path"], request.get("intervals"))
+        elif op == "score":
+            result = score_job(request["config_path"], request.get("intervals") or {})
+        elif op == "whatif":
+            result = whatif_job(request["config_path"], request.get("strategy") or "greedy", request.get("scenario") or {})
+        else:
+            return {"ok": False, "op": op, "error": f"Unknown operation: {op}"}
+    except Exception as e:
+        return {"ok": False, "op": op, "error": f"{type(e).__name__}: {e}"}
+    result.update({"ok": True, "op": op})
+    return result
+
+
+def schedule_job(config_path: str, strategy: str) -> Dict[str, Any]:
+    """Generate a schedule with the requested strategy and score it, reusing cached results."""
+    from caching.results import get_result_cache, schedule_cached
+
+    config = get_warm_config(config_path)
+    schedule, metrics, cached = schedule_cached(config, strategy, cache=get_result_cache(config_path))
+    return {
+        "strategy": strategy,
+        "intervals": schedule_to_dict(schedule),
+        "metrics": metrics.model_dump(mode="json"),
+        "cached": cached,
+    }
+
+
+def validate_job(config_path: str, intervals: Optional[Dict[str, Dict[str, str]]] = None) -> Dict[str, Any]:
+    """Validate the config and, when given, a schedule against it."""
+    from validation.config import validate_config
+    from validation.schedule import validate_schedule_constraints
+
+    config = get_warm_config(config_path)
+    result: Dict[str, Any] = {"config": validate_config(config).model_dump(mode="json")}
+    if intervals is not None:
+        schedule = schedule_from_dict(intervals)
+        result["schedule"] = validate_schedule_constraints(schedule, config).model_dump(mode="json")
+    return result
+
+
+def score_job(config_path: str, intervals: Dict[str, Dict[str, str]]) -> Dict[str, Any]:
+    """Compute schedule metrics for an existing schedule."""
+    from analytics import generate_schedule_summary
+
+    config = get_warm_config(config_path)
+    metrics = generate_schedule_summary(schedule_from_dict(intervals), config)
+    return {"metrics": metrics.model_dump(mode="json")}
+
+
+def whatif_job(config_path: str, strategy: str, scenario: Dict[str, Any]) -> Dict[str, Any]:
+    """Schedule and score one scenario of a config, reusing cached results per variant."""
+    from caching.results import get_result_cache, schedule_cached
+    from scenarios import Scenario, materialize_scenario
+
+    parsed = Scenario.from_dict(scenario)
+    # The variant shares unchanged submissions with the warm config; schedule a private copy of it
+    config = materialize_scenario(_load_warm_config(config_path), parsed).model_copy(deep=True)
+    _, metrics, cached = schedule_cached(config, strategy, cache=get_result_cache(config_path))
+    return {
+        "scenario": parsed.name,
+        "changes": parsed.describe(),
+        "strategy": strategy,
+        "metrics": metrics.model_dump(mode="json"),
+        "cached": cached,
+    }
+
+
+def schedule_to_dict(schedule: Schedule) -> Dict[str, Dict[str, str]]:
+    """Convert a Schedule to the ``{id: {start_date, end_date}}`` JSON form."""
+    return {
+        sid: {"start_date": interval.start_date.isoformat(), "end_date": interval.end_date.isoformat()}
+        for sid, interval in schedule.intervals.items()
+    }
+
+
+def schedule_from_dict(intervals: Dict[str, Dict[str, str]]) -> Schedule:
+    """Build a Schedule from the ``{id: {start_date, end_date}}`` JSON form."""
+    schedule = Schedule()
+    for sid, interval in intervals.items():
+        schedule.add_interval(
+            sid,
+            date.fromisoformat(interval["start_date"]),
+            end_date=date.fromisoformat(interval["end_date"])
+        )
+    return schedule
+
@@ -1,7 +1,7 @@
 """Unified table generation and formatting for schedules."""
 
 from __future__ import annotations
-from typing import Dict, List, Any
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Sequence
 from datetime import date, timedelta, date as current_date
 import json
 import csv
@@ -71,20 +71,29 @@ def generate_schedule_summary_table(schedule: Schedule, config: Config) -> List[
 
 def generate_schedule_table(schedule: Schedule, config: Config) -> List[Dict[str, str]]:
     """Generate a table showing the schedule assignments."""
+    return list(iter_schedule_rows(schedule, config))
+
+
+def iter_schedule_rows(schedule: Schedule, config: Config,
+                       durations: Optional[Dict[str, int]] = None) -> Iterator[Dict[str, str]]:
+    """Yield schedule table rows one at a time, ordered by start date.
+
+    ``durations`` maps submission IDs to precomputed durations in days so
+    callers producing several tables only compute them once.
+    """
     if not schedule:
-        return []
+        return
     
-    table_data = []
     for submission_id, interval in sorted(schedule.intervals.items(), key=lambda x: x[1].start_date):
         submission = config.get_submission(submission_id)
         if submission:
-            duration_days = submission.get_duration_days(config)
+            duration_days = durations[submission_id] if durations is not None else submission.get_duration_days(config)
             end_date = interval.start_date + timedelta(days=duration_days)
             
             # Get conference info
             conference_name = config.get_conference_name(submission.conference_id, default="N/A")
             
-            table_data.append({
+            yield {
                 "ID": submission_id,
                 "Title": submission.title[:DISPLAY_CONSTANTS.max_title_length] + "..." if len(submission.title) > DISPLAY_CONSTANTS.max_title_length else submission.title,
                 "Type": submission.kind.value.title(),
@@ -93,9 +102,7 @@ def generate_schedule_table(schedule: Schedule, config: Config) -> List[Dict[str
                 "Duration (days)": str(duration_days),
                 "Conference": conference_name,
                 "Status": "Scheduled"
-            })
-    
-    return table_data
+            }
 
 
 def generate_metrics_table(schedule: Schedule, config: Config) -> List[Dict[str, str]]:
@@ -155,22 +162,27 @@ def generate_metrics_table(schedule: Schedule, config: Config) -> List[Dict[str,
 
 def generate_deadline_table(schedule: Schedule, config: Config) -> List[Dict[str, str]]:
     """Generate a table showing deadline information."""
+    return list(iter_deadline_rows(schedule, config))
+
+
+def iter_deadline_rows(schedule: Schedule, config: Config,
+                       durations: Optional[Dict[str, int]] = None) -> Iterator[Dict[str, str]]:
+    """Yield deadline table rows one at a time, ordered by start date."""
     if not schedule:
-        return []
+        return
     
-    table_data = []
     for submission_id, interval in sorted(schedule.intervals.items(), key=lambda x: x[1].start_date):
         submission = config.get_submission(submission_id)
         if submission and submission.conference_id:
             conference = config.get_conference(submission.conference_id)
             if conference and submission.kind in conference.deadlines:
                 deadline = conference.deadlines[submission.kind]
-                duration_days = submission.get_duration_days(config)
+                duration_days = durations[submission_id] if durations is not None else submission.get_duration_days(config)
                 end_date = interval.start_date + timedelta(days=duration_days)
                 days_until_deadline = (deadline - end_date).days
                 status = "On Time" if days_until_deadline >= 0 else "Late"
                 
-                table_data.append({
+                yield {
                     "Submission": submission_id,
                     "Conference": conference.name,
                     "Type": submission.kind.value.title(),
@@ -179,54 +191,58 @@ def generate_deadline_table(schedule: Schedule, config: Config) -> List[Dict[str
                     "Deadline": deadline.strftime("%Y-%m-%d"),
                     "Days Until Deadline": str(days_until_deadline),
                     "Status": status
-                })
-    
-    return table_data
+                }
 
 
 def generate_violations_table(validation_result: Dict[str, Any]) -> List[Dict[str, str]]:
     """Generate a table showing constraint violations."""
+    return list(iter_violation_rows(validation_result))
+
+
+# Columns of violation rows; each violation type fills only the detail columns that apply to it
+VIOLATION_COLUMNS = ("Type", "Submission", "Description", "Severity", "Days Late", "Dependency", "Load", "Limit")
+
+
+def iter_violation_rows(validation_result: Dict[str, Any]) -> Iterator[Dict[str, str]]:
+    """Yield constraint violation rows one at a time; their keys vary by type, see VIOLATION_COLUMNS."""
     if not validation_result or "constraints" not in validation_result:
-        return []
+        return
     
-    table_data = []
     constraints = validation_result["constraints"]
     
     # Process deadline violations
     if "deadlines" in constraints:
         for violation in constraints["deadlines"].get("violations", []):
-            table_data.append({
+            yield {
                 "Type": "Deadline",
                 "Submission": violation.get("submission_id", "Unknown"),
                 "Description": violation.get("description", "Unknown"),
                 "Severity": violation.get("severity", "medium"),
                 "Days Late": str(violation.get("days_late", 0))
-            })
+            }
     
     # Process dependency violations
     if "dependencies" in constraints:
         for violation in constraints["dependencies"].get("violations", []):
-            table_data.append({
+            yield {
                 "Type": "Dependency",
                 "Submission": violation.get("submission_id", "Unknown"),
                 "Description": violation.get("description", "Unknown"),
                 "Severity": violation.get("severity", "medium"),
                 "Dependency": violation.get("dependency_id", "Unknown")
-            })
+            }
     
     # Process resource violations
     if "resources" in constraints:
         for violation in constraints["resources"].get("violations", []):
-            table_data.append({
+            yield {
                 "Type": "Resource",
                 "Submission": violation.get("submission_id", "Unknown"),
                 "Description": violation.get("description", "Unknown"),
                 "Severity": violation.get("severity", "medium"),
                 "Load": str(violation.get("load", 0)),
                 "Limit": str(violation.get("limit", 0))
-            })
-    
-    return table_data
+            }
 
 
 def generate_penalties_table(penalty_breakdown: Dict[str, float]) -> List[Dict[str, str]]:
@@ -570,14 +586,46 @@ def save_schedule_json(schedule: Schedule, output_dir: str, filename: str = "sch
 
 def save_table_csv(table_data: List[Dict[str, str]], output_dir: str, filename: str) -> str:
     """Save table data as CSV file."""
-    if not table_data:
+    return write_rows_csv(table_data, Path(output_dir) / filename)
+
+
+def write_rows_csv(rows: Iterable[Dict[str, str]], filepath: Path,
+                   fieldnames: Optional[Sequence[str]] = None) -> str:
+    """
+    Stream rows into a CSV file without materializing the table.
+    
+    Nothing is written when there are no rows.
+    
+    Parameters
+    ----------
+    rows : Iterable[Dict[str, str]]
+        Table rows, typically a lazy generator
+    filepath : Path
+        Destination CSV file
+    fieldnames : Sequence[str], optional
+        CSV header; taken from the first row when omitted. Rows missing a
+        column leave it empty
+        
+    Returns
+    -------
+    str
+        Path to saved CSV file, or "" when there were no rows
+        
+    Raises
+    ------
+    ValueError
+        If a row has a key outside the header, rather than dropping it
+    """
+    rows = iter(rows)
+    first = next(rows, None)
+    if first is None:
         return ""
     
-    filepath = Path(output_dir) / filename
     with open(filepath, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=table_data[0].keys())
+        writer = csv.DictWriter(f, fieldnames=list(fieldnames or first.keys()), restval="")
         writer.writeheader()
-        writer.writerows(table_data)
+        writer.writerow(first)
+        writer.writerows(rows)
     return str(filepath)
 
 
@@ -1,8 +1,9 @@
 """Configuration validation functions for data integrity and schema compliance."""
 
-from typing import Dict, Any, List, Optional, Set
+from typing import List
 from datetime import date, timedelta
 
+from core.graph import get_dependency_structure
 from core.models import Config, Submission, Conference, ValidationResult, Schedule
 from core.constants import SCHEDULING_CONSTANTS
 from validation.constants import validate_constants
@@ -135,64 +136,4 @@ def _validate_config_conferences(config: Config) -> List[str]:
 
 def _detect_circular_dependencies(config: Config) -> List[str]:
     """Detect circular dependencies in submissions."""
-    def has_cycle(node: str, visited: Set[str], rec_stack: Set[str], graph: Dict[str, List[str]]) -> bool:
-        visited.add(node)
-        rec_stack.add(node)
-        
-        for neighbor in graph.get(node, []):
-            if neighbor not in visited:
-                if has_cycle(neighbor, visited, rec_stack, graph):
-                    return True
-                elif neighbor in rec_stack:
-                    return True
-        
-        rec_stack.remove(node)
-        return False
-    
-    # Build dependency graph
-    graph = {}
-    for submission in config.submissions:
-        if submission.depends_on:
-            graph[submission.id] = submission.depends_on
-        else:
-            graph[submission.id] = []
-    
-    # Check for cycles
-    visited: Set[str] = set()
-    cycles = []
-    
-    for node in graph:
-        if node not in visited:
-            rec_stack: Set[str] = set()
-            if has_cycle(node, visited, rec_stack, graph):
-                # Find the actual cycle
-                cycle_path = _find_cycle_path(node, graph)
-                if cycle_path:
-                    cycles.append(" -> ".join(cycle_path))
-    
-    return cycles
-
-
-def _find_cycle_path(start: str, graph: Dict[str, List[str]]) -> Optional[List[str]]:
-    """Find a cycle path starting from the given node."""
-    def dfs(node: str, path: List[str], visited: Set[str]) -> Optional[List[str]]:
-        if node in path:
-            # Found a cycle
-            cycle_start = path.index(node)
-            return path[cycle_start:] + [node]
-        
-        if node in visited:
-            return None
-        
-        visited.add(node)
-        path.append(node)
-        
-        for neighbor in graph.get(node, []):
-            result = dfs(neighbor, path, visited)
-            if result:
-                return result
-        
-        path.pop()
-        return None
-    
-    return dfs(start, [], set())
+    return [" -> ".join(cycle) for cycle in get_dependency_structure(config.submissions).cycles]
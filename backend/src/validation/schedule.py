@@ -4,12 +4,14 @@ from typing import Dict, Any
 from datetime import date
 
 from core.models import Config, Schedule, ValidationResult
+from caching.metrics import memoize_schedule_metric
 from validation.resources import validate_resources_constraints
 from validation.venue import validate_venue_constraints
 from validation.deadline import validate_deadline_constraints
 from validation.dependencies import validate_dependency_constraints
 
 
+@memoize_schedule_metric
 def validate_schedule_constraints(schedule: Schedule, config: Config) -> ValidationResult:
     """Validate comprehensive schedule constraints including deadlines, dependencies, resources, and venue."""
     if not schedule:
@@ -363,6 +363,47 @@ class TestCSVExporter:
             assert all("Penalty Type" in item and "Amount" in item for item in penalties_data)
 
 
+def test_daily_load_stats_match_per_day_count(sample_config, sample_schedule):
+    """Test the endpoint sweep agrees with counting load day by day."""
+    exporter = CSVExporter(sample_config)
+    data = exporter.prepare_export(sample_schedule, validation=False, penalties=False)
+    
+    daily_load: Dict[date, int] = {}
+    for sid, duration in data.durations.items():
+        start = sample_schedule.intervals[sid].start_date
+        for offset in range(duration):
+            day = start + timedelta(days=offset)
+            daily_load[day] = daily_load.get(day, 0) + 1
+    
+    assert data.max_concurrent == max(daily_load.values())
+    assert data.average_load == pytest.approx(sum(daily_load.values()) / len(daily_load))
+
+
+def test_export_all_csv_computes_shared_data_once(sample_config, sample_schedule, temp_output_dir, monkeypatch):
+    """Test validation and penalties run once per export, not once per file."""
+    exporter = CSVExporter(sample_config)
+    calls = {"validation": 0, "penalties": 0}
+    run_validation = exporter._run_comprehensive_validation
+    run_penalties = exporter._calculate_comprehensive_penalties
+    
+    def count_validation(schedule):
+        calls["validation"] += 1
+        return run_validation(schedule)
+    
+    def count_penalties(schedule):
+        calls["penalties"] += 1
+        return run_penalties(schedule)
+    
+    monkeypatch.setattr(exporter, "_run_comprehensive_validation", count_validation)
+    monkeypatch.setattr(exporter, "_calculate_comprehensive_penalties", count_penalties)
+    saved_files = exporter.export_all_csv(sample_schedule, str(temp_output_dir / "all"))
+    
+    assert calls == {"validation": 1, "penalties": 1}
+    sequential_dir = temp_output_dir / "sequential"
+    assert Path(saved_files["schedule"]).read_text() == Path(exporter.export_schedule_csv(sample_schedule, str(sequential_dir))).read_text()
+    assert Path(saved_files["summary"]).read_text() == Path(exporter.export_summary_csv(sample_schedule, str(sequential_dir))).read_text()
+
+
 def test_export_schedule_to_csv_convenience_function(sample_config, sample_schedule, temp_output_dir):
     """Test the convenience function for exporting schedule to CSV."""
     from exporters.csv_exporter import export_schedule_to_csv
@@ -0,0 +1,129 @@
+"""Tests for the parallel export orchestrator."""
+
+import json
+import threading
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+
+from core.models import Config, Schedule
+from exporters.orchestrator import (
+    EXPORT_MANIFEST_NAME, ExportArtifact, ExportOrchestrator, FigureRenderer, build_schedule_artifacts
+)
+
+
+@pytest.fixture
+def schedule() -> Schedule:
+    """Three staggered intervals."""
+    schedule = Schedule()
+    for index in range(3):
+        start = date(2026, 1, 1) + timedelta(days=20 * index)
+        schedule.add_interval(f"sub-{index}", start, end_date=start + timedelta(days=14))
+    return schedule
+
+
+def test_export_writes_then_skips_unchanged(schedule, tmp_path) -> None:
+    """Test a repeated export reuses files whose inputs did not change."""
+    config = Config.create_default()
+    orchestrator = ExportOrchestrator(str(tmp_path))
+
+    first = orchestrator.run(build_schedule_artifacts(schedule, config, ["csv", "json", "html"]))
+    assert not any(result.skipped or result.error for result in first.values())
+    assert Path(first["csv"].path).read_text().splitlines()[0] == "Submission ID,Start Date,End Date,Duration (days)"
+    assert json.loads(Path(first["json"].path).read_text())["intervals"]["sub-0"]["start_date"] == "2026-01-01"
+    assert "plotly" in Path(first["html"].path).read_text()
+
+    second = orchestrator.run(build_schedule_artifacts(schedule, config, ["csv", "json", "html"]))
+    assert all(result.skipped for result in second.values())
+
+    schedule.add_interval("sub-3", date(2026, 6, 1), end_date=date(2026, 6, 10))
+    third = orchestrator.run(build_schedule_artifacts(schedule, config, ["csv", "json"]))
+    assert not any(result.skipped for result in third.values())
+    assert all(result.skipped for result in orchestrator.run(
+        build_schedule_artifacts(schedule, config, ["csv"])).values())
+    assert not orchestrator.run(build_schedule_artifacts(schedule, config, ["csv"]), force=True)["csv"].skipped
+
+
+def test_json_export_writes_given_payload(schedule, tmp_path) -> None:
+    """Test the JSON export keeps the loaded schedule file's format and tracks its changes."""
+    config = Config.create_default()
+    orchestrator = ExportOrchestrator(str(tmp_path))
+    legacy = {"sub-0": "2026-01-01", "sub-1": "2026-01-21", "sub-2": "2026-02-10"}
+
+    first = orchestrator.run(build_schedule_artifacts(schedule, config, ["json"], json_data=legacy))
+    assert json.loads(Path(first["json"].path).read_text()) == legacy
+
+    legacy["note"] = "edited"
+    second = orchestrator.run(build_schedule_artifacts(schedule, config, ["json"], json_data=legacy))
+    assert not second["json"].skipped
+    assert json.loads(Path(second["json"].path).read_text())["note"] == "edited"
+
+
+def test_failed_artifact_is_isolated_and_retried(tmp_path) -> None:
+    """Test one failing artifact neither blocks the others nor enters the manifest."""
+    def fail(path: Path) -> str:
+        raise RuntimeError("renderer unavailable")
+
+    def write(path: Path) -> str:
+        path.write_text("ok")
+        return str(path)
+
+    orchestrator = ExportOrchestrator(str(tmp_path))
+    artifacts = [
+        ExportArtifact("good", "good.txt", {"v": 1}, write),
+        ExportArtifact("bad", "bad.txt", {"v": 1}, fail),
+    ]
+    results = orchestrator.run(artifacts)
+    assert results["bad"].error == "renderer unavailable"
+    assert Path(results["good"].path).read_text() == "ok"
+
+    manifest = json.loads((tmp_path / EXPORT_MANIFEST_NAME).read_text())
+    assert set(manifest["artifacts"]) == {"good"}
+    assert orchestrator.run(artifacts)["bad"].error is not None
+
+
+def test_artifacts_are_written_concurrently(tmp_path) -> None:
+    """Test independent artifacts run on separate worker threads."""
+    barrier = threading.Barrier(3, timeout=5)
+
+    def write(path: Path) -> str:
+        barrier.wait()
+        path.write_text(path.name)
+        return str(path)
+
+    artifacts = [ExportArtifact(f"a{index}", f"a{index}.txt", index, write) for index in range(3)]
+    results = ExportOrchestrator(str(tmp_path), max_workers=3).run(artifacts)
+    assert all(result.path and not result.error for result in results.values())
+
+
+def test_renderer_serializes_renders(tmp_path) -> None:
+    """Test the shared renderer renders one figure at a time from any thread."""
+    active = []
+    overlaps = []
+
+    class Figure:
+        def write_image(self, path: str) -> None:
+            active.append(path)
+            overlaps.append(len(active))
+            Path(path).write_bytes(b"png")
+            active.remove(path)
+
+    renderer = FigureRenderer()
+    threads = [
+        threading.Thread(target=renderer.write_image, args=(Figure(), str(tmp_path / f"{index}.png")))
+        for index in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert max(overlaps) == 1
+    assert len(list(tmp_path.glob("*.png"))) == 8
+
+
+def test_unknown_format_is_rejected(schedule) -> None:
+    """Test unsupported formats raise ValueError."""
+    with pytest.raises(ValueError):
+        build_schedule_artifacts(schedule, Config.create_default(), ["pdf"])
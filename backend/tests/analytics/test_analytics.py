@@ -119,3 +119,24 @@ class TestScheduleMetricsStructure:
             assert isinstance(metrics.start_date, date)
         if metrics.end_date is not None:
             assert isinstance(metrics.end_date, date) 
+
+
+class TestDependencyGraphAnalysis:
+    """Test depth and critical path analysis of the dependency graph."""
+
+    def test_longest_chain_is_critical_path(self) -> None:
+        """Test the critical path follows the longest dependency chain from its root."""
+        from analytics import _build_dependency_graph, _calculate_depths, _find_critical_path
+        from core.models import Submission, SubmissionType
+
+        def paper(sid: str, *deps: str) -> Submission:
+            return Submission(id=sid, title=sid, kind=SubmissionType.PAPER, depends_on=list(deps))
+
+        submissions = [paper("a"), paper("b", "a"), paper("c", "b"), paper("d"), paper("e", "a", "d"),
+                       paper("x", "y"), paper("y", "x")]
+        config = Config.create_default().model_copy(update={"submissions": submissions})
+        nodes = _build_dependency_graph(config)
+
+        assert _calculate_depths(nodes) == {"a": 0, "d": 0, "b": 1, "e": 1, "c": 2}
+        assert _find_critical_path(nodes) == ["a", "b", "c"]
+        assert nodes["c"].critical_path and not nodes["e"].critical_path
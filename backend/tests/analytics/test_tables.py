@@ -2,6 +2,9 @@
 
 from datetime import date
 from typing import Dict, List, Any, Optional
+import csv
+
+import pytest
 
 from tables import (
     generate_simple_monthly_table, 
@@ -16,6 +19,9 @@ from tables import (
     create_analytics_table,
     save_schedule_json,
     save_table_csv,
+    write_rows_csv,
+    iter_violation_rows,
+    VIOLATION_COLUMNS,
     get_output_summary
 )
 from core.models import Schedule, Interval
@@ -373,6 +379,50 @@ class TestFileIOFunctions:
         
         assert filepath == ""
     
+    def test_write_rows_csv_streams_generator(self, tmp_path) -> None:
+        """Test rows are written lazily from a generator, header from the first row."""
+        consumed = []
+        
+        def rows():
+            for index in range(1000):
+                consumed.append(index)
+                yield {"ID": f"sub-{index}", "Value": str(index)}
+        
+        generator = rows()
+        filepath = write_rows_csv(generator, tmp_path / "streamed.csv")
+        
+        lines = (tmp_path / "streamed.csv").read_text(encoding="utf-8").splitlines()
+        assert filepath.endswith("streamed.csv")
+        assert lines[0] == "ID,Value"
+        assert lines[-1] == "sub-999,999"
+        assert len(consumed) == 1000
+        assert write_rows_csv(iter([]), tmp_path / "none.csv") == ""
+        assert not (tmp_path / "none.csv").exists()
+    
+    def test_write_rows_csv_keeps_mixed_violation_columns(self, tmp_path) -> None:
+        """Test detail columns of every violation type survive, whichever type comes first."""
+        validation_result: Any = {
+            'constraints': {
+                'deadlines': {'violations': [{'submission_id': 'paper1', 'days_late': 3}]},
+                'dependencies': {'violations': [{'submission_id': 'paper2', 'dependency_id': 'paper1'}]},
+                'resources': {'violations': [{'submission_id': 'paper3', 'load': 4, 'limit': 2}]}
+            }
+        }
+        filepath = write_rows_csv(iter_violation_rows(validation_result), tmp_path / "violations.csv", VIOLATION_COLUMNS)
+        
+        with open(filepath, newline='', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+        assert list(rows[0].keys()) == list(VIOLATION_COLUMNS)
+        assert rows[0]["Days Late"] == "3" and rows[0]["Dependency"] == ""
+        assert rows[1]["Dependency"] == "paper1"
+        assert (rows[2]["Load"], rows[2]["Limit"]) == ("4", "2")
+    
+    def test_write_rows_csv_rejects_keys_outside_header(self, tmp_path) -> None:
+        """Test a row with a column the header lacks raises instead of losing data."""
+        rows = [{"ID": "a"}, {"ID": "b", "Extra": "x"}]
+        with pytest.raises(ValueError):
+            write_rows_csv(rows, tmp_path / "mixed.csv")
+    
     def test_get_output_summary(self) -> None:
         """Test output summary generation."""
         saved_files = {
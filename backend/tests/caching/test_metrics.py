@@ -0,0 +1,89 @@
+"""Tests for schedule versioning and metric memoization."""
+
+import pickle
+from datetime import date
+
+import pytest
+
+from analytics import generate_schedule_summary
+from caching.metrics import clear_metrics_cache, get_metrics_cache_stats, memoize_schedule_metric
+from core.models import Interval, Schedule
+from exporters.csv_exporter import CSVExporter
+from reports import generate_schedule_report
+
+
+@pytest.fixture(autouse=True)
+def fresh_metrics_cache():
+    """Start every test with an empty memo."""
+    clear_metrics_cache()
+    yield
+    clear_metrics_cache()
+
+
+def _scheduled(config) -> Schedule:
+    """Schedule every submission in the config on consecutive months."""
+    schedule = Schedule()
+    for index, submission in enumerate(config.submissions):
+        schedule.add_interval(submission.id, date(2026, 1 + index, 1), duration_days=20)
+    return schedule
+
+
+class TestScheduleVersion:
+    """Test the schedule version counter."""
+
+    def test_mutations_bump_version(self) -> None:
+        """Test every kind of interval change produces a new version."""
+        schedule = Schedule()
+        seen = {schedule.version}
+        schedule.add_interval("a", date(2026, 1, 1))
+        seen.add(schedule.version)
+        schedule.intervals["b"] = Interval(start_date=date(2026, 2, 1), end_date=date(2026, 2, 5))
+        seen.add(schedule.version)
+        del schedule.intervals["a"]
+        seen.add(schedule.version)
+        schedule.intervals = {}
+        seen.add(schedule.version)
+        assert len(seen) == 5
+
+    def test_unpickled_schedule_gets_new_version(self) -> None:
+        """Test versions from another process can never collide with local ones."""
+        schedule = Schedule()
+        schedule.add_interval("a", date(2026, 1, 1))
+        restored = pickle.loads(pickle.dumps(schedule))
+        assert restored.intervals == schedule.intervals
+        assert restored.version != schedule.version
+
+
+class TestMemoization:
+    """Test memoized metric functions."""
+
+    def test_recomputes_after_mutation(self, config) -> None:
+        """Test cached results are reused until the schedule changes."""
+        calls = []
+
+        @memoize_schedule_metric
+        def count_intervals(schedule, config):
+            calls.append(1)
+            return len(schedule.intervals)
+
+        schedule = _scheduled(config)
+        assert count_intervals(schedule, config) == count_intervals(schedule, config) == 2
+        assert len(calls) == 1
+
+        schedule.add_interval("extra", date(2026, 6, 1))
+        assert count_intervals(schedule, config) == 3
+        assert len(calls) == 2
+
+    def test_export_run_computes_each_metric_once(self, config, tmp_path) -> None:
+        """Test a full report and export computes validation and scoring once each."""
+        schedule = _scheduled(config)
+        generate_schedule_summary(schedule, config)
+        generate_schedule_report(schedule, config)
+        CSVExporter(config).export_all_csv(schedule, str(tmp_path))
+
+        stats = get_metrics_cache_stats()
+        assert stats["validation.schedule.validate_schedule_constraints"]["misses"] == 1
+        assert stats["scoring.penalties.calculate_penalty_score"]["misses"] == 1
+        assert stats["scoring.efficiency.calculate_efficiency_resource"]["misses"] == 1
+        assert stats["scoring.efficiency.calculate_efficiency_resource"]["hits"] > 0
+        assert all(counts["misses"] == 1 for counts in stats.values())
@@ -0,0 +1,147 @@
+"""Tests for the content-addressed schedule result cache."""
+
+import os
+import time
+from datetime import date, timedelta
+
+from caching.results import (
+    ScheduleResultCache, get_config_hash, get_result_cache, is_cacheable, make_result_key, schedule_cached
+)
+from analytics import generate_schedule_summary
+from core.config import load_config
+from core.models import Config, Schedule, ScheduleMetrics, SubmissionType
+from conftest import create_flexible_submission, create_mock_conference, create_mock_config
+
+
+def _empty_metrics() -> ScheduleMetrics:
+    """Metrics of an empty schedule, for entries stored directly."""
+    return generate_schedule_summary(Schedule(), Config.create_default())
+
+
+def _unassigned_config() -> Config:
+    """Config with one engineering paper the scheduler has to assign a conference to."""
+    conference = create_mock_conference("conf1", "Conf 1", {SubmissionType.PAPER: date.today() + timedelta(days=200)})
+    submission = create_flexible_submission("paper1", "Paper 1", preferred_conferences=["Conf 1"], engineering=True)
+    return create_mock_config(submissions=[submission], conferences=[conference])
+
+
+def _fill(cache: ScheduleResultCache, count: int) -> None:
+    """Store count entries with increasing last-used times, alternating strategies."""
+    for index in range(count):
+        schedule = Schedule()
+        schedule.add_interval(f"s{index}", date(2025, 1, 1), duration_days=index + 1)
+        cache.put(f"key{index}", schedule, _empty_metrics(), "greedy" if index % 2 else "optimal")
+        last_used = time.time() - 100 + index
+        os.utime(cache._entry_path(f"key{index}"), (last_used, last_used))
+
+
+class TestResultKeys:
+    """Test cache key construction."""
+
+    def test_key_depends_on_content(self, sample_config) -> None:
+        """Test equal configs share a key and edited configs do not."""
+        copy = sample_config.model_copy(deep=True)
+        assert get_config_hash(copy) == get_config_hash(sample_config)
+        assert make_result_key(copy, "greedy") == make_result_key(sample_config, "greedy")
+
+        copy.max_concurrent_submissions += 1
+        assert make_result_key(copy, "greedy") != make_result_key(sample_config, "greedy")
+
+    def test_key_ignores_unused_params(self, sample_config) -> None:
+        """Test only parameters the strategy accepts change the key."""
+        base = make_result_key(sample_config, "greedy")
+        assert make_result_key(sample_config, "greedy", {"seed": 7}) == base
+        assert make_result_key(sample_config, "random", {"seed": 7}) != make_result_key(sample_config, "random", {"seed": 8})
+        assert make_result_key(sample_config, "greedy", as_of=date(2030, 1, 1)) != base
+
+    def test_unseeded_random_is_not_cacheable(self) -> None:
+        """Test runs without a reproducible result are never cached."""
+        assert not is_cacheable("random")
+        assert is_cacheable("random", {"seed": 1})
+        assert is_cacheable("greedy")
+
+
+class TestScheduleCached:
+    """Test scheduling through the result cache."""
+
+    def test_hit_skips_scheduling(self, test_config_path, monkeypatch) -> None:
+        """Test a second identical run is served from the cache."""
+        cache = get_result_cache(test_config_path)
+        schedule, metrics, cached = schedule_cached(load_config(test_config_path), "greedy", cache=cache)
+        assert not cached
+        assert schedule.intervals
+
+        from schedulers.base import BaseScheduler
+        monkeypatch.setattr(BaseScheduler, "create_scheduler", classmethod(lambda *a, **k: 1 / 0))
+        again, again_metrics, cached = schedule_cached(load_config(test_config_path), "greedy", cache=cache)
+        assert cached
+        assert again.intervals == schedule.intervals
+        assert again_metrics == metrics
+
+        stats = cache.stats()
+        assert stats["entries"] == 1
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["by_strategy"] == {"greedy": 1}
+
+    def test_hit_leaves_config_like_a_miss(self, tmp_path) -> None:
+        """Test a hit applies the conference assignments a fresh run makes on the config."""
+        cache = ScheduleResultCache(str(tmp_path))
+        missed = _unassigned_config()
+        schedule_cached(missed, "greedy", cache=cache)
+        assert missed.submissions[0].conference_id == "conf1"
+
+        hit = _unassigned_config()
+        _, _, cached = schedule_cached(hit, "greedy", cache=cache)
+        assert cached
+        assert hit.model_dump() == missed.model_dump()
+
+    def test_fallback_results_are_not_cached(self, test_config_path, monkeypatch) -> None:
+        """Test a run where the strategy failed and fell back is retried next time."""
+        from schedulers.optimal import OptimalScheduler
+        monkeypatch.setattr(OptimalScheduler, "_setup_milp_model", lambda *args: None)
+        cache = get_result_cache(test_config_path)
+
+        schedule, _, cached = schedule_cached(load_config(test_config_path), "optimal", cache=cache)
+        assert not cached
+        assert schedule.intervals
+        assert cache.stats()["entries"] == 0
+
+        _, _, cached = schedule_cached(load_config(test_config_path), "optimal", cache=cache)
+        assert not cached
+
+    def test_no_cache_always_schedules(self, test_config_path) -> None:
+        """Test passing no cache runs the scheduler."""
+        _, _, cached = schedule_cached(load_config(test_config_path), "greedy")
+        assert not cached
+
+
+class TestEviction:
+    """Test LRU eviction and purging."""
+
+    def test_lru_eviction(self, tmp_path) -> None:
+        """Test the least recently used entries go first."""
+        cache = ScheduleResultCache(str(tmp_path), max_entries=3)
+        _fill(cache, 3)
+        assert cache.get("key0") is not None  # key0 becomes most recently used
+
+        cache.put("key3", Schedule(), _empty_metrics(), "greedy")
+        assert cache.get("key1") is None
+        assert cache.get("key0") is not None
+        assert cache.stats()["evictions"] == 1
+
+    def test_size_budget(self, tmp_path) -> None:
+        """Test entries are evicted to stay under the byte budget."""
+        cache = ScheduleResultCache(str(tmp_path), max_bytes=1)
+        cache.put("key0", Schedule(), _empty_metrics(), "greedy")
+        assert cache.stats()["entries"] == 0
+        assert cache.get("key0") is None
+
+    def test_purge(self, tmp_path) -> None:
+        """Test purging by strategy, by age and everything."""
+        cache = ScheduleResultCache(str(tmp_path))
+        _fill(cache, 4)
+        assert cache.purge(strategy="optimal") == 2
+        assert cache.purge(older_than_days=1) == 0
+        assert cache.purge() == 2
+        assert cache.stats()["entries"] == 0
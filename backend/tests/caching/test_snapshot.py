@@ -0,0 +1,125 @@
+"""Tests for the binary config snapshot cache."""
+
+import json
+import os
+from pathlib import Path
+
+from caching.snapshot import (
+    SNAPSHOT_MAGIC, clear_config_cache, get_snapshot_path, inspect_config_cache,
+    load_config_cached, warm_config_cache
+)
+from core.config import load_config
+from core.models import Config
+
+
+class TestLoadConfigCached:
+    """Test loading configs through the snapshot cache."""
+
+    def test_first_load_writes_snapshot(self, test_config_path) -> None:
+        """Test that a cold load builds a snapshot next to the config."""
+        config = load_config_cached(test_config_path)
+        snapshot = get_snapshot_path(test_config_path)
+
+        assert isinstance(config, Config)
+        assert snapshot.exists()
+        assert snapshot.parent == Path(test_config_path).resolve().parent / ".cache"
+        assert snapshot.read_bytes().startswith(SNAPSHOT_MAGIC)
+
+    def test_cached_load_matches_json_load(self, test_config_path) -> None:
+        """Test that a snapshot round-trips to the same Config."""
+        load_config_cached(test_config_path)
+        cached = load_config_cached(test_config_path)
+        fresh = load_config(test_config_path)
+
+        assert cached.model_dump() == fresh.model_dump()
+
+    def test_cached_loads_are_independent_copies(self, test_config_path) -> None:
+        """Test that mutating one cached config does not leak into the next."""
+        first = load_config_cached(test_config_path)
+        first.submissions[0].conference_id = "mutated"
+        second = load_config_cached(test_config_path)
+
+        assert second.submissions[0].conference_id != "mutated"
+
+    def test_changed_input_rebuilds_snapshot(self, test_config_path) -> None:
+        """Test that editing a data file invalidates the snapshot."""
+        load_config_cached(test_config_path)
+        papers_file = Path(test_config_path).parent / "ed_papers.json"
+        papers = json.loads(papers_file.read_text(encoding="utf-8"))
+        papers.append({"id": "paper2", "title": "Test Paper 2", "draft_window_months": 2})
+        papers_file.write_text(json.dumps(papers), encoding="utf-8")
+
+        assert inspect_config_cache(test_config_path)["status"] == "stale"
+        config = load_config_cached(test_config_path)
+        assert "paper2" in {s.id for s in config.submissions}
+        assert inspect_config_cache(test_config_path)["status"] == "fresh"
+
+    def test_touched_input_keeps_snapshot(self, test_config_path) -> None:
+        """Test that a new mtime with identical content does not force a rebuild."""
+        load_config_cached(test_config_path)
+        papers_file = Path(test_config_path).parent / "ed_papers.json"
+        stat = papers_file.stat()
+        os.utime(papers_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+
+        assert inspect_config_cache(test_config_path)["status"] == "touched"
+        load_config_cached(test_config_path)
+        assert inspect_config_cache(test_config_path)["status"] == "fresh"
+
+    def test_corrupt_snapshot_is_rebuilt(self, test_config_path) -> None:
+        """Test that an unreadable snapshot is replaced."""
+        snapshot = get_snapshot_path(test_config_path)
+        snapshot.parent.mkdir(parents=True, exist_ok=True)
+        snapshot.write_bytes(b"garbage")
+
+        config = load_config_cached(test_config_path)
+        assert len(config.submissions) > 0
+        assert snapshot.read_bytes().startswith(SNAPSHOT_MAGIC)
+
+    def test_missing_config_falls_back_to_default(self, tmp_path) -> None:
+        """Test that a missing config file behaves like load_config."""
+        config = load_config_cached(str(tmp_path / "missing.json"))
+        assert isinstance(config, Config)
+        assert not (tmp_path / ".cache").exists()
+
+
+class TestCacheManagement:
+    """Test warming, inspecting and clearing snapshots."""
+
+    def test_warm_then_inspect(self, test_config_path, tmp_path) -> None:
+        """Test warming into a custom cache directory."""
+        cache_dir = tmp_path / "snapshots"
+        result = warm_config_cache(test_config_path, str(cache_dir))
+        assert result["status"] == "rebuilt"
+        assert result["previous"] == "missing"
+
+        again = warm_config_cache(test_config_path, str(cache_dir))
+        assert again["status"] == "fresh"
+
+        info = inspect_config_cache(test_config_path, str(cache_dir))
+        assert info["status"] == "fresh"
+        assert info["submissions"] == 2
+        assert info["payload_bytes"] > 0
+        assert all("sha256" in entry for entry in info["inputs"] if entry["exists"])
+
+    def test_clear(self, test_config_path, tmp_path) -> None:
+        """Test clearing a single snapshot and a whole cache directory."""
+        cache_dir = tmp_path / "snapshots"
+        warm_config_cache(test_config_path, str(cache_dir))
+
+        assert clear_config_cache(test_config_path, str(cache_dir)) == 1
+        assert inspect_config_cache(test_config_path, str(cache_dir))["status"] == "missing"
+
+        warm_config_cache(test_config_path, str(cache_dir))
+        assert clear_config_cache(cache_dir=str(cache_dir)) == 1
+
+
+class TestSchemaTag:
+    """Test the tag that invalidates snapshots when loading code changes."""
+
+    def test_schema_sources_exist(self) -> None:
+        """Test every fingerprinted module exists, including date parsing and record reading."""
+        from caching import snapshot
+        src_root = Path(snapshot.__file__).resolve().parent.parent
+
+        assert {"core/dates.py", "core/streaming.py"} <= set(snapshot._SCHEMA_SOURCES)
+        assert all((src_root / relative).is_file() for relative in snapshot._SCHEMA_SOURCES)
@@ -35,6 +35,25 @@ class TestLoadConfig:
         assert hasattr(config, 'blackout_dates')
         assert isinstance(config.blackout_dates, list)
     
+    def test_parallel_load_matches_sequential(self, test_data_dir) -> None:
+        """Test concurrent data file loading produces the same config as sequential loaders."""
+        config_path = Path(test_data_dir) / 'config.json'
+        config = load_config(str(config_path))
+
+        with open(config_path, 'r', encoding='utf-8') as f:
+            config_data = json.load(f)
+        data_files = config_data.get("data_files", {})
+        conferences = _load_conferences(Path(test_data_dir) / data_files.get("conferences", "conferences.json"))
+        submissions = _load_submissions_with_abstracts(
+            Path(test_data_dir) / data_files.get("mods", "mod_papers.json"),
+            Path(test_data_dir) / data_files.get("papers", "ed_papers.json"),
+            conferences,
+            config_data
+        )
+
+        assert [c.id for c in config.conferences] == [c.id for c in conferences]
+        assert [s.model_dump() for s in config.submissions] == [s.model_dump() for s in submissions]
+
     def test_load_config_file_not_found(self) -> None:
         """Test loading config when file is not found."""
         config = load_config("nonexistent_config.json")
@@ -91,3 +91,52 @@ def test_parse_date_long_invalid():
         assert False, "Should have raised ValueError"
     except (ValueError, TypeError):
         pass 
+
+
+def test_parse_date_fast_iso():
+    """Test that ISO dates and datetimes take the fast path."""
+    from core.dates import parse_date_fast, get_date_parse_stats, reset_date_parse_stats
+    reset_date_parse_stats()
+    assert parse_date_fast("2025-01-15") == date(2025, 1, 15)
+    assert parse_date_fast("2025-01-15T10:30:00") == date(2025, 1, 15)
+    assert parse_date_fast(date(2025, 1, 15)) == date(2025, 1, 15)
+    stats = get_date_parse_stats()
+    assert stats["iso"] == 2
+    assert stats["fallback"] == 0
+
+def test_parse_date_fast_fallback():
+    """Test that non-ISO dates fall back to dateutil and are counted."""
+    from core.dates import parse_date_fast, get_date_parse_stats, reset_date_parse_stats
+    reset_date_parse_stats()
+    assert parse_date_fast("January 15, 2025") == date(2025, 1, 15)
+    assert parse_date_fast("01/15/2025") == date(2025, 1, 15)
+    assert get_date_parse_stats()["fallback"] == 2
+
+def test_parse_date_fast_invalid():
+    """Test that unparseable input raises like dateutil does."""
+    from core.dates import parse_date_fast, get_date_parse_stats, reset_date_parse_stats
+    reset_date_parse_stats()
+    try:
+        parse_date_fast("invalid-date")
+        assert False, "Should have raised ValueError"
+    except ValueError:
+        pass
+    try:
+        parse_date_fast(None)
+        assert False, "Should have raised TypeError"
+    except TypeError:
+        pass
+    assert get_date_parse_stats()["failed"] == 1
+
+def test_expand_date_range():
+    """Test inclusive date range expansion."""
+    from core.dates import expand_date_range
+    result = expand_date_range(date(2024, 12, 30), date(2025, 1, 2))
+    assert result == [date(2024, 12, 30), date(2024, 12, 31), date(2025, 1, 1), date(2025, 1, 2)]
+    assert expand_date_range(date(2025, 1, 2), date(2025, 1, 1)) == []
+
+def test_expand_recurring_dates():
+    """Test recurring date expansion across years."""
+    from core.dates import expand_recurring_dates
+    assert expand_recurring_dates(7, 4, range(2024, 2027)) == [date(2024, 7, 4), date(2025, 7, 4), date(2026, 7, 4)]
+    assert expand_recurring_dates(2, 29, range(2023, 2026)) == [date(2024, 2, 29)]
@@ -0,0 +1,147 @@
+"""Tests for critical path analysis of the dependency graph."""
+
+import time
+
+from core.graph import analyze_config_graph, analyze_graph, analyze_structure, get_dependency_structure
+from core.models import SubmissionType
+from conftest import create_mock_config, create_mock_submission
+
+
+class TestAnalyzeStructure:
+    """Test topological order, components and cycle witnesses."""
+
+    def test_order_puts_dependencies_first(self) -> None:
+        """Test the order matches a depth-first post-order over dependencies."""
+        structure = analyze_structure({"c": ["b"], "a": [], "b": ["a"], "d": []})
+
+        assert structure.order == ["a", "b", "c", "d"]
+        assert not structure.has_cycles
+
+    def test_cycles_have_closed_witness_paths(self) -> None:
+        """Test each cyclic component gets one path back to its first member."""
+        dependencies = {"a": ["b"], "b": ["c"], "c": ["a"], "d": ["d"], "e": ["a"], "f": []}
+        structure = analyze_structure(dependencies)
+
+        assert structure.cycles == [["a", "b", "c", "a"], ["d", "d"]]
+        assert structure.cyclic == {"a", "b", "c", "d"}
+        assert structure.order.index("e") > structure.order.index("a")
+        assert sorted(structure.order) == sorted(dependencies)
+
+    def test_long_chain_does_not_recurse(self) -> None:
+        """Test a chain far deeper than the recursion limit is ordered."""
+        size = 50000
+        structure = analyze_structure({f"n{i}": [f"n{i + 1}"] if i + 1 < size else [] for i in range(size)})
+
+        assert structure.order[0] == f"n{size - 1}"
+        assert structure.order[-1] == "n0"
+
+    def test_long_cycle_is_found(self) -> None:
+        """Test a cycle through a long chain is found without recursion."""
+        size = 50000
+        structure = analyze_structure({f"n{i}": [f"n{(i + 1) % size}"] for i in range(size)})
+
+        assert len(structure.cycles) == 1
+        assert len(structure.cycles[0]) == size + 1
+
+    def test_structure_is_cached_per_dependencies(self) -> None:
+        """Test equal dependencies share one structure and changed ones do not."""
+        submissions = [
+            create_mock_submission("paper1", "Paper 1", SubmissionType.PAPER, "conf1"),
+            create_mock_submission("paper2", "Paper 2", SubmissionType.PAPER, "conf1", depends_on=["paper1"]),
+        ]
+        first = get_dependency_structure(submissions)
+
+        assert get_dependency_structure(list(submissions)) is first
+        submissions[0].depends_on = ["paper2"]
+        assert get_dependency_structure(submissions).has_cycles
+
+
+class TestAnalyzeGraph:
+    """Test the critical path method over plain dependency maps."""
+
+    def test_diamond_times_and_floats(self) -> None:
+        """Test earliest/latest times and floats on a diamond with one short branch."""
+        dependencies = {"a": [], "b": ["a"], "c": ["a"], "d": ["b", "c"]}
+        analysis = analyze_graph(dependencies, durations={"a": 2, "b": 5, "c": 1, "d": 3})
+
+        assert analysis.order[0] == "a" and analysis.order[-1] == "d"
+        assert analysis.earliest_start == {"a": 0, "b": 2, "c": 2, "d": 7}
+        assert analysis.latest_start == {"a": 0, "b": 2, "c": 6, "d": 7}
+        assert analysis.total_float == {"a": 0, "b": 0, "c": 4, "d": 0}
+        assert analysis.free_float["c"] == 4
+        assert analysis.critical_path == ["a", "b", "d"]
+        assert analysis.project_duration == 10
+        assert analysis.depths == {"a": 0, "b": 1, "c": 1, "d": 2}
+        assert analysis.is_critical("b") and not analysis.is_critical("c")
+
+    def test_free_float_differs_from_total_float(self) -> None:
+        """Test free float only counts slack before the next successor."""
+        dependencies = {"a": [], "b": ["a"], "c": [], "d": ["b", "c"]}
+        analysis = analyze_graph(dependencies, durations={"a": 5, "b": 1, "c": 1, "d": 1})
+
+        assert analysis.total_float["c"] == 5
+        assert analysis.free_float["c"] == 5
+        assert analysis.total_float["b"] == 0
+        assert analysis.free_float["a"] == 0
+
+    def test_lags_delay_dependents(self) -> None:
+        """Test a lag after dependencies finish shifts the dependent's start."""
+        analysis = analyze_graph({"a": [], "b": ["a"]}, durations={"a": 3, "b": 2}, lags={"b": 4})
+
+        assert analysis.earliest_start["b"] == 7
+        assert analysis.project_duration == 9
+        assert analysis.total_float == {"a": 0, "b": 0}
+
+    def test_cycles_are_reported_not_ordered(self) -> None:
+        """Test nodes on or behind a cycle are left out of the times."""
+        analysis = analyze_graph({"a": [], "b": ["a", "c"], "c": ["b"], "d": ["c"]})
+
+        assert analysis.order == ["a"]
+        assert sorted(analysis.cyclic) == ["b", "c", "d"]
+        assert analysis.critical_path == ["a"]
+
+    def test_unknown_and_duplicate_dependencies_are_ignored(self) -> None:
+        """Test dependencies outside the graph and repeats do not block ordering."""
+        analysis = analyze_graph({"a": ["missing"], "b": ["a", "a"]})
+
+        assert analysis.order == ["a", "b"]
+        assert analysis.depths == {"a": 0, "b": 1}
+
+    def test_priority_key_orders_critical_first(self) -> None:
+        """Test the priority key puts critical and then cyclic nodes in the right place."""
+        analysis = analyze_graph({"a": [], "b": ["a"], "c": [], "x": ["y"], "y": ["x"]},
+                                 durations={"a": 4, "b": 4, "c": 1})
+
+        assert sorted(["x", "c", "a"], key=analysis.priority_key) == ["a", "c", "x"]
+
+    def test_long_chain_is_linear(self) -> None:
+        """Test a long chain with many shortcut edges is analysed quickly."""
+        size = 20000
+        dependencies = {f"n{i}": [f"n{j}" for j in range(max(0, i - 3), i)] for i in range(size)}
+
+        start = time.perf_counter()
+        analysis = analyze_graph(dependencies)
+        elapsed = time.perf_counter() - start
+
+        assert len(analysis.critical_path) == size
+        assert analysis.max_depth == size - 1
+        assert elapsed < 5.0
+
+
+class TestAnalyzeConfigGraph:
+    """Test critical path analysis of a config's submissions."""
+
+    def test_uses_submission_durations(self) -> None:
+        """Test submission durations weight the critical path."""
+        submissions = [
+            create_mock_submission("paper1", "Paper 1", SubmissionType.PAPER, "conf1"),
+            create_mock_submission("abs1", "Abstract 1", SubmissionType.ABSTRACT, "conf1"),
+            create_mock_submission("paper2", "Paper 2", SubmissionType.PAPER, "conf1", depends_on=["paper1"]),
+        ]
+        config = create_mock_config(submissions=submissions)
+        analysis = analyze_config_graph(config)
+
+        paper_days = submissions[0].get_duration_days(config)
+        assert analysis.critical_path == ["paper1", "paper2"]
+        assert analysis.project_duration >= 2 * paper_days
+        assert analysis.total_float["abs1"] > 0
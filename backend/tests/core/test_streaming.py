@@ -0,0 +1,134 @@
+"""Tests for streaming JSON/JSONL ingestion."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from core import streaming
+from core.config import _load_mods, _load_papers, build_submission_filter, load_config
+from core.streaming import iter_json_records
+
+
+PAPERS = [
+    {"id": "paper1", "title": "Paper 1", "author": "ed", "preferred_conferences": ["ICML"]},
+    {"id": "paper2", "title": "Paper 2", "author": "pccp", "preferred_conferences": ["MICCAI"]},
+    {"id": "paper3", "title": "Paper 3", "preferred_conferences": ["MICCAI", "ICML"]},
+]
+
+
+@pytest.fixture(params=["array", "jsonl"])
+def papers_file(request, tmp_path) -> Path:
+    """Write the same papers as a JSON array or as JSONL."""
+    if request.param == "array":
+        path = tmp_path / "papers.json"
+        path.write_text(json.dumps(PAPERS, indent=2), encoding="utf-8")
+    else:
+        path = tmp_path / "papers.jsonl"
+        path.write_text("\n".join(json.dumps(p) for p in PAPERS) + "\n", encoding="utf-8")
+    return path
+
+
+class TestIterJsonRecords:
+    """Test the incremental record reader."""
+
+    def test_reads_array_and_jsonl(self, papers_file) -> None:
+        """Test both formats yield the same records in order."""
+        assert list(iter_json_records(papers_file)) == PAPERS
+
+    def test_small_chunks_span_records(self, papers_file, monkeypatch) -> None:
+        """Test records split across chunk boundaries decode correctly."""
+        monkeypatch.setattr(streaming, "ijson", None)
+        assert list(iter_json_records(papers_file, chunk_size=7)) == PAPERS
+
+    def test_jsonl_detected_without_suffix(self, tmp_path) -> None:
+        """Test a .json file holding one object per line is read as JSONL."""
+        path = tmp_path / "papers.json"
+        path.write_text("\n".join(json.dumps(p) for p in PAPERS), encoding="utf-8")
+        assert list(iter_json_records(path)) == PAPERS
+
+    def test_empty_file(self, tmp_path) -> None:
+        """Test empty files and empty arrays yield nothing."""
+        empty = tmp_path / "empty.json"
+        empty.write_text("  \n", encoding="utf-8")
+        empty_array = tmp_path / "empty_array.json"
+        empty_array.write_text("[ ]", encoding="utf-8")
+        assert list(iter_json_records(empty)) == []
+        assert list(iter_json_records(empty_array)) == []
+
+    def test_truncated_array_raises(self, tmp_path, monkeypatch) -> None:
+        """Test an unterminated array is reported as an error."""
+        monkeypatch.setattr(streaming, "ijson", None)
+        path = tmp_path / "broken.json"
+        path.write_text('[{"id": "a"}, {"id": ', encoding="utf-8")
+        with pytest.raises(ValueError):
+            list(iter_json_records(path))
+
+    def test_malformed_record_raises_before_eof(self, tmp_path, monkeypatch) -> None:
+        """Test an undecodable record stops the reader once it outgrows the bound."""
+        monkeypatch.setattr(streaming, "ijson", None)
+        path = tmp_path / "malformed.jsonl"
+        path.write_text('{"id": "a"}\n{"id": oops}\n' + "\n".join(json.dumps(p) for p in PAPERS * 200), encoding="utf-8")
+        read = []
+        records = iter_json_records(path, chunk_size=16, max_record_size=256)
+        with pytest.raises(ValueError, match="Malformed"):
+            for record in records:
+                read.append(record)
+        assert read == [{"id": "a"}]
+
+    def test_many_records_in_one_chunk(self, tmp_path, monkeypatch) -> None:
+        """Test records decoded from a large buffer are not re-copied per record."""
+        monkeypatch.setattr(streaming, "ijson", None)
+        path = tmp_path / "many.jsonl"
+        path.write_text("\n".join(json.dumps({"id": f"p{i}"}) for i in range(100000)), encoding="utf-8")
+        records = list(iter_json_records(path, chunk_size=4 * 1024 * 1024))
+        assert len(records) == 100000
+        assert records[-1] == {"id": "p99999"}
+
+    def test_is_lazy(self, papers_file, monkeypatch) -> None:
+        """Test records are produced one at a time."""
+        monkeypatch.setattr(streaming, "ijson", None)
+        records = iter_json_records(papers_file, chunk_size=16)
+        assert next(records)["id"] == "paper1"
+        records.close()
+
+
+class TestStreamingLoaders:
+    """Test mod and paper loaders built on the streaming reader."""
+
+    def test_load_papers_from_both_formats(self, papers_file) -> None:
+        """Test papers load identically from arrays and JSONL."""
+        papers = _load_papers(papers_file)
+        assert [p.id for p in papers] == ["paper1", "paper2", "paper3"]
+
+    def test_filter_by_author_uses_default(self, papers_file) -> None:
+        """Test author filtering treats a missing author as the loader default."""
+        papers = _load_papers(papers_file, {"authors": ["ed"]})
+        assert [p.id for p in papers] == ["paper1", "paper3"]
+
+    def test_filter_by_conference(self, papers_file) -> None:
+        """Test conference filtering before models are built."""
+        papers = _load_papers(papers_file, {"conferences": ["MICCAI"], "authors": ["pccp"]})
+        assert [p.id for p in papers] == ["paper2"]
+
+    def test_bad_record_is_skipped(self, tmp_path) -> None:
+        """Test one invalid record does not abort the rest of the file."""
+        path = tmp_path / "mods.jsonl"
+        lines = [{"id": "mod_1", "title": "Mod 1"}, {"title": "No id"}, {"id": "mod_2", "title": "Mod 2"}]
+        path.write_text("\n".join(json.dumps(line) for line in lines), encoding="utf-8")
+        assert [m.id for m in _load_mods(path)] == ["mod_1", "mod_2"]
+
+    def test_no_filters(self) -> None:
+        """Test empty filters build no predicate."""
+        assert build_submission_filter(None, "ed") is None
+        assert build_submission_filter({"authors": []}, "ed") is None
+
+    def test_config_submission_filters(self, test_config_path) -> None:
+        """Test submission_filters in config.json restricts loaded submissions."""
+        config_file = Path(test_config_path)
+        config_data = json.loads(config_file.read_text(encoding="utf-8"))
+        config_data["submission_filters"] = {"authors": ["ed"]}
+        config_file.write_text(json.dumps(config_data), encoding="utf-8")
+
+        config = load_config(test_config_path)
+        assert [s.id for s in config.submissions] == ["paper1"]
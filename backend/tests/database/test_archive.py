@@ -0,0 +1,142 @@
+"""Tests for the columnar schedule archive."""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from core.models import Schedule
+from database.archive import ARCHIVE_MAGIC, ScheduleArchive, export_parquet
+
+
+def _schedule(start: date, count: int = 3) -> Schedule:
+    """Build a schedule of count 10-day intervals starting on start."""
+    schedule = Schedule()
+    for index in range(count):
+        begin = start + timedelta(days=15 * index)
+        schedule.add_interval(f"sub-{index}", begin, end_date=begin + timedelta(days=10))
+    return schedule
+
+
+@pytest.fixture
+def archive(tmp_path) -> ScheduleArchive:
+    """Archive with two greedy schedules in 2026 and one optimal schedule in 2027."""
+    archive = ScheduleArchive(str(tmp_path / "history.ppa"))
+    archive.append(_schedule(date(2026, 1, 1)), "greedy", "jan", {"makespan": 40, "monthly_distribution": {"2026-01": 2}})
+    archive.append_many([
+        (_schedule(date(2026, 6, 1)), "greedy", "jun", None, datetime(2026, 6, 1, 12)),
+        (_schedule(date(2027, 3, 1), 5), "optimal", "mar", {"makespan": 70}, None),
+    ])
+    return archive
+
+
+def test_round_trip(archive) -> None:
+    """Test archived schedules rebuild the original intervals."""
+    groups = list(archive.scan())
+    assert [g.header["name"] for g in groups] == ["jan", "jun", "mar"]
+    assert groups[0].to_schedule().intervals == _schedule(date(2026, 1, 1)).intervals
+    assert archive.path.read_bytes().startswith(ARCHIVE_MAGIC)
+
+
+def test_header_metadata(archive) -> None:
+    """Test scalar metrics and timestamps are kept in headers."""
+    history = archive.metrics_history()
+    assert history[0]["makespan"] == 40
+    assert "monthly_distribution" not in history[0]
+    assert history[1]["created_at"] == "2026-06-01T12:00:00"
+    assert archive.stats() == {
+        "path": str(archive.path),
+        "bytes": archive.path.stat().st_size,
+        "row_groups": 3,
+        "rows": 11,
+        "by_strategy": {"greedy": 2, "optimal": 1},
+    }
+
+
+def test_predicate_pushdown(archive) -> None:
+    """Test strategy and date range filters select row groups by header stats."""
+    assert [g.header["name"] for g in archive.scan(strategy="greedy")] == ["jan", "jun"]
+    assert [h["name"] for h in archive.headers(start="2026-05-01", end=date(2026, 12, 31))] == ["jun"]
+    assert [h["name"] for h in archive.headers(start=date(2027, 1, 1))] == ["mar"]
+    assert archive.headers(strategy="optimal", end=date(2026, 12, 31)) == []
+
+
+def test_day_columns_are_views(archive) -> None:
+    """Test day columns are memory views that outlive the scan."""
+    groups = list(archive.scan(strategy="optimal"))
+    starts = groups[0].start_days
+    assert isinstance(starts, memoryview)
+    assert list(starts) == sorted(starts)
+    assert date.fromordinal(starts[0]) == date(2027, 3, 1)
+
+
+def test_truncated_tail_is_ignored(archive) -> None:
+    """Test a partially written final row group does not break reads."""
+    data = archive.path.read_bytes()
+    archive.path.write_bytes(data[:-5])
+    assert [h["name"] for h in archive.headers()] == ["jan", "jun"]
+
+
+@pytest.mark.parametrize("cut", [5, 40])
+def test_append_repairs_truncated_tail(archive, cut) -> None:
+    """Test appending after an interrupted write drops the torn group instead of writing behind it."""
+    data = archive.path.read_bytes()
+    archive.path.write_bytes(data[:-cut])
+    archive.append(_schedule(date(2028, 1, 1)), "optimal", "after")
+    assert [g.header["name"] for g in archive.scan()] == ["jan", "jun", "after"]
+    assert archive.stats()["row_groups"] == 3
+
+
+def test_append_repairs_torn_magic(tmp_path) -> None:
+    """Test a file cut inside its magic bytes is rewritten from the start."""
+    archive = ScheduleArchive(str(tmp_path / "torn.ppa"))
+    archive.path.write_bytes(ARCHIVE_MAGIC[:3])
+    archive.append(_schedule(date(2026, 1, 1)), "greedy", "first")
+    assert [h["name"] for h in archive.headers()] == ["first"]
+
+
+def test_append_refuses_other_files(tmp_path) -> None:
+    """Test appending to a file that is not an archive raises instead of corrupting it."""
+    archive = ScheduleArchive(str(tmp_path / "notes.ppa"))
+    archive.path.write_bytes(b"hello")
+    with pytest.raises(ValueError):
+        archive.append(_schedule(date(2026, 1, 1)), "greedy")
+    assert archive.path.read_bytes() == b"hello"
+
+
+def _append_from_process(path: str, index: int) -> None:
+    """Append a few schedules from a separate process."""
+    archive = ScheduleArchive(path)
+    for repeat in range(5):
+        archive.append(_schedule(date(2026, 1, 1) + timedelta(days=repeat)), "greedy", f"p{index}-{repeat}")
+
+
+def test_appends_from_several_processes(tmp_path) -> None:
+    """Test the file lock keeps concurrent appends from other processes whole."""
+    import multiprocessing
+    from database import archive as archive_module
+    if archive_module.fcntl is None or "fork" not in multiprocessing.get_all_start_methods():
+        pytest.skip("needs fcntl and fork")
+    path = str(tmp_path / "shared.ppa")
+    context = multiprocessing.get_context("fork")
+    processes = [context.Process(target=_append_from_process, args=(path, index)) for index in range(4)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    names = [h["name"] for h in ScheduleArchive(path).headers()]
+    assert sorted(names) == sorted(f"p{index}-{repeat}" for index in range(4) for repeat in range(5))
+
+
+def test_missing_archive_is_empty(tmp_path) -> None:
+    """Test reading an archive that was never written."""
+    archive = ScheduleArchive(str(tmp_path / "none.ppa"))
+    assert list(archive.scan()) == []
+    assert archive.stats()["row_groups"] == 0
+
+
+def test_parquet_export(archive, tmp_path) -> None:
+    """Test Parquet export when pyarrow is available."""
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = export_parquet(str(archive.path), str(tmp_path / "history.parquet"))
+    assert pq.ParquetFile(path).metadata.num_row_groups == 3
@@ -0,0 +1,67 @@
+"""Tests for memory-mapped fixed-width schedule files."""
+
+from datetime import date, timedelta
+
+import pytest
+
+from core.models import Schedule
+from database.schedule_file import MappedScheduleFile, read_schedule_window, write_schedule_file
+
+
+@pytest.fixture
+def schedule() -> Schedule:
+    """Schedule with staggered intervals of varying length and ID width."""
+    schedule = Schedule()
+    for index in range(60):
+        start = date(2026, 1, 1) + timedelta(days=(index * 37) % 365)
+        schedule.add_interval(f"paper-{'x' * (index % 5)}{index}", start, end_date=start + timedelta(days=5 + index % 40))
+    return schedule
+
+
+def test_round_trip(schedule, tmp_path) -> None:
+    """Test a file converts back to the same Schedule."""
+    path = write_schedule_file(schedule, str(tmp_path / "plan.ppsf"))
+    with MappedScheduleFile(path) as schedule_file:
+        assert len(schedule_file) == 60
+        assert schedule_file.start_date == schedule.start_date
+        assert schedule_file.to_schedule().intervals == schedule.intervals
+
+
+@pytest.mark.parametrize("start,end", [
+    (date(2026, 3, 1), date(2026, 3, 31)),
+    (date(2025, 1, 1), date(2026, 1, 1)),
+    (date(2026, 12, 20), None),
+    (None, date(2026, 2, 1)),
+    (date(2030, 1, 1), date(2030, 2, 1)),
+])
+def test_window_matches_full_filter(schedule, tmp_path, start, end) -> None:
+    """Test window slicing returns exactly the overlapping intervals."""
+    path = write_schedule_file(schedule, str(tmp_path / "plan.ppsf"))
+    expected = {
+        sid for sid, interval in schedule.intervals.items()
+        if (start is None or interval.end_date >= start) and (end is None or interval.start_date <= end)
+    }
+    assert set(read_schedule_window(path, start, end).intervals) == expected
+
+
+def test_empty_schedule(tmp_path) -> None:
+    """Test an empty schedule round-trips."""
+    path = write_schedule_file(Schedule(), str(tmp_path / "empty.ppsf"))
+    with MappedScheduleFile(path) as schedule_file:
+        assert len(schedule_file) == 0
+        assert schedule_file.start_date is None
+        assert schedule_file.window(date(2026, 1, 1), date(2026, 2, 1)).intervals == {}
+
+
+def test_invalid_files_are_rejected(schedule, tmp_path) -> None:
+    """Test foreign and truncated files raise ValueError."""
+    bogus = tmp_path / "bogus.ppsf"
+    bogus.write_bytes(b"not a schedule file at all")
+    with pytest.raises(ValueError):
+        MappedScheduleFile(str(bogus))
+
+    path = tmp_path / "plan.ppsf"
+    write_schedule_file(schedule, str(path))
+    path.write_bytes(path.read_bytes()[:-10])
+    with pytest.raises(ValueError):
+        MappedScheduleFile(str(path))
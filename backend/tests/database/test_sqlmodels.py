@@ -0,0 +1,72 @@
+"""Tests for ScheduleDatabase persistence."""
+
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import inspect
+from sqlmodel import create_engine
+
+from core.models import Schedule
+from database.sqlmodels import ScheduleDatabase
+
+
+@pytest.fixture
+def database(tmp_path):
+    """ScheduleDatabase backed by a temporary SQLite file."""
+    db = ScheduleDatabase(create_engine(f"sqlite:///{tmp_path / 'schedules.db'}"))
+    yield db
+    db.close()
+
+
+def _schedule(count: int, offset: int = 0) -> Schedule:
+    """Build a schedule with count submissions on consecutive days."""
+    schedule = Schedule()
+    for index in range(count):
+        schedule.add_interval(f"sub-{index}", date(2026, 1, 1) + timedelta(days=index + offset))
+    return schedule
+
+
+def test_save_and_load_round_trip(database) -> None:
+    """Test a saved schedule loads back with its start dates and config."""
+    schedule = _schedule(3)
+    schedule_id = database.save_schedule("plan", "greedy", schedule, {"max_concurrent_submissions": 2})
+
+    loaded = database.load_schedule(schedule_id)
+    assert loaded["name"] == "plan"
+    assert loaded["strategy"] == "greedy"
+    assert loaded["schedule"] == {sid: interval.start_date for sid, interval in schedule.intervals.items()}
+    assert loaded["config"] == {"max_concurrent_submissions": 2}
+    assert database.load_schedule(schedule_id + 100) is None
+
+
+def test_save_many_in_one_transaction(database) -> None:
+    """Test a whole comparison is stored and listed."""
+    entries = [(f"compare-{name}", name, _schedule(5, offset), {}) for offset, name in enumerate(["greedy", "optimal"])]
+    ids = database.save_many(entries)
+
+    assert len(set(ids)) == 2
+    assert {row["strategy"] for row in database.list_schedules()} == {"greedy", "optimal"}
+    assert database.load_schedule(ids[1])["schedule"]["sub-0"] == date(2026, 1, 2)
+
+
+def test_save_many_rolls_back_on_error(database) -> None:
+    """Test a failing entry leaves no partial comparison behind."""
+    with pytest.raises(AttributeError):
+        database.save_many([("good", "greedy", _schedule(2), {}), ("bad", "greedy", None, {})])
+    assert database.list_schedules() == []
+
+
+def test_large_schedule_and_delete(database) -> None:
+    """Test bulk paths handle large schedules and delete removes every row."""
+    schedule_id = database.save_schedule("large", "greedy", _schedule(10_000), {})
+    assert len(database.load_schedule(schedule_id)["schedule"]) == 10_000
+
+    assert database.delete_schedule(schedule_id)
+    assert database.load_schedule(schedule_id) is None
+    assert not database.delete_schedule(schedule_id)
+
+
+def test_compound_index_exists(database) -> None:
+    """Test items are indexed on (schedule_id, submission_id)."""
+    indexes = inspect(database.engine).get_indexes("scheduleitem")
+    assert ["schedule_id", "submission_id"] in [index["column_names"] for index in indexes]
@@ -0,0 +1,154 @@
+"""Tests for the scheduling service and its workers."""
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from service import worker
+from service.server import SchedulingService, create_app
+from service.worker import get_warm_config, run_job, schedule_from_dict, schedule_to_dict
+
+
+@pytest.fixture
+def service_config_path(test_data_dir, tmp_path) -> str:
+    """Copy the shared test data so tests can modify it."""
+    for path in Path(test_data_dir).iterdir():
+        (tmp_path / path.name).write_bytes(path.read_bytes())
+    worker._WARM_CONFIGS.clear()
+    return str(tmp_path / "config.json")
+
+
+class TestWorker:
+    """Test job functions run by workers."""
+
+    def test_warm_config_returns_independent_copies(self, service_config_path) -> None:
+        """Test callers can mutate a warm config without affecting later jobs."""
+        first = get_warm_config(service_config_path)
+        first.submissions[0].conference_id = "mutated"
+        second = get_warm_config(service_config_path)
+        assert second.submissions[0].conference_id != "mutated"
+        assert len(worker._WARM_CONFIGS) == 1
+
+    def test_warm_config_reloads_on_change(self, service_config_path) -> None:
+        """Test a changed input file is picked up."""
+        count = len(get_warm_config(service_config_path).submissions)
+        papers_file = Path(service_config_path).parent / "ed_papers.json"
+        papers = json.loads(papers_file.read_text(encoding="utf-8"))
+        papers.append({"id": "extra-paper", "title": "Extra"})
+        papers_file.write_text(json.dumps(papers), encoding="utf-8")
+        assert len(get_warm_config(service_config_path).submissions) == count + 1
+
+    def test_schedule_then_score(self, service_config_path) -> None:
+        """Test scheduling and scoring round-trip through the JSON form."""
+        result = run_job({"op": "schedule", "config_path": service_config_path, "strategy": "greedy"})
+        assert result["ok"], result.get("error")
+        assert result["intervals"]
+        assert "makespan" in result["metrics"]
+
+        scored = run_job({"op": "score", "config_path": service_config_path, "intervals": result["intervals"]})
+        assert scored["ok"]
+        assert scored["metrics"]["makespan"] == result["metrics"]["makespan"]
+
+    def test_errors_are_returned(self, service_config_path) -> None:
+        """Test failures come back as error results rather than exceptions."""
+        assert not run_job({"op": "schedule", "config_path": service_config_path, "strategy": "nope"})["ok"]
+        assert not run_job({"op": "unknown", "config_path": service_config_path})["ok"]
+
+    def test_whatif_job(self, service_config_path) -> None:
+        """Test a scenario is applied to the warm config and scheduled."""
+        result = run_job({
+            "op": "whatif", "config_path": service_config_path,
+            "scenario": {"name": "capacity", "config": {"max_concurrent_submissions": 3}}
+        })
+        assert result["ok"], result.get("error")
+        assert result["scenario"] == "capacity"
+        assert result["changes"] == "max_concurrent_submissions=3"
+        assert "makespan" in result["metrics"]
+        assert get_warm_config(service_config_path).max_concurrent_submissions == 2
+
+        failed = run_job({"op": "whatif", "config_path": service_config_path, "scenario": {"config": {"nope": 1}}})
+        assert not failed["ok"]
+
+    def test_whatif_leaves_baseline_unchanged(self, service_config_path, monkeypatch) -> None:
+        """Test conference assignments made while scheduling a scenario do not reach later jobs."""
+        from schedulers.greedy import GreedyScheduler
+        schedule = GreedyScheduler.schedule
+
+        def assigning_schedule(self):
+            result = schedule(self)
+            for submission in self.config.submissions:
+                submission.conference_id = "assigned"
+            return result
+        monkeypatch.setattr(GreedyScheduler, "schedule", assigning_schedule)
+
+        warm = worker._load_warm_config(service_config_path)
+        before = warm.model_dump()
+        baseline = run_job({"op": "schedule", "config_path": service_config_path})
+        scenario = run_job({
+            "op": "whatif", "config_path": service_config_path,
+            "scenario": {"name": "capacity", "config": {"max_concurrent_submissions": 3}}
+        })
+        assert scenario["ok"], scenario.get("error")
+
+        assert worker._load_warm_config(service_config_path) is warm
+        assert warm.model_dump() == before
+        again = run_job({"op": "schedule", "config_path": service_config_path})
+        assert again["cached"]
+        assert (again["intervals"], again["metrics"]) == (baseline["intervals"], baseline["metrics"])
+
+    def test_schedule_dict_round_trip(self) -> None:
+        """Test schedule JSON conversion is lossless."""
+        intervals = {"a": {"start_date": "2025-01-01", "end_date": "2025-01-05"}}
+        assert schedule_to_dict(schedule_from_dict(intervals)) == intervals
+
+
+class TestServer:
+    """Test the HTTP API using an in-process thread pool."""
+
+    def test_endpoints(self, service_config_path) -> None:
+        """Test health, schedule, validate and batch endpoints."""
+        service = SchedulingService(workers=2, preload=[service_config_path], use_processes=False)
+        with TestClient(create_app(service)) as client:
+            assert client.get("/health").json()["status"] == "ok"
+
+            scheduled = client.post("/schedule", json={"config_path": service_config_path, "strategy": "greedy"}).json()
+            assert scheduled["ok"]
+
+            validated = client.post("/validate", json={
+                "config_path": service_config_path, "intervals": scheduled["intervals"]
+            }).json()
+            assert validated["ok"]
+            assert "schedule" in validated
+
+            batch = client.post("/batch", json={"requests": [
+                {"op": "schedule", "config_path": service_config_path, "strategy": "greedy"},
+                {"op": "validate", "config_path": service_config_path},
+                {"op": "schedule", "config_path": service_config_path, "strategy": "greedy"},
+            ]}).json()["results"]
+            assert [r["op"] for r in batch] == ["schedule", "validate", "schedule"]
+            assert batch[0] == batch[2]
+
+            # The duplicate batch entry is computed once
+            assert client.get("/health").json()["requests_served"] == 4
+
+            whatif = client.post("/whatif", json={
+                "config_path": service_config_path,
+                "scenarios": [{"name": "capacity", "config": {"max_concurrent_submissions": 3}}]
+            }).json()
+            assert [r["scenario"] for r in whatif["results"]] == ["baseline", "capacity"]
+            assert [row["Status"] for row in whatif["table"]] == ["OK", "OK"]
+
+    def test_process_pool(self, service_config_path) -> None:
+        """Test jobs run in spawned worker processes."""
+        service = SchedulingService(workers=1, use_processes=True)
+        try:
+            results = asyncio.run(service.submit_batch([
+                {"op": "schedule", "config_path": service_config_path, "strategy": "greedy"},
+                {"op": "validate", "config_path": service_config_path},
+            ]))
+        finally:
+            service.shutdown()
+        assert all(r["ok"] for r in results), results
@@ -0,0 +1,66 @@
+"""Tests for import-time profiling and lazy CLI imports."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+from profiling import ImportTiming, measure_import_time, parse_importtime, summarize_import_times
+
+
+BACKEND_DIR = Path(__file__).parent.parent
+
+SAMPLE_OUTPUT = """import time: self [us] | cumulative | imported package
+import time:       166 |        166 |   _io
+import time:       410 |       1056 | _frozen_importlib_external
+some unrelated stderr line
+import time:       200 |        300 |     json.decoder
+"""
+
+
+class TestParseImporttime:
+    """Test parsing of -X importtime output."""
+
+    def test_parse_lines_and_depth(self) -> None:
+        """Test timings, names and nesting depth are read from each line."""
+        timings = parse_importtime(SAMPLE_OUTPUT)
+        assert timings == [
+            ImportTiming("_io", 166, 166, 1),
+            ImportTiming("_frozen_importlib_external", 410, 1056, 0),
+            ImportTiming("json.decoder", 200, 300, 2),
+        ]
+
+    def test_summary(self) -> None:
+        """Test totals count only top-level imports and heavy packages are flagged."""
+        timings = parse_importtime(SAMPLE_OUTPUT) + [ImportTiming("pulp.apis", 5000, 9000, 1)]
+        summary = summarize_import_times(timings, top=2)
+        assert summary["total_ms"] == 1.056
+        assert summary["module_count"] == 4
+        assert [e["module"] for e in summary["top_cumulative"]] == ["pulp.apis", "_frozen_importlib_external"]
+        assert summary["heavy_packages"] == ["pulp"]
+
+
+class TestLazyImports:
+    """Test that CLIs and schedulers only import what they need."""
+
+    def test_greedy_scheduler_does_not_import_pulp(self) -> None:
+        """Test creating a non-optimal scheduler leaves pulp unloaded."""
+        timings = measure_import_time(["schedulers.base", "schedulers.greedy"], [str(BACKEND_DIR / "src")])
+        modules = {t.module for t in timings}
+        assert "schedulers.greedy" in modules
+        assert "schedulers.optimal" not in modules
+        assert "pulp" not in modules
+
+    def test_list_strategies_skips_backend_imports(self) -> None:
+        """Test --list-strategies runs without importing pydantic or schedulers."""
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "generate_schedule.py", "--list-strategies"],
+            capture_output=True,
+            text=True,
+            cwd=BACKEND_DIR,
+            timeout=30
+        )
+        assert result.returncode == 0
+        assert "optimal" in result.stdout
+        modules = {t.module.split(".")[0] for t in parse_importtime(result.stderr)}
+        assert "pydantic" not in modules
+        assert "schedulers" not in modules
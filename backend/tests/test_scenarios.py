@@ -0,0 +1,108 @@
+"""Tests for what-if scenario materialization, runs and comparison."""
+
+from datetime import timedelta
+
+import pytest
+
+from core.config import load_config
+from scenarios import (
+    BASELINE_NAME, Scenario, ScenarioResult, compare_scenarios, materialize_scenario, run_scenarios
+)
+
+
+@pytest.fixture
+def base_config(test_data_dir):
+    """Load the shared test config."""
+    return load_config(f"{test_data_dir}/config.json")
+
+
+class TestMaterializeScenario:
+    """Test copy-on-write application of scenario changes."""
+
+    def test_config_field_change_shares_unchanged_items(self, base_config) -> None:
+        """Test a config field change copies nothing but the config."""
+        variant = materialize_scenario(base_config, Scenario("capacity", {"max_concurrent_submissions": 3}))
+
+        assert variant.max_concurrent_submissions == 3
+        assert base_config.max_concurrent_submissions == 2
+        assert all(a is b for a, b in zip(variant.submissions, base_config.submissions))
+        assert all(a is b for a, b in zip(variant.conferences, base_config.conferences))
+
+    def test_deadline_shift_copies_only_that_conference(self, base_config) -> None:
+        """Test shifting a conference's deadlines, found by name, leaves the others shared."""
+        original = base_config.get_conference("iccv")
+        variant = materialize_scenario(base_config, Scenario("iccv", deadline_shifts={"ICCV": 7}))
+
+        shifted = variant.get_conference("iccv")
+        assert shifted is not original
+        assert shifted.deadlines == {kind: day + timedelta(days=7) for kind, day in original.deadlines.items()}
+        assert variant.get_conference("embc") is base_config.get_conference("embc")
+
+    def test_submission_change_copies_only_that_submission(self, base_config) -> None:
+        """Test a submission change is applied to a copy."""
+        variant = materialize_scenario(base_config, Scenario("lead", submission_changes={"mod_2": {"lead_time_from_parents": 14}}))
+
+        assert variant.get_submission("mod_2").lead_time_from_parents == 14
+        assert base_config.get_submission("mod_2").lead_time_from_parents == 0
+        assert variant.get_submission("mod_1") is base_config.get_submission("mod_1")
+
+    @pytest.mark.parametrize("scenario", [
+        Scenario("field", {"no_such_field": 1}),
+        Scenario("structural", {"submissions": []}),
+        Scenario("invalid", {"max_concurrent_submissions": "many"}),
+        Scenario("conference", deadline_shifts={"nowhere": 7}),
+        Scenario("submission", submission_changes={"missing": {"lead_time_from_parents": 1}}),
+    ])
+    def test_invalid_changes_raise(self, base_config, scenario) -> None:
+        """Test unknown targets and invalid values are rejected."""
+        with pytest.raises(ValueError):
+            materialize_scenario(base_config, scenario)
+
+    def test_from_dict(self) -> None:
+        """Test the JSON form of a scenario."""
+        scenario = Scenario.from_dict({
+            "name": "mixed",
+            "config": {"max_concurrent_submissions": 3},
+            "deadline_shifts": {"ICCV": "-7"},
+            "submissions": {"mod_1": {"lead_time_from_parents": 5}}
+        })
+
+        assert scenario.deadline_shifts == {"ICCV": -7}
+        assert scenario.describe() == "max_concurrent_submissions=3, ICCV deadlines -7d, mod_1.lead_time_from_parents=5"
+
+
+class TestRunScenarios:
+    """Test parallel scenario runs and the comparison table."""
+
+    def test_run_in_threads_leaves_base_untouched(self, base_config) -> None:
+        """Test scenarios run on private copies and report errors per scenario."""
+        before = base_config.model_dump()
+        scenarios = [Scenario("capacity", {"max_concurrent_submissions": 4}), Scenario("bad", {"nope": 1})]
+
+        results = run_scenarios(base_config, scenarios, max_workers=2, use_processes=False)
+
+        assert [result.name for result in results] == [BASELINE_NAME, "capacity", "bad"]
+        assert results[0].metrics is not None and results[1].metrics is not None
+        assert results[2].metrics is None and "nope" in results[2].error
+        assert base_config.model_dump() == before
+
+    def test_run_in_processes_matches_serial(self, base_config) -> None:
+        """Test worker processes produce the same metrics as a serial run."""
+        scenarios = [Scenario("capacity", {"max_concurrent_submissions": 3})]
+
+        parallel = run_scenarios(base_config, scenarios, max_workers=2)
+        serial = run_scenarios(base_config, scenarios, max_workers=1)
+
+        assert [result.metrics for result in parallel] == [result.metrics for result in serial]
+
+    def test_compare_scenarios(self, base_config) -> None:
+        """Test the comparison table shows changes relative to the baseline."""
+        results = run_scenarios(base_config, [Scenario("same")], max_workers=1)
+        results.append(ScenarioResult("broken", "x=1", error="ValueError: bad"))
+
+        table = compare_scenarios(results)
+
+        assert [row["Scenario"] for row in table] == [BASELINE_NAME, "same", "broken"]
+        assert table[1]["Penalty Change"] == "+0.00"
+        assert table[1]["Status"] == "OK"
+        assert table[2]["Status"] == "Error: ValueError: bad"
@@ -9,6 +9,7 @@ import plotly.graph_objects as go
 from plotly.graph_objs import Figure
 
 from app.components.gantt.chart import create_gantt_chart
+from app.components.dashboard.graph import create_dependency_graph_chart
 
 # Import backend modules directly - TOML pythonpath should handle this
 from core.models import Config, Submission
@@ -189,45 +190,22 @@ def _create_project_dependencies_chart(config: Optional[Config] = None) -> Figur
     Returns:
         Plotly Figure object
     """
-    fig = go.Figure()
-    
     if config and config.submissions:
-        # Use real data from config - analyze dependencies
-        dependency_counts = []
-        submission_names = []
-        
-        for submission in config.submissions:
-            deps = submission.depends_on or []
-            dependency_counts.append(len(deps))
-            
-            title = submission.title
-            if len(title) > 25:
-                submission_names.append(title[:25] + "...")
-            else:
-                submission_names.append(title)
-        
-        fig.add_trace(go.Scatter(
-            x=submission_names,
-            y=dependency_counts,
-            mode='lines+markers',
-            name='Real Dependencies',
-            marker=dict(size=10, color='orange')
-        ))
-        
-        title = f'Project Dependencies Analysis - Real Data ({len(config.submissions)} submissions)'
-    else:
-        # Fallback to sample data
-        fig.add_trace(go.Scatter(
-            x=[1, 2, 3, 4, 5],
-            y=[2, 4, 1, 3, 2],
-            mode='lines+markers',
-            name='Sample Data',
-            marker=dict(size=10, color='orange')
-        ))
-        title = 'Project Dependencies Analysis - Sample Data'
+        # Use real data from config - layered graph with the critical path highlighted
+        return create_dependency_graph_chart(config)
+    
+    # Fallback to sample data
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=[1, 2, 3, 4, 5],
+        y=[2, 4, 1, 3, 2],
+        mode='lines+markers',
+        name='Sample Data',
+        marker=dict(size=10, color='orange')
+    ))
     
     fig.update_layout(
-        title=title,
+        title='Project Dependencies Analysis - Sample Data',
         xaxis_title='Submissions',
         yaxis_title='Dependency Count',
         height=600,
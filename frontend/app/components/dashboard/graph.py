@@ -0,0 +1,260 @@
+"""
+Layered dependency-graph layout and rendering for the dashboard.
+
+Layouts follow the Sugiyama scheme: submissions are layered by dependency
+depth, edges spanning several layers are routed through virtual points, and
+nodes within each layer are reordered by the barycenter of their neighbours
+to reduce crossings. Coordinates are computed once per config hash and kept
+in a small LRU; the figure draws all edges and all nodes as one WebGL trace
+each, with the critical path's edges overlaid as a third.
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import plotly.graph_objects as go
+from plotly.graph_objs import Figure
+
+# Import backend modules directly - TOML pythonpath should handle this
+from analytics import _build_dependency_graph
+from core.graph import analyze_config_graph
+from core.models import Config
+
+from app.figure_cache import get_config_key
+
+# Most barycenter sweeps (each one down and one up the layers) for crossing reduction
+CROSSING_SWEEPS = 4
+
+# Node labels are drawn only for graphs up to this size; larger graphs rely on hover
+LABEL_MAX_NODES = 60
+
+# Layouts kept per config hash
+MAX_GRAPH_LAYOUTS = 16
+
+NODE_COLOR = '#3498db'
+CRITICAL_COLOR = '#e74c3c'
+EDGE_COLOR = 'rgba(127, 140, 141, 0.5)'
+
+
+@dataclass
+class GraphLayout:
+    """Node coordinates and routed edges of a layered dependency graph."""
+    positions: Dict[str, Tuple[float, float]] = field(default_factory=dict)
+    layers: List[List[str]] = field(default_factory=list)
+    edges: List[Tuple[str, str, List[Tuple[float, float]]]] = field(default_factory=list)
+    critical_path: List[str] = field(default_factory=list)
+    cyclic: List[str] = field(default_factory=list)
+
+
+_layouts: "OrderedDict[str, GraphLayout]" = OrderedDict()
+_layouts_lock = threading.Lock()
+
+
+def get_graph_layout(config: Config) -> GraphLayout:
+    """Return the layered layout of a config's dependency graph, computing it once per config hash."""
+    key = get_config_key(config)
+    with _layouts_lock:
+        layout = _layouts.get(key)
+        if layout is not None:
+            _layouts.move_to_end(key)
+            return layout
+    layout = compute_graph_layout(config)
+    with _layouts_lock:
+        _layouts[key] = layout
+        while len(_layouts) > MAX_GRAPH_LAYOUTS:
+            _layouts.popitem(last=False)
+    return layout
+
+
+def compute_graph_layout(config: Config, sweeps: int = CROSSING_SWEEPS) -> GraphLayout:
+    """
+    Compute a layered layout of the submission dependency graph.
+
+    Parameters
+    ----------
+    config : Config
+        Configuration whose submissions and ``depends_on`` lists form the graph
+    sweeps : int, optional
+        Number of down-and-up barycenter sweeps
+
+    Returns
+    -------
+    GraphLayout
+        x is the layer (dependency depth), y the position within the layer;
+        submissions on a dependency cycle are placed in a final layer. The
+        critical path is duration-weighted, as in the analytics report
+    """
+    nodes = _build_dependency_graph(config)
+    # Depths, critical path and cycles from one critical path method pass
+    analysis = analyze_config_graph(config)
+    depths = analysis.depths
+    critical_path = analysis.critical_path
+    cyclic = analysis.cyclic
+    layer_of = dict(depths)
+    cycle_layer = max(depths.values(), default=-1) + 1
+    for node_id in cyclic:
+        layer_of[node_id] = cycle_layer
+
+    # Members are indexed globally: submissions first, then virtual points on long edges
+    members: List[object] = list(nodes)
+    index_of = {node_id: index for index, node_id in enumerate(members)}
+    layer_count = max(layer_of.values(), default=-1) + 1
+    layer_members: List[List[int]] = [[] for _ in range(layer_count)]
+    for node_id in nodes:
+        layer_members[layer_of[node_id]].append(index_of[node_id])
+
+    segment_sources: List[List[int]] = [[] for _ in range(max(layer_count - 1, 0))]
+    segment_targets: List[List[int]] = [[] for _ in range(max(layer_count - 1, 0))]
+    chains: List[Tuple[str, str, List[int]]] = []
+    for node_id, node in nodes.items():
+        for dep_id in dict.fromkeys(node.dependencies):
+            if dep_id not in nodes:
+                continue
+            chain = [index_of[dep_id]]
+            start_layer, end_layer = layer_of[dep_id], layer_of[node_id]
+            # Cycle members may share a layer or point backwards; draw those edges directly
+            if end_layer > start_layer:
+                for layer in range(start_layer + 1, end_layer):
+                    members.append((dep_id, node_id, layer))
+                    layer_members[layer].append(len(members) - 1)
+                    chain.append(len(members) - 1)
+                chain.append(index_of[node_id])
+                for layer, (before, after) in enumerate(zip(chain, chain[1:]), start=start_layer):
+                    segment_sources[layer].append(before)
+                    segment_targets[layer].append(after)
+            else:
+                chain.append(index_of[node_id])
+            chains.append((dep_id, node_id, chain))
+
+    layers = [np.array(layer, dtype=np.int64) for layer in layer_members]
+    segments = [
+        (np.array(sources, dtype=np.int64), np.array(targets, dtype=np.int64))
+        for sources, targets in zip(segment_sources, segment_targets)
+    ]
+    positions = _reduce_crossings(layers, segments, len(members), sweeps)
+
+    x = np.zeros(len(members))
+    y = np.zeros(len(members))
+    for layer_index, layer in enumerate(layers):
+        x[layer] = layer_index
+        y[layer] = positions[layer] - (len(layer) - 1) / 2
+
+    return GraphLayout(
+        positions={node_id: (float(x[index]), float(y[index])) for node_id, index in index_of.items()},
+        layers=[[members[index] for index in layer if index < len(nodes)] for layer in layers],
+        edges=[
+            (dep_id, node_id, [(float(x[index]), float(y[index])) for index in chain])
+            for dep_id, node_id, chain in chains
+        ],
+        critical_path=critical_path,
+        cyclic=cyclic
+    )
+
+
+def create_dependency_graph_chart(config: Config) -> Figure:
+    """Draw a config's dependency graph from its cached layered layout."""
+    layout = get_graph_layout(config)
+    titles = {submission.id: submission.title for submission in config.submissions}
+    critical = set(layout.critical_path)
+    critical_edges = set(zip(layout.critical_path, layout.critical_path[1:]))
+
+    fig = go.Figure()
+    fig.add_trace(_edge_trace(
+        [points for dep_id, node_id, points in layout.edges if (dep_id, node_id) not in critical_edges],
+        EDGE_COLOR, 1, 'Dependencies'
+    ))
+    fig.add_trace(_edge_trace(
+        [points for dep_id, node_id, points in layout.edges if (dep_id, node_id) in critical_edges],
+        CRITICAL_COLOR, 3, 'Critical path'
+    ))
+
+    node_ids = list(layout.positions)
+    show_labels = len(node_ids) <= LABEL_MAX_NODES
+    coordinates = np.array([layout.positions[node_id] for node_id in node_ids], dtype=np.float32).reshape(-1, 2)
+    fig.add_trace(go.Scattergl(
+        x=coordinates[:, 0],
+        y=coordinates[:, 1],
+        mode='markers+text' if show_labels else 'markers',
+        text=[titles.get(node_id, node_id)[:25] for node_id in node_ids] if show_labels else None,
+        textposition='top center',
+        hovertext=[
+            f"{titles.get(node_id, node_id)}<br>ID: {node_id}<br>Depth: {int(layout.positions[node_id][0])}"
+            + ("<br>On critical path" if node_id in critical else "")
+            for node_id in node_ids
+        ],
+        hoverinfo='text',
+        marker=dict(
+            size=[14 if node_id in critical else 9 for node_id in node_ids],
+            color=[CRITICAL_COLOR if node_id in critical else NODE_COLOR for node_id in node_ids],
+            line=dict(width=1, color='white')
+        ),
+        name='Submissions',
+        showlegend=False
+    ))
+
+    title = (f'Project Dependencies - {len(node_ids)} submissions, '
+             f'{len(layout.layers)} layers, critical path of {len(layout.critical_path)}')
+    if layout.cyclic:
+        title += f' ({len(layout.cyclic)} on dependency cycles)'
+    fig.update_layout(
+        title=title,
+        xaxis=dict(title='Dependency depth', showgrid=False, zeroline=False, dtick=1),
+        yaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
+        height=600,
+        plot_bgcolor='white',
+        paper_bgcolor='white',
+        hovermode='closest'
+    )
+    return fig
+
+
+def _reduce_crossings(layers: List[np.ndarray], segments: List[Tuple[np.ndarray, np.ndarray]],
+                      size: int, sweeps: int) -> np.ndarray:
+    """Reorder layers in place by the barycenter of neighbours in the adjacent layer.
+
+    ``segments[i]`` holds the (source, target) member indices of edge segments
+    from layer i to layer i + 1. Returns each member's position in its layer.
+    """
+    positions = np.zeros(size)
+    for layer in layers:
+        positions[layer] = np.arange(len(layer))
+
+    def reorder(index: int, own: np.ndarray, other: np.ndarray) -> bool:
+        layer = layers[index]
+        if len(layer) < 2 or not len(own):
+            return False
+        slots = positions[own].astype(np.int64)
+        totals = np.bincount(slots, weights=positions[other], minlength=len(layer))
+        counts = np.bincount(slots, minlength=len(layer))
+        current = np.arange(len(layer))
+        # Unconnected members keep their place
+        barycenters = np.where(counts > 0, totals / np.maximum(counts, 1), current)
+        order = np.lexsort((current, barycenters))
+        if np.array_equal(order, current):
+            return False
+        layers[index] = layer[order]
+        positions[layers[index]] = current
+        return True
+
+    for _ in range(sweeps):
+        changed = False
+        for index in range(1, len(layers)):
+            sources, targets = segments[index - 1]
+            changed |= reorder(index, targets, sources)
+        for index in range(len(layers) - 2, -1, -1):
+            sources, targets = segments[index]
+            changed |= reorder(index, sources, targets)
+        if not changed:
+            break
+    return positions
+
+
+def _edge_trace(paths: List[List[Tuple[float, float]]], color: str, width: int, name: str) -> go.Scattergl:
+    """One WebGL line trace for many edge polylines, separated by gaps."""
+    points = [point for path in paths for point in path + [(np.nan, np.nan)]]
+    coordinates = np.array(points, dtype=np.float32).reshape(-1, 2)
+    return go.Scattergl(x=coordinates[:, 0], y=coordinates[:, 1], mode='lines', connectgaps=False,
+                        line=dict(color=color, width=width), hoverinfo='skip', name=name, showlegend=False)
@@ -4,8 +4,8 @@ Dashboard layout components for Paper Planner.
 
 from dash import html, dcc, callback, callback_context, ALL, MATCH
 from dash.dependencies import Input, Output, State
-from typing import Dict, Optional
-from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+from datetime import date, datetime
 from plotly.graph_objs import Figure
 from app.components.dashboard.chart import (
     create_dashboard_chart,
@@ -13,6 +13,8 @@ from app.components.dashboard.chart import (
 )
 from app.components.exporter.controls import create_export_controls, export_chart_png, export_chart_html
 from app.storage import get_state_manager
+from app.figure_cache import get_config_key, get_figure_cache, make_figure_key
+from app.figure_patch import update_figure
 
 # Import backend modules directly - TOML pythonpath should handle this
 from core.models import Config
@@ -29,7 +31,8 @@ def create_dashboard_layout(config: Optional[Config] = None) -> html.Div:
         Dashboard layout as html.Div
     """
     # Create initial chart with real data
-    initial_figure = create_dashboard_chart('timeline', config)
+    initial_key = _dashboard_figure_key(config, 'timeline')
+    initial_figure = get_figure_cache().get_or_create(initial_key, lambda: create_dashboard_chart('timeline', config))
     
     # Store component state using clean state manager
     if config:
@@ -57,6 +60,8 @@ def create_dashboard_layout(config: Optional[Config] = None) -> html.Div:
         ),
         _create_controls(),
         create_export_controls('dashboard-chart', 'dashboard_chart'),
+        # Cache key of the figure on screen, so updates can be sent as patches
+        dcc.Store(id='dashboard-figure-key', data=initial_key),
         html.Div(id="export-dashboard-chart-status", className="export-status"),
         html.Div(id="dashboard-storage-status", className="storage-status"),
         # Store refresh timestamp for debugging
@@ -113,25 +118,34 @@ def _create_controls() -> html.Div:
     ], className="dashboard-controls")
 
 
+def _dashboard_figure_key(config: Optional[Config], chart_type: str) -> str:
+    """Figure cache key of a dashboard chart."""
+    return make_figure_key(get_config_key(config), None, f'dashboard-{chart_type}', as_of=date.today())
+
+
 # Dash Callbacks
 # IMPORTANT: prevent_initial_call=True prevents infinite loops
 # The initial chart is created in create_dashboard_layout() with real data
 # Callbacks only run on user interaction (refresh button, chart type change)
 @callback(
     Output('dashboard-chart', 'figure'),
+    Output('dashboard-figure-key', 'data'),
     Input('refresh-chart-btn', 'n_clicks'),
     Input('chart-type-dropdown', 'value'),
+    State('dashboard-figure-key', 'data'),
     prevent_initial_call=True
 )
-def update_dashboard_chart(n_clicks: Optional[int], chart_type: str) -> Figure:
+def update_dashboard_chart(n_clicks: Optional[int], chart_type: str,
+                           figure_key: Optional[str] = None) -> Tuple[Any, Optional[str]]:
     """Update dashboard chart based on user inputs.
     
     Args:
         n_clicks: Number of times refresh button was clicked
         chart_type: Selected chart type
+        figure_key: Cache key of the figure currently shown
         
     Returns:
-        Updated chart figure as Plotly Figure
+        Chart figure, or a patch when only parts of it changed, and the new figure key
     """
     try:
         # Update component state
@@ -152,14 +166,15 @@ def update_dashboard_chart(n_clicks: Optional[int], chart_type: str) -> Figure:
                 max_concurrent_submissions=config_data.get('max_concurrent_submissions', 2)
             )
         
-        # Create chart with stored config or fallback to sample data
-        figure = create_dashboard_chart(chart_type, config)
+        # Create chart with stored config or fallback to sample data, reusing cached figures
+        key = _dashboard_figure_key(config, chart_type)
+        figure = get_figure_cache().get_or_create(key, lambda: create_dashboard_chart(chart_type, config))
         
-        return figure
+        return update_figure(figure_key, key, figure), key
         
     except Exception as e:
         print(f"Error updating dashboard chart: {e}")
-        return _create_error_chart(f"Error updating chart: {str(e)}")
+        return _create_error_chart(f"Error updating chart: {str(e)}"), None
 
 
 @callback(
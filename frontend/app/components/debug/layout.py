@@ -0,0 +1,99 @@
+"""
+Debug panel components for Paper Planner.
+"""
+
+from dash import html, dcc, Input, Output, callback, callback_context
+from typing import Any, Dict, List, Optional
+from core.models import Config
+from caching.metrics import get_metrics_cache_stats
+from app.figure_cache import get_figure_cache
+from app.metrics_service import get_metrics_service
+
+# How often the cache statistics refresh (milliseconds)
+DEBUG_REFRESH_INTERVAL_MS = 2000
+
+
+def create_debug_panel() -> html.Details:
+    """Create the collapsible panel showing this server's cache statistics.
+    
+    The caches are per process, so the panel is mounted in every app
+    rather than served by an app of its own; it polls only while open.
+    
+    Returns:
+        Debug panel as html.Details
+    """
+    return html.Details([
+        html.Summary("Cache statistics", className="debug-title"),
+        html.Div([
+            html.Button('Clear Figure Cache', id='clear-figure-cache-btn', className="control-button")
+        ], className="debug-controls"),
+        html.Div(_create_cache_tables(), id='debug-cache-stats', className="debug-stats"),
+        dcc.Interval(id='debug-refresh-interval', interval=DEBUG_REFRESH_INTERVAL_MS, disabled=True)
+    ], id='debug-panel', className="debug-layout")
+
+
+def _create_cache_tables() -> List[html.Div]:
+    """Render figure and metric cache statistics as tables."""
+    figure_stats = get_figure_cache().stats()
+    figure_rows = {
+        'Entries': f"{figure_stats['entries']} / {figure_stats['max_entries']}",
+        'Size': f"{figure_stats['bytes'] / 1024:.1f} KB / {figure_stats['max_bytes'] / (1024 * 1024):.0f} MB",
+        'Hits': figure_stats['hits'],
+        'Misses': figure_stats['misses'],
+        'Evictions': figure_stats['evictions'],
+        'Hit rate': f"{figure_stats['hit_rate']:.1%}",
+    }
+    metric_rows = {
+        name: f"{counts.get('hits', 0)} hits / {counts.get('misses', 0)} misses"
+        for name, counts in sorted(get_metrics_cache_stats().items())
+    }
+    service_stats = get_metrics_service().stats()
+    service_rows = {
+        'Scored schedules': service_stats['cached'],
+        'Pending': service_stats['pending'],
+        'Failed': service_stats['errors'],
+    }
+    return [
+        _create_stats_table("Figure cache", figure_rows),
+        _create_stats_table("Metric cache", metric_rows or {'(empty)': ''}),
+        _create_stats_table("Metrics service", service_rows)
+    ]
+
+
+def _create_stats_table(title: str, rows: Dict[str, Any]) -> html.Div:
+    """Create a two-column table of statistic names and values."""
+    return html.Div([
+        html.H3(title),
+        html.Table([
+            html.Tbody([
+                html.Tr([html.Td(name), html.Td(str(value))]) for name, value in rows.items()
+            ])
+        ], className="debug-table")
+    ], className="debug-section")
+
+
+@callback(
+    Output('debug-refresh-interval', 'disabled'),
+    Input('debug-panel', 'open')
+)
+def toggle_debug_refresh(is_open: Optional[bool]) -> bool:
+    """Poll cache statistics only while the panel is expanded."""
+    return not is_open
+
+
+@callback(
+    Output('debug-cache-stats', 'children'),
+    Input('debug-refresh-interval', 'n_intervals'),
+    Input('clear-figure-cache-btn', 'n_clicks'),
+    prevent_initial_call=True
+)
+def update_debug_stats(n_intervals: Optional[int], n_clicks: Optional[int]) -> List[html.Div]:
+    """Refresh cache statistics, clearing the figure cache when requested."""
+    try:
+        triggered = callback_context.triggered
+        if triggered and triggered[0]['prop_id'].startswith('clear-figure-cache-btn'):
+            get_figure_cache().clear()
+        return _create_cache_tables()
+    except Exception as e:
+        print(f"Error updating debug stats: {e}")
+        return [html.Div(f"❌ Stats error: {e}")]
@@ -8,6 +8,8 @@ from typing import Any, Optional
 from dash import html
 from plotly.graph_objs import Figure
 
+from exporters.orchestrator import get_figure_renderer
+
 
 def export_chart_png(fig: Figure, filename: str, output_dir: Optional[str] = None) -> Optional[str]:
     """Export a chart as PNG using headless server."""
@@ -21,8 +23,8 @@ def export_chart_png(fig: Figure, filename: str, output_dir: Optional[str] = Non
         # Ensure output directory exists
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Save as PNG using headless server (as per user preferences)
-        fig.write_image(str(output_path), engine="kaleido")
+        # Save as PNG using the shared headless renderer, kept warm between exports
+        get_figure_renderer().write_image(fig, str(output_path))
         
         return str(output_path)
         
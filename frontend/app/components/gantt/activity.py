@@ -209,3 +209,144 @@ def _truncate_text_for_bar_width(text: str, start_date: date, end_date: date, mi
     if bar_width_days < min_width_days and len(text) > 8:
         return text[:5] + "..."
     return text
+
+
+# ============================================================================
+# Trace-based rendering
+# ============================================================================
+
+# Above this many bars, bars are drawn as WebGL line segments instead of SVG bars
+GL_BAR_THRESHOLD = 2000
+
+_DAY_MS = 24 * 60 * 60 * 1000
+
+
+def add_activity_traces(fig: Figure, schedule: Schedule, config: Config,
+                        activity_rows: Optional[Dict[str, int]] = None) -> None:
+    """Add activity bars as a few batched traces instead of per-bar shapes.
+    
+    Bars are grouped by fill style (type and engineering field) into one trace
+    each, labels become bar text and hover info, and all dependency arrows are
+    drawn as a single line trace with ``None`` separators. The figure size in
+    the browser then grows with the number of groups, not the number of bars.
+    ``activity_rows`` supplies precomputed rows, e.g. those of the full
+    schedule when drawing a window of it.
+    """
+    if not schedule or not schedule.intervals:
+        return
+    
+    if activity_rows is None:
+        activity_rows = assign_activity_rows(schedule, config)
+    use_gl = len(schedule.intervals) > GL_BAR_THRESHOLD
+    
+    groups: Dict[tuple, Dict[str, list]] = {}
+    for submission_id, interval in schedule.intervals.items():
+        submission = config.submissions_dict.get(submission_id)
+        if not submission:
+            continue
+        key = (submission.kind.value, _get_submission_color(submission))
+        group = groups.setdefault(key, {"ids": [], "starts": [], "ends": [], "rows": [], "labels": [], "hover": []})
+        group["ids"].append(submission_id)
+        group["starts"].append(interval.start_date)
+        group["ends"].append(interval.end_date)
+        group["rows"].append(activity_rows[submission_id])
+        group["labels"].append(_get_display_title(submission))
+        group["hover"].append(_get_hover_text(submission, interval.start_date, interval.end_date))
+    
+    for (kind, color), group in groups.items():
+        fig.add_trace(_create_gl_bar_trace(kind, color, group) if use_gl else _create_bar_trace(kind, color, group))
+    
+    arrow_trace = _create_dependency_trace(schedule, config, activity_rows, use_gl)
+    if arrow_trace is not None:
+        fig.add_trace(arrow_trace)
+    
+    fig.update_layout(barmode='overlay', showlegend=False)
+
+
+def _create_bar_trace(kind: str, color: str, group: Dict[str, list]) -> go.Bar:
+    """Create one horizontal bar trace for a group of same-styled submissions."""
+    is_poster = kind == "poster"
+    return go.Bar(
+        orientation='h',
+        base=[start.isoformat() for start in group["starts"]],
+        x=[(end - start).days * _DAY_MS for start, end in zip(group["starts"], group["ends"])],
+        y=group["rows"],
+        width=0.8,
+        ids=group["ids"],
+        text=group["labels"],
+        textposition='inside',
+        insidetextanchor='middle',
+        textfont={'size': 10, 'color': '#2c3e50'},
+        hovertext=group["hover"],
+        hoverinfo='text',
+        marker=dict(
+            color="rgba(255, 255, 255, 0.1)" if is_poster else color,
+            line=dict(color=color, width=1 if is_poster else 0),
+            pattern=dict(shape="." if is_poster else ""),
+            opacity=0.6 if is_poster else 0.8
+        ),
+        name=kind.title(),
+        showlegend=False
+    )
+
+
+def _create_gl_bar_trace(kind: str, color: str, group: Dict[str, list]) -> go.Scattergl:
+    """Create one WebGL trace drawing each bar as a thick line segment."""
+    x: list = []
+    y: list = []
+    hover: list = []
+    for start, end, row, text in zip(group["starts"], group["ends"], group["rows"], group["hover"]):
+        x.extend((start, end, None))
+        y.extend((row, row, None))
+        hover.extend((text, text, None))
+    return go.Scattergl(
+        x=x,
+        y=y,
+        mode='lines',
+        line=dict(color=color, width=6, dash='dot' if kind == "poster" else 'solid'),
+        hovertext=hover,
+        hoverinfo='text',
+        opacity=0.6 if kind == "poster" else 0.8,
+        name=kind.title(),
+        showlegend=False
+    )
+
+
+def _create_dependency_trace(schedule: Schedule, config: Config, activity_rows: Dict[str, int],
+                             use_gl: bool = False) -> Optional[Union[go.Scatter, go.Scattergl]]:
+    """Create a single trace holding every dependency arrow, separated by ``None``."""
+    x: list = []
+    y: list = []
+    sizes: list = []
+    for submission_id, interval in schedule.intervals.items():
+        submission = config.submissions_dict.get(submission_id)
+        if not submission or not submission.depends_on:
+            continue
+        for dep_id in submission.depends_on:
+            if dep_id in schedule.intervals:
+                x.extend((schedule.intervals[dep_id].end_date, interval.start_date, None))
+                y.extend((activity_rows[dep_id] + 0.3, activity_rows[submission_id] - 0.3, None))
+                sizes.extend((0, 8, 0))
+    if not x:
+        return None
+    
+    line = dict(color='#e74c3c', width=2, dash='dot')
+    if use_gl:
+        # WebGL markers cannot follow the line angle, so large charts draw plain lines
+        return go.Scattergl(x=x, y=y, mode='lines', line=line, showlegend=False, hoverinfo='skip')
+    return go.Scatter(
+        x=x,
+        y=y,
+        mode='lines+markers',
+        line=line,
+        marker=dict(symbol='arrow', angleref='previous', size=sizes, color='#e74c3c'),
+        showlegend=False,
+        hoverinfo='skip'
+    )
+
+
+def _get_hover_text(submission: Submission, start_date: date, end_date: date) -> str:
+    """Hover text carrying the title, type and author labels of a bar."""
+    author = submission.author.upper() if submission.author else "Unknown"
+    return (f"<b>{submission.title}</b><br>{submission.kind.value.title()} · {author}<br>"
+            f"{start_date.isoformat()} → {end_date.isoformat()}")
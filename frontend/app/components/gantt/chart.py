@@ -16,10 +16,18 @@ from core.config import load_config
 
 # Frontend imports
 from app.components.gantt.sample import create_sample_gantt_chart, create_demo_schedule_from_config
-from app.components.gantt.activity import add_activity_bars
+from app.components.gantt.activity import add_activity_bars, add_activity_traces
 from app.components.gantt.timeline import add_background_elements
 
 
+# Rendering modes: one layout shape/annotation per bar, batched traces, or by size
+RENDER_MODE_SHAPES = 'shapes'
+RENDER_MODE_TRACES = 'traces'
+RENDER_MODE_AUTO = 'auto'
+
+# Schedules with more submissions than this render with traces in auto mode
+TRACE_RENDER_THRESHOLD = 150
+
 # Type aliases for frontend use
 ConfigData = Dict[str, Any]  # Simplified config representation
 SubmissionData = Dict[str, Any]  # Simplified submission representation
@@ -60,6 +68,32 @@ def create_gantt_chart(config: Optional[Union[Config, Dict[str, Any]]] = None, u
     return _create_empty_chart()
 
 
+def create_gantt_chart_from_schedule(schedule: Schedule, config: Config,
+                                     render_mode: str = RENDER_MODE_AUTO) -> Figure:
+    """Create a gantt chart for a schedule produced by a scheduler run.
+    
+    Args:
+        schedule: Scheduled intervals keyed by submission ID
+        config: Configuration the schedule was generated from
+        render_mode: 'shapes', 'traces' or 'auto' (traces for large schedules)
+        
+    Returns:
+        Plotly Figure object
+    """
+    if not schedule or not schedule.intervals:
+        return _create_empty_chart()
+    return _create_chart_from_config({'schedule': schedule, 'config': config, 'render_mode': render_mode})
+
+
+def resolve_render_mode(render_mode: str, num_activities: int) -> str:
+    """Resolve 'auto' to shapes or traces based on the number of bars."""
+    if render_mode == RENDER_MODE_AUTO:
+        return RENDER_MODE_TRACES if num_activities > TRACE_RENDER_THRESHOLD else RENDER_MODE_SHAPES
+    if render_mode not in (RENDER_MODE_SHAPES, RENDER_MODE_TRACES):
+        raise ValueError(f"Unknown gantt render mode: {render_mode}")
+    return render_mode
+
+
 def _create_chart_from_config(config_data: Dict[str, Any]) -> Figure:
     """Create a gantt chart with real data from stored state or database."""
     fig = go.Figure()
@@ -69,14 +103,26 @@ def _create_chart_from_config(config_data: Dict[str, Any]) -> Figure:
     
     if schedule and config:
         _setup_chart_layout(fig, 'Paper Planner Timeline - Database Data')
+        num_activities = len(schedule)
+        render_mode = resolve_render_mode(config_data.get('render_mode', RENDER_MODE_AUTO), num_activities)
         
-        # Use the real activity bars and background elements
-        add_activity_bars(fig, schedule, config)
-        add_background_elements(fig)
-        
-        # Set y-axis range based on number of activities
-        if schedule:
-            num_activities = len(schedule)
+        if render_mode == RENDER_MODE_TRACES:
+            add_activity_traces(fig, schedule, config)
+            # Background traces need the axis ranges up front
+            fig.update_layout(
+                xaxis=dict(range=[
+                    min(interval.start_date for interval in schedule.intervals.values()).isoformat(),
+                    max(interval.end_date for interval in schedule.intervals.values()).isoformat()
+                ]),
+                yaxis=dict(range=[-0.5, num_activities - 0.5])
+            )
+            add_background_elements(fig, use_traces=True)
+        else:
+            # Use the real activity bars and background elements
+            add_activity_bars(fig, schedule, config)
+            add_background_elements(fig)
+            
+            # Set y-axis range based on number of activities
             fig.update_layout(yaxis=dict(range=[-0.5, num_activities - 0.5]))
     else:
         return _create_empty_chart()
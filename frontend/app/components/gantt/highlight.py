@@ -0,0 +1,79 @@
+"""
+Highlighting submissions on a Gantt chart.
+
+Highlighting dims every bar that does not match a query. It only changes the
+marker opacity of the batched bar traces, so it is sent to the browser as a
+small Patch rather than a new figure.
+"""
+
+import copy
+from typing import Any, Dict, List, Optional
+
+from dash import Patch, no_update
+
+# Opacity of bars that do not match the highlight query
+DIMMED_OPACITY = 0.15
+
+
+def apply_highlight(figure: Dict[str, Any], query: Optional[str]) -> Dict[str, Any]:
+    """Return a copy of a figure dict with bars not matching query dimmed."""
+    opacities = _highlight_opacities(figure, query)
+    if not opacities:
+        return figure
+    figure = copy.copy(figure)
+    figure['data'] = list(figure.get('data', []))
+    for index, opacity in opacities.items():
+        trace = dict(figure['data'][index])
+        trace['marker'] = {**trace.get('marker', {}), 'opacity': opacity}
+        figure['data'][index] = trace
+    return figure
+
+
+def create_highlight_patch(figure: Optional[Dict[str, Any]], query: Optional[str]) -> Any:
+    """
+    Build a Patch setting bar opacities for a highlight query.
+
+    Parameters
+    ----------
+    figure : dict, optional
+        Un-highlighted figure dict currently shown
+    query : str, optional
+        Case-insensitive substring of a submission ID or bar label; empty clears
+
+    Returns
+    -------
+    Any
+        A Patch touching only ``marker.opacity`` of bar traces, or
+        ``no_update`` when the figure has no bars to highlight
+    """
+    if not figure:
+        return no_update
+    opacities = _highlight_opacities(figure, query, include_unchanged=True)
+    if not opacities:
+        return no_update
+    patch = Patch()
+    for index, opacity in opacities.items():
+        patch['data'][index]['marker']['opacity'] = opacity
+    return patch
+
+
+def _highlight_opacities(figure: Dict[str, Any], query: Optional[str],
+                         include_unchanged: bool = False) -> Dict[int, Any]:
+    """Map bar trace indices to their opacity (a scalar, or a per-bar list when highlighting)."""
+    query = (query or '').strip().lower()
+    if not query and not include_unchanged:
+        return {}
+    opacities: Dict[int, Any] = {}
+    for index, trace in enumerate(figure.get('data', [])):
+        if trace.get('type') != 'bar' or not trace.get('ids'):
+            continue
+        base = trace.get('marker', {}).get('opacity', 1)
+        if not query:
+            opacities[index] = base
+            continue
+        labels: List[str] = trace.get('text') or [''] * len(trace['ids'])
+        opacities[index] = [
+            base if query in str(sid).lower() or query in str(label).lower() else DIMMED_OPACITY
+            for sid, label in zip(trace['ids'], labels)
+        ]
+    return opacities
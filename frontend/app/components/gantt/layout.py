@@ -2,18 +2,28 @@
 Gantt layout components for Paper Planner.
 """
 
-from dash import html, dcc, Input, Output, callback, State, callback_context
-from typing import Optional
+from dash import html, dcc, Input, Output, callback, State, callback_context, no_update
+from datetime import date
+from typing import Any, Dict, Optional, Tuple
 from plotly.graph_objs import Figure
 from app.components.gantt.chart import (
     create_gantt_chart,
     _create_error_chart
 )
+from app.components.gantt.viewport import (
+    get_viewport, register_viewport, render_viewport_cached, viewport_figure_key, parse_relayout_range
+)
+from app.components.gantt.highlight import apply_highlight, create_highlight_patch
+from app.figure_cache import get_config_key, get_figure_cache, make_figure_key
+from app.figure_patch import update_figure
 from app.components.exporter.controls import create_export_controls, export_chart_png, export_chart_html
 from app.storage import get_state_manager
+from app.jobs import get_job_manager, DEFAULT_CONFIG_PATH, JOB_DONE, JOB_FAILED, JOB_CANCELLED
 
 # Import backend modules directly - TOML pythonpath should handle this
-from core.models import Config
+from core.models import Config, SchedulerStrategy
+
+SCHEDULER_STRATEGIES = [strategy.value for strategy in SchedulerStrategy]
 
 
 def create_gantt_layout(config: Optional[Config] = None) -> html.Div:
@@ -26,7 +36,8 @@ def create_gantt_layout(config: Optional[Config] = None) -> html.Div:
         Gantt layout as html.Div
     """
     # Create initial chart with sample data since no config is available at initialization
-    initial_figure = create_gantt_chart(use_sample_data=True)
+    initial_key = _sample_figure_key(None)
+    initial_figure = get_figure_cache().get_or_create(initial_key, lambda: create_gantt_chart(use_sample_data=True))
     
     # Create a demo schedule if we have config data but no schedule
     demo_schedule = None
@@ -77,6 +88,12 @@ def create_gantt_layout(config: Optional[Config] = None) -> html.Div:
             }
         ),
         _create_gantt_controls(),
+        html.Div(id="gantt-job-status", className="job-status"),
+        dcc.Store(id='gantt-job-store', data={'config_path': DEFAULT_CONFIG_PATH}),
+        dcc.Interval(id='gantt-job-poll', interval=1000, disabled=True),
+        dcc.Store(id='gantt-viewport-store'),
+        # Cache key of the figure on screen, so updates can be sent as patches
+        dcc.Store(id='gantt-figure-key', data=initial_key),
         create_export_controls('gantt-chart', 'gantt_chart'),
         html.Div(id="export-gantt-chart-status", className="export-status"),
         html.Div(id="gantt-storage-status", className="storage-status"),
@@ -102,26 +119,68 @@ def _create_gantt_controls() -> html.Div:
                 id='refresh-gantt-btn',
                 className="control-button"
             )
+        ], className="control-group"),
+        html.Div([
+            html.Label("Strategy:", className="control-label"),
+            dcc.Dropdown(
+                id='gantt-strategy-dropdown',
+                options=[{'label': name.title(), 'value': name} for name in SCHEDULER_STRATEGIES],
+                value='greedy',
+                clearable=False,
+                className="control-dropdown"
+            ),
+            html.Button(
+                'Run Scheduler',
+                id='run-gantt-scheduler-btn',
+                className="control-button"
+            )
+        ], className="control-group"),
+        html.Div([
+            html.Label("Highlight:", className="control-label"),
+            dcc.Input(
+                id='gantt-highlight-input',
+                type='text',
+                placeholder='Submission ID or title',
+                debounce=True,
+                className="control-input"
+            )
         ], className="control-group")
     ], className="gantt-controls")
 
 
+def _sample_figure_key(config: Optional[Config]) -> str:
+    """Figure cache key of the refresh chart, which uses sample data without a config."""
+    return make_figure_key(get_config_key(config), None, 'gantt', as_of=date.today())
+
+
+def _highlight_transform(query: Optional[str]):
+    """Apply the current highlight to figures before diffing them."""
+    return (lambda figure: apply_highlight(figure, query)) if query else None
+
+
 
 
 # Dash Callbacks
 @callback(
     Output('gantt-chart', 'figure'),
+    Output('gantt-viewport-store', 'data', allow_duplicate=True),
+    Output('gantt-figure-key', 'data', allow_duplicate=True),
     Input('refresh-gantt-btn', 'n_clicks'),
+    State('gantt-figure-key', 'data'),
+    State('gantt-highlight-input', 'value'),
     prevent_initial_call=True
 )
-def update_gantt_chart(n_clicks: Optional[int]) -> Figure:
+def update_gantt_chart(n_clicks: Optional[int], figure_key: Optional[str] = None,
+                       highlight: Optional[str] = None) -> Tuple[Any, None, Optional[str]]:
     """Update gantt chart.
     
     Args:
         n_clicks: Number of times refresh button was clicked
+        figure_key: Cache key of the figure currently shown
+        highlight: Current highlight query
         
     Returns:
-        Updated chart figure as Plotly Figure
+        Chart figure or patch, a cleared viewport key, and the new figure key
     """
     try:
         # Update component state
@@ -141,13 +200,130 @@ def update_gantt_chart(n_clicks: Optional[int]) -> Figure:
                 config = None
         
         # Create chart - will use sample data if no config available
-        figure = create_gantt_chart(config=config, use_sample_data=(config is None))
+        key = _sample_figure_key(config)
+        figure = get_figure_cache().get_or_create(
+            key, lambda: create_gantt_chart(config=config, use_sample_data=(config is None))
+        )
         
-        return figure
+        return update_figure(figure_key, key, figure, _highlight_transform(highlight)), None, key
         
     except Exception as e:
         print(f"Error updating gantt chart: {e}")
-        return _create_error_chart(f"Error updating chart: {str(e)}")
+        return _create_error_chart(f"Error updating chart: {str(e)}"), None, None
+
+
+@callback(
+    Output('gantt-job-store', 'data'),
+    Output('gantt-job-poll', 'disabled'),
+    Output('gantt-job-status', 'children'),
+    Input('run-gantt-scheduler-btn', 'n_clicks'),
+    State('gantt-strategy-dropdown', 'value'),
+    State('gantt-job-store', 'data'),
+    prevent_initial_call=True
+)
+def submit_gantt_job(n_clicks: Optional[int], strategy: str, job_store: Optional[Dict[str, Any]]) -> Tuple[Dict[str, Any], bool, str]:
+    """Submit a background scheduling job and start polling it."""
+    job_store = dict(job_store or {})
+    try:
+        job_id = get_job_manager().submit(job_store.get('config_path'), strategy or 'greedy')
+    except Exception as e:
+        return job_store, True, f"❌ Could not start scheduler: {e}"
+    job_store['job_id'] = job_id
+    return job_store, False, f"⏳ {strategy} scheduler queued (job {job_id})"
+
+
+@callback(
+    Output('gantt-chart', 'figure', allow_duplicate=True),
+    Output('gantt-job-poll', 'disabled', allow_duplicate=True),
+    Output('gantt-job-status', 'children', allow_duplicate=True),
+    Output('gantt-viewport-store', 'data'),
+    Output('gantt-figure-key', 'data', allow_duplicate=True),
+    Input('gantt-job-poll', 'n_intervals'),
+    State('gantt-job-store', 'data'),
+    State('gantt-figure-key', 'data'),
+    State('gantt-highlight-input', 'value'),
+    prevent_initial_call=True
+)
+def poll_gantt_job(n_intervals: Optional[int], job_store: Optional[Dict[str, Any]],
+                   figure_key: Optional[str] = None, highlight: Optional[str] = None) -> Tuple[Any, bool, str, Any, Any]:
+    """Poll the running job; render its schedule once it completes."""
+    job_id = (job_store or {}).get('job_id')
+    if not job_id:
+        return no_update, True, "", no_update, no_update
+    
+    status = get_job_manager().status(job_id)
+    if status is None:
+        return no_update, True, f"⚠️ Job {job_id} is no longer available", no_update, no_update
+    
+    if status['state'] == JOB_DONE:
+        try:
+            figure, viewport_key, key = _create_chart_from_job_result(status['result'])
+            figure = update_figure(figure_key, key, figure, _highlight_transform(highlight))
+        except Exception as e:
+            return _create_error_chart(f"Error rendering schedule: {e}"), True, f"❌ Render failed: {e}", None, None
+        metrics = status['result'].get('metrics', {})
+        return figure, True, (
+            f"✅ {status['strategy']} finished in {status['elapsed_seconds']}s: "
+            f"{len(status['result']['intervals'])} submissions, makespan {metrics.get('makespan', 'n/a')} days"
+        ), viewport_key, key
+    if status['state'] in (JOB_FAILED, JOB_CANCELLED):
+        return no_update, True, f"❌ Job {status['state']}: {status.get('error') or status['message']}", no_update, no_update
+    
+    return no_update, False, f"⏳ {status['message']} ({status['progress']:.0%}, {status['elapsed_seconds']}s)", no_update, no_update
+
+
+def _create_chart_from_job_result(result: Dict[str, Any]) -> Tuple[Any, str, str]:
+    """Register a finished job's schedule for windowed rendering and draw its full span.
+    
+    Returns the figure, the viewport key and the figure's cache key.
+    """
+    from caching.snapshot import load_config_cached
+    from service.worker import schedule_from_dict
+    
+    config = load_config_cached(result['config_path'])
+    viewport_key = register_viewport(schedule_from_dict(result['intervals']), config, result.get('strategy'))
+    viewport = get_viewport(viewport_key)
+    return render_viewport_cached(viewport), viewport_key, viewport_figure_key(viewport)
+
+
+@callback(
+    Output('gantt-chart', 'figure', allow_duplicate=True),
+    Output('gantt-figure-key', 'data', allow_duplicate=True),
+    Input('gantt-chart', 'relayoutData'),
+    State('gantt-viewport-store', 'data'),
+    State('gantt-figure-key', 'data'),
+    State('gantt-highlight-input', 'value'),
+    prevent_initial_call=True
+)
+def update_gantt_viewport(relayout_data: Optional[Dict[str, Any]], viewport_key: Optional[str],
+                          figure_key: Optional[str] = None, highlight: Optional[str] = None) -> Tuple[Any, Any]:
+    """Re-render only the visible date range after a zoom or pan."""
+    viewport = get_viewport(viewport_key)
+    visible_range = parse_relayout_range(relayout_data)
+    if viewport is None or visible_range is None:
+        return no_update, no_update
+    try:
+        key = viewport_figure_key(viewport, *visible_range)
+        figure = render_viewport_cached(viewport, *visible_range)
+        return update_figure(figure_key, key, figure, _highlight_transform(highlight)), key
+    except Exception as e:
+        print(f"Error rendering gantt viewport: {e}")
+        return no_update, no_update
+
+
+@callback(
+    Output('gantt-chart', 'figure', allow_duplicate=True),
+    Input('gantt-highlight-input', 'value'),
+    State('gantt-figure-key', 'data'),
+    prevent_initial_call=True
+)
+def highlight_gantt_submissions(query: Optional[str], figure_key: Optional[str]) -> Any:
+    """Dim bars not matching the query by patching only their opacity."""
+    try:
+        return create_highlight_patch(get_figure_cache().peek(figure_key), query)
+    except Exception as e:
+        print(f"Error highlighting gantt submissions: {e}")
+        return no_update
 
 
 @callback(
@@ -3,18 +3,27 @@ Timeline calculations and activity positioning for Gantt charts.
 Handles activity row assignments, dependency grouping, and background visualization.
 """
 
+import heapq
 from datetime import date, timedelta
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 import plotly.graph_objects as go
 from plotly.graph_objs import Figure
 
 # Import backend modules directly - TOML pythonpath should handle this
 from core.models import Config, Submission, Schedule
 from validation.resources import validate_resources_constraints
+from caching.metrics import memoize_schedule_metric
 
 
+@memoize_schedule_metric
 def assign_activity_rows(schedule: Optional[Schedule], config: Config) -> Dict[str, int]:
-    """Assign each activity to a specific row for visual layout."""
+    """Assign each activity to a specific row for visual layout.
+    
+    Dependency groups are placed in start order on the lowest-numbered row
+    that is free by their start; a heap of busy rows keyed on free time and a
+    heap of free row numbers make this O(n log n). Results are memoized on
+    the schedule version, so repeated renders and exports reuse the layout.
+    """
     if not schedule:
         return {}
     
@@ -26,37 +35,31 @@ def assign_activity_rows(schedule: Optional[Schedule], config: Config) -> Dict[s
     
     # Calculate time intervals for each dependency group (not individual submissions)
     group_intervals = []
-    for group_id, group_submissions in dependency_groups.items():
+    for order, group_submissions in enumerate(dependency_groups.values()):
         # Find the earliest start and latest end for the entire group
         group_start = min(schedule.intervals[sub_id].start_date for sub_id in group_submissions)
-        group_end = max(
-            schedule.intervals[sub_id].end_date
-            for sub_id in group_submissions
-        )
-        group_intervals.append((group_id, group_start, group_end, group_submissions))
+        group_end = max(schedule.intervals[sub_id].end_date for sub_id in group_submissions)
+        group_intervals.append((group_start, order, group_end, group_submissions))
     
-    # Sort by start date
-    group_intervals.sort(key=lambda x: x[1])
+    # Sort by start date, keeping group order for ties
+    group_intervals.sort(key=lambda x: (x[0], x[1]))
     
-    # Assign rows based on actual overlaps between dependency groups
     concurrency_map = {}
-    used_rows = []  # Track which rows are occupied and until when
-    
-    for group_id, start_date, end_date, group_submissions in group_intervals:
-        # Find the first available row
-        row = 0
-        while row < len(used_rows):
-            if used_rows[row] <= start_date:
-                # This row is free
-                break
-            row += 1
+    busy_rows: List[Tuple[date, int]] = []  # (free from, row)
+    free_rows: List[int] = []
+    row_count = 0
+    
+    for start_date, _, end_date, group_submissions in group_intervals:
+        # Release every row that is free by this group's start
+        while busy_rows and busy_rows[0][0] <= start_date:
+            heapq.heappush(free_rows, heapq.heappop(busy_rows)[1])
         
-        # If no free row found, create a new one
-        if row >= len(used_rows):
-            used_rows.append(end_date)
+        if free_rows:
+            row = heapq.heappop(free_rows)
         else:
-            # Update the row's end time
-            used_rows[row] = end_date
+            row = row_count
+            row_count += 1
+        heapq.heappush(busy_rows, (end_date, row))
         
         # Assign all submissions in this group to the same row
         for submission_id in group_submissions:
@@ -65,8 +68,12 @@ def assign_activity_rows(schedule: Optional[Schedule], config: Config) -> Dict[s
     return concurrency_map
 
 
-def add_background_elements(fig: Figure) -> None:
-    """Add background elements to the chart."""
+def add_background_elements(fig: Figure, use_traces: bool = False) -> None:
+    """Add background elements to the chart.
+    
+    With ``use_traces`` the weekend shading and month markers are a few
+    background traces rather than one layout shape or annotation each.
+    """
     try:
         # Get chart dimensions from the figure (layout is now configured)
         x_range = getattr(fig.layout, 'xaxis', None)
@@ -112,10 +119,16 @@ def add_background_elements(fig: Figure) -> None:
         y_max = y_range.range[1]
         
         # Add working days background
-        _add_weekend_shading(fig, start_date, end_date)
+        if use_traces:
+            _add_weekend_trace(fig, start_date, end_date, y_min, y_max)
+        else:
+            _add_weekend_shading(fig, start_date, end_date)
         
         # Add monthly markers
-        _add_month_boundaries(fig, start_date, end_date)
+        if use_traces:
+            _add_month_boundary_traces(fig, start_date, end_date, y_min, y_max)
+        else:
+            _add_month_boundaries(fig, start_date, end_date)
         
     except Exception as e:
         print(f"Background elements failed: {e}")
@@ -139,6 +152,35 @@ def _add_weekend_shading(fig: Figure, start_date: date, end_date: date) -> None:
         current_date += timedelta(days=1)
 
 
+def _add_weekend_trace(fig: Figure, start_date: date, end_date: date, y_min: float, y_max: float) -> None:
+    """Add all weekends as one filled background trace drawn beneath the bars."""
+    x: list = []
+    y: list = []
+    # Start at the first Saturday on or before the range
+    current_date = start_date - timedelta(days=(start_date.weekday() - 5) % 7)
+    while current_date <= end_date:
+        weekend_end = current_date + timedelta(days=2)
+        x.extend((current_date, weekend_end, weekend_end, current_date, current_date, None))
+        y.extend((y_min, y_min, y_max, y_max, y_min, None))
+        current_date += timedelta(days=7)
+    if not x:
+        return
+    
+    fig.add_trace(go.Scatter(
+        x=x,
+        y=y,
+        mode='lines',
+        fill='toself',
+        fillcolor='rgba(236, 240, 241, 0.3)',
+        line=dict(width=0),
+        hoverinfo='skip',
+        showlegend=False,
+        name='weekends'
+    ))
+    # Move the band behind every other trace
+    fig.data = (fig.data[-1],) + tuple(fig.data[:-1])
+
+
 def _add_month_boundaries(fig: Figure, start_date: date, end_date: date) -> None:
     """Add vertical lines for month boundaries."""
     current_date = start_date.replace(day=1)
@@ -174,48 +216,83 @@ def _add_month_boundaries(fig: Figure, start_date: date, end_date: date) -> None
             current_date = current_date.replace(month=current_date.month + 1)
 
 
-def _group_by_dependencies(schedule: Schedule, submissions: Dict[str, Submission]) -> Dict[str, List[str]]:
-    """Group submissions by their dependency relationships."""
-    groups = {}
-    processed = set()
-    
-    for submission_id in schedule.intervals.keys():
-        if submission_id in processed:
-            continue
-            
-        # Start a new group
-        group_id = f"group_{len(groups)}"
-        group_submissions = []
-        
-        # Find all submissions in this dependency chain
-        _collect_dependency_chain(submission_id, schedule, submissions, group_submissions, processed)
-        
-        groups[group_id] = group_submissions
+def _add_month_boundary_traces(fig: Figure, start_date: date, end_date: date, y_min: float, y_max: float) -> None:
+    """Add month boundaries as one line trace and their labels as one text trace."""
+    boundaries = []
+    current_date = start_date.replace(day=1)
+    while current_date <= end_date:
+        if current_date >= start_date:
+            boundaries.append(current_date)
+        if current_date.month == 12:
+            current_date = current_date.replace(year=current_date.year + 1, month=1)
+        else:
+            current_date = current_date.replace(month=current_date.month + 1)
+    if not boundaries:
+        return
     
-    return groups
+    x: list = []
+    y: list = []
+    for boundary in boundaries:
+        x.extend((boundary, boundary, None))
+        y.extend((y_min, y_max, None))
+    fig.add_trace(go.Scatter(
+        x=x,
+        y=y,
+        mode='lines',
+        line=dict(color='rgba(189, 195, 199, 0.5)', width=1, dash='dot'),
+        hoverinfo='skip',
+        showlegend=False,
+        name='months'
+    ))
+    fig.add_trace(go.Scatter(
+        x=boundaries,
+        y=[y_max] * len(boundaries),
+        mode='text',
+        text=[boundary.strftime('%b %Y') for boundary in boundaries],
+        textposition='top center',
+        textfont={'size': 10, 'color': '#7f8c8d'},
+        cliponaxis=False,
+        hoverinfo='skip',
+        showlegend=False,
+        name='month labels'
+    ))
+    # Keep the boundary lines behind the bars, labels on top
+    fig.data = (fig.data[-2],) + tuple(fig.data[:-2]) + (fig.data[-1],)
 
 
-def _collect_dependency_chain(submission_id: str, schedule: Schedule, 
-                            submissions: Dict[str, Submission], group: List[str], processed: set):
-    """Recursively collect all submissions in a dependency chain."""
-    if submission_id in processed or submission_id not in schedule.intervals:
-        return
+def _group_by_dependencies(schedule: Schedule, submissions: Dict[str, Submission]) -> Dict[str, List[str]]:
+    """Group scheduled submissions connected by dependencies, using union-find.
     
-    processed.add(submission_id)
-    group.append(submission_id)
+    Groups are numbered in the order their first member appears in the
+    schedule.
+    """
+    parent = {submission_id: submission_id for submission_id in schedule.intervals}
     
-    submission = submissions.get(submission_id)
-    if submission and submission.depends_on:
-        # Add dependencies first (they come before this submission)
-        for dep_id in submission.depends_on:
-            if dep_id in schedule.intervals:
-                _collect_dependency_chain(dep_id, schedule, submissions, group, processed)
+    def find(submission_id: str) -> str:
+        root = submission_id
+        while parent[root] != root:
+            root = parent[root]
+        # Path compression
+        while parent[submission_id] != root:
+            parent[submission_id], submission_id = root, parent[submission_id]
+        return root
     
-    # Find submissions that depend on this one
-    for other_id, other_submission in submissions.items():
-        if (other_id in schedule.intervals and other_submission.depends_on and 
-            submission_id in other_submission.depends_on):
-            _collect_dependency_chain(other_id, schedule, submissions, group, processed)
-
-
-
+    for submission_id in schedule.intervals:
+        submission = submissions.get(submission_id)
+        if submission and submission.depends_on:
+            for dep_id in submission.depends_on:
+                if dep_id in parent:
+                    root, dep_root = find(submission_id), find(dep_id)
+                    if root != dep_root:
+                        parent[dep_root] = root
+    
+    groups: Dict[str, List[str]] = {}
+    group_ids: Dict[str, str] = {}
+    for submission_id in schedule.intervals:
+        root = find(submission_id)
+        if root not in group_ids:
+            group_ids[root] = f"group_{len(group_ids)}"
+            groups[group_ids[root]] = []
+        groups[group_ids[root]].append(submission_id)
+    
+    return groups
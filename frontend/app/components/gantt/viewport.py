@@ -0,0 +1,268 @@
+"""
+Viewport-windowed Gantt rendering with level of detail.
+Keeps large schedules server-side and renders only the visible date range.
+"""
+
+import hashlib
+import threading
+import uuid
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+import plotly.graph_objects as go
+from plotly.graph_objs import Figure
+
+# Import backend modules directly - TOML pythonpath should handle this
+from core.models import Config, Schedule
+
+from app.figure_cache import get_config_key, get_figure_cache, make_figure_key
+from app.components.gantt.activity import add_activity_traces
+from app.components.gantt.chart import _setup_chart_layout, _create_empty_chart
+from app.components.gantt.timeline import assign_activity_rows, add_background_elements
+
+
+# Show individual bars and labels when at most this many intervals are visible
+DETAIL_MAX_BARS = 300
+
+# Density view resolution: time bins across the viewport and row bands down it
+DENSITY_BINS = 200
+DENSITY_MAX_BANDS = 40
+
+# Schedules kept server-side for zoom/pan requests
+MAX_VIEWPORTS = 8
+
+# Keeps the user's zoom when the figure is replaced after a relayout
+VIEWPORT_UIREVISION = 'gantt-viewport'
+
+
+class IntervalIndex:
+    """Sorted start/end index over a Schedule for date-window queries.
+
+    Intervals are sorted by start day; the longest interval bounds how far
+    before a window an overlapping interval can start, so a window is found
+    with two binary searches plus a scan of the candidates.
+    """
+
+    def __init__(self, schedule: Schedule):
+        entries = sorted(
+            (interval.start_date.toordinal(), interval.end_date.toordinal(), sid)
+            for sid, interval in schedule.intervals.items()
+        )
+        self.starts: List[int] = [start for start, _, _ in entries]
+        self.ends: List[int] = [end for _, end, _ in entries]
+        self.ids: List[str] = [sid for _, _, sid in entries]
+        self.max_duration = max((end - start for start, end, _ in entries), default=0)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def start_date(self) -> Optional[date]:
+        return date.fromordinal(self.starts[0]) if self.starts else None
+
+    @property
+    def end_date(self) -> Optional[date]:
+        return date.fromordinal(max(self.ends)) if self.ends else None
+
+    def window(self, start: Optional[date] = None, end: Optional[date] = None) -> List[int]:
+        """Return positions of intervals overlapping [start, end] (inclusive)."""
+        lo = 0 if start is None else bisect_left(self.starts, start.toordinal() - self.max_duration)
+        hi = len(self.starts) if end is None else bisect_right(self.starts, end.toordinal())
+        if start is None:
+            return list(range(lo, hi))
+        start_day = start.toordinal()
+        return [index for index in range(lo, hi) if self.ends[index] >= start_day]
+
+
+class ScheduleViewport:
+    """A schedule, its config, stable row assignment and interval index."""
+
+    def __init__(self, schedule: Schedule, config: Config, strategy: Optional[str] = None):
+        self.schedule = schedule
+        self.config = config
+        self.strategy = strategy
+        self.rows = assign_activity_rows(schedule, config)
+        self.index = IntervalIndex(schedule)
+        self.row_count = max(self.rows.values(), default=-1) + 1
+        self._cache_key: Optional[Tuple[str, str]] = None
+
+    @property
+    def cache_key(self) -> Tuple[str, str]:
+        """(config hash, schedule hash) identifying this viewport's figures."""
+        if self._cache_key is None:
+            digest = hashlib.sha1()
+            for sid, start, end in zip(self.index.ids, self.index.starts, self.index.ends):
+                digest.update(f"{sid}:{start}:{end};".encode("utf-8"))
+            self._cache_key = (get_config_key(self.config), digest.hexdigest())
+        return self._cache_key
+
+    def window_schedule(self, positions: List[int]) -> Schedule:
+        """Build a Schedule holding only the given index positions."""
+        window = Schedule()
+        window.intervals = {
+            self.index.ids[position]: self.schedule.intervals[self.index.ids[position]]
+            for position in positions
+        }
+        return window
+
+
+_viewports: "OrderedDict[str, ScheduleViewport]" = OrderedDict()
+_viewports_lock = threading.Lock()
+
+
+def register_viewport(schedule: Schedule, config: Config, strategy: Optional[str] = None) -> str:
+    """Keep a schedule server-side for windowed rendering and return its key."""
+    viewport = ScheduleViewport(schedule, config, strategy)
+    key = uuid.uuid4().hex
+    with _viewports_lock:
+        _viewports[key] = viewport
+        while len(_viewports) > MAX_VIEWPORTS:
+            _viewports.popitem(last=False)
+    return key
+
+
+def get_viewport(key: Optional[str]) -> Optional[ScheduleViewport]:
+    """Look up a registered schedule, refreshing its recency."""
+    if not key:
+        return None
+    with _viewports_lock:
+        viewport = _viewports.get(key)
+        if viewport is not None:
+            _viewports.move_to_end(key)
+        return viewport
+
+
+def parse_relayout_range(relayout_data: Optional[Dict[str, Any]]) -> Optional[Tuple[Optional[date], Optional[date]]]:
+    """Extract the x-axis date range from Plotly relayoutData.
+
+    Returns (None, None) for an autorange reset and None when the event did
+    not change the x-axis (e.g. a resize).
+    """
+    if not relayout_data:
+        return None
+    if relayout_data.get('xaxis.autorange'):
+        return None, None
+    if 'xaxis.range[0]' in relayout_data and 'xaxis.range[1]' in relayout_data:
+        bounds = relayout_data['xaxis.range[0]'], relayout_data['xaxis.range[1]']
+    elif 'xaxis.range' in relayout_data:
+        bounds = tuple(relayout_data['xaxis.range'])
+    else:
+        return None
+    try:
+        start, end = (date.fromisoformat(str(bound)[:10]) for bound in bounds)
+    except ValueError:
+        return None
+    return (start, end) if start <= end else (end, start)
+
+
+def render_viewport(viewport: ScheduleViewport, start: Optional[date] = None,
+                    end: Optional[date] = None) -> Figure:
+    """
+    Render the part of a schedule visible in [start, end].
+
+    Parameters
+    ----------
+    viewport : ScheduleViewport
+        Registered schedule to render
+    start, end : date, optional
+        Visible date range; the full schedule span when omitted
+
+    Returns
+    -------
+    Figure
+        Individual bars when few intervals are visible, otherwise a
+        fixed-size density heatmap of row bands over time
+    """
+    if not len(viewport.index):
+        return _create_empty_chart()
+    start = start or viewport.index.start_date
+    end = end or viewport.index.end_date
+    positions = viewport.index.window(start, end)
+
+    if len(positions) <= DETAIL_MAX_BARS:
+        fig = _render_detail(viewport, positions, start, end)
+    else:
+        fig = _render_density(viewport, positions, start, end)
+    fig.update_layout(uirevision=VIEWPORT_UIREVISION)
+    return fig
+
+
+def viewport_figure_key(viewport: ScheduleViewport, start: Optional[date] = None,
+                        end: Optional[date] = None) -> str:
+    """Figure cache key for a viewport's schedule and visible range."""
+    config_hash, schedule_hash = viewport.cache_key
+    return make_figure_key(config_hash, viewport.strategy, 'gantt-viewport',
+                           (start, end), schedule=schedule_hash)
+
+
+def render_viewport_cached(viewport: ScheduleViewport, start: Optional[date] = None,
+                           end: Optional[date] = None) -> Any:
+    """Render a viewport through the figure cache, keyed on schedule and visible range."""
+    return get_figure_cache().get_or_create(viewport_figure_key(viewport, start, end),
+                                            lambda: render_viewport(viewport, start, end))
+
+
+def _render_detail(viewport: ScheduleViewport, positions: List[int], start: date, end: date) -> Figure:
+    """Render visible intervals as individual labelled bars."""
+    fig = go.Figure()
+    _setup_chart_layout(fig, f'Paper Planner Timeline - {len(positions)} of {len(viewport.index)} submissions')
+    window = viewport.window_schedule(positions)
+    add_activity_traces(fig, window, viewport.config, activity_rows=viewport.rows)
+    fig.update_layout(
+        xaxis=dict(range=[start.isoformat(), end.isoformat()]),
+        yaxis=dict(range=[-0.5, viewport.row_count - 0.5]),
+        uniformtext=dict(minsize=8, mode='hide')
+    )
+    add_background_elements(fig, use_traces=True)
+    return fig
+
+
+def _render_density(viewport: ScheduleViewport, positions: List[int], start: date, end: date) -> Figure:
+    """Render visible intervals as counts per (row band, time bin)."""
+    first_day = start.toordinal()
+    span = end.toordinal() - first_day + 1
+    bin_days = max(1, -(-span // DENSITY_BINS))
+    bins = -(-span // bin_days)
+    rows_per_band = max(1, -(-viewport.row_count // DENSITY_MAX_BANDS))
+    bands = -(-viewport.row_count // rows_per_band)
+
+    # Difference arrays per band: +1 at the first bin an interval touches, -1 after the last
+    deltas = [[0] * (bins + 1) for _ in range(bands)]
+    for position in positions:
+        band = viewport.rows[viewport.index.ids[position]] // rows_per_band
+        first_bin = max(0, viewport.index.starts[position] - first_day) // bin_days
+        last_bin = min(span - 1, viewport.index.ends[position] - first_day) // bin_days
+        deltas[band][first_bin] += 1
+        deltas[band][last_bin + 1] -= 1
+
+    z = []
+    for band_deltas in deltas:
+        running = 0
+        counts = []
+        for delta in band_deltas[:bins]:
+            running += delta
+            counts.append(running)
+        z.append(counts)
+
+    x = [(start + timedelta(days=bin_index * bin_days)).isoformat() for bin_index in range(bins)]
+    y = [
+        f"Rows {band * rows_per_band}-{min(viewport.row_count, (band + 1) * rows_per_band) - 1}"
+        for band in range(bands)
+    ]
+
+    fig = go.Figure(go.Heatmap(
+        x=x,
+        y=y,
+        z=z,
+        colorscale='Blues',
+        hovertemplate='%{y}<br>%{x}<br>%{z} active<extra></extra>',
+        colorbar=dict(title='Active')
+    ))
+    _setup_chart_layout(fig, f'Paper Planner Timeline - density of {len(positions)} submissions (zoom in for detail)')
+    fig.update_layout(
+        xaxis=dict(range=[start.isoformat(), end.isoformat()]),
+        yaxis=dict(autorange='reversed', showgrid=False)
+    )
+    return fig
@@ -8,11 +8,24 @@ from plotly.subplots import make_subplots
 from datetime import datetime, date
 from typing import Any, Dict, List, Optional
 from plotly.graph_objs import Figure
+from app.metrics_service import METRIC_FIELDS, MetricsSnapshot
 
+METRIC_COLORS = ['#2E86AB', '#A23B72', '#F18F01', '#C73E1D', '#592E83']
 
 
-def create_metrics_chart() -> Figure:
-    """Create the main metrics chart - public function."""
+def create_metrics_chart(snapshot: Optional[MetricsSnapshot] = None) -> Figure:
+    """Create the main metrics chart - public function.
+    
+    Args:
+        snapshot: Scored saved schedules from the metrics service; sample
+            numbers are shown when omitted
+    
+    Returns:
+        Current metrics as bars and their trend across saved schedules
+    """
+    if snapshot is not None:
+        return _create_snapshot_chart(snapshot)
+    
     # Create subplots: 1 row, 2 columns
     fig = make_subplots(
         rows=1, cols=2,
@@ -103,6 +116,74 @@ def create_metrics_chart() -> Figure:
 
 
 
+def _create_snapshot_chart(snapshot: MetricsSnapshot) -> Figure:
+    """Create the metrics chart from scored saved schedules."""
+    current_title = f'Current Metrics ({snapshot.current_label})' if snapshot.current_label else 'Current Metrics'
+    fig = make_subplots(
+        rows=1, cols=2,
+        subplot_titles=(current_title, 'Trend Across Saved Schedules'),
+        specs=[[{"type": "bar"}, {"type": "scatter"}]],
+        horizontal_spacing=0.1
+    )
+    
+    labels = [label for _, label in METRIC_FIELDS]
+    scores = [round(snapshot.current.get(name, 0.0), 1) for name, _ in METRIC_FIELDS]
+    fig.add_trace(
+        go.Bar(
+            x=labels,
+            y=scores if snapshot.current else [],
+            name='Current Score',
+            marker_color=METRIC_COLORS,
+            text=scores if snapshot.current else [],
+            textposition='auto',
+            showlegend=False
+        ),
+        row=1, col=1
+    )
+    
+    timestamps = [point['timestamp'] for point in snapshot.trends]
+    hover = [
+        f"{point['filename']} ({point['strategy']})<br>Penalty: {point['total_penalty']:.1f}"
+        for point in snapshot.trends
+    ]
+    for (name, label), color in zip(METRIC_FIELDS, METRIC_COLORS):
+        fig.add_trace(
+            go.Scatter(
+                x=timestamps,
+                y=[point[name] for point in snapshot.trends],
+                name=label,
+                mode='lines+markers',
+                line=dict(color=color, width=3),
+                marker=dict(size=8),
+                hovertext=hover,
+                hovertemplate='%{hovertext}<br>' + label + ': %{y:.1f}<extra></extra>'
+            ),
+            row=1, col=2
+        )
+    
+    status = []
+    if snapshot.pending:
+        status.append(f"scoring {snapshot.pending} more saved schedule{'s' if snapshot.pending != 1 else ''}...")
+    if snapshot.errors:
+        status.append(f"{len(snapshot.errors)} could not be scored")
+    if not snapshot.trends and not snapshot.pending:
+        status.append("no saved schedules yet - save a schedule to track its metrics")
+    
+    fig.update_layout(
+        title='Paper Planner Performance Dashboard' + (f" - {'; '.join(status)}" if status else ''),
+        height=500,
+        showlegend=True,
+        plot_bgcolor='white',
+        paper_bgcolor='white',
+        font=dict(family="Arial, sans-serif", size=12)
+    )
+    fig.update_xaxes(title_text="Metrics", row=1, col=1)
+    fig.update_yaxes(title_text="Score (%)", row=1, col=1, range=[0, 100])
+    fig.update_xaxes(title_text="Saved", row=1, col=2)
+    fig.update_yaxes(title_text="Score (%)", row=1, col=2, range=[0, 100])
+    return fig
+
+
 def _create_error_chart(error_msg: str) -> Figure:
     """Create an error chart when something goes wrong."""
     fig = go.Figure()
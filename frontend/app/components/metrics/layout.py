@@ -3,7 +3,7 @@ Metrics layout components for Paper Planner.
 """
 
 from dash import html, dcc, Input, Output, callback, State, callback_context
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from datetime import datetime
 from plotly.graph_objs import Figure
 from app.components.metrics.chart import (
@@ -12,8 +12,14 @@ from app.components.metrics.chart import (
 )
 from app.components.exporter.controls import create_export_controls
 from app.storage import get_state_manager
+from app.jobs import DEFAULT_CONFIG_PATH
+from app.metrics_service import MetricsSnapshot, get_metrics_service
 from core.models import Config
 
+# How often the page polls for metrics still being scored (milliseconds)
+METRICS_POLL_INTERVAL_MS = 1000
+
+
 def create_metrics_layout(config: Optional[Config] = None) -> html.Div:
     """Create the metrics-only layout with minimal UI.
     
@@ -23,8 +29,9 @@ def create_metrics_layout(config: Optional[Config] = None) -> html.Div:
     Returns:
         Metrics layout as html.Div
     """
-    # Create initial chart with real data
-    initial_figure = create_metrics_chart()
+    # Create initial chart from whatever metrics are already scored; the rest stream in
+    snapshot = _get_metrics_snapshot()
+    initial_figure = create_metrics_chart(snapshot) if snapshot else _create_error_chart("Metrics unavailable")
     
     # Store component state using clean state manager
     if config:
@@ -50,6 +57,8 @@ def create_metrics_layout(config: Optional[Config] = None) -> html.Div:
             }
         ),
         _create_metrics_controls(),
+        dcc.Interval(id='metrics-poll', interval=METRICS_POLL_INTERVAL_MS,
+                     disabled=not (snapshot and snapshot.pending)),
         create_export_controls('metrics-chart', 'metrics_chart'),
         html.Div(id="metrics-storage-status", className="storage-status"),
         # Store refresh timestamp for debugging
@@ -75,36 +84,44 @@ def _create_metrics_controls() -> html.Div:
         ], className="control-group")
     ], className="metrics-controls")
 
+def _get_metrics_snapshot() -> Optional[MetricsSnapshot]:
+    """Queue scoring of saved schedules and return the metrics ready so far."""
+    try:
+        return get_metrics_service().snapshot(DEFAULT_CONFIG_PATH)
+    except Exception as e:
+        print(f"Warning: Could not load metrics: {e}")
+        return None
+
 @callback(
     Output('metrics-chart', 'figure'),
+    Output('metrics-poll', 'disabled'),
     Input('refresh-metrics-btn', 'n_clicks'),
+    Input('metrics-poll', 'n_intervals'),
     prevent_initial_call=True
 )
-def update_metrics_chart(n_clicks: Optional[int]) -> Figure:
+def update_metrics_chart(n_clicks: Optional[int], n_intervals: Optional[int] = None) -> Tuple[Figure, bool]:
     """Update metrics chart.
     
+    Scoring runs in the metrics service's background thread, so this only
+    collects finished results and keeps polling while any are pending.
+    
     Args:
         n_clicks: Number of times refresh button was clicked
+        n_intervals: Number of poll ticks while metrics are being scored
         
     Returns:
-        Updated chart figure as Plotly Figure
+        Updated chart figure as Plotly Figure, and whether polling stops
     """
     try:
         # Update component state
         get_state_manager().update_component_refresh_time('metrics')
         
-        # For now, always use sample data since we're not loading custom configs in callbacks
-        # In a full implementation, you'd want to load the custom config here
-        config = None
-        
-        # Create chart with sample data
-        figure = create_metrics_chart()
-        
-        return figure
+        snapshot = get_metrics_service().snapshot(DEFAULT_CONFIG_PATH)
+        return create_metrics_chart(snapshot), not snapshot.pending
         
     except Exception as e:
         print(f"Error updating metrics chart: {e}")
-        return _create_error_chart(f"Error updating chart: {str(e)}")
+        return _create_error_chart(f"Error updating chart: {str(e)}"), True
 
 @callback(
     Output('metrics-storage-status', 'children'),
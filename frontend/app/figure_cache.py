@@ -0,0 +1,133 @@
+"""
+Server-side cache of rendered Plotly figures.
+
+Figures are stored as compact JSON keyed on what they are drawn from (config
+hash, strategy, chart type and viewport), so repeat views and chart switches
+skip rebuilding them. Entries are evicted least-recently-used first once the
+cache exceeds its entry count or byte budget. Hits are returned as plain
+figure dicts, which Dash sends to the browser without re-validating a Figure.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+import plotly.io as pio
+from plotly.graph_objs import Figure
+
+DEFAULT_MAX_ENTRIES = 128
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+FigureLike = Union[Figure, Dict[str, Any]]
+
+
+def make_figure_key(config_hash: Optional[str], strategy: Optional[str], chart_type: str,
+                    viewport: Optional[Tuple[Any, ...]] = None, **extra: Any) -> str:
+    """Build a cache key from the inputs a figure is drawn from."""
+    payload = json.dumps(
+        {"config": config_hash, "strategy": strategy, "chart": chart_type, "viewport": viewport, **extra},
+        sort_keys=True, default=str
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def get_config_key(config: Any) -> str:
+    """Hash a Config for figure keys; 'sample' when no config is loaded."""
+    if config is None:
+        return "sample"
+    from caching.results import get_config_hash
+    return get_config_hash(config)
+
+
+class FigureCache:
+    """LRU cache of figure JSON bounded by entry count and total bytes."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached figure dict, or None on a miss."""
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+        return json.loads(payload)
+
+    def peek(self, key: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Return the cached figure dict without counting a lookup or refreshing recency."""
+        with self._lock:
+            payload = self._entries.get(key) if key else None
+        return json.loads(payload) if payload is not None else None
+
+    def put(self, key: str, figure: FigureLike) -> None:
+        """Store a figure; figures larger than the whole budget are not cached."""
+        payload = pio.to_json(figure, validate=False, pretty=False, remove_uids=True)
+        size = len(payload)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous)
+            self._entries[key] = payload
+            self._bytes += size
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+                self._evictions += 1
+
+    def get_or_create(self, key: str, builder: Callable[[], FigureLike]) -> FigureLike:
+        """Return the cached figure for key, building and caching it on a miss."""
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        figure = builder()
+        self.put(key, figure)
+        return figure
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._hits = self._misses = self._evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return entry, byte and hit/miss/eviction counts."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+            }
+
+
+_figure_cache: Optional[FigureCache] = None
+_figure_cache_lock = threading.Lock()
+
+
+def get_figure_cache() -> FigureCache:
+    """Return the process-wide figure cache."""
+    global _figure_cache
+    with _figure_cache_lock:
+        if _figure_cache is None:
+            _figure_cache = FigureCache()
+        return _figure_cache
@@ -0,0 +1,149 @@
+"""
+Incremental figure updates with Dash ``Patch``.
+
+Callbacks know the cache key of the figure currently shown in a graph, so the
+previous figure is read back from the figure cache and diffed against the new
+one. When the two share a trace structure only the changed properties are sent,
+down to single elements of a coordinate array; otherwise, or when the patch
+would not be much smaller than the figure, the whole figure is sent.
+"""
+
+import json
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import plotly.io as pio
+from dash import Patch, no_update
+
+from app.figure_cache import FigureLike, get_figure_cache
+
+# Send the whole figure when a patch would be more than this fraction of its size
+MAX_PATCH_RATIO = 0.5
+
+# Approximate JSON size of one patch operation besides its value
+OPERATION_OVERHEAD_BYTES = 64
+
+FigureTransform = Callable[[Dict[str, Any]], Dict[str, Any]]
+
+_DELETE = object()
+
+
+def build_figure_patch(old: Dict[str, Any], new: Dict[str, Any],
+                       max_ratio: float = MAX_PATCH_RATIO) -> Optional[Patch]:
+    """
+    Build a Patch turning figure dict old into new.
+
+    Parameters
+    ----------
+    old, new : Dict[str, Any]
+        Figure dicts, as produced by ``plotly.io.to_json``
+    max_ratio : float, optional
+        Largest patch size, as a fraction of the new figure's JSON size
+
+    Returns
+    -------
+    Optional[Patch]
+        The patch (possibly with no operations), or None when the traces
+        differ in number or type or the patch would be too large
+    """
+    old_data, new_data = old.get('data', []), new.get('data', [])
+    if len(old_data) != len(new_data) or any(
+        old_trace.get('type') != new_trace.get('type') for old_trace, new_trace in zip(old_data, new_data)
+    ):
+        return None
+
+    operations: List[Tuple[List[Any], Any]] = []
+    for index, (old_trace, new_trace) in enumerate(zip(old_data, new_data)):
+        _diff(old_trace, new_trace, ['data', index], operations)
+    _diff(old.get('layout', {}), new.get('layout', {}), ['layout'], operations)
+
+    patch_size = sum(len(_dumps(value)) for _, value in operations if value is not _DELETE)
+    if patch_size > max_ratio * len(_dumps(new)):
+        return None
+
+    patch = Patch()
+    for location, value in operations:
+        target = patch
+        for part in location[:-1]:
+            target = target[part]
+        if value is _DELETE:
+            del target[location[-1]]
+        else:
+            target[location[-1]] = value
+    return patch
+
+
+def update_figure(previous_key: Optional[str], key: str, figure: FigureLike,
+                  transform: Optional[FigureTransform] = None) -> Any:
+    """
+    Return what a figure callback should send to replace the figure at previous_key.
+
+    Parameters
+    ----------
+    previous_key : str, optional
+        Figure cache key of the figure currently shown
+    key : str
+        Figure cache key of the figure to show
+    figure : Figure or dict
+        The figure to show, as returned by ``FigureCache.get_or_create``
+    transform : callable, optional
+        Client-side state (e.g. a highlight) applied to both figures before diffing
+
+    Returns
+    -------
+    Any
+        ``no_update`` when nothing changed, a Patch when the figures share their
+        structure, otherwise the full figure dict
+    """
+    if previous_key is not None and previous_key == key:
+        return no_update
+    cache = get_figure_cache()
+    new = cache.peek(key)
+    if new is None:
+        new = figure if isinstance(figure, dict) else json.loads(pio.to_json(figure, validate=False))
+    if transform is not None:
+        new = transform(new)
+
+    old = cache.peek(previous_key)
+    if old is None:
+        return new
+    if transform is not None:
+        old = transform(old)
+    patch = build_figure_patch(old, new)
+    if patch is None:
+        return new
+    return patch if patch_operations(patch) else no_update
+
+
+def patch_operations(patch: Patch) -> List[Dict[str, Any]]:
+    """Return the operations a patch will apply in the browser."""
+    return patch.to_plotly_json()['operations']
+
+
+def _diff(old: Any, new: Any, location: List[Any], operations: List[Tuple[List[Any], Any]]) -> None:
+    """Append the assignments and deletions turning old into new at location."""
+    if old == new:
+        return
+    if isinstance(old, dict) and isinstance(new, dict):
+        for name, value in new.items():
+            if name in old:
+                _diff(old[name], value, location + [name], operations)
+            else:
+                operations.append((location + [name], value))
+        for name in old:
+            if name not in new:
+                operations.append((location + [name], _DELETE))
+    elif isinstance(old, list) and isinstance(new, list) and len(old) == len(new):
+        changed = [index for index, (before, after) in enumerate(zip(old, new)) if before != after]
+        # Each element-wise update carries its own location, so only use them while cheaper
+        element_cost = sum(len(_dumps(new[index])) + OPERATION_OVERHEAD_BYTES for index in changed)
+        if element_cost < len(_dumps(new)):
+            for index in changed:
+                _diff(old[index], new[index], location + [index], operations)
+        else:
+            operations.append((location, new))
+    else:
+        operations.append((location, new))
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, separators=(',', ':'), default=str)
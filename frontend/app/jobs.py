@@ -0,0 +1,208 @@
+"""
+Background scheduling jobs for Paper Planner.
+
+Long scheduler runs (optimal, strategy comparisons) execute in a process pool
+so they never block a Dash request thread. Callbacks submit a job, keep the
+returned job ID in a dcc.Store and poll it from a dcc.Interval.
+"""
+
+import multiprocessing
+import os
+import queue
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from caching.snapshot import get_input_signature
+
+DEFAULT_CONFIG_PATH = str(Path(__file__).resolve().parents[2] / "backend" / "data" / "config.json")
+
+JOB_PENDING = "pending"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+
+# Set in each worker process by _init_job_worker
+_progress_queue = None
+
+
+def _init_job_worker(progress_queue) -> None:
+    """Pool initializer: keep the progress queue and import the scheduling stack once."""
+    global _progress_queue
+    _progress_queue = progress_queue
+    import schedulers.base  # noqa: F401
+    import analytics  # noqa: F401
+    import caching.results  # noqa: F401
+
+
+def _report_progress(job_id: str, progress: float, message: str) -> None:
+    """Send a progress update from a worker to the parent process."""
+    if _progress_queue is not None:
+        try:
+            _progress_queue.put_nowait((job_id, progress, message))
+        except Exception:
+            pass
+
+
+def run_schedule_job(job_id: str, config_path: str, strategy: str) -> Dict[str, Any]:
+    """Load a config, schedule it with the given strategy and score the result."""
+    from caching.results import get_result_cache, schedule_cached
+    from service.worker import get_warm_config, schedule_to_dict
+
+    _report_progress(job_id, 0.1, "Loading configuration")
+    config = get_warm_config(config_path)
+
+    _report_progress(job_id, 0.3, f"Running {strategy} scheduler")
+    schedule, metrics, cached = schedule_cached(config, strategy, cache=get_result_cache(config_path))
+
+    return {
+        "strategy": strategy,
+        "config_path": config_path,
+        "intervals": schedule_to_dict(schedule),
+        "metrics": metrics.model_dump(mode="json"),
+        "cached": cached,
+    }
+
+
+class JobManager:
+    """Runs scheduling jobs in a process pool and tracks their status."""
+
+    def __init__(self, max_workers: int = 2, max_finished_jobs: int = 100):
+        self.max_workers = max_workers
+        self.max_finished_jobs = max_finished_jobs
+        self._context = multiprocessing.get_context("spawn")
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._progress_queue = None
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._result_cache: Dict[Tuple, str] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, config_path: Optional[str] = None, strategy: str = "greedy", force: bool = False) -> str:
+        """Submit a scheduling job and return its ID.
+
+        An identical earlier job (same strategy and unchanged config inputs)
+        is reused unless ``force`` is set.
+        """
+        config_path = os.path.abspath(config_path or DEFAULT_CONFIG_PATH)
+        cache_key = (config_path, strategy, get_input_signature(config_path))
+
+        with self._lock:
+            cached_id = self._result_cache.get(cache_key)
+            if not force and cached_id in self._jobs and self._jobs[cached_id]["state"] in (JOB_PENDING, JOB_RUNNING, JOB_DONE):
+                return cached_id
+
+            job_id = uuid.uuid4().hex[:12]
+            future = self._get_executor().submit(run_schedule_job, job_id, config_path, strategy)
+            self._jobs[job_id] = {
+                "job_id": job_id,
+                "strategy": strategy,
+                "config_path": config_path,
+                "state": JOB_PENDING,
+                "progress": 0.0,
+                "message": "Queued",
+                "submitted_at": time.time(),
+                "finished_at": None,
+                "future": future,
+                "result": None,
+                "error": None,
+            }
+            self._result_cache[cache_key] = job_id
+            self._evict_finished()
+        return job_id
+
+    def status(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return a JSON-serializable snapshot of a job, or None if unknown."""
+        self._drain_progress()
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            self._refresh(job)
+            snapshot = {key: value for key, value in job.items() if key != "future"}
+        finished_at = snapshot["finished_at"] or time.time()
+        snapshot["elapsed_seconds"] = round(finished_at - snapshot["submitted_at"], 2)
+        return snapshot
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a job that has not started yet."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or not job["future"].cancel():
+                return False
+            job.update(state=JOB_CANCELLED, message="Cancelled", finished_at=time.time())
+            return True
+
+    def shutdown(self) -> None:
+        """Stop the worker pool, cancelling queued jobs."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Create the pool on first use so importing this module stays cheap."""
+        if self._executor is None:
+            self._progress_queue = self._context.Queue()
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=self._context,
+                initializer=_init_job_worker,
+                initargs=(self._progress_queue,)
+            )
+        return self._executor
+
+    def _drain_progress(self) -> None:
+        """Apply progress messages sent by workers."""
+        if self._progress_queue is None:
+            return
+        while True:
+            try:
+                job_id, progress, message = self._progress_queue.get_nowait()
+            except queue.Empty:
+                return
+            except (EOFError, OSError):
+                return
+            with self._lock:
+                job = self._jobs.get(job_id)
+                if job and job["state"] in (JOB_PENDING, JOB_RUNNING):
+                    job.update(state=JOB_RUNNING, progress=progress, message=message)
+
+    def _refresh(self, job: Dict[str, Any]) -> None:
+        """Move a job to its final state once its future completes."""
+        future: Future = job["future"]
+        if job["state"] in (JOB_DONE, JOB_FAILED, JOB_CANCELLED) or not future.done():
+            if job["state"] == JOB_PENDING and future.running():
+                job.update(state=JOB_RUNNING, message="Running")
+            return
+        if future.cancelled():
+            job.update(state=JOB_CANCELLED, message="Cancelled")
+        elif future.exception() is not None:
+            error = future.exception()
+            job.update(state=JOB_FAILED, message="Failed", error=f"{type(error).__name__}: {error}")
+        else:
+            job.update(state=JOB_DONE, progress=1.0, message="Done", result=future.result())
+        job["finished_at"] = time.time()
+
+    def _evict_finished(self) -> None:
+        """Drop the oldest finished jobs beyond max_finished_jobs."""
+        finished = [job for job in self._jobs.values() if job["future"].done()]
+        excess = len(finished) - self.max_finished_jobs
+        if excess <= 0:
+            return
+        for job in sorted(finished, key=lambda j: j["submitted_at"])[:excess]:
+            del self._jobs[job["job_id"]]
+
+
+# Global job manager instance
+_job_manager_instance = None
+
+def get_job_manager() -> JobManager:
+    """Get the global job manager instance, creating it if needed."""
+    global _job_manager_instance
+    if _job_manager_instance is None:
+        _job_manager_instance = JobManager()
+    return _job_manager_instance
@@ -7,6 +7,7 @@ from dash import Dash, html, dcc, Input, Output, callback, page_container
 from app.components.dashboard.layout import create_dashboard_layout
 from app.components.gantt.layout import create_gantt_layout
 from app.components.metrics.layout import create_metrics_layout
+from app.components.debug.layout import create_debug_panel
 from typing import Optional
 
 
@@ -27,7 +28,8 @@ def create_app(mode: str, data_path: Optional[str] | None = None) -> Dash:
     if mode not in layouts:
         raise ValueError(f"Unknown mode: {mode}")
     
-    app.layout = layouts[mode](config)
+    # Caches live in this process, so every app carries its own debug panel
+    app.layout = html.Div([layouts[mode](config), create_debug_panel()])
     return app
 
 
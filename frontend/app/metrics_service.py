@@ -0,0 +1,224 @@
+"""
+Cached, asynchronous schedule metrics for the metrics page.
+
+Scoring runs the backend scoring stack (penalties, quality, efficiency via
+``generate_schedule_summary``) on a background thread, so callbacks return at
+once and poll for results from a dcc.Interval. Results are cached per
+schedule version (or saved-schedule revision) and config, so each schedule is
+scored once. Saved schedules are scored oldest first, one at a time, and the
+trend grows point by point as they complete.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from caching.snapshot import get_input_signature, load_config_cached
+from core.models import Config, Schedule
+
+from app.figure_cache import get_config_key
+
+MAX_CACHED_METRICS = 256
+METRICS_WORKERS = 1
+
+# ScheduleMetrics fields shown on the metrics page, all on a 0-100 scale
+METRIC_FIELDS = (
+    ('compliance_rate', 'Deadline Compliance'),
+    ('quality_score', 'Quality'),
+    ('efficiency_score', 'Efficiency'),
+    ('utilization_rate', 'Resource Utilization'),
+    ('completion_rate', 'Completion'),
+)
+
+
+def score_schedule(schedule: Schedule, config: Config) -> Dict[str, Any]:
+    """Score a schedule with the full scoring stack and return the metrics as JSON."""
+    from analytics import generate_schedule_summary
+    return generate_schedule_summary(schedule, config).model_dump(mode='json')
+
+
+@dataclass
+class MetricsSnapshot:
+    """Metrics available so far for the current schedule and the saved history."""
+    current: Dict[str, Any] = field(default_factory=dict)
+    current_label: str = ''
+    trends: List[Dict[str, Any]] = field(default_factory=list)
+    pending: int = 0
+    errors: List[str] = field(default_factory=list)
+
+
+class MetricsService:
+    """Scores schedules on a background thread and caches the results."""
+
+    def __init__(self, storage: Any = None, max_workers: int = METRICS_WORKERS,
+                 max_entries: int = MAX_CACHED_METRICS):
+        self.max_workers = max_workers
+        self.max_entries = max_entries
+        self._storage = storage
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._results: "OrderedDict[Hashable, Dict[str, Any]]" = OrderedDict()
+        self._pending: Dict[Hashable, Future] = {}
+        self._errors: Dict[Hashable, str] = {}
+        self._configs: Dict[str, Tuple[Tuple, Config, str]] = {}
+        # Reentrant: cancelling futures on shutdown runs their callbacks in this thread
+        self._lock = threading.RLock()
+
+    def load_config(self, config_path: str) -> Tuple[Config, str]:
+        """Return a config and its hash, reusing both until the input files change."""
+        path = os.path.abspath(config_path)
+        signature = get_input_signature(path)
+        with self._lock:
+            cached = self._configs.get(path)
+            if cached is not None and cached[0] == signature:
+                return cached[1], cached[2]
+        config = load_config_cached(path)
+        config_key = get_config_key(config)
+        with self._lock:
+            self._configs[path] = (signature, config, config_key)
+        return config, config_key
+
+    def submit(self, schedule: Schedule, config: Config, config_key: Optional[str] = None) -> Hashable:
+        """Score a schedule in the background unless this version is already scored; return its key."""
+        key = ('version', schedule.version, config_key or get_config_key(config))
+        self._submit(key, lambda: score_schedule(schedule, config))
+        return key
+
+    def result(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        """Return finished metrics for a key, or None while pending or after a failure."""
+        with self._lock:
+            return self._results.get(key)
+
+    def snapshot(self, config_path: str) -> MetricsSnapshot:
+        """
+        Queue scoring of every saved schedule and return what is ready.
+
+        Parameters
+        ----------
+        config_path : str
+            Config the saved schedules are scored against
+
+        Returns
+        -------
+        MetricsSnapshot
+            Trend points for scored saved schedules in save order, the newest
+            of them as the current metrics, and how many are still pending
+        """
+        config, config_key = self.load_config(config_path)
+        storage = self._get_storage()
+        entries = sorted(storage.list_schedules(), key=lambda entry: entry.get('timestamp') or '')
+
+        snapshot = MetricsSnapshot()
+        for entry in entries:
+            filename = entry['filename']
+            key = ('saved', filename, entry.get('timestamp'), config_key)
+            self._submit(key, lambda filename=filename: self._score_saved(storage, filename, config))
+            with self._lock:
+                metrics = self._results.get(key)
+                error = self._errors.get(key)
+                pending = key in self._pending
+            if metrics is not None:
+                snapshot.trends.append({
+                    'filename': filename,
+                    'timestamp': entry.get('timestamp'),
+                    'strategy': entry.get('strategy'),
+                    'total_penalty': metrics.get('total_penalty', 0.0),
+                    **{name: metrics.get(name, 0.0) for name, _ in METRIC_FIELDS}
+                })
+            elif error is not None:
+                snapshot.errors.append(f"{filename}: {error}")
+            elif pending:
+                snapshot.pending += 1
+
+        if snapshot.trends:
+            latest = snapshot.trends[-1]
+            snapshot.current = {name: latest[name] for name, _ in METRIC_FIELDS}
+            snapshot.current_label = latest['filename']
+        return snapshot
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        """Block until all queued scoring has finished (for scripts and tests)."""
+        with self._lock:
+            futures = list(self._pending.values())
+        for future in futures:
+            try:
+                future.result(timeout=timeout)
+            except Exception:
+                pass
+
+    def clear(self) -> None:
+        """Drop cached metrics and errors."""
+        with self._lock:
+            self._results.clear()
+            self._errors.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Return cached, pending and failed counts."""
+        with self._lock:
+            return {'cached': len(self._results), 'pending': len(self._pending), 'errors': len(self._errors)}
+
+    def shutdown(self) -> None:
+        """Stop the worker thread, cancelling queued scoring."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+            self._pending.clear()
+
+    def _submit(self, key: Hashable, task: Callable[[], Dict[str, Any]]) -> None:
+        """Queue a scoring task unless its result is cached, pending or failed."""
+        with self._lock:
+            if key in self._results:
+                self._results.move_to_end(key)
+                return
+            if key in self._pending or key in self._errors:
+                return
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='metrics')
+            future = self._executor.submit(task)
+            self._pending[key] = future
+        future.add_done_callback(lambda done: self._finish(key, done))
+
+    def _finish(self, key: Hashable, future: Future) -> None:
+        """Move a finished task's result or error into the cache."""
+        with self._lock:
+            self._pending.pop(key, None)
+            if future.cancelled():
+                return
+            error = future.exception()
+            if error is not None:
+                self._errors[key] = f"{type(error).__name__}: {error}"
+                return
+            self._results[key] = future.result()
+            while len(self._results) > self.max_entries:
+                self._results.popitem(last=False)
+
+    def _score_saved(self, storage: Any, filename: str, config: Config) -> Dict[str, Any]:
+        """Load a saved schedule and score it."""
+        schedule = storage.load_schedule(filename)
+        if schedule is None:
+            raise ValueError(f"Saved schedule {filename} could not be loaded")
+        return score_schedule(schedule, config)
+
+    def _get_storage(self) -> Any:
+        """Create the schedule storage on first use."""
+        if self._storage is None:
+            from app.storage import StorageManager
+            self._storage = StorageManager()
+        return self._storage
+
+
+# Global metrics service instance
+_metrics_service_instance = None
+_metrics_service_lock = threading.Lock()
+
+
+def get_metrics_service() -> MetricsService:
+    """Get the global metrics service instance, creating it if needed."""
+    global _metrics_service_instance
+    with _metrics_service_lock:
+        if _metrics_service_instance is None:
+            _metrics_service_instance = MetricsService()
+        return _metrics_service_instance
@@ -4,75 +4,260 @@ Handles SQLite-based localStorage equivalent for schedules.
 """
 
 import sqlite3
+import hashlib
 import json
+import queue
+import threading
+import zlib
+from contextlib import contextmanager
+from datetime import date, datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 
 # Import backend modules directly - TOML pythonpath should handle this
 from core.models import Config, Schedule
+from database.schedule_file import SCHEDULE_FILE_SUFFIX, read_schedule_window, write_schedule_file
+
+SCHEDULES_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS schedules (
+        filename TEXT PRIMARY KEY,
+        schedule_data BLOB NOT NULL,
+        timestamp TEXT NOT NULL,
+        strategy TEXT NOT NULL,
+        submission_count INTEGER NOT NULL
+    )
+"""
+
+COMPONENT_STATES_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS component_states (
+        component_name TEXT,
+        state_key TEXT,
+        state_value TEXT,
+        timestamp TEXT,
+        PRIMARY KEY (component_name, state_key)
+    )
+"""
+
+# Prefix of schedules stored with the compact binary encoding
+PACKED_SCHEDULE_MAGIC = b"PPSCHED1"
+SCHEDULE_ENCODINGS = ("json", "packed")
+
+# Schedules at least this large also get a memory-mappable window file
+WINDOW_FILE_MIN_INTERVALS = 500
+
+# Connections each engine keeps open; requests beyond this wait for a free one
+DEFAULT_POOL_SIZE = 4
+SQLITE_TIMEOUT_SECONDS = 30
+
+
+class SQLiteEngine:
+    """Thread-safe SQLite access through a small pool of reusable WAL-mode connections.
+    
+    Dash serves each request on its own thread, so connections are checked
+    out per operation and returned afterwards instead of being kept per
+    thread; at most ``pool_size`` are ever open, each with sqlite3's prepared
+    statement cache. The schema is created once.
+    """
+    
+    def __init__(self, db_path: Path, schema: str, pool_size: int = DEFAULT_POOL_SIZE):
+        self.db_path = Path(db_path)
+        self.pool_size = max(1, pool_size)
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._opened = 0
+        self._closed = False
+        self._lock = threading.Lock()
+        with self.transaction() as conn:
+            conn.execute(schema)
+    
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Check out a pooled connection for the duration of the block."""
+        conn = self._checkout()
+        try:
+            yield conn
+        finally:
+            self._release(conn)
+    
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run statements in one transaction, committing on success."""
+        with self.connection() as conn:
+            try:
+                yield conn
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+    
+    def open_connections(self) -> int:
+        """Number of connections currently open, idle or checked out."""
+        with self._lock:
+            return self._opened
+    
+    def close(self) -> None:
+        """Close idle connections; checked-out ones are closed when returned."""
+        with self._lock:
+            self._closed = True
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(conn)
+    
+    def _checkout(self) -> sqlite3.Connection:
+        """Take an idle connection, open a new one below the pool size, or wait for one."""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            can_open = self._opened < self.pool_size
+            if can_open:
+                self._opened += 1
+        if not can_open:
+            return self._idle.get(timeout=SQLITE_TIMEOUT_SECONDS)
+        try:
+            conn = sqlite3.connect(str(self.db_path), timeout=SQLITE_TIMEOUT_SECONDS,
+                                   cached_statements=128, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            return conn
+        except BaseException:
+            with self._lock:
+                self._opened -= 1
+            raise
+    
+    def _release(self, conn: sqlite3.Connection) -> None:
+        """Return a connection to the pool, or close it if the engine was closed."""
+        with self._lock:
+            closed = self._closed
+        if closed:
+            self._discard(conn)
+        else:
+            self._idle.put(conn)
+    
+    def _discard(self, conn: sqlite3.Connection) -> None:
+        """Close a pooled connection and free its slot."""
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+        with self._lock:
+            self._opened -= 1
+
+
+# One engine per database file, shared by all storage objects
+_engines: Dict[Tuple[str, str], SQLiteEngine] = {}
+_engines_lock = threading.Lock()
+
+
+def get_sqlite_engine(db_path: Path, schema: str) -> SQLiteEngine:
+    """Get the shared engine for a database file, creating its schema once."""
+    key = (str(Path(db_path).resolve()), schema)
+    with _engines_lock:
+        engine = _engines.get(key)
+        if engine is None:
+            engine = SQLiteEngine(db_path, schema)
+            _engines[key] = engine
+        return engine
+
+
+def close_sqlite_engines() -> None:
+    """Close all shared engines (used on shutdown and in tests)."""
+    with _engines_lock:
+        for engine in _engines.values():
+            engine.close()
+        _engines.clear()
+
+
+def encode_schedule(schedule: Schedule, strategy: str, timestamp: str, encoding: str = "json") -> Any:
+    """Encode a schedule for storage as JSON text or a compact binary blob."""
+    if encoding == "packed":
+        # Dates as ordinals in flat [id, start, end] rows, then zlib
+        payload = {
+            'strategy': strategy,
+            'timestamp': timestamp,
+            'intervals': [
+                [sid, interval.start_date.toordinal(), interval.end_date.toordinal()]
+                for sid, interval in schedule.intervals.items()
+            ]
+        }
+        return PACKED_SCHEDULE_MAGIC + zlib.compress(json.dumps(payload, separators=(",", ":")).encode("utf-8"))
+    return json.dumps({
+        'strategy': strategy,
+        'schedule': schedule.model_dump(mode='json'),
+        'timestamp': timestamp
+    })
+
+
+def decode_schedule(stored: Any) -> Schedule:
+    """Decode a stored schedule written with either encoding."""
+    if isinstance(stored, bytes) and stored.startswith(PACKED_SCHEDULE_MAGIC):
+        payload = json.loads(zlib.decompress(stored[len(PACKED_SCHEDULE_MAGIC):]))
+        schedule = Schedule()
+        for sid, start, end in payload['intervals']:
+            schedule.add_interval(sid, date.fromordinal(start), end_date=date.fromordinal(end))
+        return schedule
+    data = json.loads(stored)
+    return Schedule(**data.get('schedule', {}))
 
 
 class ScheduleStorage:
     """SQLite-based storage for schedules (localStorage equivalent)."""
     
-    def __init__(self):
-        """Initialize storage with SQLite database in user's home directory."""
+    def __init__(self, encoding: str = "json", window_file_min_intervals: int = WINDOW_FILE_MIN_INTERVALS):
+        """Initialize storage with SQLite database in user's home directory.
+        
+        Args:
+            encoding: 'json' to store readable JSON text, 'packed' for a
+                compact zlib-compressed binary encoding. Loading handles both.
+            window_file_min_intervals: Schedules with at least this many
+                intervals are also written as a memory-mappable file so
+                load_schedule_window can slice them without a full parse.
+        """
+        self.encoding = encoding if encoding in SCHEDULE_ENCODINGS else "json"
+        self.window_file_min_intervals = window_file_min_intervals
         try:
             # Create data directory in user's home folder (client-side equivalent)
             data_dir = Path.home() / ".paper_planner"
             data_dir.mkdir(exist_ok=True)
             
+            self.windows_dir = data_dir / "windows"
             self.db_path = data_dir / "schedules.db"
-            
-            # Create table if it doesn't exist
-            with sqlite3.connect(str(self.db_path)) as conn:
-                conn.execute("""
-                    CREATE TABLE IF NOT EXISTS schedules (
-                        filename TEXT PRIMARY KEY,
-                        schedule_data TEXT NOT NULL,
-                        timestamp TEXT NOT NULL,
-                        strategy TEXT NOT NULL,
-                        submission_count INTEGER NOT NULL
-                    )
-                """)
-                conn.commit()
+            self._engine = get_sqlite_engine(self.db_path, SCHEDULES_SCHEMA)
         except Exception as e:
             print("Warning: Could not initialize storage: %s", e)
             self.db_path = None
+            self._engine = None
     
-    def save_schedule(self, schedule: Schedule, filename: str) -> bool:
+    def save_schedule(self, schedule: Schedule, filename: str, strategy: str = 'unknown') -> bool:
         """Save schedule to SQLite storage."""
-        if not self.db_path:
+        if not self._engine:
             return False
             
         try:
-            # Convert Schedule to dict for storage
-            schedule_data = {
-                'strategy': 'unknown',  # Will be updated when we have strategy info
-                'schedule': schedule.model_dump(),
-                'timestamp': datetime.now().isoformat()
-            }
-            
-            strategy = schedule_data.get('strategy', 'unknown')
-            submission_count = len(schedule.intervals)
-            timestamp = schedule_data.get('timestamp', datetime.now().isoformat())
-            
-            json_data = json.dumps(schedule_data)
+            timestamp = datetime.now().isoformat()
+            stored = encode_schedule(schedule, strategy, timestamp, self.encoding)
             
-            with sqlite3.connect(str(self.db_path)) as conn:
+            with self._engine.transaction() as conn:
                 conn.execute("""
                     INSERT OR REPLACE INTO schedules 
                     (filename, schedule_data, timestamp, strategy, submission_count)
                     VALUES (?, ?, ?, ?, ?)
                 """, (
                     filename,
-                    json_data,
+                    stored,
                     timestamp,
                     strategy,
-                    submission_count
+                    len(schedule.intervals)
                 ))
-                conn.commit()
+            
+            window_file = self._window_file(filename)
+            if len(schedule.intervals) >= self.window_file_min_intervals:
+                write_schedule_file(schedule, str(window_file))
+            else:
+                window_file.unlink(missing_ok=True)
             
             return True
         except Exception as e:
@@ -81,75 +266,97 @@ class ScheduleStorage:
     
     def load_schedule(self, filename: str) -> Optional[Schedule]:
         """Load schedule from SQLite storage."""
-        if not self.db_path:
+        if not self._engine:
             return None
             
         try:
-            with sqlite3.connect(str(self.db_path)) as conn:
-                cursor = conn.execute(
+            with self._engine.connection() as conn:
+                row = conn.execute(
                     "SELECT schedule_data FROM schedules WHERE filename = ?",
                     (filename,)
-                )
-                row = cursor.fetchone()
-                
-                if row:
-                    data = json.loads(row[0])
-                    # Convert back to Schedule model
-                    schedule_dict = data.get('schedule', {})
-                    return Schedule(**schedule_dict)
-                return None
+                ).fetchone()
+            return decode_schedule(row[0]) if row else None
         except Exception as e:
             print("Error loading schedule: %s", e)
             return None
     
+    def load_schedule_window(self, filename: str, start: Optional[date] = None,
+                             end: Optional[date] = None) -> Optional[Schedule]:
+        """Load only the intervals overlapping [start, end], e.g. a Gantt viewport.
+        
+        Large schedules are sliced from their memory-mapped window file;
+        smaller ones are loaded fully and filtered.
+        """
+        if not self._engine:
+            return None
+        
+        window_file = self._window_file(filename)
+        if window_file.exists():
+            try:
+                return read_schedule_window(str(window_file), start, end)
+            except Exception as e:
+                print(f"Warning: Could not read window file for {filename}: {e}")
+        
+        schedule = self.load_schedule(filename)
+        if schedule is None:
+            return None
+        return Schedule(intervals={
+            sid: interval for sid, interval in schedule.intervals.items()
+            if (start is None or interval.end_date >= start) and (end is None or interval.start_date <= end)
+        })
+    
     def list_saved_schedules(self) -> List[Dict[str, Any]]:
         """List all saved schedules from SQLite storage."""
-        if not self.db_path:
+        if not self._engine:
             return []
             
         try:
-            with sqlite3.connect(str(self.db_path)) as conn:
-                cursor = conn.execute("""
+            with self._engine.connection() as conn:
+                rows = conn.execute("""
                     SELECT filename, timestamp, strategy, submission_count 
                     FROM schedules 
                     ORDER BY timestamp DESC
-                """)
-                
-                schedules = []
-                for row in cursor.fetchall():
-                    schedules.append({
-                        "filename": row[0],
-                        "timestamp": row[1],
-                        "strategy": row[2],
-                        "submission_count": row[3]
-                    })
-                
-                return schedules
+                """).fetchall()
+            
+            return [
+                {
+                    "filename": row[0],
+                    "timestamp": row[1],
+                    "strategy": row[2],
+                    "submission_count": row[3]
+                }
+                for row in rows
+            ]
         except Exception as e:
             print("Error listing saved schedules: %s", e)
             return []
     
     def delete_schedule(self, filename: str) -> bool:
         """Delete a saved schedule."""
-        if not self.db_path:
+        if not self._engine:
             return False
             
         try:
-            with sqlite3.connect(str(self.db_path)) as conn:
+            with self._engine.transaction() as conn:
                 conn.execute("DELETE FROM schedules WHERE filename = ?", (filename,))
-                conn.commit()
+            self._window_file(filename).unlink(missing_ok=True)
             
             return True
         except Exception as e:
             print("Error deleting schedule: %s", e)
             return False
     
+    def _window_file(self, filename: str) -> Path:
+        """Path of the memory-mappable copy of a saved schedule."""
+        key = hashlib.sha256(filename.encode("utf-8")).hexdigest()[:24]
+        return self.windows_dir / f"{key}{SCHEDULE_FILE_SUFFIX}"
+    
     def export_schedule(self, schedule: Schedule, filename: str) -> str:
         """Export schedule as downloadable JSON string."""
         try:
             # Convert Schedule to dict for export
             export_data = {
-                'schedule': schedule.model_dump(),
+                'schedule': schedule.model_dump(mode='json'),
                 'filename': filename,
                 'timestamp': datetime.now().isoformat()
             }
@@ -211,9 +418,17 @@ class StorageManager:
 
 
 # Component state storage using SQLite (consistent with schedule storage)
+def _component_states_path() -> Path:
+    """Path of the component state database."""
+    return Path.home() / ".paper_planner" / "component_states.db"
+
+
 def save_state(component_name: str, state_data: Dict[str, Any]) -> bool:
     """Save component state to SQLite storage.
     
+    All keys of a component are written with one executemany in a single
+    transaction.
+    
     Args:
         component_name: Name of the component (e.g., 'dashboard', 'gantt', 'metrics')
         state_data: State data to save
@@ -222,34 +437,23 @@ def save_state(component_name: str, state_data: Dict[str, Any]) -> bool:
         True if successful, False otherwise
     """
     try:
-        data_dir = Path.home() / ".paper_planner"
-        data_dir.mkdir(exist_ok=True)
-        
-        db_path = data_dir / "component_states.db"
+        db_path = _component_states_path()
+        db_path.parent.mkdir(exist_ok=True)
+        engine = get_sqlite_engine(db_path, COMPONENT_STATES_SCHEMA)
         
-        with sqlite3.connect(str(db_path)) as conn:
-            # Create component states table if it doesn't exist
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS component_states (
-                    component_name TEXT,
-                    state_key TEXT,
-                    state_value TEXT,
-                    timestamp TEXT,
-                    PRIMARY KEY (component_name, state_key)
-                )
-            """)
-            
-            # Save each state key-value pair
-            timestamp = datetime.now().isoformat()
-            for key, value in state_data.items():
-                if key != 'timestamp':  # Don't save timestamp as a state key
-                    conn.execute("""
-                        INSERT OR REPLACE INTO component_states 
-                        (component_name, state_key, state_value, timestamp)
-                        VALUES (?, ?, ?, ?)
-                    """, (component_name, key, json.dumps(value), timestamp))
-            
-            conn.commit()
+        # Save each state key-value pair (timestamp is stored per row, not as a key)
+        timestamp = datetime.now().isoformat()
+        rows = [
+            (component_name, key, json.dumps(value), timestamp)
+            for key, value in state_data.items()
+            if key != 'timestamp'
+        ]
+        with engine.transaction() as conn:
+            conn.executemany("""
+                INSERT OR REPLACE INTO component_states 
+                (component_name, state_key, state_value, timestamp)
+                VALUES (?, ?, ?, ?)
+            """, rows)
         return True
     except Exception as e:
         print(f"Error saving {component_name} state: {e}")
@@ -266,34 +470,33 @@ def load_state(component_name: str) -> Dict[str, Any]:
         State data dictionary, or empty dict if not found
     """
     try:
-        data_dir = Path.home() / ".paper_planner"
-        db_path = data_dir / "component_states.db"
+        db_path = _component_states_path()
         
         if not db_path.exists():
             return {}
         
-        with sqlite3.connect(str(db_path)) as conn:
-            cursor = conn.execute("""
+        with get_sqlite_engine(db_path, COMPONENT_STATES_SCHEMA).connection() as conn:
+            rows = conn.execute("""
                 SELECT state_key, state_value, timestamp 
                 FROM component_states 
                 WHERE component_name = ?
                 ORDER BY timestamp DESC
-            """, (component_name,))
-            
-            state_data = {}
-            latest_timestamp = None
-            for row in cursor.fetchall():
-                key, value, timestamp = row
-                latest_timestamp = timestamp
-                try:
-                    state_data[key] = json.loads(value)
-                except json.JSONDecodeError:
-                    state_data[key] = value  # Fallback to raw value
-            
-            if state_data and latest_timestamp:
-                state_data['timestamp'] = latest_timestamp
-            
-            return state_data
+            """, (component_name,)).fetchall()
+        
+        state_data = {}
+        latest_timestamp = None
+        for row in rows:
+            key, value, timestamp = row
+            latest_timestamp = timestamp
+            try:
+                state_data[key] = json.loads(value)
+            except json.JSONDecodeError:
+                state_data[key] = value  # Fallback to raw value
+        
+        if state_data and latest_timestamp:
+            state_data['timestamp'] = latest_timestamp
+        
+        return state_data
     except Exception as e:
         print(f"Error loading {component_name} state: {e}")
         return {}
@@ -0,0 +1,99 @@
+"""Tests for the layered dependency graph."""
+
+import random
+
+from core.models import Config, Submission, SubmissionType
+from app.components.dashboard import graph as graph_module
+from app.components.dashboard.graph import compute_graph_layout, create_dependency_graph_chart, get_graph_layout
+
+
+def _random_dependencies(seed: int = 3):
+    """make_portfolio fields: each submission depends on up to three of the 30 before it."""
+    rng = random.Random(seed)
+    
+    def fields(index: int):
+        earlier = range(max(0, index - 30), index)
+        return {"depends_on": [f"s{dep}" for dep in rng.sample(earlier, min(len(earlier), rng.randint(0, 3)))]}
+    return fields
+
+
+def _crossings(layout) -> int:
+    """Count crossings between edge segments spanning the same pair of layers."""
+    segments = {}
+    for _, _, points in layout.edges:
+        for (x1, y1), (x2, y2) in zip(points, points[1:]):
+            segments.setdefault(x1, []).append((y1, y2))
+    crossings = 0
+    for spans in segments.values():
+        for index, (a1, a2) in enumerate(spans):
+            crossings += sum(1 for b1, b2 in spans[index + 1:] if (a1 - b1) * (a2 - b2) < 0)
+    return crossings
+
+
+def test_layers_follow_dependencies(make_portfolio):
+    """Test every edge points to a later layer through unit-length segments."""
+    config, _ = make_portfolio(300, prefix="s", fields=_random_dependencies())
+    layout = compute_graph_layout(config)
+    assert len(layout.positions) == 300 and not layout.cyclic
+    for dep_id, node_id, points in layout.edges:
+        assert layout.positions[dep_id][0] < layout.positions[node_id][0]
+        assert points[0] == layout.positions[dep_id] and points[-1] == layout.positions[node_id]
+        assert all(after[0] - before[0] == 1 for before, after in zip(points, points[1:]))
+    path = layout.critical_path
+    assert len(path) == len(layout.layers)
+    assert [layout.positions[node_id][0] for node_id in path] == list(range(len(path)))
+
+
+def test_barycenter_sweeps_reduce_crossings(make_portfolio):
+    """Test crossing reduction beats the unsorted initial order."""
+    config, _ = make_portfolio(300, prefix="s", fields=_random_dependencies())
+    assert _crossings(compute_graph_layout(config)) < _crossings(compute_graph_layout(config, sweeps=0))
+
+
+def test_cycles_are_placed_not_dropped():
+    """Test submissions on a dependency cycle still get coordinates."""
+    submissions = [
+        Submission(id="a", title="a", kind=SubmissionType.PAPER),
+        Submission(id="b", title="b", kind=SubmissionType.PAPER, depends_on=["a", "c"]),
+        Submission(id="c", title="c", kind=SubmissionType.PAPER, depends_on=["b"]),
+    ]
+    layout = compute_graph_layout(Config.create_default().model_copy(update={"submissions": submissions}))
+    assert set(layout.cyclic) == {"b", "c"}
+    assert set(layout.positions) == {"a", "b", "c"}
+
+
+def test_critical_path_is_duration_weighted_like_analytics(monkeypatch):
+    """Test the highlighted path is the analytics report's, from a single analysis pass."""
+    from analytics import _analyze_dependency_graph
+    submissions = [
+        Submission(id="a", title="a", kind=SubmissionType.ABSTRACT),
+        Submission(id="b", title="b", kind=SubmissionType.ABSTRACT, depends_on=["a"]),
+        Submission(id="c", title="c", kind=SubmissionType.ABSTRACT, depends_on=["b"]),
+        Submission(id="p", title="p", kind=SubmissionType.PAPER),
+    ]
+    config = Config.create_default().model_copy(update={"submissions": submissions})
+    calls = []
+    analyze = graph_module.analyze_config_graph
+    monkeypatch.setattr(graph_module, "analyze_config_graph", lambda cfg: calls.append(1) or analyze(cfg))
+
+    layout = compute_graph_layout(config)
+    assert layout.critical_path == _analyze_dependency_graph(config).critical_path == ["p"]
+    assert layout.positions["c"][0] == 2
+    assert len(calls) == 1
+
+
+def test_layout_is_cached_per_config(make_portfolio, monkeypatch):
+    """Test the layout is computed once per config hash and drawn as WebGL traces."""
+    config, _ = make_portfolio(50, prefix="s", fields=_random_dependencies())
+    calls = []
+    compute = graph_module.compute_graph_layout
+    monkeypatch.setattr(graph_module, "compute_graph_layout", lambda cfg: calls.append(1) or compute(cfg))
+    graph_module._layouts.clear()
+    first = get_graph_layout(config)
+    assert get_graph_layout(config.model_copy()) is first
+    assert len(calls) == 1
+
+    fig = create_dependency_graph_chart(config)
+    assert [trace.type for trace in fig.data] == ["scattergl", "scattergl", "scattergl"]
+    assert len(fig.data[2].x) == 50
+    assert sum(color == graph_module.CRITICAL_COLOR for color in fig.data[2].marker.color) == len(first.critical_path)
@@ -1,9 +1,16 @@
 """Tests for gantt chart component."""
 
 import pytest
+from datetime import date, timedelta
 from app.components.gantt.chart import create_gantt_chart, _create_empty_chart, _create_error_chart
 from plotly.graph_objs import Figure
 
+# Papers chained in runs of three, alternating engineering, starting every ten days
+CHAINED_PAPERS = dict(
+    fields=lambda i: {"depends_on": [f"p{i - 1}"] if i % 3 else [], "engineering": bool(i % 2)},
+    start=lambda i: date(2026, 1, 5) + timedelta(days=10 * i),
+)
+
 def test_create_gantt_chart_exists():
     """Test that create_gantt_chart function exists and is callable."""
     assert callable(create_gantt_chart)
@@ -68,3 +75,47 @@ def test_gantt_chart_has_expected_height():
     
     fig = create_gantt_chart(use_sample_data=True)
     assert fig.layout.height == 500
+
+
+def test_trace_mode_batches_bars_and_arrows(make_portfolio):
+    """Test trace rendering uses a constant number of traces and no per-bar shapes."""
+    from app.components.gantt.chart import create_gantt_chart_from_schedule
+    
+    config, schedule = make_portfolio(60, **CHAINED_PAPERS)
+    fig = create_gantt_chart_from_schedule(schedule, config, render_mode='traces')
+    
+    bar_traces = [trace for trace in fig.data if trace.type == 'bar']
+    assert len(bar_traces) == 2  # engineering and non-engineering papers
+    assert sum(len(trace.y) for trace in bar_traces) == 60
+    arrows = [trace for trace in fig.data if trace.type == 'scatter' and trace.mode == 'lines+markers']
+    assert len(arrows) == 1
+    assert list(arrows[0].x).count(None) == 40
+    assert {fig.data[0].name, fig.data[1].name} == {'weekends', 'months'}
+    assert len(fig.layout.shapes) == 0
+    assert len(fig.layout.annotations) == 0
+
+
+def test_auto_mode_switches_on_size(make_portfolio):
+    """Test auto mode keeps shapes for small charts and traces for large ones."""
+    from app.components.gantt.chart import (
+        create_gantt_chart_from_schedule, resolve_render_mode, TRACE_RENDER_THRESHOLD
+    )
+    
+    config, schedule = make_portfolio(4, **CHAINED_PAPERS)
+    assert any(trace.type != 'bar' for trace in create_gantt_chart_from_schedule(schedule, config).data)
+    assert len(create_gantt_chart_from_schedule(schedule, config).layout.shapes) >= 4
+    assert resolve_render_mode('auto', TRACE_RENDER_THRESHOLD + 1) == 'traces'
+    assert resolve_render_mode('auto', TRACE_RENDER_THRESHOLD) == 'shapes'
+    with pytest.raises(ValueError):
+        resolve_render_mode('canvas', 10)
+
+
+def test_gl_bars_for_very_large_schedules(make_portfolio):
+    """Test very large schedules draw bars with WebGL segments."""
+    from app.components.gantt.activity import GL_BAR_THRESHOLD
+    from app.components.gantt.chart import create_gantt_chart_from_schedule
+    
+    config, schedule = make_portfolio(GL_BAR_THRESHOLD + 1, **CHAINED_PAPERS)
+    fig = create_gantt_chart_from_schedule(schedule, config)
+    assert {trace.type for trace in fig.data} == {'scatter', 'scattergl'}
+    assert len(fig.data) <= 6
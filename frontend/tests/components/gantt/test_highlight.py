@@ -0,0 +1,45 @@
+"""Tests for gantt submission highlighting."""
+
+import json
+
+import plotly.graph_objects as go
+import plotly.io as pio
+from dash import Patch, no_update
+
+from app.components.gantt.highlight import DIMMED_OPACITY, apply_highlight, create_highlight_patch
+
+
+def _figure():
+    """Two bar traces plus a dependency line trace."""
+    fig = go.Figure([
+        go.Bar(ids=["p1", "p2"], text=["Alpha", "Beta"], x=[1, 2], marker=dict(opacity=0.8)),
+        go.Bar(ids=["a1"], text=["Gamma"], x=[3], marker=dict(opacity=0.6)),
+        go.Scatter(x=[0, 1], y=[0, 1]),
+    ])
+    return json.loads(pio.to_json(fig, validate=False))
+
+
+def test_highlight_dims_non_matching_bars():
+    """Test only bars matching the query keep their opacity."""
+    figure = _figure()
+    highlighted = apply_highlight(figure, "beta")
+    assert highlighted["data"][0]["marker"]["opacity"] == [DIMMED_OPACITY, 0.8]
+    assert highlighted["data"][1]["marker"]["opacity"] == [DIMMED_OPACITY]
+    assert "marker" not in highlighted["data"][2] or "opacity" not in highlighted["data"][2]["marker"]
+    assert figure["data"][0]["marker"]["opacity"] == 0.8
+    assert apply_highlight(figure, "") is figure
+
+
+def test_highlight_patch_touches_only_opacity():
+    """Test the patch sets bar opacities and clearing restores them."""
+    patch = create_highlight_patch(_figure(), "P1")
+    assert isinstance(patch, Patch)
+    operations = patch.to_plotly_json()["operations"]
+    assert [operation["location"] for operation in operations] == [
+        ["data", 0, "marker", "opacity"], ["data", 1, "marker", "opacity"]
+    ]
+    assert operations[0]["params"]["value"] == [0.8, DIMMED_OPACITY]
+
+    cleared = create_highlight_patch(_figure(), None).to_plotly_json()["operations"]
+    assert [operation["params"]["value"] for operation in cleared] == [0.8, 0.6]
+    assert create_highlight_patch(None, "p1") is no_update
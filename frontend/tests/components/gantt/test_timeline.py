@@ -60,3 +60,58 @@ def test_assign_activity_rows_with_none_schedule():
     except Exception:
         # If it fails due to missing dependencies, that's okay
         pass
+
+
+def _chains(chain_length: int):
+    """make_portfolio arguments for papers chained in runs of chain_length."""
+    from datetime import date, timedelta
+    
+    return dict(
+        prefix="s",
+        fields=lambda i: {"depends_on": [f"s{i - 1}"] if i % chain_length else []},
+        start=lambda i: date(2026, 1, 1) + timedelta(days=(i * 7) % 400),
+        days=20,
+    )
+
+
+def test_rows_keep_chains_together_without_overlap(make_portfolio):
+    """Test dependency chains share a row and groups on one row never overlap."""
+    config, schedule = make_portfolio(300, **_chains(3))
+    rows = assign_activity_rows(schedule, config)
+    
+    for i in range(300):
+        if i % 3:
+            assert rows[f"s{i}"] == rows[f"s{i - 1}"]
+    
+    spans = {}
+    for i in range(0, 300, 3):
+        members = [f"s{j}" for j in range(i, min(i + 3, 300))]
+        spans[i] = (rows[members[0]],
+                    min(schedule.intervals[m].start_date for m in members),
+                    max(schedule.intervals[m].end_date for m in members))
+    by_row = {}
+    for row, start, end in spans.values():
+        by_row.setdefault(row, []).append((start, end))
+    for intervals in by_row.values():
+        intervals.sort()
+        assert all(previous[1] <= current[0] for previous, current in zip(intervals, intervals[1:]))
+    # First fit uses rows 0..n-1 without gaps
+    assert set(rows.values()) == set(range(max(rows.values()) + 1))
+
+
+def test_rows_handle_long_chains(make_portfolio):
+    """Test a chain longer than the recursion limit is grouped onto one row."""
+    config, schedule = make_portfolio(3000, **_chains(3000))
+    assert set(assign_activity_rows(schedule, config).values()) == {0}
+
+
+def test_rows_are_memoized_per_schedule_version(make_portfolio):
+    """Test repeated layouts reuse the result until the schedule changes."""
+    from datetime import date
+    
+    config, schedule = make_portfolio(20, **_chains(2))
+    first = assign_activity_rows(schedule, config)
+    assert assign_activity_rows(schedule, config) is first
+    
+    schedule.add_interval("s0", date(2030, 1, 1), end_date=date(2030, 1, 5))
+    assert assign_activity_rows(schedule, config) is not first
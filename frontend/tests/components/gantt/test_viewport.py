@@ -0,0 +1,79 @@
+"""Tests for viewport-windowed gantt rendering."""
+
+from datetime import date, timedelta
+
+import pytest
+
+from app.components.gantt import viewport as viewport_module
+from app.components.gantt.viewport import (
+    DENSITY_BINS, DENSITY_MAX_BANDS, IntervalIndex, ScheduleViewport,
+    get_viewport, parse_relayout_range, register_viewport, render_viewport
+)
+
+# Independent papers spread over several years with varying durations
+SPREAD_PAPERS = dict(start=lambda i: date(2026, 1, 1) + timedelta(days=(i * 37) % 1500), days=lambda i: 20 + i % 60)
+
+
+@pytest.mark.parametrize("start,end", [
+    (date(2026, 3, 1), date(2026, 3, 31)),
+    (date(2025, 1, 1), date(2026, 1, 10)),
+    (date(2030, 1, 1), date(2031, 1, 1)),
+    (None, None),
+])
+def test_interval_index_window_matches_full_scan(make_portfolio, start, end):
+    """Test index windows return exactly the overlapping intervals."""
+    _, schedule = make_portfolio(500, **SPREAD_PAPERS)
+    index = IntervalIndex(schedule)
+    expected = {
+        sid for sid, interval in schedule.intervals.items()
+        if (start is None or interval.end_date >= start) and (end is None or interval.start_date <= end)
+    }
+    assert {index.ids[position] for position in index.window(start, end)} == expected
+
+
+def test_parse_relayout_range():
+    """Test zoom, autorange and unrelated relayout events."""
+    assert parse_relayout_range({'xaxis.range[0]': '2026-03-01 12:00:00.5', 'xaxis.range[1]': '2026-02-01'}) == (
+        date(2026, 2, 1), date(2026, 3, 1))
+    assert parse_relayout_range({'xaxis.range': ['2026-01-01', '2026-06-30']}) == (date(2026, 1, 1), date(2026, 6, 30))
+    assert parse_relayout_range({'xaxis.autorange': True}) == (None, None)
+    assert parse_relayout_range({'autosize': True}) is None
+    assert parse_relayout_range(None) is None
+
+
+def test_wide_zoom_renders_fixed_size_density(make_portfolio):
+    """Test the full span of a large portfolio aggregates into a bounded heatmap."""
+    config, schedule = make_portfolio(2000, **SPREAD_PAPERS)
+    viewport = ScheduleViewport(schedule, config)
+    fig = render_viewport(viewport)
+
+    assert [trace.type for trace in fig.data] == ['heatmap']
+    heatmap = fig.data[0]
+    assert len(heatmap.x) <= DENSITY_BINS
+    assert len(heatmap.z) <= DENSITY_MAX_BANDS
+    assert max(max(row) for row in heatmap.z) >= 1
+    assert fig.layout.uirevision == viewport_module.VIEWPORT_UIREVISION
+
+
+def test_zoomed_in_renders_visible_bars_only(make_portfolio):
+    """Test a narrow window draws only the overlapping bars, on their full-schedule rows."""
+    config, schedule = make_portfolio(2000, **SPREAD_PAPERS)
+    viewport = ScheduleViewport(schedule, config)
+    start, end = date(2026, 6, 1), date(2026, 6, 10)
+    fig = render_viewport(viewport, start, end)
+
+    bars = [trace for trace in fig.data if trace.type == 'bar']
+    drawn = {sid for trace in bars for sid in trace.ids}
+    assert drawn == {viewport.index.ids[position] for position in viewport.index.window(start, end)}
+    assert {row for trace in bars for row in trace.y} <= {viewport.rows[sid] for sid in drawn}
+    assert tuple(fig.layout.xaxis.range) == (start.isoformat(), end.isoformat())
+
+
+def test_registry_is_bounded(make_portfolio, monkeypatch):
+    """Test old viewports are evicted once the registry is full."""
+    monkeypatch.setattr(viewport_module, "MAX_VIEWPORTS", 2)
+    config, schedule = make_portfolio(3, **SPREAD_PAPERS)
+    keys = [register_viewport(schedule, config) for _ in range(3)]
+    assert get_viewport(keys[0]) is None
+    assert get_viewport(keys[2]).schedule is schedule
+    assert get_viewport(None) is None
@@ -1,7 +1,11 @@
 """Pytest configuration for Dash app tests."""
 
 import pytest
+from datetime import date, timedelta
 from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+from core.models import Config, Schedule, Submission, SubmissionType
 
 # Dash-specific fixtures
 @pytest.fixture
@@ -14,8 +18,38 @@ def dash_components_dir() -> Path:
     """Fixture to provide the Dash components directory."""
     return Path(__file__).parent.parent / "components"
 
+# Schedule fixtures
+PortfolioFactory = Callable[..., Tuple[Config, Schedule]]
+
+
+@pytest.fixture
+def make_portfolio() -> PortfolioFactory:
+    """Fixture to build a default config of generated papers and a schedule of them.
+    
+    The factory takes the paper count and, optionally, the ID prefix, extra
+    Submission fields per index (e.g. depends_on), the start date per index
+    and the duration in days, fixed or per index. It returns (config, schedule).
+    """
+    def make(count: int, prefix: str = "p",
+             fields: Optional[Callable[[int], Dict[str, Any]]] = None,
+             start: Optional[Callable[[int], date]] = None,
+             days: Union[int, Callable[[int], int]] = 30) -> Tuple[Config, Schedule]:
+        submissions = [
+            Submission(id=f"{prefix}{i}", title=f"Paper {i}", kind=SubmissionType.PAPER, **(fields(i) if fields else {}))
+            for i in range(count)
+        ]
+        config = Config.create_default().model_copy(update={"submissions": submissions})
+        schedule = Schedule()
+        for i in range(count):
+            begin = start(i) if start else date(2026, 1, 1) + timedelta(days=45 * i)
+            schedule.add_interval(f"{prefix}{i}", begin, end_date=begin + timedelta(days=days(i) if callable(days) else days))
+        return config, schedule
+    return make
+
+
 # Re-export all core fixtures so they're available in Dash tests
 __all__ = [
     'dash_app_dir',
-    'dash_components_dir'
+    'dash_components_dir',
+    'make_portfolio'
 ]
@@ -0,0 +1,109 @@
+"""Tests for the server-side figure cache."""
+
+from datetime import date, timedelta
+
+import plotly.graph_objects as go
+
+from core.models import Config, Schedule, Submission, SubmissionType
+from app.figure_cache import FigureCache, get_figure_cache, make_figure_key
+from app.components.gantt.viewport import ScheduleViewport, render_viewport_cached
+from app.components.debug.layout import create_debug_panel, toggle_debug_refresh
+
+
+def _figure(points: int = 3) -> go.Figure:
+    """Small scatter figure with the given number of points."""
+    return go.Figure(go.Scatter(x=list(range(points)), y=list(range(points))))
+
+
+def test_hits_return_cached_dict():
+    """Test repeat lookups are served from the cache and counted."""
+    cache = FigureCache()
+    builds = []
+
+    def build():
+        builds.append(1)
+        return _figure()
+
+    first = cache.get_or_create("k", build)
+    second = cache.get_or_create("k", build)
+    assert isinstance(first, go.Figure)
+    assert isinstance(second, dict)
+    assert list(second["data"][0]["x"]) == [0, 1, 2]
+    assert len(builds) == 1
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+    assert stats["hit_rate"] == 0.5
+
+
+def test_lru_eviction_by_entry_count():
+    """Test the least recently used figure is evicted first."""
+    cache = FigureCache(max_entries=2)
+    cache.put("a", _figure())
+    cache.put("b", _figure())
+    assert cache.get("a") is not None
+    cache.put("c", _figure())
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_byte_budget_is_enforced():
+    """Test total size stays under the byte cap and oversized figures are skipped."""
+    size = len(go.Figure(_figure(50)).to_json())
+    cache = FigureCache(max_bytes=int(size * 2.5))
+    for key in "abc":
+        cache.put(key, _figure(50))
+    stats = cache.stats()
+    assert stats["entries"] == 2 and stats["bytes"] <= stats["max_bytes"]
+    cache.put("huge", _figure(5000))
+    assert cache.get("huge") is None
+    cache.clear()
+    assert cache.stats()["entries"] == 0 and cache.stats()["bytes"] == 0
+
+
+def test_key_depends_on_every_input():
+    """Test keys differ across config, strategy, chart type and viewport."""
+    base = make_figure_key("cfg", "greedy", "gantt", (date(2026, 1, 1), date(2026, 2, 1)))
+    assert base == make_figure_key("cfg", "greedy", "gantt", (date(2026, 1, 1), date(2026, 2, 1)))
+    assert len({
+        base,
+        make_figure_key("other", "greedy", "gantt", (date(2026, 1, 1), date(2026, 2, 1))),
+        make_figure_key("cfg", "optimal", "gantt", (date(2026, 1, 1), date(2026, 2, 1))),
+        make_figure_key("cfg", "greedy", "dashboard", (date(2026, 1, 1), date(2026, 2, 1))),
+        make_figure_key("cfg", "greedy", "gantt", (date(2026, 1, 1), date(2026, 3, 1))),
+    }) == 5
+
+
+def test_repeat_viewport_is_served_from_cache():
+    """Test the same zoom window on the same schedule renders once."""
+    submissions = [Submission(id=f"p{i}", title=f"Paper {i}", kind=SubmissionType.PAPER) for i in range(20)]
+    config = Config.create_default().model_copy(update={"submissions": submissions})
+    schedule = Schedule()
+    for i in range(20):
+        start = date(2026, 1, 1) + timedelta(days=10 * i)
+        schedule.add_interval(f"p{i}", start, end_date=start + timedelta(days=15))
+
+    cache = get_figure_cache()
+    cache.clear()
+    window = (date(2026, 2, 1), date(2026, 4, 1))
+    render_viewport_cached(ScheduleViewport(schedule, config, "greedy"), *window)
+    repeat = render_viewport_cached(ScheduleViewport(schedule, config, "greedy"), *window)
+    assert isinstance(repeat, dict)
+    assert cache.stats()["hits"] == 1
+
+    render_viewport_cached(ScheduleViewport(schedule, config, "optimal"), *window)
+    assert cache.stats()["misses"] == 2
+    cache.clear()
+
+
+def test_debug_panel_is_mounted_in_every_app():
+    """Test each app mode carries the cache statistics panel of its own process."""
+    from app.main import create_app
+    from dash import html
+    
+    for mode in ('gantt', 'dashboard', 'metrics'):
+        layout = create_app(mode).layout
+        assert isinstance(layout.children[-1], html.Details)
+        assert layout.children[-1].id == 'debug-panel'
+    assert "debug-cache-stats" in str(create_debug_panel())
+    assert toggle_debug_refresh(True) is False and toggle_debug_refresh(None) is True
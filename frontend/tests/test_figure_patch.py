@@ -0,0 +1,88 @@
+"""Tests for Patch-based incremental figure updates."""
+
+import copy
+import json
+from datetime import date, timedelta
+
+import plotly.graph_objects as go
+import plotly.io as pio
+from dash import Patch, no_update
+
+from app.figure_cache import get_figure_cache
+from app.figure_patch import build_figure_patch, patch_operations, update_figure
+from app.components.gantt.viewport import ScheduleViewport, render_viewport_cached, viewport_figure_key
+
+
+def _apply(figure, patch):
+    """Apply a patch's operations the way the browser does."""
+    figure = copy.deepcopy(figure)
+    for operation in patch_operations(patch):
+        *path, last = operation['location']
+        target = figure
+        for part in path:
+            target = target[part]
+        if operation['operation'] == 'Assign':
+            target[last] = operation['params']['value']
+        else:
+            assert operation['operation'] == 'Delete'
+            del target[last]
+    return figure
+
+
+def _as_dict(figure):
+    return json.loads(pio.to_json(figure, validate=False))
+
+
+def test_patch_reproduces_new_figure():
+    """Test applying the patch to the old figure yields the new one."""
+    old = _as_dict(go.Figure(go.Bar(x=list(range(50))), layout={"title": {"text": "Old"}}))
+    new = copy.deepcopy(old)
+    new["data"][0]["x"][2] = 300
+    new["layout"]["title"]["text"] = "New"
+    new["layout"]["barmode"] = "overlay"
+    del new["layout"]["template"]
+
+    patch = build_figure_patch(old, new)
+    assert isinstance(patch, Patch)
+    assert _apply(old, patch) == new
+    assert {"operation": "Assign", "location": ["data", 0, "x", 2], "params": {"value": 300}} in patch_operations(patch)
+
+
+def test_structure_change_needs_full_figure():
+    """Test different trace counts or types fall back to the full figure."""
+    old = _as_dict(go.Figure(go.Bar(x=[1, 2])))
+    assert build_figure_patch(old, _as_dict(go.Figure([go.Bar(x=[1, 2]), go.Bar(x=[3])]))) is None
+    assert build_figure_patch(old, _as_dict(go.Figure(go.Scatter(x=[1, 2])))) is None
+    assert build_figure_patch(old, _as_dict(go.Figure(go.Bar(x=list(range(100))))), max_ratio=0.01) is None
+
+
+def test_rescheduled_submission_sends_only_its_coordinates(make_portfolio):
+    """Test moving one submission patches that bar instead of resending the chart."""
+    config, schedule = make_portfolio(40)
+    # Paper 17 starts a week later
+    _, rescheduled = make_portfolio(40, start=lambda i: date(2026, 1, 1) + timedelta(days=45 * i + (7 if i == 17 else 0)))
+    cache = get_figure_cache()
+    cache.clear()
+    before = ScheduleViewport(schedule, config, "greedy")
+    after = ScheduleViewport(rescheduled, config, "greedy")
+    render_viewport_cached(before)
+    figure = render_viewport_cached(after)
+
+    update = update_figure(viewport_figure_key(before), viewport_figure_key(after), figure)
+    assert isinstance(update, Patch)
+    old, new = cache.peek(viewport_figure_key(before)), cache.peek(viewport_figure_key(after))
+    assert _apply(old, update) == new
+    assert len(json.dumps(patch_operations(update))) < len(json.dumps(new)) / 10
+    cache.clear()
+
+
+def test_update_figure_without_previous_figure():
+    """Test unchanged keys send nothing and unknown previous figures send everything."""
+    cache = get_figure_cache()
+    cache.clear()
+    cache.put("shown", go.Figure(go.Bar(x=[1])))
+    assert update_figure("shown", "shown", go.Figure(go.Bar(x=[1]))) is no_update
+    full = update_figure(None, "shown", go.Figure(go.Bar(x=[1])))
+    assert isinstance(full, dict) and full["data"][0]["x"] == [1]
+    assert update_figure("evicted", "shown", go.Figure(go.Bar(x=[1])))["data"][0]["type"] == "bar"
+    cache.clear()
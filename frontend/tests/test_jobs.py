@@ -0,0 +1,62 @@
+"""Tests for app.jobs module."""
+
+import time
+import pytest
+from pathlib import Path
+from app.jobs import JobManager, JOB_DONE, JOB_FAILED
+
+BACKEND_TEST_DATA = Path(__file__).resolve().parents[2] / "backend" / "tests" / "common" / "data"
+
+
+@pytest.fixture
+def job_config_path(tmp_path) -> str:
+    """Copy the backend test data so snapshot files land in a temp directory."""
+    for path in BACKEND_TEST_DATA.iterdir():
+        (tmp_path / path.name).write_bytes(path.read_bytes())
+    return str(tmp_path / "config.json")
+
+
+@pytest.fixture
+def job_manager():
+    """Job manager with a single worker, shut down after the test."""
+    manager = JobManager(max_workers=1)
+    yield manager
+    manager.shutdown()
+
+
+def _wait_for(manager: JobManager, job_id: str, timeout: float = 20.0) -> dict:
+    """Poll a job until it finishes or the timeout passes."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        status = manager.status(job_id)
+        if status["state"] in (JOB_DONE, JOB_FAILED):
+            return status
+        time.sleep(0.1)
+    pytest.fail(f"Job {job_id} did not finish within {timeout}s")
+
+
+def test_job_runs_and_is_reused(job_manager, job_config_path):
+    """Test a job completes in the background and identical submissions reuse it."""
+    job_id = job_manager.submit(job_config_path, "greedy")
+    status = _wait_for(job_manager, job_id)
+
+    assert status["state"] == JOB_DONE
+    assert status["progress"] == 1.0
+    assert status["result"]["intervals"]
+    assert "makespan" in status["result"]["metrics"]
+    assert job_manager.submit(job_config_path, "greedy") == job_id
+    assert job_manager.submit(job_config_path, "greedy", force=True) != job_id
+
+
+def test_failed_job_reports_error(job_manager, job_config_path):
+    """Test scheduler errors surface in the job status."""
+    status = _wait_for(job_manager, job_manager.submit(job_config_path, "not-a-strategy"))
+
+    assert status["state"] == JOB_FAILED
+    assert "ValueError" in status["error"]
+
+
+def test_unknown_job_status(job_manager):
+    """Test unknown job IDs return None without starting the pool."""
+    assert job_manager.status("missing") is None
+    assert job_manager._executor is None
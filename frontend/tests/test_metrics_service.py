@@ -0,0 +1,120 @@
+"""Tests for the cached, asynchronous metrics service."""
+
+import shutil
+import threading
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+
+from core.models import Config, Schedule
+from app.metrics_service import METRIC_FIELDS, MetricsService
+from app.components.metrics.chart import create_metrics_chart
+
+DATA_DIR = Path(__file__).resolve().parents[2] / "backend" / "data"
+
+
+class _SavedSchedules:
+    """In-memory stand-in for the saved-schedule storage, counting loads."""
+
+    def __init__(self, config: Config):
+        self.saved = {}
+        self.loads = []
+        self.gate = threading.Event()
+        self.gate.set()
+        ids = [submission.id for submission in config.submissions][:6]
+        for index in range(3):
+            schedule = Schedule()
+            for offset, sid in enumerate(ids):
+                start = date(2026, 1, 1) + timedelta(days=30 * offset + 10 * index)
+                schedule.add_interval(sid, start, end_date=start + timedelta(days=20))
+            self.saved[f"plan-{index}"] = (f"2026-01-0{index + 1}T00:00:00", schedule)
+
+    def list_schedules(self):
+        return [
+            {"filename": name, "timestamp": timestamp, "strategy": "greedy"}
+            for name, (timestamp, schedule) in reversed(list(self.saved.items()))
+        ]
+
+    def load_schedule(self, filename):
+        self.gate.wait(5)
+        self.loads.append(filename)
+        return self.saved[filename][1]
+
+
+@pytest.fixture
+def config_path(tmp_path) -> str:
+    """Copy of the bundled config so snapshots are written under tmp_path."""
+    for path in DATA_DIR.glob("*.json"):
+        shutil.copy(path, tmp_path / path.name)
+    return str(tmp_path / "config.json")
+
+
+def test_snapshot_streams_then_serves_from_cache(config_path):
+    """Test saved schedules are scored in the background, oldest first, and only once."""
+    probe = MetricsService(storage=None)
+    config, _ = probe.load_config(config_path)
+    storage = _SavedSchedules(config)
+    service = MetricsService(storage=storage)
+    storage.gate.clear()
+
+    first = service.snapshot(config_path)
+    assert first.pending == 3 and not first.trends
+
+    storage.gate.set()
+    service.wait(timeout=30)
+    done = service.snapshot(config_path)
+    assert done.pending == 0 and not done.errors
+    assert [point["filename"] for point in done.trends] == ["plan-0", "plan-1", "plan-2"]
+    assert storage.loads == ["plan-0", "plan-1", "plan-2"]
+    assert done.current_label == "plan-2"
+    assert set(done.current) == {name for name, _ in METRIC_FIELDS}
+
+    service.snapshot(config_path)
+    assert len(storage.loads) == 3
+    assert service.stats() == {"cached": 3, "pending": 0, "errors": 0}
+    service.shutdown()
+
+
+def test_submit_scores_each_schedule_version_once(make_portfolio):
+    """Test a schedule is rescored only after it changes."""
+    config, schedule = make_portfolio(4, start=lambda i: date(2026, 1, 1) + timedelta(days=40 * i), days=19)
+
+    service = MetricsService(storage=_SavedSchedules(config))
+    key = service.submit(schedule, config, "cfg")
+    assert service.submit(schedule, config, "cfg") == key
+    service.wait(timeout=30)
+    assert service.result(key)["scheduled_count"] == 4
+
+    schedule.add_interval("p0", date(2026, 6, 1), end_date=date(2026, 6, 20))
+    assert service.submit(schedule, config, "cfg") != key
+    service.shutdown()
+
+
+def test_failed_schedule_is_reported(config_path):
+    """Test a saved schedule that cannot be loaded is reported, not retried."""
+    probe = MetricsService(storage=None)
+    config, _ = probe.load_config(config_path)
+    storage = _SavedSchedules(config)
+    storage.saved["broken"] = ("2026-02-01T00:00:00", None)
+    service = MetricsService(storage=storage)
+    service.snapshot(config_path)
+    service.wait(timeout=30)
+    snapshot = service.snapshot(config_path)
+    assert len(snapshot.trends) == 3
+    assert snapshot.errors and snapshot.errors[0].startswith("broken")
+    service.shutdown()
+
+
+def test_chart_from_snapshot(config_path):
+    """Test the metrics chart plots current bars and one trend line per metric."""
+    probe = MetricsService(storage=None)
+    config, _ = probe.load_config(config_path)
+    service = MetricsService(storage=_SavedSchedules(config))
+    service.snapshot(config_path)
+    service.wait(timeout=30)
+    fig = create_metrics_chart(service.snapshot(config_path))
+    assert len(fig.data) == 1 + len(METRIC_FIELDS)
+    assert len(fig.data[0].y) == len(METRIC_FIELDS)
+    assert all(len(trace.x) == 3 for trace in fig.data[1:])
+    service.shutdown()
@@ -90,3 +90,103 @@ def test_state_manager_methods_exist():
     for method_name in expected_methods:
         assert hasattr(manager, method_name)
         assert callable(getattr(manager, method_name))
+
+
+def test_schedule_round_trip_with_both_encodings(monkeypatch, tmp_path):
+    """Test schedules saved as JSON or packed binary load back unchanged."""
+    from datetime import date
+    from core.models import Schedule
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    
+    schedule = Schedule()
+    for index in range(50):
+        schedule.add_interval(f"paper-{index}", date(2026, 1, 1 + index % 28), duration_days=30)
+    
+    json_storage = ScheduleStorage()
+    packed_storage = ScheduleStorage(encoding="packed")
+    assert json_storage.save_schedule(schedule, "as-json", strategy="greedy")
+    assert packed_storage.save_schedule(schedule, "as-packed", strategy="greedy")
+    
+    # Either storage object reads both encodings
+    assert json_storage.load_schedule("as-packed").intervals == schedule.intervals
+    assert packed_storage.load_schedule("as-json").intervals == schedule.intervals
+    
+    with json_storage._engine.connection() as conn:
+        sizes = dict(conn.execute("SELECT filename, length(schedule_data) FROM schedules").fetchall())
+        assert sizes["as-packed"] < sizes["as-json"] / 2
+        assert conn.execute("SELECT typeof(schedule_data) FROM schedules WHERE filename = 'as-packed'").fetchone()[0] == "blob"
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert {s["filename"] for s in json_storage.list_saved_schedules()} == {"as-json", "as-packed"}
+
+
+def test_concurrent_state_saves(monkeypatch, tmp_path):
+    """Test component state can be saved from many threads at once."""
+    from concurrent.futures import ThreadPoolExecutor
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    
+    def save(index):
+        return save_state(f"component-{index % 4}", {"index": index, "settings": {"zoom": index}})
+    
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        assert all(pool.map(save, range(64)))
+    
+    for component in range(4):
+        state = load_state(f"component-{component}")
+        assert state["index"] % 4 == component
+        assert "timestamp" in state
+
+
+def test_short_lived_threads_share_a_bounded_pool(monkeypatch, tmp_path):
+    """Test one thread per request does not open one connection per thread."""
+    import threading
+    from app.storage import COMPONENT_STATES_SCHEMA, DEFAULT_POOL_SIZE, get_sqlite_engine
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    results = []
+    
+    def request(index):
+        results.append(save_state("gantt", {"index": index}) and load_state("gantt") != {})
+    
+    for batch in range(0, 300, 30):
+        threads = [threading.Thread(target=request, args=(index,)) for index in range(batch, batch + 30)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    
+    engine = get_sqlite_engine(tmp_path / ".paper_planner" / "component_states.db", COMPONENT_STATES_SCHEMA)
+    assert len(results) == 300 and all(results)
+    assert engine.open_connections() <= DEFAULT_POOL_SIZE
+    engine.close()
+    assert engine.open_connections() == 0
+
+
+def test_load_schedule_window(monkeypatch, tmp_path):
+    """Test date windows come from the mapped file for large schedules and match a full filter."""
+    from datetime import date, timedelta
+    from core.models import Schedule
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    
+    schedule = Schedule()
+    for index in range(40):
+        start = date(2026, 1, 1) + timedelta(days=7 * index)
+        schedule.add_interval(f"paper-{index}", start, end_date=start + timedelta(days=20))
+    
+    storage = ScheduleStorage(window_file_min_intervals=10)
+    assert storage.save_schedule(schedule, "large")
+    assert storage._window_file("large").exists()
+    
+    window = storage.load_schedule_window("large", date(2026, 3, 1), date(2026, 3, 31))
+    expected = {
+        sid for sid, interval in schedule.intervals.items()
+        if interval.end_date >= date(2026, 3, 1) and interval.start_date <= date(2026, 3, 31)
+    }
+    assert set(window.intervals) == expected
+    
+    # Small schedules fall back to loading and filtering
+    small = ScheduleStorage(window_file_min_intervals=1000)
+    assert small.save_schedule(schedule, "large")
+    assert not small._window_file("large").exists()
+    assert set(small.load_schedule_window("large", date(2026, 3, 1), date(2026, 3, 31)).intervals) == expected
+    
+    assert storage.delete_schedule("large")
+    assert storage.load_schedule_window("large") is None